@@ -19,6 +19,11 @@ import redis
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
 from influxdb_client.client.bucket_api import BucketsApi
+from influxdb_writer import InfluxDBBatchWriter
+import valuestream
+from sequence import SequenceExecutor, new_command
+import socket
+from urllib.parse import urlparse
 
 
 async_mode = None #"threading" #"eventlet" None
@@ -28,10 +33,15 @@ mongoclient = None
 logger = None
 clients = {}
 rt_pubsub = None
+rt_stream = None
 redis_event_thread = None
 rt_db = None
+influxdb_writer = None
 get_value = None
 ifs_status = {}
+sequence_executor = None
+command_senders = {} # command id -> (socket.io sid, monotonic time sent) of select/operate commands of the browsers
+COMMAND_RESULT_TIMEOUT = 300 # seconds a sender is kept for a command without result (i.e. the IFS went down)
 
 poll_datapoint = {}
 alarm_rules_list = {}
@@ -616,21 +626,101 @@ def get_objects_for_gis(data):
   socketio.emit("geojson_object_add_to_map_gis",geojson )
 
 
+# commands for an IEC104 RTU are sent to the command channel of the IFS that owns the RTU (ifs_command:<IFS>),
+# other dataproviders (static://) still use the <operation>:<element> channels
+# the browser (sid) of a select or operate is registered before the command is sent, so its result goes to that
+# browser, also when it arrives before the id is returned. The IFS publishes no result for a cancel
+def publish_command(operation, element, value, sid=None):
+  global rt_db
+  uri = urlparse(element)
+  if uri.scheme != "iec60870-5-104":
+    rt_db.publish(operation + ":" + element, value)
+    return
+  command = new_command(operation, element, value)
+  ifs = rt_db.hget("ifs_rtu_owner", uri.netloc)
+  if ifs == None:
+    logger.warning("no IFS owns RTU %s, %s of %s not sent" % (uri.netloc, operation, element))
+    if sid != None and operation != "cancel":
+      socketio.emit("command_result", dict(command, result="failed", reason="no IFS owns RTU"), to=sid)
+    return
+  if sid != None and operation != "cancel":
+    now = time.monotonic()
+    for id in [id for id, (sender, sent) in command_senders.items() if now - sent > COMMAND_RESULT_TIMEOUT]:
+      del command_senders[id]
+    command_senders[command["id"]] = (sid, now)
+  # id and created are returned in the result of the command, published by the IFS on command_result
+  rt_db.publish("ifs_command:" + ifs.decode("utf-8"), json.dumps(command))
+  return command["id"]
+
+
+# returns the id of the command to the browser
 @socketio.on('publish', namespace='')
 def publish_operation(data):
-  global rt_db
+  command_id = None
   if data['operation'] == 'select':
     logger.info("select:" + data['element'] + ">" + data['value'])
-    rt_db.publish("select:" + data['element'],data['value'])
+    command_id = publish_command("select", data['element'], data['value'], request.sid)
     publish_event(data['element'],"control:select",data['value'])
   if data['operation'] == 'operate':
     logger.info("operate:" + data['element'] + ">" + data['value'])
-    rt_db.publish("operate:" + data['element'],data['value'])
+    command_id = publish_command("operate", data['element'], data['value'], request.sid)
     publish_event(data['element'],"control:operate",data['value'])
   if data['operation'] == 'cancel':  
     logger.info("cancel:" + data['element'])
-    rt_db.publish("cancel:" + data['element'],"cancel")
+    command_id = publish_command("cancel", data['element'], "cancel")
     publish_event(data['element'],"control:cancel","None")
+  return command_id
+
+
+# result of a command, with the timings of each step, forwarded to the browser that sent the command
+def command_result_handler(message):
+  try:
+    result = json.loads(message['data'])
+    id = result.get('id')
+  except (ValueError, AttributeError) as e:
+    logger.error("invalid command result: %s (%s)" % (str(message['data']), str(e)))
+    return
+  logger.info("command %s %s to %s: %s" % (str(id), str(result.get('operation')), str(result.get('element')), str(result.get('result'))))
+  sender = command_senders.pop(id, None)
+  if sender != None:
+    socketio.emit("command_result", result, to=sender[0])
+  if sequence_executor != None:
+    sequence_executor.result(result)
+
+
+@socketio.on('get_sequences', namespace='')
+def get_sequences(data):
+  global mongoclient
+  db = mongoclient.scada
+  return [item['name'] for item in db.switching_sequences.find({}, {"name": 1})]
+
+
+# start a sequence by name, the progress is sent with sequence_progress events. returns the run id
+@socketio.on('run_sequence', namespace='')
+def run_sequence(name):
+  global mongoclient
+  db = mongoclient.scada
+  sequence = db.switching_sequences.find_one({"name": name})
+  if sequence == None:
+    logger.error("unknown switching sequence: " + str(name))
+    return None
+  run_id = uuid.uuid4().hex
+  logger.info("starting switching sequence %s (%s)" % (name, run_id))
+  publish_event(name, "sequence:start", run_id)
+  socketio.start_background_task(sequence_task, sequence, run_id)
+  return run_id
+
+
+def sequence_task(sequence, run_id):
+  run = sequence_executor.run(sequence, run_id)
+  logger.info("switching sequence %s (%s): %s in %s ms" % (sequence['name'], run_id, run['status'], str(run['duration_ms'])))
+  publish_event(sequence['name'], "sequence:" + run['status'], run_id)
+
+
+@socketio.on('abort_sequence', namespace='')
+def abort_sequence(run_id):
+  logger.info("aborting switching sequence " + str(run_id))
+  return sequence_executor.abort(run_id)
 
 
 ### front end status check
@@ -669,20 +759,12 @@ def ifs_check_online(interval):
 #######################################################################
 
 
-def redis_dataUpdate(msg):
-  global rt_db
-  if rt_db == None:
-    logger.error("No redis db connected")
-    return
-
-  key = msg['channel'][15:]
-  data = rt_db.get(key)
-  key_u8 = key.decode("utf-8")[5:]
-  data_u8 = data.decode("utf-8")
-  
-  logger.debug("update: %s %s", str(key_u8), str(data_u8))
-  updateDataPoint( key_u8,data_u8) # emit to connected webclients
-  update_alarms( key_u8,data_u8 )
+# batch of updates from the value stream, with the value included, so no GET is needed
+def redis_dataUpdate(updates):
+  for key_u8, data_u8, quality, timestamp in updates:
+    logger.debug("update: %s %s", str(key_u8), str(data_u8))
+    updateDataPoint( key_u8,data_u8) # emit to connected webclients
+    update_alarms( key_u8,data_u8 )
 
 
 
@@ -1006,10 +1088,10 @@ def save_alarm_rules(data):
 ### Event logic ###
 def publish_event(element,msg,value):
   # add event item @ influxdb
-  global influxdb_write_api
+  global influxdb_writer
   current_time = datetime.utcnow()
   p = Point("event").tag("element", element).time(int(current_time.timestamp()*1000000),write_precision='us').field("message", msg).field("value", str(value))
-  influxdb_write_api.write(bucket=event_bucket, record=p)
+  influxdb_writer.write(event_bucket, p)
   socketio.emit('add_event_to_table', {"time":current_time.strftime("%Y-%m-%d %H:%M:%S.%f+00:00"), 'element':element, 'msg':msg, 'value':value})
   # re-eval if we need to trigger an alarm-rule. this can become recursive, but due to the "." concatination, we prevent an endless loop in the logic
   update_alarms( element + "." + msg, value )
@@ -1161,15 +1243,18 @@ def worker():
 
 def redis_events():
   global rt_pubsub
+  global rt_stream
   while True:
-    if rt_pubsub == None:
+    if rt_pubsub == None or rt_stream == None:
       logger.error("no redis connection")
       socketio.sleep(10)
       continue
+    # read value updates in batches, without blocking the webserver
+    count = rt_stream.read(redis_dataUpdate)
     message = rt_pubsub.get_message()
     if message:
       logger.warning("missed event:" + str(message))
-    else:
+    elif count == 0:
       socketio.sleep(0.01)
 
 
@@ -1229,8 +1314,15 @@ if __name__ == '__main__':
     rt_db = redis.Redis(host=redis_host, port=6379, password=redis_password)
     rt_pubsub = rt_db.pubsub()
 
-    rt_pubsub.psubscribe(**{'__keyspace@0__:data:*': redis_dataUpdate}) # needed for values in clients and alarms
-    rt_pubsub.subscribe(**{ "ifs_status_online": ifs_status_handler })
+    # a group name that is stable over restarts, so updates of the downtime are read after a restart. every client
+    # instance needs all updates, so a second instance needs its own CLIENT_STREAM_GROUP (i.e. client:<name>)
+    stream_group = os.environ.get('CLIENT_STREAM_GROUP', "client")
+    rt_stream = valuestream.StreamConsumer(rt_db, stream_group, socket.gethostname()) # needed for values in clients and alarms
+    # groups of client instances that are gone for an hour, or named after the hostname of a replaced container
+    for group in valuestream.remove_stale_groups(rt_db, "client", stream_group, 3600000):
+      logger.info("removed stale stream group: " + group)
+    rt_pubsub.subscribe(**{ "ifs_status_online": ifs_status_handler, "modbus_status_online": ifs_status_handler, "command_result": command_result_handler })
+    sequence_executor = SequenceExecutor(rt_db, socketio.sleep, socketio.emit, publish_event)
     
     redis_event_thread = socketio.start_background_task(target=redis_events)
     logger.info("connected to redis")
@@ -1245,6 +1337,8 @@ if __name__ == '__main__':
             org=influxdb_org)
     influxdb_query_api = influxdb_client.query_api()
     influxdb_write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
+    influxdb_writer = InfluxDBBatchWriter(influxdb_write_api, influxdb_org, flush_interval=0.2, spill_file="./influxdb_spill.lp")
+    influxdb_writer.start()
 
     influxdb_bucket_api = influxdb_client.buckets_api()
     vbucket = influxdb_bucket_api.find_bucket_by_name(value_bucket)
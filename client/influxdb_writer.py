@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+#
+# Asynchronous batching writer for the historical database(influxdb)
+# records are put in a bounded queue, and written by a background thread in line-protocol batches,
+# based on batch size or flush interval. If influxdb cannot be reached, batches are spilled to a file
+# on disk, and replayed when influxdb is available again.
+#
+# this file is shared between the ifs, modbus_ifs, static_dataprovider and client, and should be kept identical
+#
+import os
+import time
+import queue
+import threading
+import logging
+
+from influxdb_client import Point, WritePrecision
+
+logger = logging.getLogger('influxdb_writer')
+
+
+class InfluxDBBatchWriter:
+
+    def __init__(self, write_api, org=None, batch_size=500, flush_interval=1.0, queue_size=10000,
+            put_timeout=0.1, spill_file=None, spill_max_bytes=100*1024*1024, retry_interval=5.0):
+        self.write_api = write_api # should be a SYNCHRONOUS write api, as it is only called from the writer thread
+        self.org = org
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval # seconds
+        self.put_timeout = put_timeout # seconds a producer is blocked when the queue is full, before the record is dropped
+        self.spill_file = spill_file # None disables spilling, and records are dropped when influxdb is unavailable
+        self.spill_max_bytes = spill_max_bytes
+        self.retry_interval = retry_interval # seconds to wait before influxdb is retried after a failed write
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.online = True
+        self.retry_time = 0
+        self.running = False
+        self.thread = None
+        self.stats = {
+            'queued': 0,    # records accepted in the queue
+            'written': 0,   # records written to influxdb
+            'blocked': 0,   # puts that had to wait for queue space (backpressure)
+            'dropped': 0,   # records lost due to a full queue, or a full spill file
+            'spilled': 0,   # records written to the spill file
+            'replayed': 0,  # records from the spill file written to influxdb
+            'errors': 0,    # failed writes to influxdb
+        }
+
+
+    def start(self):
+        if self.thread == None:
+            self.running = True
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+
+    # stop the writer thread, and write (or spill) all remaining records
+    def stop(self):
+        self.running = False
+        if self.thread != None:
+            self.thread.join()
+            self.thread = None
+
+
+    def queue_depth(self):
+        return self.queue.qsize()
+
+
+    # add a record (Point or line-protocol string) to the queue, returns False if the record was dropped
+    def write(self, bucket, record):
+        if isinstance(record, Point):
+            if record._time == None: # timestamp now, else the time of the (delayed) write would be used
+                record.time(time.time_ns(), WritePrecision.NS)
+            precision = record._write_precision
+            line = record.to_line_protocol()
+        else:
+            precision = WritePrecision.NS
+            line = record
+
+        item = (bucket, precision, line)
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            self.stats['blocked'] += 1
+            try:
+                self.queue.put(item, timeout=self.put_timeout)
+            except queue.Full:
+                self.stats['dropped'] += 1
+                if self.stats['dropped'] % 1000 == 1:
+                    logger.warning("influxdb write queue full, dropped %i records" % self.stats['dropped'])
+                return False
+        self.stats['queued'] += 1
+        return True
+
+
+    def run(self):
+        while self.running == True or not self.queue.empty():
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+                if self.running == False and self.queue.empty():
+                    break
+            if len(batch) > 0:
+                self.flush(batch)
+            elif self.online == False or self.spill_pending():
+                self.replay()
+
+
+    def flush(self, batch):
+        if self.online == False and time.monotonic() < self.retry_time:
+            self.spill(batch) # influxdb is known to be down, do not wait for another timeout
+            return False
+
+        if self.send(batch) == True:
+            self.stats['written'] += len(batch)
+            self.replay()
+            return True
+
+        self.spill(batch)
+        return False
+
+
+    # write a batch, grouped per bucket and precision
+    def send(self, batch):
+        groups = {}
+        for bucket, precision, line in batch:
+            groups.setdefault((bucket, precision), []).append(line)
+        try:
+            for (bucket, precision), lines in groups.items():
+                self.write_api.write(bucket=bucket, org=self.org, record=lines, write_precision=precision)
+        except Exception as e:
+            self.stats['errors'] += 1
+            if self.online == True:
+                logger.error("influxdb: could not write batch of %i records: %s" % (len(batch), str(e)))
+            self.online = False
+            self.retry_time = time.monotonic() + self.retry_interval
+            return False
+        if self.online == False:
+            logger.info("influxdb available again")
+            self.online = True
+        return True
+
+
+    # records in the spill file, or in a replay file that was left by a crash during a replay
+    def spill_pending(self):
+        if self.spill_file == None:
+            return False
+        for file in (self.spill_file + ".replay", self.spill_file):
+            if os.path.exists(file) and os.path.getsize(file) > 0:
+                return True
+        return False
+
+
+    def spill(self, batch, count=True):
+        if self.spill_file == None:
+            self.stats['dropped'] += len(batch)
+            return
+        try:
+            if os.path.exists(self.spill_file) and os.path.getsize(self.spill_file) > self.spill_max_bytes:
+                self.stats['dropped'] += len(batch)
+                return
+            with open(self.spill_file, 'a') as f:
+                for bucket, precision, line in batch:
+                    f.write("%s\t%s\t%s\n" % (bucket, precision, line))
+            if count == True:
+                self.stats['spilled'] += len(batch)
+        except Exception as e:
+            self.stats['dropped'] += len(batch)
+            logger.error("could not spill %i records to %s: %s" % (len(batch), self.spill_file, str(e)))
+
+
+    # write the spill file back to influxdb, remaining records are spilled again if influxdb fails
+    # a replay file left by a crash is replayed first, and the spill file by the next replay, so neither
+    # is overwritten. records of the crashed replay that were already written are written again, which
+    # influxdb ignores, as they have the same timestamp
+    def replay(self):
+        if not self.spill_pending() or time.monotonic() < self.retry_time:
+            return
+        replay_file = self.spill_file + ".replay"
+        if not os.path.exists(replay_file):
+            os.replace(self.spill_file, replay_file)
+        logger.debug("replaying spilled records from %s" % replay_file)
+
+        batch = []
+        failed = False
+        with open(replay_file, 'r') as f:
+            for entry in f:
+                item = entry.rstrip("\n").split("\t", 2)
+                if len(item) != 3:
+                    continue
+                batch.append(tuple(item))
+                if len(batch) >= self.batch_size:
+                    if failed == False and self.send(batch) == True:
+                        self.stats['replayed'] += len(batch)
+                    else:
+                        failed = True
+                        self.spill(batch, False)
+                    batch = []
+        if len(batch) > 0:
+            if failed == False and self.send(batch) == True:
+                self.stats['replayed'] += len(batch)
+            else:
+                self.spill(batch, False)
+        os.remove(replay_file)
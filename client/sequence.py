@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+#
+# Switching sequences: a named list of select/operate steps, executed as a whole instead of one
+# command per operator action. Sequences are stored in the mongodb collection switching_sequences:
+#
+#   { "name": "restore feeder 12",
+#     "steps": [
+#       { "id": "open_a", "operation": "operate", "element": "iec60870-5-104://10.1.0.10:2404/DoublePointCommand/6000", "value": "1",
+#         "interlocks": [ { "datapoint": "iec60870-5-104://10.1.0.10:2404/DoublePointInformation/6001", "value": "2" } ] },
+#       { "id": "close_b", "operation": "operate", "element": "...", "value": "2", "after": ["open_a"] },
+#       { "id": "close_c", "operation": "operate", "element": "...", "value": "2", "after": ["open_a"] } ] }
+#
+# a step starts when the steps in "after" are done (default: the previous step, "after": [] starts
+# it directly). All steps that can start at the same moment are checked with one MGET for their
+# interlocks, and sent with one redis pipeline, with one message per IFS. The executor then waits
+# for the results of the commands (command_result), so steps on different RTU's run in parallel.
+# when a step fails, no new steps are started, and the steps that depend on it are skipped.
+#
+import time
+import uuid
+import json
+from urllib.parse import urlparse
+
+STEP_WAITING = "waiting"           # waiting for the steps it depends on
+STEP_RUNNING = "running"           # command sent, waiting for its result
+STEP_DONE = "done"                 # command completed or confirmed by the RTU
+STEP_FAILED = "failed"             # command failed, rejected or timed out
+STEP_INTERLOCKED = "interlocked"   # an interlock condition was not met, the command was not sent
+STEP_SKIPPED = "skipped"           # not started, as the sequence failed or was aborted
+
+SUCCESS_RESULTS = ("completed", "confirmed")
+
+
+# a command for an IFS, in the format of ifs_command:<IFS>
+def new_command(operation, element, value):
+    return {"id": uuid.uuid4().hex, "operation": operation, "element": element, "value": value, "created": time.time() * 1000}
+
+
+# check a sequence document, and return its steps with defaults, raises ValueError for an invalid sequence
+def get_steps(sequence):
+    steps = []
+    ids = set()
+    for index, step in enumerate(sequence.get("steps", [])):
+        step = dict(step)
+        step.setdefault("id", str(index))
+        if step["id"] in ids:
+            raise ValueError("duplicate step id: %s" % step["id"])
+        if step.get("operation") not in ("select", "operate"):
+            raise ValueError("invalid operation in step %s: %s" % (step["id"], str(step.get("operation"))))
+        if not "element" in step or not "value" in step:
+            raise ValueError("missing element or value in step %s" % step["id"])
+        if not "after" in step:
+            step["after"] = [steps[-1]["id"]] if len(steps) > 0 else []
+        step.setdefault("interlocks", [])
+        ids.add(step["id"])
+        steps.append(step)
+
+    # all dependencies should exist, and not form a cycle
+    done = set()
+    remaining = list(steps)
+    while len(remaining) > 0:
+        ready = [step for step in remaining if set(step["after"]) <= done]
+        if len(ready) == 0:
+            raise ValueError("unknown step, or a cycle, in 'after' of steps: %s" % ", ".join(step["id"] for step in remaining))
+        for step in ready:
+            done.add(step["id"])
+            remaining.remove(step)
+    return steps
+
+
+class SequenceExecutor:
+
+    def __init__(self, rt_db, sleep, emit, log_event, timeout=30):
+        self.rt_db = rt_db
+        self.sleep = sleep # sleep function that does not block the webserver, i.e. socketio.sleep
+        self.emit = emit # called with (event, data) to inform the browsers of the progress
+        self.log_event = log_event # called with (element, message, value) for each command, for the event log
+        self.timeout = timeout # seconds to wait for the result of a command
+        self.poll_interval = 0.01 # seconds between checks for results
+        self.waiting = set() # command id's of running steps
+        self.results = {} # command id -> result, received from the IFS
+        self.runs = {} # run id -> progress of a running sequence
+
+
+    # result of a command, from the command_result channel
+    def result(self, result):
+        if result.get("id") in self.waiting:
+            self.results[result["id"]] = result
+
+
+    def abort(self, run_id):
+        if run_id in self.runs:
+            self.runs[run_id]["aborted"] = True
+            return True
+        return False
+
+
+    def progress(self, run):
+        self.emit("sequence_progress", {key: value for key, value in run.items() if key != "aborted"})
+
+
+    # execute a sequence, returns the progress of the run when it is done
+    # this blocks until the sequence is done, so it should run in a background task
+    def run(self, sequence, run_id=None):
+        run = {
+            "id": run_id or uuid.uuid4().hex,
+            "name": sequence.get("name"),
+            "status": "running",
+            "steps": {},
+            "results": {},
+            "start": time.time() * 1000,
+            "duration_ms": None,
+            "aborted": False,
+        }
+        try:
+            steps = get_steps(sequence)
+        except ValueError as e:
+            run["status"] = "invalid: " + str(e)
+            self.progress(run)
+            return run
+
+        self.runs[run["id"]] = run
+        state = run["steps"]
+        for step in steps:
+            state[step["id"]] = STEP_WAITING
+        running = {} # command id -> (step, deadline)
+        failed = False
+        try:
+            while True:
+                changed = False
+                # steps that can not run anymore
+                for step in steps:
+                    if state[step["id"]] == STEP_WAITING and (failed == True or run["aborted"] == True or
+                            any(state[after] in (STEP_FAILED, STEP_INTERLOCKED, STEP_SKIPPED) for after in step["after"])):
+                        state[step["id"]] = STEP_SKIPPED
+                        changed = True
+
+                ready = [step for step in steps if state[step["id"]] == STEP_WAITING and all(state[after] == STEP_DONE for after in step["after"])]
+                if len(ready) > 0:
+                    sent = self.start_steps(ready, state, run["results"])
+                    for command_id, step in sent.items():
+                        running[command_id] = (step, time.monotonic() + self.timeout)
+                    if any(state[step["id"]] in (STEP_FAILED, STEP_INTERLOCKED) for step in ready):
+                        failed = True
+                    changed = True
+
+                for command_id, (step, deadline) in list(running.items()):
+                    result = self.results.pop(command_id, None)
+                    if result == None and time.monotonic() < deadline:
+                        continue
+                    del running[command_id]
+                    self.waiting.discard(command_id)
+                    if result == None:
+                        result = {"id": command_id, "result": "timeout"}
+                    run["results"][step["id"]] = result
+                    if result.get("result") in SUCCESS_RESULTS:
+                        state[step["id"]] = STEP_DONE
+                    else:
+                        state[step["id"]] = STEP_FAILED
+                        failed = True
+                    changed = True
+
+                if changed == True:
+                    self.progress(run)
+                if len(running) == 0 and not STEP_WAITING in state.values():
+                    break
+                self.sleep(self.poll_interval)
+        finally:
+            for command_id in running:
+                self.waiting.discard(command_id)
+                self.results.pop(command_id, None)
+            del self.runs[run["id"]]
+
+        if run["aborted"] == True:
+            run["status"] = "aborted"
+        elif all(value == STEP_DONE for value in state.values()):
+            run["status"] = "completed"
+        else:
+            run["status"] = "failed"
+        run["duration_ms"] = round(time.time() * 1000 - run["start"], 1)
+        self.progress(run)
+        return run
+
+
+    # check the interlocks of steps that are ready, and send their commands in one pipeline
+    # returns command id -> step, of the steps that wait for a result
+    def start_steps(self, steps, state, results):
+        # one MGET for the interlocks of all steps
+        datapoints = sorted(set(interlock["datapoint"] for step in steps for interlock in step["interlocks"]))
+        values = {}
+        if len(datapoints) > 0:
+            for datapoint, value in zip(datapoints, self.rt_db.mget(["data:" + datapoint for datapoint in datapoints])):
+                values[datapoint] = value.decode("utf-8") if value != None else None
+
+        # one HMGET for the IFS of all RTU's
+        rtus = sorted(set(urlparse(step["element"]).netloc for step in steps if step["element"].startswith("iec60870-5-104://")))
+        owners = {}
+        if len(rtus) > 0:
+            for rtu, ifs in zip(rtus, self.rt_db.hmget("ifs_rtu_owner", rtus)):
+                owners[rtu] = ifs.decode("utf-8") if ifs != None else None
+
+        commands = {} # IFS -> commands
+        sent = {}
+        pipe = self.rt_db.pipeline(transaction=False)
+        for step in steps:
+            blocked = [interlock for interlock in step["interlocks"] if values.get(interlock["datapoint"]) != str(interlock["value"])]
+            if len(blocked) > 0:
+                state[step["id"]] = STEP_INTERLOCKED
+                results[step["id"]] = {"result": "interlocked", "reason": "%s is %s, not %s" %
+                    (blocked[0]["datapoint"], str(values.get(blocked[0]["datapoint"])), str(blocked[0]["value"]))}
+                continue
+
+            command = new_command(step["operation"], step["element"], str(step["value"]))
+            uri = urlparse(step["element"])
+            if uri.scheme != "iec60870-5-104":
+                # static datapoints do not return a result
+                pipe.publish(step["operation"] + ":" + step["element"], command["value"])
+                state[step["id"]] = STEP_DONE
+            elif owners.get(uri.netloc) == None:
+                state[step["id"]] = STEP_FAILED
+                results[step["id"]] = {"result": "failed", "reason": "no IFS owns RTU %s" % uri.netloc}
+                continue
+            else:
+                commands.setdefault(owners[uri.netloc], []).append(command)
+                self.waiting.add(command["id"])
+                sent[command["id"]] = step
+                state[step["id"]] = STEP_RUNNING
+            self.log_event(step["element"], "control:" + step["operation"], command["value"])
+
+        for ifs, batch in commands.items():
+            pipe.publish("ifs_command:" + ifs, json.dumps(batch))
+        pipe.execute()
+        return sent
@@ -210,6 +210,11 @@ function init_mapelements(type){
     }
   });
 
+  //result of a command sent from this browser, with the timings of each step, shown in the control panel
+  socket.on('command_result', function (result) {
+    showCommandResult(result);
+  });
+
   //receive data from scada, and update items to display it(svg or geojson)
   socket.on('updateDataPoint', function (data) { 
     //console.log("called:" + data.toString());
@@ -649,6 +654,7 @@ function open_control(event,datapoint){
   sidebar._container.querySelector('#info_control_int').style.display = "none";
 
   sidebar._container.querySelector('#info_control').style.display = "block";
+  sidebar._container.querySelector('#info_command_result').innerHTML = "";
 
   //add value to control element
   //sidebar._container.querySelector('#control_element').value = control_element;
@@ -712,12 +718,40 @@ function open_control(event,datapoint){
 }
 
 //the actual operate functions
+function showCommandResult(result) {
+  let text = result['operation'] + " " + result['element'] + ": " + result['result'];
+  if(result['reason']){
+    text += " (" + result['reason'] + ")";
+  }
+  if(result['act_con_ms'] != null || result['act_term_ms'] != null || result['total_ms'] != null){
+    text += "<br>ACT_CON: " + (result['act_con_ms'] != null ? result['act_con_ms'] + " ms" : "-") +
+      ", ACT_TERM: " + (result['act_term_ms'] != null ? result['act_term_ms'] + " ms" : "-") +
+      ", total: " + (result['total_ms'] != null ? result['total_ms'] + " ms" : "-");
+  }
+  let element = sidebar._container.querySelector('#info_command_result');
+  element.className = "CommandResult_" + result['result'];
+  element.dataset.id = result['id'];
+  element.innerHTML = text;
+  console.log(text);
+}
+
+function commandSent(element, operation) {
+  return function (id) {
+    let result = sidebar._container.querySelector('#info_command_result');
+    if(id && result.dataset.id != id){ //the result can arrive before the id
+      result.dataset.id = id;
+      result.className = "CommandResult_sent";
+      result.innerHTML = operation + " " + element + ": sent";
+    }
+  };
+}
+
 function select(element, value) {
-  socket.emit('publish', {'operation': 'select', 'element': element, 'value': value});
+  socket.emit('publish', {'operation': 'select', 'element': element, 'value': value}, commandSent(element, 'select'));
 }
 
 function operate(element, value) {
-  socket.emit('publish', {'operation': 'operate', 'element': element, 'value': value});
+  socket.emit('publish', {'operation': 'operate', 'element': element, 'value': value}, commandSent(element, 'operate'));
 }
 
 function cancel(element) {
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+# Value bus on a redis stream, that replaces keyspace notifications of the data:<point> keys
+# each update of a datapoint is appended to the stream as (point, value, quality, ts), next to its key.
+# consumers read the stream in batches with a consumer group, so an update is not lost while a consumer
+# is slow or restarting, and the value does not have to be read again with GET. The group name should be
+# stable over restarts (not the hostname of a container), the updates of a group that is gone are lost.
+# A consumer takes over the pending updates of consumers of its group that are gone (i.e. a previous
+# container with another hostname), so these are not lost either
+#
+# this file is shared between the ifs, modbus_ifs, static_dataprovider, solver and client, and should be kept identical
+#
+import time
+import redis
+
+STREAM = "data_stream"
+STREAM_MAXLEN = 100000 # approximate amount of entries kept in the stream, older entries are trimmed
+
+
+# append an update to the stream, rt_db can be a redis client or pipeline
+def add_value(rt_db, point, value, quality=0, timestamp=None):
+    if timestamp == None:
+        timestamp = int(time.time() * 1000)
+    rt_db.xadd(STREAM, {'point': point, 'value': value, 'quality': quality, 'ts': timestamp},
+        maxlen=STREAM_MAXLEN, approximate=True)
+
+
+class StreamConsumer:
+
+    def __init__(self, rt_db, group, consumer, count=1000, claim_idle=60000):
+        self.rt_db = rt_db
+        self.group = group # each group receives all updates, consumers within a group divide them
+        self.consumer = consumer
+        self.count = count # maximum updates per read
+        self.pending = True # first read updates that were delivered, but not acknowledged before a restart
+        try:
+            rt_db.xgroup_create(STREAM, group, id='$', mkstream=True)
+        except redis.exceptions.ResponseError as e:
+            if not "BUSYGROUP" in str(e): # the group already exists
+                raise
+        self.claim(claim_idle)
+
+
+    # take over the updates that were delivered to other consumers of the group, but not acknowledged for
+    # min_idle ms, and remove the consumers that are idle for min_idle ms without pending updates
+    # returns the amount of updates taken over, they are read first as pending updates of this consumer
+    def claim(self, min_idle):
+        claimed = 0
+        start = '0-0'
+        while True:
+            result = self.rt_db.xautoclaim(STREAM, self.group, self.consumer, min_idle, start_id=start, count=self.count)
+            start = result[0]
+            claimed += len(result[1])
+            if start in (b'0-0', '0-0'):
+                break
+        for item in self.rt_db.xinfo_consumers(STREAM, self.group):
+            name = item['name'].decode("utf-8") if isinstance(item['name'], bytes) else item['name']
+            if name != self.consumer and item['pending'] == 0 and item['idle'] >= min_idle:
+                self.rt_db.xgroup_delconsumer(STREAM, self.group, name)
+        if claimed > 0:
+            self.pending = True
+        return claimed
+
+
+    # read a batch of updates, and call handler with a list of (point, value, quality, ts)
+    # the updates are acknowledged when handler returns. block is the maximum time in ms to wait, None does not wait
+    # returns the amount of updates
+    def read(self, handler, block=None):
+        result = None
+        if self.pending == True:
+            result = self.rt_db.xreadgroup(self.group, self.consumer, {STREAM: '0'}, count=self.count)
+            if not result or len(result[0][1]) == 0:
+                self.pending = False
+        if self.pending == False:
+            result = self.rt_db.xreadgroup(self.group, self.consumer, {STREAM: '>'}, count=self.count, block=block)
+
+        ids = []
+        updates = []
+        for stream, entries in result or []:
+            for id, fields in entries:
+                ids.append(id)
+                if fields: # trimmed entries that were still pending have no fields
+                    updates.append((fields[b'point'].decode("utf-8"), fields[b'value'].decode("utf-8"),
+                        int(fields[b'quality']), int(fields[b'ts'])))
+        if len(ids) == 0:
+            return 0
+
+        handler(updates)
+        self.rt_db.xack(STREAM, self.group, *ids)
+        return len(updates)
+
+
+# remove the consumer groups with a name starting with prefix, except keep, of which all consumers are idle
+# for max_idle ms, i.e. groups named after the hostname of a container that was replaced
+# returns the names of the removed groups
+def remove_stale_groups(rt_db, prefix, keep, max_idle):
+    removed = []
+    for group in rt_db.xinfo_groups(STREAM):
+        name = group['name'].decode("utf-8") if isinstance(group['name'], bytes) else group['name']
+        if name == keep or not name.startswith(prefix):
+            continue
+        consumers = rt_db.xinfo_consumers(STREAM, name)
+        if all(item['idle'] >= max_idle for item in consumers):
+            rt_db.xgroup_destroy(STREAM, name)
+            removed.append(name)
+    return removed
@@ -2,20 +2,70 @@
 
 import os
 import time
+import math
 import sys
+import json
+import threading
 import logging
+from urllib.parse import urlparse
 import redis
-import libiec60870client
+from redisbatch import RedisBatchWriter
+from hashring import HashRing
+from deadband import DeadbandFilter
+from scaling import ValueScaler
+from pointtable import PointTable
+from capture import CaptureWriter
+from commandtracker import RESULT_FAILED
+from timerwheel import TimerWheel
 
 import pymongo
 
-from influxdb_client import InfluxDBClient, Point
+from influxdb_client import InfluxDBClient
 from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_writer import InfluxDBBatchWriter
 
-IFS_NAME = "IFS_A"
-LIMIT = 100
+IFS_NAME = os.environ.get('IFS_NAME', "IFS_A")
+LIMIT = int(os.environ.get('IFS_RTU_LIMIT', 100)) # maximum RTU's per IFS instance
 update_datapoint = None
 value_bucket = "bucket_1"
+redis_writer = None
+influxdb_writer = None
+rtu_names = {} # connection tuple (host:port) to RTU name as configured in dataprovider_list
+command_routes = {} # RTU name -> connection tuple, of the RTU's of this IFS, to route commands of ifs_command:<IFS_NAME>
+ifs_members = {} # IFS name -> last heartbeat (monotonic time) of all IFS instances
+ring = HashRing()
+deadband_filter = DeadbandFilter()
+value_scaler = ValueScaler()
+capture_writer = None
+unserved_rtus = [] # RTU's that do not fit on any IFS instance, as published in ifs_rtu_unserved
+member_limits = {} # IFS name -> RTU limit of the instances online, as published in ifs_rtu_limit
+local_points = {} # rtu -> PointTable, for datapoints set by the IFS itself (i.e. RTU status)
+rtu_apci = {} # RTU -> APCI parameters (k, w, t0-t3) as configured in dataprovider_list
+rtu_gi_schedule = {} # RTU -> periodic GI's {qoi: interval in seconds} as configured in dataprovider_list
+rtu_frames = {} # connection tuple -> (i_received, s_sent, monotonic time) at the last publish_stats
+command_latency = {} # RTU -> histogram of command round trips, counts per COMMAND_LATENCY_BUCKETS, and above
+command_latency_lock = threading.Lock()
+
+# batching of realtime db writes, values received within the flush interval are written in one pipeline
+REDIS_FLUSH_INTERVAL = float(os.environ.get('IFS_REDIS_FLUSH_INTERVAL', 0.05)) # seconds, 0 writes each ASDU immediately
+REDIS_BATCH_SIZE = int(os.environ.get('IFS_REDIS_BATCH_SIZE', 1000)) # max keys per MSET
+# batching of historical db writes, values are queued and written by a background thread
+INFLUXDB_BATCH_SIZE = int(os.environ.get('IFS_INFLUXDB_BATCH_SIZE', 500)) # max records per write
+INFLUXDB_FLUSH_INTERVAL = float(os.environ.get('IFS_INFLUXDB_FLUSH_INTERVAL', 1.0)) # seconds
+INFLUXDB_QUEUE_SIZE = int(os.environ.get('IFS_INFLUXDB_QUEUE_SIZE', 100000)) # records buffered in memory
+INFLUXDB_SPILL_FILE = os.environ.get('IFS_INFLUXDB_SPILL_FILE', "./influxdb_spill.lp") # records buffered on disk while influxdb is down
+STATS_INTERVAL = 10 # seconds between publishing IFS statistics
+COMMAND_LATENCY_BUCKETS = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000) # ms, upper bounds of the command round trip histogram
+POLL_INTERVAL = 0.1 # seconds between processing RTU timers, events are processed directly
+HEARTBEAT_INTERVAL = 1 # seconds between watchdog signals and configuration checks
+WATCH_RETRY_INTERVAL = 5 # seconds before a failed watch of a mongodb collection is restarted
+MEMBER_TIMEOUT = 5 # seconds without heartbeat before an IFS is considered gone, and its RTU's are claimed by others
+MAX_PENDING_CONNECTIONS = int(os.environ.get('IFS_MAX_PENDING_CONNECTIONS', 10)) # RTU's connecting at the same time
+IFS_BACKEND = os.environ.get('IFS_BACKEND', "lib60870") # IEC104 implementation: lib60870 (C library) or asyncio (pure python)
+IFS_WORKERS = int(os.environ.get('IFS_WORKERS', 2)) # threads that process received values, decoupled from the receiving threads
+IFS_MAX_GI = int(os.environ.get('IFS_MAX_GI', 4)) # General Interrogations in progress at the same time
+IFS_GI_JITTER = float(os.environ.get('IFS_GI_JITTER', 2)) # seconds, maximum random delay of a GI after an RTU connected
+IFS_CAPTURE_FILE = os.environ.get('IFS_CAPTURE_FILE', "") # file to record all received APDU's in, for replay.py. empty disables capturing
 
 # CP16Time2a - milisecond(int)
 # CP24Time2a - milisecond(int), minute(int), invalid(bool), substitute(bool)
@@ -23,40 +73,6 @@ value_bucket = "bucket_1"
 # CP56Time2a - milisecond(int), minute(int), hour(int), summertime(bool), dayofweek(int), (dayofmonth), year(int), invalid(bool), substitute(bool)
 # only CP56Time2a should be used in IEC60870-5-104
 
-def getAsduName(datatype):
-    if datatype == 1:
-        return "SinglePointInformation" # 	            M_SP_NA_1; 1 (bool)
-    if datatype == 3:
-        return "DoublePointInformation" #	            M_DP_NA_1; 3 (2 bits enum)
-    if datatype == 7:
-        return "BitString32" #                          M_BO_NA_1; 7 (bits, max 32 bits )
-    if datatype == 9:
-        return "MeasuredValueNormalized" #              M_ME_NA_1; 9 (float normalized value between -1 and 1)
-    if datatype == 11:
-        return "MeasuredValueScaled" #		            M_ME_NB_1; 11 (int between -32.768 and 32.767)
-    if datatype == 13:
-        return "MeasuredValueShort" #                   M_ME_NC_1; 13 (float value)
-    if datatype == 35:
-        return "MeasuredValueScaled_CP56Time2a" #       M_ME_TE_1; 35 (int between -32.768 and 32.767 with timestamp)
-    if datatype == 45:
-        return "SinglePointCommand" #		            C_SC_NA_1; 45 (bool)
-    if datatype == 46:
-        return "DoublePointCommand" #		            C_DC_NA_1; 46 (2 bits enum)
-    if datatype == 47:        
-        return "RegulatingStepCommand" #                C_RC_NA_1; 47 (0=invalid, 1=lower, 2=higher, 3=invalid)
-    if datatype == 48:
-        return "SetpointCommandNormalized" #            C_SE_NA_1; 48 (float normalized value between -1 and 1)
-    if datatype == 49:
-        return "SetpointCommandScaled" #                C_SE_NB_1; 49 (int between -32.768 and 32.767)
-    if datatype == 50:
-        return "SetpointCommandShort" #                 C_SE_NC_1; 50 (float value)
-    if datatype == 51:
-        return "BitstringCommand" #                     C_BO_NA_1; 51 (bits, max 32 bits )
-    if datatype == 107:
-        return "TestCommand_CP56Time2a" #	            C_TS_TA_1; 107
-    if datatype == 256:
-        return "status" #	                            RTU status type, not mapped in IEC60870 standard, used for device status datapoint in IFS
-
 datatypes_match = {
     "SinglePointCommand": "SinglePointInformation",
     "DoublePointCommand": "DoublePointInformation",
@@ -79,45 +95,214 @@ datatypes_match = {
 #    }
 #    scada_database.data_timeseries.insert_one(data)
 
-def update_datapoint_influxdb(rtu, ioa, ASDU, value):
-    global influxdb_write_api
-    id = "iec60870-5-104://" + rtu + "/" + getAsduName(ASDU) + "/" + str(ioa)
-
-    p = Point("datapoint").tag("id", id).tag("quality", "good").field("value", int(value))
-    influxdb_write_api.write(bucket=value_bucket, record=p)
-    return
-
-
-def callback(tupl, data):
-    global rt_db
-    logger.debug("RTU:" + tupl + " - update:" + str(data))
-    for key, value in data.items():
-        set_data(tupl,value['ASDU'],key, value['value'])
+# IEC60870 quality descriptor to the quality tag stored with a value
+def quality_name(quality):
+    if quality == 0:
+        return "good"
+    if quality & 0x80: # IV
+        return "invalid"
+    return "questionable" # OV, BL, SB or NT set
+
+
+# value as stored in the realtime db: integers as before, floats (i.e. scaled values) without truncation
+def store_value(value):
+    if isinstance(value, float) and not value.is_integer():
+        return value
+    return int(value)
+
+
+# write a point as line protocol, with the series key precomputed in the point
+# value is the (scaled) value of the point, the field value stays an integer, as influxdb does not
+# allow the type of a field to change, floats are also stored in the field value_float
+def update_datapoint_influxdb(point, value):
+    global influxdb_writer
+    if point.timestamp != None: # source timestamp of the RTU in ms
+        timestamp = point.timestamp * 1000000
+    else:
+        timestamp = time.time_ns()
+    if isinstance(value, float):
+        # nan and inf have no integer value, and are not accepted by influxdb, they are only stored in the realtime db
+        if not math.isfinite(value):
+            logger.warning("value %r of %s not stored in influxdb" % (value, point.id))
+            return
+        influxdb_writer.write(value_bucket, "%s,quality=%s value=%ii,value_float=%r %i" % (point.series_key, quality_name(point.quality), int(value), value, timestamp))
+    else:
+        influxdb_writer.write(value_bucket, "%s,quality=%s value=%ii %i" % (point.series_key, quality_name(point.quality), int(value), timestamp))
+
+
+def callback(tupl, points):
+    global redis_writer
+    logger.debug("RTU:" + tupl + " - update:" + str(points))
+    # collect all values of this ASDU, so they are written to the realtime db as one batch
+    updates = []
+    now = time.monotonic()
+    # convert all values of the ASDU to engineering units at once
+    values = value_scaler.convert([point.id for point in points], [point.value for point in points])
+    for point, value in zip(points, values):
+        # skip values within the deadband of this datapoint
+        if deadband_filter.accept(point.id, value, point.quality, now) == False:
+            continue
+        updates.append((point.redis_key, store_value(value), point.quality, point.timestamp))
+        # push timeseries data to time series db 
+        update_datapoint(point, value)
+    if len(updates) > 0:
+        redis_writer.update_many(updates)
 
         
 def set_data(rtu,ASDU,key,value):
+    if not rtu in local_points:
+        local_points[rtu] = PointTable(rtu)
+    point = local_points[rtu].update(ASDU, key, value)
     # push to realtime db
-    rt_db.set("data:iec60870-5-104://"+rtu+"/"+getAsduName(ASDU)+"/"+str(key), int(value))# {rtu, type, ioa}{value, timestamp, quality}
+    redis_writer.set(point.redis_key, int(value))# {rtu, type, ioa}{value, timestamp, quality}
     # push timeseries data to time series db 
-    update_datapoint(rtu, key, ASDU, value)
-
-
-def operate_handler(message):
-    global iecclient
-    logger.debug("> operate:"+str(message))
-    # TODO: try/catch for int conversion
-    iecclient.operate(message['channel'][8:].decode("utf-8") , int(message['data'].decode("utf-8")) )
+    update_datapoint(point, value)
+
+
+# publish counters of this IFS in the realtime db, as ifs_stats:<IFS_NAME>
+def publish_stats():
+    stats = {}
+    for key, value in redis_writer.stats.items():
+        stats["redis_" + key] = value
+    for key, value in influxdb_writer.stats.items():
+        stats["influxdb_" + key] = value
+    stats["influxdb_queue_depth"] = influxdb_writer.queue_depth()
+    for key, value in iecclient.queue.stats.items():
+        stats["handoff_" + key] = value
+    stats["handoff_queue_depth"] = iecclient.queue.depth()
+    for key, value in iecclient.gi.stats.items():
+        stats["gi_" + key] = value
+    if capture_writer != None:
+        for key, value in capture_writer.stats.items():
+            stats["capture_" + key] = value
+    for key, value in deadband_filter.stats.items():
+        stats["deadband_" + key] = value
+    for key, value in value_scaler.stats.items():
+        stats["scaling_" + key] = value
+    rt_db.hset("ifs_stats:" + IFS_NAME, mapping=stats)
+    publish_rtu_stats()
+
+
+# publish the throughput per RTU since the last call, as ifs_rtu_stats:<IFS_NAME>
+# a low S frame ratio means the RTU sends many I frames per acknowledgement (w is used well)
+def publish_rtu_stats():
+    now = time.monotonic()
+    stats = {}
+    for tupl, rtu in list(iecclient.connections.items()):
+        i_received = rtu["i_received"]
+        s_sent = rtu["s_sent"]
+        if tupl in rtu_frames:
+            last_i, last_s, last_time = rtu_frames[tupl]
+            i_frames = i_received - last_i
+            name = rtu_names.get(tupl, tupl)
+            stats[name + ".i_frames_per_s"] = round(i_frames / max(now - last_time, 0.001), 1)
+            stats[name + ".s_frame_ratio"] = round((s_sent - last_s) / i_frames, 3) if i_frames > 0 else 0
+        rtu_frames[tupl] = (i_received, s_sent, now)
+    for tupl in list(rtu_frames):
+        if not tupl in iecclient.connections:
+            del rtu_frames[tupl]
+    rt_db.delete("ifs_rtu_stats:" + IFS_NAME)
+    if len(stats) > 0:
+        rt_db.hset("ifs_rtu_stats:" + IFS_NAME, mapping=stats)
+
+    # command round trips per RTU, counted since the start of the IFS
+    histograms = {}
+    with command_latency_lock:
+        for rtu, histogram in command_latency.items():
+            for i, bucket in enumerate(COMMAND_LATENCY_BUCKETS):
+                histograms["%s.le_%i" % (rtu, bucket)] = histogram[i]
+            histograms[rtu + ".le_inf"] = histogram[len(COMMAND_LATENCY_BUCKETS)]
+    if len(histograms) > 0:
+        rt_db.hset("ifs_command_latency:" + IFS_NAME, mapping=histograms)
+
+
+# commands for the RTU's of this IFS, published by the client on ifs_command:<IFS_NAME> as json
+# {"operation": "select"|"operate"|"cancel", "element": "iec60870-5-104://<rtu>/<type>/<ioa>", "value": "1"}
+# or a list of commands (i.e. the steps of a switching sequence that start at the same moment)
+def command_handler(message):
+    logger.debug("> command:"+str(message['data']))
+    try:
+        commands = json.loads(message['data'])
+    except ValueError as e:
+        logger.error("invalid command: %s (%s)" % (str(message['data']), str(e)))
+        return
+    if not isinstance(commands, list):
+        commands = [commands]
+    for command in commands:
+        handle_command(command)
 
 
-def select_handler(message):
+def handle_command(command):
     global iecclient
-    logger.debug("> select:"+str(message))
-    # TODO: try/catch for int conversion
-    iecclient.select(message['channel'][7:].decode("utf-8") , int(message['data'].decode("utf-8")) )
+    try:
+        operation = command['operation']
+        element = command['element']
+        uri = urlparse(element)
+    except (KeyError, TypeError, AttributeError) as e:
+        logger.error("invalid command: %s (%s)" % (str(command), str(e)))
+        return
+    command['received'] = time.time() * 1000
+    if operation == "cancel":
+        return
+    if uri.scheme != "iec60870-5-104" or not uri.netloc in command_routes:
+        logger.warning("no route for command %s to %s" % (operation, element))
+        command_result(command_failed(command, "no route to RTU"))
+        return
 
-def cancel_handler(message):
-    global iecclient
-    logger.debug("> cancel:"+str(message))
+    try:
+        value = int(command['value'])
+    except (ValueError, KeyError, TypeError):
+        logger.error("invalid value in command %s to %s: %s" % (operation, element, str(command.get('value'))))
+        command_result(command_failed(command, "invalid value"))
+        return
+    if operation == "select":
+        sent = iecclient.select(element, value, command)
+    elif operation == "operate":
+        sent = iecclient.operate(element, value, command)
+    else:
+        logger.error("unknown operation in command to %s: %s" % (element, operation))
+        command_result(command_failed(command, "unknown operation"))
+        return
+    if sent == 0:
+        command_result(command_failed(command, "RTU not active, or could not send"))
+
+
+# result of a command that did not reach the RTU, in the format of commandtracker.py
+def command_failed(command, reason):
+    return {
+        "id": command.get("id"),
+        "operation": command.get("operation"),
+        "element": command.get("element"),
+        "value": command.get("value"),
+        "rtu": urlparse(command.get("element", "")).netloc,
+        "result": RESULT_FAILED,
+        "reason": reason,
+        "ui_to_ifs_ms": None,
+        "act_con_ms": None,
+        "act_term_ms": None,
+        "total_ms": None,
+    }
+
+
+# publish the result of a command for the client on command_result, and count the round trip to the RTU
+def command_result(result):
+    result["rtu"] = rtu_names.get(result["rtu"], result["rtu"])
+    logger.info("command %s %s to %s: %s" % (str(result["id"]), str(result["operation"]), str(result["element"]), result["result"]))
+    rt_db.publish("command_result", json.dumps(result))
+    latency = result["act_term_ms"] if result["act_term_ms"] != None else result["act_con_ms"]
+    if latency == None:
+        return
+    rtu = result["rtu"]
+    with command_latency_lock:
+        if not rtu in command_latency:
+            command_latency[rtu] = [0] * (len(COMMAND_LATENCY_BUCKETS) + 1)
+        histogram = command_latency[rtu]
+        for i, bucket in enumerate(COMMAND_LATENCY_BUCKETS):
+            if latency <= bucket:
+                histogram[i] += 1
+                break
+        else:
+            histogram[len(COMMAND_LATENCY_BUCKETS)] += 1
 
 
 def ifs_status(message):
@@ -125,64 +310,136 @@ def ifs_status(message):
         logger.info("status ifs:"+str(message))
 
 
-def get_RTU(rtu):
-    global iecclient
+# heartbeat of any IFS instance, used to divide the RTU's over the instances that are online
+def ifs_heartbeat(message):
+    ifs_members[message['data'].decode("utf-8")] = time.monotonic()
+
+
+def get_live_members():
+    now = time.monotonic()
+    members = set([IFS_NAME])
+    for ifs, lastseen in list(ifs_members.items()):
+        if now - lastseen < MEMBER_TIMEOUT:
+            members.add(ifs)
+    return members
+
+
+# the RTU limit of each instance, published by the instances in the redis hash ifs_rtu_limit before their
+# heartbeat, so all instances divide the RTU's with the same limits. an instance without limit gets no RTU's
+def get_member_limits(members):
+    members = sorted(members)
+    limits = {}
+    for ifs, limit in zip(members, rt_db.hmget("ifs_rtu_limit", members)):
+        try:
+            limits[ifs] = int(limit)
+        except (TypeError, ValueError):
+            limits[ifs] = 0
+    return limits
+
+
+def split_RTU(rtu):
     _rtu = rtu.split(":")
     ip = _rtu[0]
     if len(_rtu) > 1:
         port = int(_rtu[1])
     else:
         port = 2404
+    return ip, port
 
-    return iecclient.getRTU(ip, port)
+
+# register RTU, the connection is managed by iecclient.poll()
+def add_RTU(rtu):
+    global iecclient
+    ip, port = split_RTU(rtu)
+    tupl = iecclient.addRTU(ip, port, rtu_apci.get(rtu), rtu_gi_schedule.get(rtu))
+    rtu_names[tupl] = rtu
+    command_routes[rtu] = tupl
+    return tupl
 
 
 def remove_RTU(rtu):
     global iecclient
-    _rtu = rtu.split(":")
-    ip = _rtu[0]
-    if len(_rtu) > 1:
-        port = int(_rtu[1])
-    else:
-        port = 2404
-
+    command_routes.pop(rtu, None)
+    ip, port = split_RTU(rtu)
     return iecclient.removeRTU(ip, port)
 
 
-# send a testframe
-def testframe(rtu):
-    global iecclient
-    _rtu = rtu.split(":")
-    ip = _rtu[0]
-    if len(_rtu) > 1:
-        port = int(_rtu[1])
+# called from iecclient.poll() when an RTU connected (STARTDT done), or lost its connection
+def rtu_state_changed(tupl, online):
+    rtu = rtu_names.get(tupl, tupl)
+    if online == True:
+        logger.info("RTU connected:"+rtu)
+        rt_db.set('connections:'+rtu+".active", b'1')
+        set_data(rtu,256,1, 1) # set status datapoint to online, if we were not connected, and now are
     else:
-        port = 2404
-
-    return iecclient.testframe(ip,port)
+        logger.info("RTU disconnected:"+rtu)
+        rt_db.set("connections:"+rtu+".active", b'0')
+        set_data(rtu,256,1, 0) # set status datapoint to offline, if we were connected, and now are not
 
 
-# retrieve RTU's from mongodb
-def get_RTU_list():
+# retrieve RTU's from mongodb, with the IFS they are assigned to
+def get_RTU_config():
+    global scada_database
+    config = {}
+    cursor = scada_database.dataprovider_list.find({"enabled": 1}) # dataprovider is for this type of IFS an RTU
+    for item in cursor:
+        if item.get("type", "iec60870-5-104") != "iec60870-5-104":
+            continue
+        config[item['dataprovider']] = item.get("IFS", "")
+        rtu_apci[item['dataprovider']] = item.get("apci")
+        rtu_gi_schedule[item['dataprovider']] = item.get("gi_schedule")
+    return config
+
+
+# the RTU's this IFS should connect to. An RTU assigned to an IFS that is online belongs to that IFS, all
+# other RTU's (IFS field empty, "auto", or an IFS that is offline) are divided by consistent hashing, with at
+# most the limit of each instance: the RTU's a full instance cannot take go to the next instance on the ring.
+# RTU's that do not fit on any instance are logged, and published in the redis set ifs_rtu_unserved
+def get_RTU_list(config, members, limits):
+    global unserved_rtus
+    fixed = dict((rtu, ifs) for rtu, ifs in config.items() if ifs in members)
+    owners = ring.assign(config, limits, fixed)
+    unserved = sorted(rtu for rtu, owner in owners.items() if owner == None)
+    if unserved != unserved_rtus:
+        if len(unserved) > 0:
+            logger.error("too much RTU's for the IFS instances online. limits: %s, %i RTU's not connected: %s" %
+                (str(limits), len(unserved), ", ".join(unserved)))
+        pipe = rt_db.pipeline()
+        pipe.delete("ifs_rtu_unserved")
+        if len(unserved) > 0:
+            pipe.sadd("ifs_rtu_unserved", *unserved)
+        pipe.execute()
+        unserved_rtus = unserved
+    return [rtu for rtu in sorted(owners) if owners[rtu] == IFS_NAME]
+
+
+# retrieve deadband and scaling configuration per datapoint from mongodb
+def load_datapoint_config():
     global scada_database
-    cursor = scada_database.dataprovider_list.find({"enabled": 1, "IFS": IFS_NAME}).distinct('dataprovider') # dataprovider is for this type of IFS an RTU
-    if len(cursor) > LIMIT:
-        logger.error("too much RTU's for this IFS. limit: %i, found: %i" % (LIMIT, len(cursor)))
-    return cursor[:LIMIT]
+    documents = list(scada_database.datapoint_config.find({"datapoint": {"$regex": "^iec60870-5-104://"}}))
+    count = deadband_filter.load(documents)
+    logger.info("loaded deadband configuration for %i datapoints" % count)
+    count = value_scaler.load(documents)
+    logger.info("loaded scaling configuration for %i datapoints" % count)
 
 
 # watch for changes in mongodb
-def mongo_watch_changes(stream):
-    if stream.alive:
-        change = stream.try_next()
-        # Note that the ChangeStream's resume token may be updated
-        # even when no changes are returned.
-        logger.debug("Current resume token: %r" % (stream.resume_token,))
-        if change is not None:
-            logger.debug("Change document: %r" % (change,))
-            return True
-        else:
-            return False
+# watch a collection in mongodb for changes, in a thread. the watch blocks until there is a change,
+# which sets changed, and wakes up the main loop, so changes are applied directly
+def watch_collection(collection, changed, wakeup):
+    while True:
+        try:
+            with collection.watch() as stream:
+                # changes before the watch started, or while it was down, are not in the stream
+                changed.set()
+                wakeup.set()
+                for change in stream:
+                    logger.debug("Change document: %r" % (change,))
+                    changed.set()
+                    wakeup.set()
+        except pymongo.errors.PyMongoError as e:
+            logger.error("mongodb: watch of %s failed: %s" % (collection.name, str(e)))
+        time.sleep(WATCH_RETRY_INTERVAL)
 
 
 
@@ -242,9 +499,11 @@ if __name__ == '__main__':
     try:
         rt_db = redis.Redis(host=redis_host, port=6379, password=redis_password)
         logger.info("connected to redis")
-        #subscribe redis events for select/operate
+        redis_writer = RedisBatchWriter(rt_db, REDIS_FLUSH_INTERVAL, REDIS_BATCH_SIZE)
+        redis_writer.start()
+        #subscribe redis events for select/operate, one channel for all RTU's of this IFS
         call_p = rt_db.pubsub()
-        call_p.subscribe(**{ "ifs_status": ifs_status })
+        call_p.subscribe(**{ "ifs_status": ifs_status, "ifs_status_online": ifs_heartbeat, "ifs_command:" + IFS_NAME: command_handler })
         thread = call_p.run_in_thread(sleep_time=0.001)
     except:
         logger.error("there is an issue with redis db")
@@ -256,72 +515,116 @@ if __name__ == '__main__':
                 token=influxdb_api, 
                 org=influxdb_org)
         influxdb_write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
+        influxdb_writer = InfluxDBBatchWriter(influxdb_write_api, influxdb_org,
+                batch_size=INFLUXDB_BATCH_SIZE,
+                flush_interval=INFLUXDB_FLUSH_INTERVAL,
+                queue_size=INFLUXDB_QUEUE_SIZE,
+                spill_file=INFLUXDB_SPILL_FILE)
+        influxdb_writer.start()
     except:
         logger.error("there is an issue with influxdb")
         exit(-1)
 
 
     logger.info("init")
-    iecclient = libiec60870client.IEC60870_5_104_client(callback)
+    # both backends have the same interface, the library is only loaded when it is used
+    if IFS_BACKEND == "asyncio":
+        import iec104asyncio
+        iecclient = iec104asyncio.IEC60870_5_104_client(callback, rtu_state_changed, MAX_PENDING_CONNECTIONS, IFS_WORKERS,
+                IFS_MAX_GI, IFS_GI_JITTER)
+    else:
+        import libiec60870client
+        iecclient = libiec60870client.IEC60870_5_104_client(callback, rtu_state_changed, MAX_PENDING_CONNECTIONS, IFS_WORKERS,
+                IFS_MAX_GI, IFS_GI_JITTER)
+    logger.info("using %s backend" % IFS_BACKEND)
+    if IFS_CAPTURE_FILE != "":
+        capture_writer = CaptureWriter(IFS_CAPTURE_FILE)
+        iecclient.raw_handler = capture_writer.write
+        logger.info("capturing received APDU's in %s" % IFS_CAPTURE_FILE)
+    iecclient.command_callback = command_result
     update_datapoint = update_datapoint_influxdb #update_datapoint_mongodb
 
-    rtu_list = get_RTU_list() 
-    logger.info("rtus:" + str(rtu_list) )
-    
-    stream = scada_database.dataprovider_list.watch()
-
-    #reset all RTU's
-    for rtu in rtu_list:
-        rt_db.set("connections:"+rtu+".active", b'0')
-        set_data(rtu,256,1, 0) # set status datapoint to offline, if we initialise the RTU
-
-    logger.info("init done: %s" % str(rtu_list))
-
+    rtu_config = get_RTU_config()
+    rtu_list = []
+    load_datapoint_config()
+
+    # changes in mongodb are watched by threads, that wake up the main loop
+    dataprovider_changed = threading.Event()
+    datapoint_config_changed = threading.Event()
+    for collection, changed in ((scada_database.dataprovider_list, dataprovider_changed), (scada_database.datapoint_config, datapoint_config_changed)):
+        threading.Thread(target=watch_collection, args=(collection, changed, iecclient.wakeup), daemon=True).start()
+
+    logger.info("init done, %s waiting for other IFS instances" % IFS_NAME)
+
+    # jobs of the main loop, in a timer wheel like the timers of the RTU's
+    jobs = TimerWheel()
+    now = time.monotonic()
+    jobs.schedule("heartbeat", now)
+    jobs.schedule("stats", now + STATS_INTERVAL)
+    jobs.schedule("claim", now + 2 * HEARTBEAT_INTERVAL) # allow heartbeats of other instances to arrive, before claiming RTU's
+    claimed = False
     while True:
-        time.sleep(1)
-        # watchdog signal
-        rt_db.publish("ifs_status_online",IFS_NAME)
-        # watch datapoint table in mongo for additions/removals (add/remove RTU on update)
-        if mongo_watch_changes(stream) == True:
-            new_rtu_list = get_RTU_list() 
+        # sleep until an RTU event or a configuration change, or the next poll
+        iecclient.wakeup.wait(POLL_INTERVAL)
+        iecclient.wakeup.clear()
+        # connect, testframe and reconnect the RTU's that have an event or an expired timer, and schedule GI's, this does not block
+        iecclient.poll()
+
+        rebalance = False
+        now = time.monotonic()
+        for job in jobs.expired(now):
+            if job == "heartbeat":
+                jobs.schedule("heartbeat", now + HEARTBEAT_INTERVAL)
+                # watchdog signal, also used by the other IFS instances to see this instance is online
+                rt_db.hset("ifs_rtu_limit", IFS_NAME, LIMIT)
+                rt_db.publish("ifs_status_online",IFS_NAME)
+                if capture_writer != None:
+                    capture_writer.flush()
+                # rebalance RTU's if an IFS instance joined or disappeared, or restarted with another limit
+                members = get_live_members()
+                limits = get_member_limits(members)
+                if members != ring.members or limits != member_limits:
+                    logger.info("IFS instances online: %s" % str(limits))
+                    ring.set_members(members)
+                    member_limits = limits
+                    rebalance = True
+            elif job == "stats":
+                jobs.schedule("stats", now + STATS_INTERVAL)
+                publish_stats()
+            elif job == "claim":
+                claimed = True
+                rebalance = True
+
+        # datapoint configuration changed in mongo, reload the deadbands and scaling
+        if datapoint_config_changed.is_set():
+            datapoint_config_changed.clear()
+            load_datapoint_config()
+
+        # datapoint table changed in mongo, for additions/removals (add/remove RTU on update)
+        if dataprovider_changed.is_set():
+            dataprovider_changed.clear()
+            rtu_config = get_RTU_config()
+            rebalance = True
+            # apply changed APCI parameters of the RTU's we keep on their next connect, and GI schedules directly
+            for rtu in rtu_list:
+                add_RTU(rtu)
+
+        if rebalance == True and claimed == True:
+            new_rtu_list = get_RTU_list(rtu_config, ring.members, member_limits)
             # check if new_list removed some connections, if so disconnect that RTU
             remove = set(list(rtu_list)) - set(list(new_rtu_list))
             for rem_rtu in remove:
                 logger.info("removing RTU:" + rem_rtu)
-                set_data(rem_rtu,256,1, 0) # set status datapoint to offline, if we remove the RTU
                 remove_RTU(rem_rtu)
-                rem_oper = "operate:%s" % ("iec60870-5-104://" + rem_rtu + "/*")
-                rem_sel = "select:%s" % ("iec60870-5-104://" + rem_rtu + "/*")
-                rem_cnl = "cancel:%s" % ("iec60870-5-104://" + rem_rtu + "/*")
-                call_p.unsubscribe(rem_oper)
-                call_p.unsubscribe(rem_sel)
-                call_p.unsubscribe(rem_cnl)
+                if not rem_rtu in rtu_config: # if the RTU moved to another IFS, the status and owner are set by that IFS
+                    set_data(rem_rtu,256,1, 0) # set status datapoint to offline, if we remove the RTU
+                    rt_db.hdel("ifs_rtu_owner", rem_rtu)
+            # check if new_list added some connections, if so register that RTU
+            add = set(list(new_rtu_list)) - set(list(rtu_list))
+            for add_rtu in add:
+                logger.info("adding RTU:" + add_rtu)
+                rt_db.set("connections:"+add_rtu+".active", b'0')
+                set_data(add_rtu,256,1, 0) # set status datapoint to offline, if we initialise the RTU
+                rt_db.hset("ifs_rtu_owner", add_rtu, IFS_NAME) # claim the RTU
+                add_RTU(add_rtu)
             rtu_list = new_rtu_list
-
-        for rtu in rtu_list:
-            #found enabled datapoint, so connect to RTU
-            rtu_on = rt_db.get("connections:"+rtu+".active")
-            if rtu_on == b'1':
-                # perform periodic testframe to check connection of all RTU, set status in redis
-                if testframe(rtu) == -1:
-                    rt_db.set("connections:"+rtu+".active", b'0') # reset status if testframe returns -1
-                    set_data(rtu,256,1, 0) # set status datapoint to offline, if we were connected, and now are not
-            else:
-                if get_RTU(rtu) == 0: # register and connect RTU's, set status in redis (0 is ok, -1 is fail)
-                    logger.info("RTU connected:"+rtu)
-                    rt_db.set('connections:'+rtu+".active", b'1')
-                    set_data(rtu,256,1, 1) # set status datapoint to online, if we were not connected, and now are
-                    # register this IFS with RTU
-                    oper = "operate:%s" % ("iec60870-5-104://" + rtu + "/*")
-                    sel = "select:%s" % ("iec60870-5-104://" + rtu + "/*")
-                    cancl = "cancel:%s" % ("iec60870-5-104://" + rtu + "/*")
-                    call_p.psubscribe(**{
-                            oper:operate_handler, 
-                            sel:select_handler, 
-                            cancl:cancel_handler, 
-                        })
-                else:
-                    logger.debug("failed to connect RTU:"+rtu)
-                    # retry periodically, set status in redis
-                    rt_db.set("connections:"+rtu+".active", b'0')
-
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+# Registry of ASDU decoders, indexed by type ID
+# a decoder takes a CS101_ASDU and returns a list of (ioa, value, quality, timestamp) tuples
+#   quality is the IEC60870 QualityDescriptor (0 is good)
+#   timestamp is the source time in ms since epoch, or None if the type has no timestamp
+# additional types can be supported with register_decoder(), without modifying the ASDU handler
+#
+from ctypes import cast, create_string_buffer
+from lib60870 import (
+    BinaryCounterReading_getValue, BinaryCounterReading_isInvalid, BitString32, BitString32_getQuality,
+    BitString32_getValue, Bitstring32WithCP56Time2a, Bitstring32WithCP56Time2a_getTimestamp,
+    CP56Time2a_toMsTimestamp, CS101_ASDU_getElementEx, CS101_ASDU_getNumberOfElements, C_DC_NA_1, C_SC_NA_1,
+    DoubleCommand, DoubleCommand_getState, DoublePointInformation, DoublePointInformation_getQuality,
+    DoublePointInformation_getValue, DoublePointWithCP56Time2a, DoublePointWithCP56Time2a_getTimestamp,
+    IEC60870_QUALITY_GOOD, IEC60870_QUALITY_INVALID, InformationObject, InformationObject_getObjectAddress,
+    IntegratedTotals, IntegratedTotalsWithCP56Time2a, IntegratedTotalsWithCP56Time2a_getTimestamp,
+    IntegratedTotals_getBCR, M_BO_NA_1, M_BO_TB_1, M_DP_NA_1, M_DP_TB_1, M_IT_NA_1, M_IT_TB_1, M_ME_NA_1,
+    M_ME_NB_1, M_ME_NC_1, M_ME_ND_1, M_ME_TD_1, M_ME_TE_1, M_ME_TF_1, M_SP_NA_1, M_SP_TB_1, M_ST_NA_1,
+    M_ST_TB_1, MeasuredValueNormalized, MeasuredValueNormalizedWithCP56Time2a,
+    MeasuredValueNormalizedWithCP56Time2a_getTimestamp, MeasuredValueNormalizedWithoutQuality,
+    MeasuredValueNormalizedWithoutQuality_getValue, MeasuredValueNormalized_getQuality,
+    MeasuredValueNormalized_getValue, MeasuredValueScaled, MeasuredValueScaledWithCP56Time2a,
+    MeasuredValueScaledWithCP56Time2a_getTimestamp, MeasuredValueScaled_getQuality,
+    MeasuredValueScaled_getValue, MeasuredValueShort, MeasuredValueShortWithCP56Time2a,
+    MeasuredValueShortWithCP56Time2a_getTimestamp, MeasuredValueShort_getQuality, MeasuredValueShort_getValue,
+    SingleCommand, SingleCommand_getState, SinglePointInformation, SinglePointInformation_getQuality,
+    SinglePointInformation_getValue, SinglePointWithCP56Time2a, SinglePointWithCP56Time2a_getTimestamp,
+    StepPositionInformation, StepPositionInformation_getQuality, StepPositionInformation_getValue,
+    StepPositionWithCP56Time2a, StepPositionWithCP56Time2a_getTimestamp,
+)
+
+ASDU_DECODERS = {}
+
+# element buffer, large enough to hold any information object (sInformationObjectUnion)
+ELEMENT_BUFFER_SIZE = 128
+
+
+def register_decoder(type_id, decoder):
+    ASDU_DECODERS[type_id] = decoder
+
+
+def get_decoder(type_id):
+    return ASDU_DECODERS.get(type_id)
+
+
+def no_quality(io):
+    return IEC60870_QUALITY_GOOD
+
+
+def integrated_totals_value(io):
+    return BinaryCounterReading_getValue(IntegratedTotals_getBCR(io))
+
+
+def integrated_totals_quality(io):
+    if BinaryCounterReading_isInvalid(IntegratedTotals_getBCR(io)):
+        return IEC60870_QUALITY_INVALID
+    return IEC60870_QUALITY_GOOD
+
+
+# create a decoder for a type, from the getters of its information object
+#   value_type: the information object type the value/quality getters expect
+#   time_type: the information object type the timestamp getter expects, None if there is no timestamp
+def make_decoder(value_type, get_value, get_quality, time_type=None, get_timestamp=None):
+    def decoder(asdu):
+        result = []
+        buffer = create_string_buffer(ELEMENT_BUFFER_SIZE)
+        element = cast(buffer, InformationObject)
+        for i in range(CS101_ASDU_getNumberOfElements(asdu)):
+            io = CS101_ASDU_getElementEx(asdu, element, i) # decode in the buffer, so nothing needs to be destroyed
+            if not io:
+                continue
+            value_io = cast(io, value_type)
+            timestamp = None
+            if time_type != None:
+                timestamp = CP56Time2a_toMsTimestamp(get_timestamp(cast(io, time_type)))
+            result.append((InformationObject_getObjectAddress(io), get_value(value_io), get_quality(value_io), timestamp))
+        return result
+    return decoder
+
+
+# monitoring direction
+register_decoder(M_SP_NA_1, make_decoder(SinglePointInformation, SinglePointInformation_getValue, SinglePointInformation_getQuality))
+register_decoder(M_SP_TB_1, make_decoder(SinglePointInformation, SinglePointInformation_getValue, SinglePointInformation_getQuality,
+    SinglePointWithCP56Time2a, SinglePointWithCP56Time2a_getTimestamp))
+register_decoder(M_DP_NA_1, make_decoder(DoublePointInformation, DoublePointInformation_getValue, DoublePointInformation_getQuality))
+register_decoder(M_DP_TB_1, make_decoder(DoublePointInformation, DoublePointInformation_getValue, DoublePointInformation_getQuality,
+    DoublePointWithCP56Time2a, DoublePointWithCP56Time2a_getTimestamp))
+register_decoder(M_ST_NA_1, make_decoder(StepPositionInformation, StepPositionInformation_getValue, StepPositionInformation_getQuality))
+register_decoder(M_ST_TB_1, make_decoder(StepPositionInformation, StepPositionInformation_getValue, StepPositionInformation_getQuality,
+    StepPositionWithCP56Time2a, StepPositionWithCP56Time2a_getTimestamp))
+register_decoder(M_BO_NA_1, make_decoder(BitString32, BitString32_getValue, BitString32_getQuality))
+register_decoder(M_BO_TB_1, make_decoder(BitString32, BitString32_getValue, BitString32_getQuality,
+    Bitstring32WithCP56Time2a, Bitstring32WithCP56Time2a_getTimestamp))
+register_decoder(M_ME_NA_1, make_decoder(MeasuredValueNormalized, MeasuredValueNormalized_getValue, MeasuredValueNormalized_getQuality))
+register_decoder(M_ME_ND_1, make_decoder(MeasuredValueNormalizedWithoutQuality, MeasuredValueNormalizedWithoutQuality_getValue, no_quality))
+register_decoder(M_ME_TD_1, make_decoder(MeasuredValueNormalized, MeasuredValueNormalized_getValue, MeasuredValueNormalized_getQuality,
+    MeasuredValueNormalizedWithCP56Time2a, MeasuredValueNormalizedWithCP56Time2a_getTimestamp))
+register_decoder(M_ME_NB_1, make_decoder(MeasuredValueScaled, MeasuredValueScaled_getValue, MeasuredValueScaled_getQuality))
+register_decoder(M_ME_TE_1, make_decoder(MeasuredValueScaled, MeasuredValueScaled_getValue, MeasuredValueScaled_getQuality,
+    MeasuredValueScaledWithCP56Time2a, MeasuredValueScaledWithCP56Time2a_getTimestamp))
+register_decoder(M_ME_NC_1, make_decoder(MeasuredValueShort, MeasuredValueShort_getValue, MeasuredValueShort_getQuality))
+register_decoder(M_ME_TF_1, make_decoder(MeasuredValueShort, MeasuredValueShort_getValue, MeasuredValueShort_getQuality,
+    MeasuredValueShortWithCP56Time2a, MeasuredValueShortWithCP56Time2a_getTimestamp))
+register_decoder(M_IT_NA_1, make_decoder(IntegratedTotals, integrated_totals_value, integrated_totals_quality))
+register_decoder(M_IT_TB_1, make_decoder(IntegratedTotals, integrated_totals_value, integrated_totals_quality,
+    IntegratedTotalsWithCP56Time2a, IntegratedTotalsWithCP56Time2a_getTimestamp))
+
+# command responses (ACT_CON/ACT_TERM)
+register_decoder(C_SC_NA_1, make_decoder(SingleCommand, SingleCommand_getState, no_quality))
+register_decoder(C_DC_NA_1, make_decoder(DoubleCommand, DoubleCommand_getState, no_quality))
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+#
+# Hand-off queue between the receiving threads of the IEC104 backends and the processing of values
+# the receive handler only appends the decoded elements of an ASDU to a deque and returns, so a slow
+# redis or influxdb can not block the connection (and cause t1/t2 timeouts on the link).
+# worker threads drain the deques in batches. Items are sharded by RTU over the workers, so the values
+# of an RTU are processed in the order they were received.
+#
+import threading
+import time
+from collections import deque
+
+
+class AsduQueue:
+
+    def __init__(self, handler, workers=2, batch_size=1000):
+        self.handler = handler # called from a worker thread with (key, item), for each queued item
+        self.batch_size = batch_size # maximum items processed before the deque is checked again
+        self.queues = [deque() for i in range(workers)] # append/popleft of a deque are thread safe
+        self.events = [threading.Event() for i in range(workers)]
+        self.lock = threading.Lock() # protects stats, updated once per batch
+        self.stats = {
+            'processed': 0,      # items processed
+            'batches': 0,        # batches processed
+            'errors': 0,         # exceptions in the handler
+            'latency_ms': 0,     # highest time in the queue of an item of the last batch
+            'latency_max_ms': 0, # highest time in the queue
+        }
+        self.running = True
+        self.threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=self.run, args=(i,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+
+    def put(self, key, item):
+        index = hash(key) % len(self.queues)
+        self.queues[index].append((key, item, time.monotonic()))
+        event = self.events[index]
+        if not event.is_set():
+            event.set()
+
+
+    def depth(self):
+        return sum(len(q) for q in self.queues)
+
+
+    def stop(self):
+        self.running = False
+        for event in self.events:
+            event.set()
+        for thread in self.threads:
+            thread.join()
+
+
+    def run(self, index):
+        q = self.queues[index]
+        event = self.events[index]
+        while self.running == True:
+            if len(q) == 0:
+                event.wait(0.1)
+                event.clear()
+                continue
+
+            count = 0
+            latency = 0
+            while len(q) > 0 and count < self.batch_size:
+                key, item, queued = q.popleft()
+                latency = max(latency, time.monotonic() - queued)
+                try:
+                    self.handler(key, item)
+                except Exception as e:
+                    with self.lock:
+                        self.stats['errors'] += 1
+                    print("error: could not process item of %s: %s" % (str(key), str(e)))
+                count += 1
+
+            latency = latency * 1000
+            with self.lock:
+                self.stats['processed'] += count
+                self.stats['batches'] += 1
+                self.stats['latency_ms'] = round(latency, 3)
+                if latency > self.stats['latency_max_ms']:
+                    self.stats['latency_max_ms'] = round(latency, 3)
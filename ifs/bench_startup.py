@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+#
+# Benchmark of the startup time of the lib60870 bindings, each measured in a fresh interpreter
+#   compile: translating lib60870.py to bytecode, paid on every start when there is no .pyc (i.e. a new container)
+#   lazy: import of the bindings, functions are resolved on first use
+#   eager: import and resolve all functions, as the bindings did before they were lazy
+#   client: import of the IEC104 client, with the functions it uses
+#
+# usage: python3 bench_startup.py [runs]   (requires /usr/local/lib/lib60870.so)
+#
+import os
+import sys
+import time
+import subprocess
+import statistics
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+CASES = {
+    "lazy": "import lib60870",
+    "eager": "import lib60870; lib60870.load_all()",
+    "client": "import libiec60870client",
+}
+
+
+# time a statement in a fresh interpreter, in ms
+def measure(statement):
+    code = "import time; t = time.perf_counter(); %s; print((time.perf_counter() - t) * 1000)" % statement
+    result = subprocess.run([sys.executable, "-c", code], cwd=DIRECTORY, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def measure_compile():
+    with open(os.path.join(DIRECTORY, "lib60870.py"), 'r') as f:
+        source = f.read()
+    start = time.perf_counter()
+    compile(source, "lib60870.py", "exec")
+    return (time.perf_counter() - start) * 1000
+
+
+if __name__ == '__main__':
+    runs = 10
+    if len(sys.argv) > 1:
+        runs = int(sys.argv[1])
+
+    # make sure the .pyc files exist, so only the import itself is measured
+    subprocess.run([sys.executable, "-m", "compileall", "-q", DIRECTORY], check=True)
+
+    print("%-8s %10s %10s" % ("case", "median ms", "min ms"))
+    results = [measure_compile() for i in range(runs)]
+    print("%-8s %10.1f %10.1f" % ("compile", statistics.median(results), min(results)))
+    for name, statement in CASES.items():
+        results = [measure(statement) for i in range(runs)]
+        print("%-8s %10.1f %10.1f" % (name, statistics.median(results), min(results)))
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+#
+# Capture file of received APDU's, for replaying production traffic (see replay.py)
+# the file starts with MAGIC, followed by records of a fixed header and a payload:
+#   kind(1 byte), receive time(8 byte double, seconds since epoch), rtu index(2 bytes), payload length(2 bytes)
+# a KIND_RTU record declares the RTU name of an index, a KIND_APDU record contains a received APDU
+# files are only appended, a later KIND_RTU record replaces the name of an index
+#
+import struct
+import threading
+import time
+
+MAGIC = b"IFSCAP1\n"
+RECORD = struct.Struct('<BdHH')
+KIND_RTU = 0
+KIND_APDU = 1
+
+
+class CaptureWriter:
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.file = open(filename, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.rtus = {} # rtu -> index in this file
+        self.lock = threading.Lock() # the lib60870 backend calls write() from a thread per connection
+        self.stats = {
+            'records': 0, # APDU's written
+            'bytes': 0,   # bytes written
+        }
+
+
+    # add a received APDU, can be used as raw_handler of the IEC104 client
+    def write(self, rtu, apdu):
+        now = time.time()
+        with self.lock:
+            index = self.rtus.get(rtu)
+            if index == None:
+                index = len(self.rtus)
+                self.rtus[rtu] = index
+                name = rtu.encode("utf-8")
+                self.file.write(RECORD.pack(KIND_RTU, now, index, len(name)) + name)
+            self.file.write(RECORD.pack(KIND_APDU, now, index, len(apdu)) + apdu)
+            self.stats['records'] += 1
+            self.stats['bytes'] += RECORD.size + len(apdu)
+
+
+    def flush(self):
+        with self.lock:
+            self.file.flush()
+
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+# iterate over the APDU's in a capture file, as (time, rtu, apdu)
+def read_capture(filename):
+    rtus = {}
+    with open(filename, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("%s is not a capture file" % filename)
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            kind, timestamp, index, length = RECORD.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length: # incomplete last record, i.e. the IFS was stopped while writing
+                return
+            if kind == KIND_RTU:
+                rtus[index] = payload.decode("utf-8")
+            elif kind == KIND_APDU:
+                yield timestamp, rtus.get(index, str(index)), payload
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+#
+# Tracking of the commands (select/operate) sent to the RTU's, until they are confirmed by the RTU
+# each command waits for its ACT_CON (and ACT_TERM for an operate) with the same type and IOA, and
+# results in a dict with the outcome and the timings of each step:
+#   ui_to_ifs_ms    publish by the client, to receiving the command in the IFS (wall clock of both)
+#   act_con_ms      sending the command to the RTU, to ACT_CON
+#   act_term_ms     sending the command to the RTU, to ACT_TERM
+#   total_ms        publish by the client, to the result
+#
+# commands are started from the redis subscriber thread, responses arrive in the thread of the
+# backend, the results are collected by poll() in the main loop
+#
+import threading
+import time
+from collections import deque
+
+COT_ACTIVATION_CON = 7
+COT_ACTIVATION_TERMINATION = 10
+COT_UNKNOWN_FIRST = 44 # 44-47: unknown type, cause of transmission, common address or IOA
+
+# outcome of a command
+RESULT_COMPLETED = "completed"   # ACT_TERM received
+RESULT_CONFIRMED = "confirmed"   # positive ACT_CON of a select, or an operate that was not terminated
+RESULT_REJECTED = "rejected"     # negative ACT_CON, or unknown type/cot/address
+RESULT_TIMEOUT = "timeout"       # no ACT_CON within the timeout
+RESULT_FAILED = "failed"         # could not be sent, or the connection closed before ACT_CON
+RESULT_SUPERSEDED = "superseded" # a new command for the same point was sent before this one was done
+
+
+class CommandTracker:
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout # seconds to wait for ACT_CON, and for ACT_TERM after ACT_CON
+        self.pending = {} # (tupl, type_id, ioa) -> command, one command at a time per point
+        self.results = deque()
+        self.lock = threading.Lock()
+
+
+    # register a command before it is sent, so a fast response can not be missed
+    # command is the dict received from the client, with id, operation, element, value,
+    # created (ms since epoch, set by the client) and received (ms since epoch, set by the IFS)
+    def start(self, tupl, type_id, ioa, select, command):
+        now = time.monotonic()
+        record = dict(command)
+        record.update({"rtu": tupl, "select": select, "sent": now, "act_con": None, "deadline": now + self.timeout})
+        key = (tupl, type_id, ioa)
+        with self.lock:
+            if key in self.pending:
+                self.finish(self.pending.pop(key), RESULT_SUPERSEDED, now)
+            self.pending[key] = record
+
+
+    # the command could not be sent, the caller reports the failure
+    def discard(self, tupl, type_id, ioa):
+        with self.lock:
+            self.pending.pop((tupl, type_id, ioa), None)
+
+
+    # an ASDU with a command type was received, returns False if it did not match a command
+    def response(self, tupl, type_id, ioa, cot, negative):
+        now = time.monotonic()
+        key = (tupl, type_id, ioa)
+        with self.lock:
+            record = self.pending.get(key)
+            if record == None:
+                return False
+            if negative == True or cot >= COT_UNKNOWN_FIRST:
+                del self.pending[key]
+                if cot == COT_ACTIVATION_CON:
+                    record["act_con"] = now
+                self.finish(record, RESULT_REJECTED, now)
+            elif cot == COT_ACTIVATION_CON:
+                record["act_con"] = now
+                if record["select"] == True:
+                    del self.pending[key]
+                    self.finish(record, RESULT_CONFIRMED, now)
+                else:
+                    record["deadline"] = now + self.timeout
+            elif cot == COT_ACTIVATION_TERMINATION:
+                del self.pending[key]
+                self.finish(record, RESULT_COMPLETED, now)
+            else:
+                return False
+        return True
+
+
+    # the connection of an RTU is closed, its commands will not be confirmed anymore
+    def disconnected(self, tupl):
+        now = time.monotonic()
+        with self.lock:
+            for key in [key for key in self.pending if key[0] == tupl]:
+                record = self.pending.pop(key)
+                self.finish(record, RESULT_CONFIRMED if record["act_con"] != None else RESULT_FAILED, now)
+
+
+    # end the commands that timed out, and return all results since the last call
+    def poll(self, now):
+        with self.lock:
+            for key, record in list(self.pending.items()):
+                if now >= record["deadline"]:
+                    del self.pending[key]
+                    self.finish(record, RESULT_CONFIRMED if record["act_con"] != None else RESULT_TIMEOUT, now)
+            results = list(self.results)
+            self.results.clear()
+        return results
+
+
+    # convert a record to its result, should be called with the lock held
+    def finish(self, record, result, now):
+        received = record.get("received")
+        created = record.get("created")
+        wall = time.time() * 1000
+        self.results.append({
+            "id": record.get("id"),
+            "operation": record.get("operation"),
+            "element": record.get("element"),
+            "value": record.get("value"),
+            "rtu": record["rtu"],
+            "result": result,
+            "reason": None,
+            "ui_to_ifs_ms": round(received - created, 1) if received != None and created != None else None,
+            "act_con_ms": round((record["act_con"] - record["sent"]) * 1000, 1) if record["act_con"] != None else None,
+            "act_term_ms": round((now - record["sent"]) * 1000, 1) if result == RESULT_COMPLETED else None,
+            "total_ms": round(wall - created, 1) if created != None else None,
+        })
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+#
+# Scheduler for the General Interrogations of the IEC104 backends
+# a station GI of each RTU that (re)connects is not sent directly, but queued with a random delay
+# (jitter), and only a limited amount of GI's run at the same time. After a restart of the IFS or a
+# mass reconnect, the RTU's are read one batch after another, instead of all at once, so redis and
+# influxdb are not flooded.
+#
+# periodic GI's can be configured per RTU, for the station (QOI 20) or a group (QOI 21-36), so
+# integrity data is refreshed per group, instead of with one station wide burst.
+#
+# not thread safe, all methods should be called from the same thread (the thread of the backend)
+#
+import random
+
+QOI_STATION = 20
+QOI_GROUP_FIRST = 21
+QOI_GROUP_LAST = 36
+
+
+class GIScheduler:
+
+    def __init__(self, send, max_running=4, jitter=2, timeout=30):
+        self.send = send # called with (tupl, qoi) to send a GI, returns False if it could not be sent
+        self.max_running = max_running # maximum GI's in progress at the same time, over all RTU's
+        self.jitter = jitter # seconds, maximum random delay of a requested GI
+        self.timeout = timeout # seconds, a GI without ACT_TERM frees its slot after this time
+        self.waiting = {} # (tupl, qoi) -> time the GI may be sent
+        self.running = {} # tupl -> (qoi, deadline), one GI at a time per RTU
+        self.periodic = {} # tupl -> {qoi: interval in seconds}, of active RTU's
+        self.next_due = {} # (tupl, qoi) -> time the next periodic GI is requested
+        self.stats = {
+            'requested': 0, # GI's requested
+            'sent': 0,      # GI's sent to an RTU
+            'completed': 0, # GI's terminated, or rejected, by the RTU
+            'timeouts': 0,  # GI's without termination within timeout
+            'failed': 0,    # GI's that could not be sent
+            'running': 0,   # GI's in progress
+            'waiting': 0,   # GI's waiting for a slot, or their jitter delay
+        }
+
+
+    # request a GI of an RTU, a GI with the same QOI that is already waiting is not requested again
+    def request(self, tupl, now, qoi=QOI_STATION):
+        key = (tupl, qoi)
+        if key in self.waiting:
+            return
+        self.waiting[key] = now + random.uniform(0, self.jitter)
+        self.stats['requested'] += 1
+
+
+    # an RTU started (STARTDT_CON), read all values, and start the periodic GI's of the RTU
+    def connected(self, tupl, now, schedule=None):
+        self.request(tupl, now)
+        self.schedule(tupl, now, schedule)
+
+
+    # set the periodic GI's of an active RTU, schedule is a dict {qoi: interval in seconds}
+    # the first GI of each QOI is at a random moment within its interval, to spread the GI's of the RTU's
+    def schedule(self, tupl, now, schedule):
+        for key in [key for key in self.next_due if key[0] == tupl]:
+            del self.next_due[key]
+        self.periodic.pop(tupl, None)
+        if schedule == None:
+            return
+        intervals = {}
+        for qoi, interval in schedule.items():
+            qoi = int(qoi)
+            interval = float(interval)
+            if qoi < QOI_STATION or qoi > QOI_GROUP_LAST:
+                print("error: invalid QOI %i in the GI schedule of %s" % (qoi, tupl))
+                continue
+            if interval <= 0:
+                continue
+            intervals[qoi] = interval
+            self.next_due[(tupl, qoi)] = now + random.uniform(0, interval)
+        if len(intervals) > 0:
+            self.periodic[tupl] = intervals
+
+
+    # the connection of an RTU is closed, or the RTU is removed
+    def disconnected(self, tupl):
+        for key in [key for key in self.waiting if key[0] == tupl]:
+            del self.waiting[key]
+        for key in [key for key in self.next_due if key[0] == tupl]:
+            del self.next_due[key]
+        self.running.pop(tupl, None)
+        self.periodic.pop(tupl, None)
+
+
+    # the GI of an RTU is terminated (ACT_TERM), or rejected (negative ACT_CON)
+    # returns the QOI of the GI, or None if there was no GI in progress
+    def completed(self, tupl):
+        if not tupl in self.running:
+            return None
+        qoi, deadline = self.running.pop(tupl)
+        self.stats['completed'] += 1
+        return qoi
+
+
+    # request due periodic GI's, and send waiting GI's while there are free slots
+    # this should be called periodically, i.e. every 100ms
+    def poll(self, now):
+        for tupl, (qoi, deadline) in list(self.running.items()):
+            if now >= deadline:
+                print("error: GI (QOI %i) of %s not terminated within %i seconds" % (qoi, tupl, self.timeout))
+                del self.running[tupl]
+                self.stats['timeouts'] += 1
+
+        for key, due in list(self.next_due.items()):
+            if now >= due:
+                tupl, qoi = key
+                interval = self.periodic[tupl][qoi]
+                self.next_due[key] = due + interval if due + interval > now else now + interval
+                self.request(tupl, now, qoi)
+
+        if len(self.running) < self.max_running and len(self.waiting) > 0:
+            # station GI's first, as the RTU's of those are not read yet, then in order of request
+            for key, start in sorted(self.waiting.items(), key=lambda item: (item[0][1] != QOI_STATION, item[1])):
+                if len(self.running) >= self.max_running:
+                    break
+                tupl, qoi = key
+                if start > now or tupl in self.running:
+                    continue
+                del self.waiting[key]
+                if self.send(tupl, qoi) == False:
+                    print("error: could not send GI (QOI %i) to %s" % (qoi, tupl))
+                    self.stats['failed'] += 1
+                    continue
+                self.running[tupl] = (qoi, now + self.timeout)
+                self.stats['sent'] += 1
+
+        self.stats['running'] = len(self.running)
+        self.stats['waiting'] = len(self.waiting)
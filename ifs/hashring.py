@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+# Consistent hash ring, used to divide RTU's over the IFS instances that are online
+# each member is placed on the ring a number of times (replicas), so keys are spread evenly,
+# and only the keys of a joining/leaving member move to another member
+#
+import bisect
+import hashlib
+
+
+class HashRing:
+
+    def __init__(self, members=(), replicas=100):
+        self.replicas = replicas
+        self.members = set()
+        self.ring = [] # sorted hashes
+        self.owners = {} # hash -> member
+        self.set_members(members)
+
+
+    def hash(self, key):
+        return int.from_bytes(hashlib.md5(key.encode("utf-8")).digest()[:8], "big")
+
+
+    def set_members(self, members):
+        self.members = set(members)
+        self.owners = {}
+        for member in self.members:
+            for i in range(self.replicas):
+                self.owners[self.hash("%s#%i" % (member, i))] = member
+        self.ring = sorted(self.owners)
+
+
+    # return the member that owns key, or None if the ring is empty
+    def get(self, key):
+        if len(self.ring) == 0:
+            return None
+        index = bisect.bisect(self.ring, self.hash(key)) % len(self.ring)
+        return self.owners[self.ring[index]]
+
+
+    # divide keys over the members, with at most capacity keys per member (consistent hashing with bounded
+    # loads): a key goes to the first member clockwise from its hash that has room, so the keys a full member
+    # cannot take move to the next members on the ring. capacity is a dict member -> maximum keys, or one
+    # maximum for all members. fixed is a dict key -> member of keys that are assigned to a member already,
+    # they are counted first. returns a dict key -> member, None for keys that do not fit on any member
+    def assign(self, keys, capacity, fixed={}):
+        if isinstance(capacity, int):
+            capacity = dict((member, capacity) for member in self.members)
+        load = dict((member, 0) for member in self.members)
+        free = sum(capacity.get(member, 0) for member in self.members)
+        result = {}
+        for key in sorted(fixed):
+            member = fixed[key]
+            if member in load and load[member] < capacity.get(member, 0):
+                load[member] += 1
+                free -= 1
+                result[key] = member
+            else:
+                result[key] = None
+        for key in sorted(keys):
+            if key in result:
+                continue
+            result[key] = None
+            if free <= 0:
+                continue
+            index = bisect.bisect(self.ring, self.hash(key))
+            for i in range(len(self.ring)):
+                member = self.owners[self.ring[(index + i) % len(self.ring)]]
+                if load[member] < capacity.get(member, 0):
+                    load[member] += 1
+                    free -= 1
+                    result[key] = member
+                    break
+        return result
@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+#
+# IEC60870-5-104 master in pure python, as an alternative backend for libiec60870client
+# all RTU connections are served by one asyncio event loop, running in a background thread.
+# APCI/ASDU frames are parsed directly from the receive buffer with memoryview/struct.
+#
+# supports I, S and U frames, the k/w windows and the t1, t2 and t3 timers of IEC60870-5-104
+# with the default parameters (COT 2 bytes, common address 2 bytes, IOA 3 bytes)
+#
+import asyncio
+import threading
+import calendar
+import random
+import struct
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+from pointtable import PointTable
+from asduqueue import AsduQueue
+from gischeduler import GIScheduler, QOI_STATION
+from commandtracker import CommandTracker
+
+# connection states of an RTU, identical to libiec60870client
+RTU_IDLE = 0        # not connected, waiting for the next connection attempt
+RTU_CONNECTING = 1  # connecting, waiting for the TCP connection
+RTU_STARTDT = 2     # connected, waiting for STARTDT_CON
+RTU_ACTIVE = 3      # connection is up, the model is read by the GI scheduler
+
+# APCI
+START_BYTE = 0x68
+MAX_APDU_LENGTH = 253
+SEQ_MODULO = 32768
+U_STARTDT_ACT = 0x07
+U_STARTDT_CON = 0x0B
+U_STOPDT_ACT = 0x13
+U_STOPDT_CON = 0x23
+U_TESTFR_ACT = 0x43
+U_TESTFR_CON = 0x83
+
+# type ID's
+C_SC_NA_1 = 45
+C_DC_NA_1 = 46
+C_IC_NA_1 = 100
+C_TS_TA_1 = 107
+
+# cause of transmission
+COT_ACTIVATION = 6
+COT_ACTIVATION_CON = 7
+COT_ACTIVATION_TERMINATION = 10
+COT_NEGATIVE = 0x40
+
+QUALITY_INVALID = 0x80
+APCI_PARAMETERS = ('k', 'w', 't0', 't1', 't2', 't3') # can be set per RTU, timers in seconds
+TIMER_INTERVAL = 0.1 # seconds between checks of the t1, t2 and t3 timers of a connection
+
+ASDU_HEADER = struct.Struct('<BBBBH') # type ID, VSQ, COT, originator address, common address
+INT16 = struct.Struct('<h')
+INT32 = struct.Struct('<i')
+UINT32 = struct.Struct('<I')
+FLOAT32 = struct.Struct('<f')
+
+
+# CP56Time2a to ms since epoch (UTC), None if the time is not valid
+def cp56_to_ms(view, o):
+    try:
+        seconds = calendar.timegm(((view[o + 6] & 0x7F) + 2000, view[o + 5] & 0x0F, view[o + 4] & 0x1F,
+            view[o + 3] & 0x1F, view[o + 2] & 0x3F, 0))
+    except ValueError:
+        return None
+    return seconds * 1000 + (view[o] | view[o + 1] << 8)
+
+
+def ms_to_cp56(timestamp):
+    t = time.gmtime(timestamp // 1000)
+    ms = t.tm_sec * 1000 + timestamp % 1000
+    return bytes((ms & 0xFF, ms >> 8, t.tm_min, t.tm_hour, t.tm_mday | ((t.tm_wday + 1) << 5), t.tm_mon, t.tm_year - 2000))
+
+
+# decoders of an information element, indexed by type ID: (element size, decoder)
+# a decoder takes the buffer and offset of the element, and returns (value, quality, timestamp)
+# values and qualities are identical to the lib60870 getters, so both backends store the same data
+ELEMENT_DECODERS = {}
+
+
+def register_decoder(type_id, size, decoder):
+    ELEMENT_DECODERS[type_id] = (size, decoder)
+
+
+def with_timestamp(decoder, size):
+    def decode(view, o):
+        value, quality, timestamp = decoder(view, o)
+        return value, quality, cp56_to_ms(view, o + size)
+    return decode
+
+
+def single_point(view, o):
+    return view[o] & 0x01, view[o] & 0xF0, None
+
+
+def double_point(view, o):
+    return view[o] & 0x03, view[o] & 0xF0, None
+
+
+def step_position(view, o):
+    value = view[o] & 0x7F
+    if value & 0x40: # 7 bit signed
+        value -= 0x80
+    return value, view[o + 1], None
+
+
+def bitstring32(view, o):
+    return UINT32.unpack_from(view, o)[0], view[o + 4], None
+
+
+def normalized(view, o):
+    return (INT16.unpack_from(view, o)[0] + 0.5) / 32767.5, view[o + 2], None
+
+
+def normalized_without_quality(view, o):
+    return (INT16.unpack_from(view, o)[0] + 0.5) / 32767.5, 0, None
+
+
+def scaled(view, o):
+    return INT16.unpack_from(view, o)[0], view[o + 2], None
+
+
+def short_float(view, o):
+    return FLOAT32.unpack_from(view, o)[0], view[o + 4], None
+
+
+def integrated_totals(view, o):
+    quality = 0
+    if view[o + 4] & 0x80:
+        quality = QUALITY_INVALID
+    return INT32.unpack_from(view, o)[0], quality, None
+
+
+def command_state(view, o):
+    return view[o] & 0x01, 0, None
+
+
+def double_command_state(view, o):
+    return view[o] & 0x03, 0, None
+
+
+# monitoring direction
+register_decoder(1, 1, single_point)                                # M_SP_NA_1
+register_decoder(30, 8, with_timestamp(single_point, 1))            # M_SP_TB_1
+register_decoder(3, 1, double_point)                                # M_DP_NA_1
+register_decoder(31, 8, with_timestamp(double_point, 1))            # M_DP_TB_1
+register_decoder(5, 2, step_position)                               # M_ST_NA_1
+register_decoder(32, 9, with_timestamp(step_position, 2))           # M_ST_TB_1
+register_decoder(7, 5, bitstring32)                                 # M_BO_NA_1
+register_decoder(33, 12, with_timestamp(bitstring32, 5))            # M_BO_TB_1
+register_decoder(9, 3, normalized)                                  # M_ME_NA_1
+register_decoder(21, 2, normalized_without_quality)                 # M_ME_ND_1
+register_decoder(34, 10, with_timestamp(normalized, 3))             # M_ME_TD_1
+register_decoder(11, 3, scaled)                                     # M_ME_NB_1
+register_decoder(35, 10, with_timestamp(scaled, 3))                 # M_ME_TE_1
+register_decoder(13, 5, short_float)                                # M_ME_NC_1
+register_decoder(36, 12, with_timestamp(short_float, 5))            # M_ME_TF_1
+register_decoder(15, 5, integrated_totals)                          # M_IT_NA_1
+register_decoder(37, 12, with_timestamp(integrated_totals, 5))      # M_IT_TB_1
+
+# command responses (ACT_CON/ACT_TERM)
+register_decoder(C_SC_NA_1, 1, command_state)
+register_decoder(C_DC_NA_1, 1, double_command_state)
+
+
+# decode the information objects of an ASDU, returns a list of (ioa, value, quality, timestamp)
+def decode_elements(type_id, vsq, view, o, end):
+    decoder = ELEMENT_DECODERS.get(type_id)
+    if decoder == None:
+        return None
+    size, decode = decoder
+    count = vsq & 0x7F
+    result = []
+    if vsq & 0x80: # sequence of elements, only the first has an IOA
+        if o + 3 + count * size > end:
+            return result
+        ioa = view[o] | view[o + 1] << 8 | view[o + 2] << 16
+        o += 3
+        for i in range(count):
+            value, quality, timestamp = decode(view, o)
+            result.append((ioa + i, value, quality, timestamp))
+            o += size
+    else:
+        if o + count * (3 + size) > end:
+            return result
+        for i in range(count):
+            ioa = view[o] | view[o + 1] << 8 | view[o + 2] << 16
+            value, quality, timestamp = decode(view, o + 3)
+            result.append((ioa, value, quality, timestamp))
+            o += 3 + size
+    return result
+
+
+# decode the ASDU of a complete APDU (i.e. from a capture file)
+# returns (type_id, cot, elements), elements is None if the type has no decoder, or None if it is not an I frame
+def decode_apdu(apdu):
+    view = memoryview(apdu)
+    if len(view) < 6 + ASDU_HEADER.size or view[0] != START_BYTE or view[2] & 0x01 != 0:
+        return None
+    end = min(len(view), 2 + view[1])
+    type_id, vsq, cot, oa, ca = ASDU_HEADER.unpack_from(view, 6)
+    return type_id, cot, decode_elements(type_id, vsq, view, 6 + ASDU_HEADER.size, end)
+
+
+def make_asdu(type_id, cot, ca, ioa, element):
+    return ASDU_HEADER.pack(type_id, 1, cot, 0, ca) + bytes((ioa & 0xFF, (ioa >> 8) & 0xFF, (ioa >> 16) & 0xFF)) + element
+
+
+class IEC104Protocol(asyncio.Protocol):
+
+    def __init__(self, client, rtu):
+        self.client = client
+        self.rtu = rtu
+        apci = client.getAPCIParameters(rtu)
+        self.k = apci['k'] # maximum I frames sent, that are not acknowledged
+        self.w = apci['w'] # acknowledge at the latest after w received I frames
+        self.t1 = apci['t1'] # seconds before a sent frame has to be acknowledged
+        self.t2 = apci['t2'] # seconds before received I frames are acknowledged, when there is nothing to send
+        self.t3 = apci['t3'] # seconds without frames before a testframe is sent
+        self.transport = None
+        self.buffer = bytearray()
+        self.vs = 0 # send sequence number
+        self.vr = 0 # receive sequence number
+        self.acked = 0 # last send sequence number acknowledged by the RTU
+        self.unacked = deque() # (sequence number, time) of sent I frames, not yet acknowledged
+        self.send_queue = deque() # ASDU's waiting for the k window
+        self.received = 0 # I frames received, and not yet acknowledged
+        self.received_time = 0 # time of the first not acknowledged I frame
+        self.u_pending = 0 # time a U frame was sent that was not yet confirmed, 0 if none
+        self.last_frame = time.monotonic()
+        self.timer = None
+        loop = asyncio.get_running_loop()
+        self.started = loop.create_future() # STARTDT_CON received
+        self.closed = loop.create_future()
+
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.timer = asyncio.get_running_loop().call_later(TIMER_INTERVAL, self.checkTimers)
+
+
+    def connection_lost(self, exc):
+        if self.timer != None:
+            self.timer.cancel()
+        if not self.started.done():
+            self.started.set_result(False)
+        if not self.closed.done():
+            self.closed.set_result(True)
+
+
+    def close(self, reason):
+        print("error: %s, closing connection to %s" % (reason, self.rtu["self"]))
+        self.transport.close()
+
+
+    def data_received(self, data):
+        self.buffer += data
+        self.last_frame = time.monotonic()
+        offset = 0
+        size = len(self.buffer)
+        with memoryview(self.buffer) as view:
+            while size - offset >= 6:
+                if view[offset] != START_BYTE:
+                    break
+                length = view[offset + 1]
+                if length < 4 or length > MAX_APDU_LENGTH:
+                    break
+                if size - offset < length + 2:
+                    break
+                if self.client.raw_handler != None:
+                    self.client.raw_handler(self.rtu["self"], bytes(view[offset:offset + length + 2]))
+                self.handleFrame(view, offset + 2, offset + 2 + length)
+                offset += length + 2
+                if self.transport.is_closing():
+                    return
+            invalid = size - offset >= 2 and (view[offset] != START_BYTE or view[offset + 1] < 4 or view[offset + 1] > MAX_APDU_LENGTH)
+        del self.buffer[:offset]
+        if invalid == True:
+            self.close("invalid APDU")
+
+
+    def handleFrame(self, view, o, end):
+        cf1 = view[o]
+        if cf1 & 0x01 == 0: # I frame
+            ns = (cf1 | view[o + 1] << 8) >> 1
+            if ns != self.vr:
+                self.close("unexpected send sequence number %i, expected %i" % (ns, self.vr))
+                return
+            self.vr = (self.vr + 1) % SEQ_MODULO
+            self.rtu['i_received'] += 1
+            if self.received == 0:
+                self.received_time = time.monotonic()
+            self.received += 1
+            if self.acknowledge((view[o + 2] | view[o + 3] << 8) >> 1) == False:
+                return
+            self.handleASDU(view, o + 4, end)
+            if self.received >= self.w:
+                self.sendS()
+        elif cf1 & 0x03 == 0x01: # S frame
+            self.acknowledge((view[o + 2] | view[o + 3] << 8) >> 1)
+        else: # U frame
+            if cf1 == U_TESTFR_ACT:
+                self.transport.write(bytes((START_BYTE, 4, U_TESTFR_CON, 0, 0, 0)))
+            elif cf1 == U_TESTFR_CON:
+                self.u_pending = 0
+            elif cf1 == U_STARTDT_CON:
+                self.u_pending = 0
+                if not self.started.done():
+                    self.started.set_result(True)
+            elif cf1 == U_STOPDT_CON:
+                self.u_pending = 0
+
+
+    # process the receive sequence number of an I or S frame, returns False if it was not valid
+    def acknowledge(self, nr):
+        if len(self.unacked) == 0 and nr == self.acked:
+            return True
+        while len(self.unacked) > 0 and self.unacked[0][0] != nr:
+            self.unacked.popleft()
+        if len(self.unacked) == 0 and nr != self.vs:
+            self.close("invalid receive sequence number %i" % nr)
+            return False
+        self.acked = nr
+        # send ASDU's that were waiting for the window
+        while len(self.send_queue) > 0 and len(self.unacked) < self.k:
+            self.sendI(self.send_queue.popleft())
+        return True
+
+
+    def handleASDU(self, view, o, end):
+        if end - o < ASDU_HEADER.size:
+            return
+        type_id, vsq, cot, oa, ca = ASDU_HEADER.unpack_from(view, o)
+        o += ASDU_HEADER.size
+
+        if type_id == C_IC_NA_1:
+            if cot & COT_NEGATIVE != 0:
+                print("error: GI rejected by %s" % self.rtu["self"])
+                self.client.gi.completed(self.rtu["self"])
+            elif cot & 0x3F == COT_ACTIVATION_TERMINATION:
+                if self.client.gi.completed(self.rtu["self"]) == QOI_STATION:
+                    self.rtu["GI"] = True
+            return
+
+        if type_id == C_TS_TA_1:
+            self.rtu['testfr_received'] += 1
+            return
+
+        elements = decode_elements(type_id, vsq, view, o, end)
+        if elements == None:
+            print("  no decoder for ASDU type: %i" % type_id)
+            return
+
+        if type_id == C_SC_NA_1 or type_id == C_DC_NA_1:
+            # command response, this is not a measurement
+            for ioa, value, quality, timestamp in elements:
+                self.client.commands.response(self.rtu['self'], type_id, ioa, cot & 0x3F, cot & COT_NEGATIVE != 0)
+            return
+
+        # processed by a worker thread, so a slow callback does not block the event loop
+        self.client.queue.put(self.rtu['self'], (self.rtu['points'], type_id, elements))
+
+
+    def sendU(self, function):
+        self.u_pending = time.monotonic()
+        self.transport.write(bytes((START_BYTE, 4, function, 0, 0, 0)))
+
+
+    def sendS(self):
+        self.received = 0
+        self.rtu['s_sent'] += 1
+        self.transport.write(bytes((START_BYTE, 4, 0x01, 0, (self.vr << 1) & 0xFF, self.vr >> 7)))
+
+
+    def sendI(self, asdu):
+        if len(self.unacked) >= self.k:
+            self.send_queue.append(asdu)
+            return
+        header = bytes((START_BYTE, len(asdu) + 4, (self.vs << 1) & 0xFF, self.vs >> 7, (self.vr << 1) & 0xFF, self.vr >> 7))
+        self.transport.write(header + asdu)
+        self.unacked.append((self.vs, time.monotonic()))
+        self.vs = (self.vs + 1) % SEQ_MODULO
+        self.received = 0 # the I frame acknowledges all received frames
+
+
+    def sendASDU(self, asdu):
+        if self.transport == None or self.transport.is_closing():
+            return False
+        self.sendI(asdu)
+        return True
+
+
+    def checkTimers(self):
+        if self.transport.is_closing():
+            return
+        now = time.monotonic()
+        if len(self.unacked) > 0 and now - self.unacked[0][1] > self.t1:
+            self.close("t1 timeout, I frame not acknowledged")
+            return
+        if self.u_pending != 0 and now - self.u_pending > self.t1:
+            self.close("t1 timeout, U frame not confirmed")
+            return
+        if self.received > 0 and now - self.received_time > self.t2:
+            self.sendS()
+        if self.u_pending == 0 and now - self.last_frame > self.t3:
+            self.last_frame = now
+            self.sendU(U_TESTFR_ACT)
+        self.timer = asyncio.get_running_loop().call_later(TIMER_INTERVAL, self.checkTimers)
+
+
+class IEC60870_5_104_client:
+
+    def __init__(self, callback, state_callback=None, max_pending=10, workers=2, max_gi=4, gi_jitter=2):
+        self.connections = {}
+        self.events = deque() # (tupl, online) state changes, processed by poll()
+        self.wakeup = threading.Event() # set when an event is queued, so the main loop can call poll() directly
+        self.timeout = 2 # seconds for each step of connecting (connect, STARTDT)
+        self.testframe_interval = 1 # seconds
+        self.max_pending = max_pending # maximum amount of RTU's connecting at the same time
+        self.min_backoff = 1 # seconds before the first reconnect attempt
+        self.max_backoff = 60 # seconds between reconnect attempts, when an RTU keeps failing
+        self.k = 12
+        self.w = 8
+        self.t1 = 15
+        self.t2 = 10
+        self.t3 = 20
+        self.callback = callback # called from a worker thread, with (tupl, points)
+        self.state_callback = state_callback # called from poll() with (tupl, online) when an RTU becomes active, or is lost
+        self.raw_handler = None # called from the event loop thread with (tupl, apdu) for each received APDU
+        self.command_callback = None # called from poll() with the result (dict) of each command, see commandtracker.py
+        self.commands = CommandTracker()
+        self.queue = AsduQueue(self.processASDU, workers) # received values, processed by worker threads that call callback
+        self.gi = GIScheduler(self.sendGI, max_gi, gi_jitter) # station GI's after a connect, and periodic GI's, runs in the event loop
+        self.loop = asyncio.new_event_loop()
+        self.pending = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.pending = asyncio.Semaphore(self.max_pending)
+        self.loop.call_soon(self.pollGI)
+        self.loop.run_forever()
+
+
+    def pollGI(self):
+        self.gi.poll(time.monotonic())
+        self.loop.call_later(TIMER_INTERVAL, self.pollGI)
+
+
+    # register an RTU, the connection is (re)established by the event loop
+    # apci is a dict with APCI_PARAMETERS to override the defaults, applied on the next connect
+    # gi_schedule is a dict {qoi: interval in seconds} of periodic GI's, for the station (20) or groups (21-36)
+    def addRTU(self, host, port, apci=None, gi_schedule=None):
+        if port == "" or port == None:
+            port = 2404
+
+        tupl = host + ":" + str(port)
+        if tupl in self.connections:
+            rtu = self.connections[tupl]
+            rtu["apci"] = apci
+            if rtu["gi_schedule"] != gi_schedule:
+                rtu["gi_schedule"] = gi_schedule
+                if rtu["state"] == RTU_ACTIVE:
+                    self.loop.call_soon_threadsafe(lambda: self.gi.schedule(tupl, time.monotonic(), gi_schedule))
+        else:
+            rtu = {
+                "host": host,
+                "port": int(port),
+                "protocol": None,
+                "state": RTU_IDLE,
+                "GI": False,
+                "points": PointTable(tupl), # kept over reconnects, the GI refreshes all values
+                "testfr_received": 0,
+                "testfr_send": 0,
+                "backoff": 0,
+                "apci": apci,
+                "gi_schedule": gi_schedule,
+                "i_received": 0, # I frames received
+                "s_sent": 0, # S frames sent (acknowledgements without data)
+                "task": None,
+                "self": tupl,
+            }
+            self.connections[tupl] = rtu
+            rtu["task"] = asyncio.run_coroutine_threadsafe(self.runRTU(rtu), self.loop)
+        return tupl
+
+
+    # check for an active connection to an RTU, with an up to date datamodel
+    # this does not block; an unknown RTU is registered and connected
+    def getRTU(self, host, port):
+        if host == None:
+            print("missing hostname")
+            return -1
+
+        tupl = self.addRTU(host, port)
+        if self.connections[tupl]["state"] == RTU_ACTIVE and self.connections[tupl]["GI"] == True:
+            return 0
+        return -1
+
+
+    # the APCI parameters of an RTU, defaults of the client, overridden by the parameters of the RTU
+    def getAPCIParameters(self, rtu):
+        apci = {'k': self.k, 'w': self.w, 't0': self.timeout, 't1': self.t1, 't2': self.t2, 't3': self.t3}
+        if rtu["apci"] != None:
+            for key in APCI_PARAMETERS:
+                if key in rtu["apci"]:
+                    apci[key] = rtu["apci"][key]
+        return apci
+
+
+    # process a queued ASDU in a worker thread. the points are updated in place,
+    # and the callback receives the updated points of this ASDU
+    def processASDU(self, tupl, item):
+        points, type_id, elements = item
+        data = [points.update(type_id, ioa, value, quality, timestamp) for ioa, value, quality, timestamp in elements]
+        if self.callback != None and len(data) > 0:
+            self.callback(tupl, data)
+
+
+    def queueEvent(self, tupl, online):
+        self.events.append((tupl, online))
+        self.wakeup.set()
+
+
+    # process state changes of the RTU's, this should be called periodically (i.e. every 100ms), and when wakeup is set
+    def poll(self):
+        while len(self.events) > 0:
+            tupl, online = self.events.popleft()
+            if self.state_callback != None:
+                self.state_callback(tupl, online)
+        for result in self.commands.poll(time.monotonic()):
+            if self.command_callback != None:
+                self.command_callback(result)
+
+
+    # connect, start and read an RTU, and keep it connected, with exponential backoff on failures
+    async def runRTU(self, rtu):
+        try:
+            while True:
+                async with self.pending:
+                    connected = await self.connectRTU(rtu)
+                if connected == True:
+                    rtu["state"] = RTU_ACTIVE
+                    rtu["backoff"] = 0
+                    # read the model, when the scheduler has a free slot
+                    self.gi.connected(rtu["self"], time.monotonic(), rtu["gi_schedule"])
+                    self.queueEvent(rtu["self"], True)
+                    await self.activeRTU(rtu)
+                    self.queueEvent(rtu["self"], False)
+                self.disconnectRTU(rtu)
+                rtu["backoff"] = min(max(rtu["backoff"] * 2, self.min_backoff), self.max_backoff)
+                await asyncio.sleep(rtu["backoff"] + random.uniform(0, rtu["backoff"] * 0.1))
+        finally:
+            if rtu["state"] == RTU_ACTIVE:
+                self.queueEvent(rtu["self"], False)
+            self.disconnectRTU(rtu)
+
+
+    async def connectRTU(self, rtu):
+        rtu["state"] = RTU_CONNECTING
+        rtu["GI"] = False
+        rtu["testfr_received"] = 0
+        rtu["testfr_send"] = 0
+        loop = asyncio.get_running_loop()
+        try:
+            transport, protocol = await asyncio.wait_for(
+                loop.create_connection(lambda: IEC104Protocol(self, rtu), rtu["host"], rtu["port"]),
+                self.getAPCIParameters(rtu)['t0'])
+            rtu["protocol"] = protocol
+            print("Connection established")
+
+            rtu["state"] = RTU_STARTDT
+            protocol.sendU(U_STARTDT_ACT)
+            if await asyncio.wait_for(asyncio.shield(protocol.started), self.timeout) == False:
+                print("error: connection to %s closed before STARTDT_CON" % rtu["self"])
+                return False
+            print("Received STARTDT_CON")
+            return True
+        except asyncio.TimeoutError:
+            print("error: timeout while connecting to %s (state: %i)" % (rtu["self"], rtu["state"]))
+        except OSError as e:
+            print("error: could not connect to %s: %s" % (rtu["self"], str(e)))
+        return False
+
+
+    # send testframes until the connection is closed
+    async def activeRTU(self, rtu):
+        protocol = rtu["protocol"]
+        while not protocol.closed.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(protocol.closed), self.testframe_interval)
+            except asyncio.TimeoutError:
+                self.sendTestframe(rtu)
+
+
+    def disconnectRTU(self, rtu):
+        protocol = rtu["protocol"]
+        if protocol != None:
+            if not protocol.transport.is_closing():
+                if rtu["state"] == RTU_ACTIVE:
+                    protocol.transport.write(bytes((START_BYTE, 4, U_STOPDT_ACT, 0, 0, 0)))
+                protocol.transport.close()
+                print("Connection closed")
+            rtu["protocol"] = None
+        rtu["state"] = RTU_IDLE
+        rtu["GI"] = False
+        self.gi.disconnected(rtu["self"])
+        self.commands.disconnected(rtu["self"])
+
+
+    # send a GI, called by the GI scheduler in the event loop
+    def sendGI(self, tupl, qoi):
+        rtu = self.connections.get(tupl)
+        if rtu == None or rtu["protocol"] == None or rtu["state"] != RTU_ACTIVE:
+            return False
+        return rtu["protocol"].sendASDU(make_asdu(C_IC_NA_1, COT_ACTIVATION, 1, 0, bytes((qoi,))))
+
+
+    def sendTestframe(self, rtu):
+        if rtu["protocol"] == None:
+            return -1
+        if rtu['testfr_send'] > rtu['testfr_received'] + 5:
+            print("error: too many missed testframes, closing connection")
+            rtu["protocol"].transport.close()
+            return -1
+        element = struct.pack('<H', 0x4938) + ms_to_cp56(int(time.time() * 1000))
+        if rtu["protocol"].sendASDU(make_asdu(C_TS_TA_1, COT_ACTIVATION, 1, 0, element)) == False:
+            return -1
+        rtu['testfr_send'] += 1
+        return 0
+
+
+    # send an ASDU from any thread, through the event loop
+    def send(self, rtu, asdu):
+        def send_in_loop():
+            if rtu["protocol"] != None:
+                rtu["protocol"].sendASDU(asdu)
+        self.loop.call_soon_threadsafe(send_in_loop)
+
+
+    def parseref(self, ref):
+        uri_ref = urlparse(ref)
+        port = uri_ref.port
+        if port == "" or port == None:
+            port = 2404
+
+        if uri_ref.scheme != "iec60870-5-104":
+            print("incorrect scheme, only iec60870-5-104 is supported, not %s" % uri_ref.scheme)
+            return None
+
+        if uri_ref.hostname == None:
+            print("missing hostname: %s" % ref)
+            return None
+
+        tupl = uri_ref.hostname + ":" + str(port)
+        if not tupl in self.connections:
+            print("unknown RTU: %s" % tupl)
+            return None
+
+        if self.connections[tupl]["state"] == RTU_ACTIVE:
+            _ref = uri_ref.path[1:].split("/")
+            return {"RTU": self.connections[tupl], "type": _ref[0], "ioa": int(_ref[1])}
+        return None
+
+
+    # send a select or operate command, the ACT_CON/ACT_TERM of the RTU are matched by self.commands
+    # command is the dict of the command as received by the IFS, it is included in the result
+    def command(self, ref, value, select, command=None):
+        obj = self.parseref(ref)
+        if obj == None:
+            return 0
+        ca = 1 # common address
+        if obj['type'] == "SinglePointCommand":
+            type_id = C_SC_NA_1
+            asdu = make_asdu(C_SC_NA_1, COT_ACTIVATION, ca, obj['ioa'], bytes(((value & 0x01) | (select << 7),)))
+        elif obj['type'] == "DoublePointCommand":
+            type_id = C_DC_NA_1
+            asdu = make_asdu(C_DC_NA_1, COT_ACTIVATION, ca, obj['ioa'], bytes(((value & 0x03) | (select << 7),)))
+        else:
+            return 0
+        self.commands.start(obj["RTU"]["self"], type_id, obj['ioa'], select, command if command != None else {"element": ref, "value": value})
+        self.send(obj["RTU"], asdu)
+        return 1
+
+
+    def select(self, ref, value, command=None):
+        return self.command(ref, value, True, command)
+
+
+    def operate(self, ref, value, command=None):
+        return self.command(ref, value, False, command)
+
+
+    # send a testframe to an RTU, returns -1 if the RTU is not active
+    def testframe(self, host, port):
+        if port == "" or port == None:
+            port = 2404
+
+        if host == None:
+            print("missing hostname")
+            return -1
+
+        tupl = host + ":" + str(port)
+        if not tupl in self.connections or self.connections[tupl]["state"] != RTU_ACTIVE:
+            return -1
+        self.loop.call_soon_threadsafe(self.sendTestframe, self.connections[tupl])
+        return 0
+
+
+    def removeRTU(self, host, port):
+        if port == "" or port == None:
+            port = 2404
+
+        tupl = host + ":" + str(port)
+        if tupl in self.connections:
+            rtu = self.connections.pop(tupl)
+            rtu["task"].cancel()
+
+
+def testcallb(tupl, data):
+    print("RTU:" + tupl + " - update:" + str(data))
+
+#test the class
+if __name__== "__main__":
+    client = IEC60870_5_104_client(testcallb)
+    client.addRTU("localhost", 2404)
+    counter = 0
+    while client.getRTU("localhost", 2404) != 0 and counter < 50:
+        client.poll()
+        time.sleep(0.1)
+        counter += 1
+    if client.getRTU("localhost", 2404) == 0:
+        tupl = "localhost:2404"
+        # perform read of latest data
+        print(list(client.connections[tupl]["points"].points.values()))
+        #perform operate
+        if client.select("iec60870-5-104://localhost:2404/DoublePointCommand/6000", 1) == 1:
+            if client.operate("iec60870-5-104://localhost:2404/DoublePointCommand/6000", 1) == 1:
+                print("oper success")
+            else:
+                print("oper failed")
+        else:
+            print("select failed")
@@ -816,6 +816,36 @@ _libs["/usr/local/lib/lib60870.so"] = load_library("/usr/local/lib/lib60870.so")
 # 1 libraries
 # End libraries
 
+# Begin lazy loader (added by make_lazy_lib60870.py)
+
+_loaders = {}
+
+
+def __getattr__(name):
+    loader = _loaders.get(name)
+    if loader is not None:
+        value = loader()
+        if value is not None:
+            globals()[name] = value
+            return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_loaders))
+
+
+# resolve all functions, as the module did before it was made lazy
+def load_all():
+    for name in list(_loaders):
+        if name not in globals():
+            try:
+                __getattr__(name)
+            except AttributeError:
+                pass
+
+# End lazy loader
+
 # No modules
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 39
@@ -839,86 +869,125 @@ SERIAL_PORT_ERROR_UNKNOWN = 99# /home/user/Desktop/scada/lib60870/lib60870-C/src
 SerialPortError = enum_anon_20# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 47
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 61
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_create", "cdecl"):
-    SerialPort_create = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_create", "cdecl")
-    SerialPort_create.argtypes = [String, c_int, c_uint8, c_char, c_uint8]
-    SerialPort_create.restype = SerialPort
+def _load_SerialPort_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_create", "cdecl"):
+        SerialPort_create = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_create", "cdecl")
+        SerialPort_create.argtypes = [String, c_int, c_uint8, c_char, c_uint8]
+        SerialPort_create.restype = SerialPort
+    return locals().get("SerialPort_create")
+_loaders["SerialPort_create"] = _load_SerialPort_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 67
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_destroy", "cdecl"):
-    SerialPort_destroy = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_destroy", "cdecl")
-    SerialPort_destroy.argtypes = [SerialPort]
-    SerialPort_destroy.restype = None
+def _load_SerialPort_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_destroy", "cdecl"):
+        SerialPort_destroy = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_destroy", "cdecl")
+        SerialPort_destroy.argtypes = [SerialPort]
+        SerialPort_destroy.restype = None
+    return locals().get("SerialPort_destroy")
+_loaders["SerialPort_destroy"] = _load_SerialPort_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 75
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_open", "cdecl"):
-    SerialPort_open = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_open", "cdecl")
-    SerialPort_open.argtypes = [SerialPort]
-    SerialPort_open.restype = c_bool
+def _load_SerialPort_open():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_open", "cdecl"):
+        SerialPort_open = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_open", "cdecl")
+        SerialPort_open.argtypes = [SerialPort]
+        SerialPort_open.restype = c_bool
+    return locals().get("SerialPort_open")
+_loaders["SerialPort_open"] = _load_SerialPort_open
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 81
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_close", "cdecl"):
-    SerialPort_close = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_close", "cdecl")
-    SerialPort_close.argtypes = [SerialPort]
-    SerialPort_close.restype = None
+def _load_SerialPort_close():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_close", "cdecl"):
+        SerialPort_close = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_close", "cdecl")
+        SerialPort_close.argtypes = [SerialPort]
+        SerialPort_close.restype = None
+    return locals().get("SerialPort_close")
+_loaders["SerialPort_close"] = _load_SerialPort_close
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 89
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_getBaudRate", "cdecl"):
-    SerialPort_getBaudRate = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_getBaudRate", "cdecl")
-    SerialPort_getBaudRate.argtypes = [SerialPort]
-    SerialPort_getBaudRate.restype = c_int
+def _load_SerialPort_getBaudRate():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_getBaudRate", "cdecl"):
+        SerialPort_getBaudRate = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_getBaudRate", "cdecl")
+        SerialPort_getBaudRate.argtypes = [SerialPort]
+        SerialPort_getBaudRate.restype = c_int
+    return locals().get("SerialPort_getBaudRate")
+_loaders["SerialPort_getBaudRate"] = _load_SerialPort_getBaudRate
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 97
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_setTimeout", "cdecl"):
-    SerialPort_setTimeout = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_setTimeout", "cdecl")
-    SerialPort_setTimeout.argtypes = [SerialPort, c_int]
-    SerialPort_setTimeout.restype = None
+def _load_SerialPort_setTimeout():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_setTimeout", "cdecl"):
+        SerialPort_setTimeout = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_setTimeout", "cdecl")
+        SerialPort_setTimeout.argtypes = [SerialPort, c_int]
+        SerialPort_setTimeout.restype = None
+    return locals().get("SerialPort_setTimeout")
+_loaders["SerialPort_setTimeout"] = _load_SerialPort_setTimeout
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 103
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_discardInBuffer", "cdecl"):
-    SerialPort_discardInBuffer = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_discardInBuffer", "cdecl")
-    SerialPort_discardInBuffer.argtypes = [SerialPort]
-    SerialPort_discardInBuffer.restype = None
+def _load_SerialPort_discardInBuffer():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_discardInBuffer", "cdecl"):
+        SerialPort_discardInBuffer = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_discardInBuffer", "cdecl")
+        SerialPort_discardInBuffer.argtypes = [SerialPort]
+        SerialPort_discardInBuffer.restype = None
+    return locals().get("SerialPort_discardInBuffer")
+_loaders["SerialPort_discardInBuffer"] = _load_SerialPort_discardInBuffer
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 111
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_readByte", "cdecl"):
-    SerialPort_readByte = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_readByte", "cdecl")
-    SerialPort_readByte.argtypes = [SerialPort]
-    SerialPort_readByte.restype = c_int
+def _load_SerialPort_readByte():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_readByte", "cdecl"):
+        SerialPort_readByte = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_readByte", "cdecl")
+        SerialPort_readByte.argtypes = [SerialPort]
+        SerialPort_readByte.restype = c_int
+    return locals().get("SerialPort_readByte")
+_loaders["SerialPort_readByte"] = _load_SerialPort_readByte
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 123
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_write", "cdecl"):
-    SerialPort_write = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_write", "cdecl")
-    SerialPort_write.argtypes = [SerialPort, POINTER(c_uint8), c_int, c_int]
-    SerialPort_write.restype = c_int
+def _load_SerialPort_write():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_write", "cdecl"):
+        SerialPort_write = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_write", "cdecl")
+        SerialPort_write.argtypes = [SerialPort, POINTER(c_uint8), c_int, c_int]
+        SerialPort_write.restype = c_int
+    return locals().get("SerialPort_write")
+_loaders["SerialPort_write"] = _load_SerialPort_write
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_serial.h: 129
-if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_getLastError", "cdecl"):
-    SerialPort_getLastError = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_getLastError", "cdecl")
-    SerialPort_getLastError.argtypes = [SerialPort]
-    SerialPort_getLastError.restype = SerialPortError
+def _load_SerialPort_getLastError():
+    if _libs["/usr/local/lib/lib60870.so"].has("SerialPort_getLastError", "cdecl"):
+        SerialPort_getLastError = _libs["/usr/local/lib/lib60870.so"].get("SerialPort_getLastError", "cdecl")
+        SerialPort_getLastError.argtypes = [SerialPort]
+        SerialPort_getLastError.restype = SerialPortError
+    return locals().get("SerialPort_getLastError")
+_loaders["SerialPort_getLastError"] = _load_SerialPort_getLastError
 
 nsSinceEpoch = c_uint64# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_time.h: 35
 
 msSinceEpoch = c_uint64# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_time.h: 36
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_time.h: 47
-if _libs["/usr/local/lib/lib60870.so"].has("Hal_getTimeInMs", "cdecl"):
-    Hal_getTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("Hal_getTimeInMs", "cdecl")
-    Hal_getTimeInMs.argtypes = []
-    Hal_getTimeInMs.restype = msSinceEpoch
+def _load_Hal_getTimeInMs():
+    if _libs["/usr/local/lib/lib60870.so"].has("Hal_getTimeInMs", "cdecl"):
+        Hal_getTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("Hal_getTimeInMs", "cdecl")
+        Hal_getTimeInMs.argtypes = []
+        Hal_getTimeInMs.restype = msSinceEpoch
+    return locals().get("Hal_getTimeInMs")
+_loaders["Hal_getTimeInMs"] = _load_Hal_getTimeInMs
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_time.h: 58
-if _libs["/usr/local/lib/lib60870.so"].has("Hal_getTimeInNs", "cdecl"):
-    Hal_getTimeInNs = _libs["/usr/local/lib/lib60870.so"].get("Hal_getTimeInNs", "cdecl")
-    Hal_getTimeInNs.argtypes = []
-    Hal_getTimeInNs.restype = nsSinceEpoch
+def _load_Hal_getTimeInNs():
+    if _libs["/usr/local/lib/lib60870.so"].has("Hal_getTimeInNs", "cdecl"):
+        Hal_getTimeInNs = _libs["/usr/local/lib/lib60870.so"].get("Hal_getTimeInNs", "cdecl")
+        Hal_getTimeInNs.argtypes = []
+        Hal_getTimeInNs.restype = nsSinceEpoch
+    return locals().get("Hal_getTimeInNs")
+_loaders["Hal_getTimeInNs"] = _load_Hal_getTimeInNs
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_time.h: 69
-if _libs["/usr/local/lib/lib60870.so"].has("Hal_setTimeInNs", "cdecl"):
-    Hal_setTimeInNs = _libs["/usr/local/lib/lib60870.so"].get("Hal_setTimeInNs", "cdecl")
-    Hal_setTimeInNs.argtypes = [nsSinceEpoch]
-    Hal_setTimeInNs.restype = c_bool
+def _load_Hal_setTimeInNs():
+    if _libs["/usr/local/lib/lib60870.so"].has("Hal_setTimeInNs", "cdecl"):
+        Hal_setTimeInNs = _libs["/usr/local/lib/lib60870.so"].get("Hal_setTimeInNs", "cdecl")
+        Hal_setTimeInNs.argtypes = [nsSinceEpoch]
+        Hal_setTimeInNs.restype = c_bool
+    return locals().get("Hal_setTimeInNs")
+_loaders["Hal_setTimeInNs"] = _load_Hal_setTimeInNs
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 38
 class struct_sThread(Structure):
@@ -931,52 +1000,76 @@ Semaphore = POINTER(None)# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/
 ThreadExecutionFunction = CFUNCTYPE(UNCHECKED(POINTER(c_ubyte)), POINTER(None))# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 44
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 56
-if _libs["/usr/local/lib/lib60870.so"].has("Thread_create", "cdecl"):
-    Thread_create = _libs["/usr/local/lib/lib60870.so"].get("Thread_create", "cdecl")
-    Thread_create.argtypes = [ThreadExecutionFunction, POINTER(None), c_bool]
-    Thread_create.restype = Thread
+def _load_Thread_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Thread_create", "cdecl"):
+        Thread_create = _libs["/usr/local/lib/lib60870.so"].get("Thread_create", "cdecl")
+        Thread_create.argtypes = [ThreadExecutionFunction, POINTER(None), c_bool]
+        Thread_create.restype = Thread
+    return locals().get("Thread_create")
+_loaders["Thread_create"] = _load_Thread_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 67
-if _libs["/usr/local/lib/lib60870.so"].has("Thread_start", "cdecl"):
-    Thread_start = _libs["/usr/local/lib/lib60870.so"].get("Thread_start", "cdecl")
-    Thread_start.argtypes = [Thread]
-    Thread_start.restype = None
+def _load_Thread_start():
+    if _libs["/usr/local/lib/lib60870.so"].has("Thread_start", "cdecl"):
+        Thread_start = _libs["/usr/local/lib/lib60870.so"].get("Thread_start", "cdecl")
+        Thread_start.argtypes = [Thread]
+        Thread_start.restype = None
+    return locals().get("Thread_start")
+_loaders["Thread_start"] = _load_Thread_start
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 75
-if _libs["/usr/local/lib/lib60870.so"].has("Thread_destroy", "cdecl"):
-    Thread_destroy = _libs["/usr/local/lib/lib60870.so"].get("Thread_destroy", "cdecl")
-    Thread_destroy.argtypes = [Thread]
-    Thread_destroy.restype = None
+def _load_Thread_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Thread_destroy", "cdecl"):
+        Thread_destroy = _libs["/usr/local/lib/lib60870.so"].get("Thread_destroy", "cdecl")
+        Thread_destroy.argtypes = [Thread]
+        Thread_destroy.restype = None
+    return locals().get("Thread_destroy")
+_loaders["Thread_destroy"] = _load_Thread_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 81
-if _libs["/usr/local/lib/lib60870.so"].has("Thread_sleep", "cdecl"):
-    Thread_sleep = _libs["/usr/local/lib/lib60870.so"].get("Thread_sleep", "cdecl")
-    Thread_sleep.argtypes = [c_int]
-    Thread_sleep.restype = None
+def _load_Thread_sleep():
+    if _libs["/usr/local/lib/lib60870.so"].has("Thread_sleep", "cdecl"):
+        Thread_sleep = _libs["/usr/local/lib/lib60870.so"].get("Thread_sleep", "cdecl")
+        Thread_sleep.argtypes = [c_int]
+        Thread_sleep.restype = None
+    return locals().get("Thread_sleep")
+_loaders["Thread_sleep"] = _load_Thread_sleep
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 84
-if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_create", "cdecl"):
-    Semaphore_create = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_create", "cdecl")
-    Semaphore_create.argtypes = [c_int]
-    Semaphore_create.restype = Semaphore
+def _load_Semaphore_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_create", "cdecl"):
+        Semaphore_create = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_create", "cdecl")
+        Semaphore_create.argtypes = [c_int]
+        Semaphore_create.restype = Semaphore
+    return locals().get("Semaphore_create")
+_loaders["Semaphore_create"] = _load_Semaphore_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 88
-if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_wait", "cdecl"):
-    Semaphore_wait = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_wait", "cdecl")
-    Semaphore_wait.argtypes = [Semaphore]
-    Semaphore_wait.restype = None
+def _load_Semaphore_wait():
+    if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_wait", "cdecl"):
+        Semaphore_wait = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_wait", "cdecl")
+        Semaphore_wait.argtypes = [Semaphore]
+        Semaphore_wait.restype = None
+    return locals().get("Semaphore_wait")
+_loaders["Semaphore_wait"] = _load_Semaphore_wait
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 91
-if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_post", "cdecl"):
-    Semaphore_post = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_post", "cdecl")
-    Semaphore_post.argtypes = [Semaphore]
-    Semaphore_post.restype = None
+def _load_Semaphore_post():
+    if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_post", "cdecl"):
+        Semaphore_post = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_post", "cdecl")
+        Semaphore_post.argtypes = [Semaphore]
+        Semaphore_post.restype = None
+    return locals().get("Semaphore_post")
+_loaders["Semaphore_post"] = _load_Semaphore_post
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_thread.h: 94
-if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_destroy", "cdecl"):
-    Semaphore_destroy = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_destroy", "cdecl")
-    Semaphore_destroy.argtypes = [Semaphore]
-    Semaphore_destroy.restype = None
+def _load_Semaphore_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Semaphore_destroy", "cdecl"):
+        Semaphore_destroy = _libs["/usr/local/lib/lib60870.so"].get("Semaphore_destroy", "cdecl")
+        Semaphore_destroy.argtypes = [Semaphore]
+        Semaphore_destroy.restype = None
+    return locals().get("Semaphore_destroy")
+_loaders["Semaphore_destroy"] = _load_Semaphore_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 44
 class struct_sServerSocket(Structure):
@@ -1013,219 +1106,318 @@ SOCKET_STATE_CONNECTED = 2# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal
 SocketState = enum_anon_21# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 60
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 69
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_new", "cdecl"):
-    Handleset_new = _libs["/usr/local/lib/lib60870.so"].get("Handleset_new", "cdecl")
-    Handleset_new.argtypes = []
-    Handleset_new.restype = HandleSet
+def _load_Handleset_new():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_new", "cdecl"):
+        Handleset_new = _libs["/usr/local/lib/lib60870.so"].get("Handleset_new", "cdecl")
+        Handleset_new.argtypes = []
+        Handleset_new.restype = HandleSet
+    return locals().get("Handleset_new")
+_loaders["Handleset_new"] = _load_Handleset_new
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 75
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_reset", "cdecl"):
-    Handleset_reset = _libs["/usr/local/lib/lib60870.so"].get("Handleset_reset", "cdecl")
-    Handleset_reset.argtypes = [HandleSet]
-    Handleset_reset.restype = None
+def _load_Handleset_reset():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_reset", "cdecl"):
+        Handleset_reset = _libs["/usr/local/lib/lib60870.so"].get("Handleset_reset", "cdecl")
+        Handleset_reset.argtypes = [HandleSet]
+        Handleset_reset.restype = None
+    return locals().get("Handleset_reset")
+_loaders["Handleset_reset"] = _load_Handleset_reset
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 84
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_addSocket", "cdecl"):
-    Handleset_addSocket = _libs["/usr/local/lib/lib60870.so"].get("Handleset_addSocket", "cdecl")
-    Handleset_addSocket.argtypes = [HandleSet, Socket]
-    Handleset_addSocket.restype = None
+def _load_Handleset_addSocket():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_addSocket", "cdecl"):
+        Handleset_addSocket = _libs["/usr/local/lib/lib60870.so"].get("Handleset_addSocket", "cdecl")
+        Handleset_addSocket.argtypes = [HandleSet, Socket]
+        Handleset_addSocket.restype = None
+    return locals().get("Handleset_addSocket")
+_loaders["Handleset_addSocket"] = _load_Handleset_addSocket
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 90
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_removeSocket", "cdecl"):
-    Handleset_removeSocket = _libs["/usr/local/lib/lib60870.so"].get("Handleset_removeSocket", "cdecl")
-    Handleset_removeSocket.argtypes = [HandleSet, Socket]
-    Handleset_removeSocket.restype = None
+def _load_Handleset_removeSocket():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_removeSocket", "cdecl"):
+        Handleset_removeSocket = _libs["/usr/local/lib/lib60870.so"].get("Handleset_removeSocket", "cdecl")
+        Handleset_removeSocket.argtypes = [HandleSet, Socket]
+        Handleset_removeSocket.restype = None
+    return locals().get("Handleset_removeSocket")
+_loaders["Handleset_removeSocket"] = _load_Handleset_removeSocket
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 108
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_waitReady", "cdecl"):
-    Handleset_waitReady = _libs["/usr/local/lib/lib60870.so"].get("Handleset_waitReady", "cdecl")
-    Handleset_waitReady.argtypes = [HandleSet, c_uint]
-    Handleset_waitReady.restype = c_int
+def _load_Handleset_waitReady():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_waitReady", "cdecl"):
+        Handleset_waitReady = _libs["/usr/local/lib/lib60870.so"].get("Handleset_waitReady", "cdecl")
+        Handleset_waitReady.argtypes = [HandleSet, c_uint]
+        Handleset_waitReady.restype = c_int
+    return locals().get("Handleset_waitReady")
+_loaders["Handleset_waitReady"] = _load_Handleset_waitReady
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 116
-if _libs["/usr/local/lib/lib60870.so"].has("Handleset_destroy", "cdecl"):
-    Handleset_destroy = _libs["/usr/local/lib/lib60870.so"].get("Handleset_destroy", "cdecl")
-    Handleset_destroy.argtypes = [HandleSet]
-    Handleset_destroy.restype = None
+def _load_Handleset_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Handleset_destroy", "cdecl"):
+        Handleset_destroy = _libs["/usr/local/lib/lib60870.so"].get("Handleset_destroy", "cdecl")
+        Handleset_destroy.argtypes = [HandleSet]
+        Handleset_destroy.restype = None
+    return locals().get("Handleset_destroy")
+_loaders["Handleset_destroy"] = _load_Handleset_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 129
-if _libs["/usr/local/lib/lib60870.so"].has("TcpServerSocket_create", "cdecl"):
-    TcpServerSocket_create = _libs["/usr/local/lib/lib60870.so"].get("TcpServerSocket_create", "cdecl")
-    TcpServerSocket_create.argtypes = [String, c_int]
-    TcpServerSocket_create.restype = ServerSocket
+def _load_TcpServerSocket_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("TcpServerSocket_create", "cdecl"):
+        TcpServerSocket_create = _libs["/usr/local/lib/lib60870.so"].get("TcpServerSocket_create", "cdecl")
+        TcpServerSocket_create.argtypes = [String, c_int]
+        TcpServerSocket_create.restype = ServerSocket
+    return locals().get("TcpServerSocket_create")
+_loaders["TcpServerSocket_create"] = _load_TcpServerSocket_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 132
-if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_create", "cdecl"):
-    UdpSocket_create = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_create", "cdecl")
-    UdpSocket_create.argtypes = []
-    UdpSocket_create.restype = UdpSocket
+def _load_UdpSocket_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_create", "cdecl"):
+        UdpSocket_create = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_create", "cdecl")
+        UdpSocket_create.argtypes = []
+        UdpSocket_create.restype = UdpSocket
+    return locals().get("UdpSocket_create")
+_loaders["UdpSocket_create"] = _load_UdpSocket_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 135
-if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_bind", "cdecl"):
-    UdpSocket_bind = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_bind", "cdecl")
-    UdpSocket_bind.argtypes = [UdpSocket, String, c_int]
-    UdpSocket_bind.restype = c_bool
+def _load_UdpSocket_bind():
+    if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_bind", "cdecl"):
+        UdpSocket_bind = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_bind", "cdecl")
+        UdpSocket_bind.argtypes = [UdpSocket, String, c_int]
+        UdpSocket_bind.restype = c_bool
+    return locals().get("UdpSocket_bind")
+_loaders["UdpSocket_bind"] = _load_UdpSocket_bind
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 138
-if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_sendTo", "cdecl"):
-    UdpSocket_sendTo = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_sendTo", "cdecl")
-    UdpSocket_sendTo.argtypes = [UdpSocket, String, c_int, POINTER(c_uint8), c_int]
-    UdpSocket_sendTo.restype = c_bool
+def _load_UdpSocket_sendTo():
+    if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_sendTo", "cdecl"):
+        UdpSocket_sendTo = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_sendTo", "cdecl")
+        UdpSocket_sendTo.argtypes = [UdpSocket, String, c_int, POINTER(c_uint8), c_int]
+        UdpSocket_sendTo.restype = c_bool
+    return locals().get("UdpSocket_sendTo")
+_loaders["UdpSocket_sendTo"] = _load_UdpSocket_sendTo
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 152
-if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_receiveFrom", "cdecl"):
-    UdpSocket_receiveFrom = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_receiveFrom", "cdecl")
-    UdpSocket_receiveFrom.argtypes = [UdpSocket, String, c_int, POINTER(c_uint8), c_int]
-    UdpSocket_receiveFrom.restype = c_int
+def _load_UdpSocket_receiveFrom():
+    if _libs["/usr/local/lib/lib60870.so"].has("UdpSocket_receiveFrom", "cdecl"):
+        UdpSocket_receiveFrom = _libs["/usr/local/lib/lib60870.so"].get("UdpSocket_receiveFrom", "cdecl")
+        UdpSocket_receiveFrom.argtypes = [UdpSocket, String, c_int, POINTER(c_uint8), c_int]
+        UdpSocket_receiveFrom.restype = c_int
+    return locals().get("UdpSocket_receiveFrom")
+_loaders["UdpSocket_receiveFrom"] = _load_UdpSocket_receiveFrom
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 156
-if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_listen", "cdecl"):
-    ServerSocket_listen = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_listen", "cdecl")
-    ServerSocket_listen.argtypes = [ServerSocket]
-    ServerSocket_listen.restype = None
+def _load_ServerSocket_listen():
+    if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_listen", "cdecl"):
+        ServerSocket_listen = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_listen", "cdecl")
+        ServerSocket_listen.argtypes = [ServerSocket]
+        ServerSocket_listen.restype = None
+    return locals().get("ServerSocket_listen")
+_loaders["ServerSocket_listen"] = _load_ServerSocket_listen
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 173
-if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_accept", "cdecl"):
-    ServerSocket_accept = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_accept", "cdecl")
-    ServerSocket_accept.argtypes = [ServerSocket]
-    ServerSocket_accept.restype = Socket
+def _load_ServerSocket_accept():
+    if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_accept", "cdecl"):
+        ServerSocket_accept = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_accept", "cdecl")
+        ServerSocket_accept.argtypes = [ServerSocket]
+        ServerSocket_accept.restype = Socket
+    return locals().get("ServerSocket_accept")
+_loaders["ServerSocket_accept"] = _load_ServerSocket_accept
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 186
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_activateTcpKeepAlive", "cdecl"):
-    Socket_activateTcpKeepAlive = _libs["/usr/local/lib/lib60870.so"].get("Socket_activateTcpKeepAlive", "cdecl")
-    Socket_activateTcpKeepAlive.argtypes = [Socket, c_int, c_int, c_int]
-    Socket_activateTcpKeepAlive.restype = None
+def _load_Socket_activateTcpKeepAlive():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_activateTcpKeepAlive", "cdecl"):
+        Socket_activateTcpKeepAlive = _libs["/usr/local/lib/lib60870.so"].get("Socket_activateTcpKeepAlive", "cdecl")
+        Socket_activateTcpKeepAlive.argtypes = [Socket, c_int, c_int, c_int]
+        Socket_activateTcpKeepAlive.restype = None
+    return locals().get("Socket_activateTcpKeepAlive")
+_loaders["Socket_activateTcpKeepAlive"] = _load_Socket_activateTcpKeepAlive
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 198
-if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_setBacklog", "cdecl"):
-    ServerSocket_setBacklog = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_setBacklog", "cdecl")
-    ServerSocket_setBacklog.argtypes = [ServerSocket, c_int]
-    ServerSocket_setBacklog.restype = None
+def _load_ServerSocket_setBacklog():
+    if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_setBacklog", "cdecl"):
+        ServerSocket_setBacklog = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_setBacklog", "cdecl")
+        ServerSocket_setBacklog.argtypes = [ServerSocket, c_int]
+        ServerSocket_setBacklog.restype = None
+    return locals().get("ServerSocket_setBacklog")
+_loaders["ServerSocket_setBacklog"] = _load_ServerSocket_setBacklog
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 210
-if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_destroy", "cdecl"):
-    ServerSocket_destroy = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_destroy", "cdecl")
-    ServerSocket_destroy.argtypes = [ServerSocket]
-    ServerSocket_destroy.restype = None
+def _load_ServerSocket_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ServerSocket_destroy", "cdecl"):
+        ServerSocket_destroy = _libs["/usr/local/lib/lib60870.so"].get("ServerSocket_destroy", "cdecl")
+        ServerSocket_destroy.argtypes = [ServerSocket]
+        ServerSocket_destroy.restype = None
+    return locals().get("ServerSocket_destroy")
+_loaders["ServerSocket_destroy"] = _load_ServerSocket_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 220
-if _libs["/usr/local/lib/lib60870.so"].has("TcpSocket_create", "cdecl"):
-    TcpSocket_create = _libs["/usr/local/lib/lib60870.so"].get("TcpSocket_create", "cdecl")
-    TcpSocket_create.argtypes = []
-    TcpSocket_create.restype = Socket
+def _load_TcpSocket_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("TcpSocket_create", "cdecl"):
+        TcpSocket_create = _libs["/usr/local/lib/lib60870.so"].get("TcpSocket_create", "cdecl")
+        TcpSocket_create.argtypes = []
+        TcpSocket_create.restype = Socket
+    return locals().get("TcpSocket_create")
+_loaders["TcpSocket_create"] = _load_TcpSocket_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 229
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_setConnectTimeout", "cdecl"):
-    Socket_setConnectTimeout = _libs["/usr/local/lib/lib60870.so"].get("Socket_setConnectTimeout", "cdecl")
-    Socket_setConnectTimeout.argtypes = [Socket, c_uint32]
-    Socket_setConnectTimeout.restype = None
+def _load_Socket_setConnectTimeout():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_setConnectTimeout", "cdecl"):
+        Socket_setConnectTimeout = _libs["/usr/local/lib/lib60870.so"].get("Socket_setConnectTimeout", "cdecl")
+        Socket_setConnectTimeout.argtypes = [Socket, c_uint32]
+        Socket_setConnectTimeout.restype = None
+    return locals().get("Socket_setConnectTimeout")
+_loaders["Socket_setConnectTimeout"] = _load_Socket_setConnectTimeout
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 243
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_bind", "cdecl"):
-    Socket_bind = _libs["/usr/local/lib/lib60870.so"].get("Socket_bind", "cdecl")
-    Socket_bind.argtypes = [Socket, String, c_int]
-    Socket_bind.restype = c_bool
+def _load_Socket_bind():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_bind", "cdecl"):
+        Socket_bind = _libs["/usr/local/lib/lib60870.so"].get("Socket_bind", "cdecl")
+        Socket_bind.argtypes = [Socket, String, c_int]
+        Socket_bind.restype = c_bool
+    return locals().get("Socket_bind")
+_loaders["Socket_bind"] = _load_Socket_bind
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 264
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_connect", "cdecl"):
-    Socket_connect = _libs["/usr/local/lib/lib60870.so"].get("Socket_connect", "cdecl")
-    Socket_connect.argtypes = [Socket, String, c_int]
-    Socket_connect.restype = c_bool
+def _load_Socket_connect():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_connect", "cdecl"):
+        Socket_connect = _libs["/usr/local/lib/lib60870.so"].get("Socket_connect", "cdecl")
+        Socket_connect.argtypes = [Socket, String, c_int]
+        Socket_connect.restype = c_bool
+    return locals().get("Socket_connect")
+_loaders["Socket_connect"] = _load_Socket_connect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 267
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_connectAsync", "cdecl"):
-    Socket_connectAsync = _libs["/usr/local/lib/lib60870.so"].get("Socket_connectAsync", "cdecl")
-    Socket_connectAsync.argtypes = [Socket, String, c_int]
-    Socket_connectAsync.restype = c_bool
+def _load_Socket_connectAsync():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_connectAsync", "cdecl"):
+        Socket_connectAsync = _libs["/usr/local/lib/lib60870.so"].get("Socket_connectAsync", "cdecl")
+        Socket_connectAsync.argtypes = [Socket, String, c_int]
+        Socket_connectAsync.restype = c_bool
+    return locals().get("Socket_connectAsync")
+_loaders["Socket_connectAsync"] = _load_Socket_connectAsync
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 270
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_checkAsyncConnectState", "cdecl"):
-    Socket_checkAsyncConnectState = _libs["/usr/local/lib/lib60870.so"].get("Socket_checkAsyncConnectState", "cdecl")
-    Socket_checkAsyncConnectState.argtypes = [Socket]
-    Socket_checkAsyncConnectState.restype = SocketState
+def _load_Socket_checkAsyncConnectState():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_checkAsyncConnectState", "cdecl"):
+        Socket_checkAsyncConnectState = _libs["/usr/local/lib/lib60870.so"].get("Socket_checkAsyncConnectState", "cdecl")
+        Socket_checkAsyncConnectState.argtypes = [Socket]
+        Socket_checkAsyncConnectState.restype = SocketState
+    return locals().get("Socket_checkAsyncConnectState")
+_loaders["Socket_checkAsyncConnectState"] = _load_Socket_checkAsyncConnectState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 289
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_read", "cdecl"):
-    Socket_read = _libs["/usr/local/lib/lib60870.so"].get("Socket_read", "cdecl")
-    Socket_read.argtypes = [Socket, POINTER(c_uint8), c_int]
-    Socket_read.restype = c_int
+def _load_Socket_read():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_read", "cdecl"):
+        Socket_read = _libs["/usr/local/lib/lib60870.so"].get("Socket_read", "cdecl")
+        Socket_read.argtypes = [Socket, POINTER(c_uint8), c_int]
+        Socket_read.restype = c_int
+    return locals().get("Socket_read")
+_loaders["Socket_read"] = _load_Socket_read
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 301
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_write", "cdecl"):
-    Socket_write = _libs["/usr/local/lib/lib60870.so"].get("Socket_write", "cdecl")
-    Socket_write.argtypes = [Socket, POINTER(c_uint8), c_int]
-    Socket_write.restype = c_int
+def _load_Socket_write():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_write", "cdecl"):
+        Socket_write = _libs["/usr/local/lib/lib60870.so"].get("Socket_write", "cdecl")
+        Socket_write.argtypes = [Socket, POINTER(c_uint8), c_int]
+        Socket_write.restype = c_int
+    return locals().get("Socket_write")
+_loaders["Socket_write"] = _load_Socket_write
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 303
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_getLocalAddress", "cdecl"):
-    Socket_getLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("Socket_getLocalAddress", "cdecl")
-    Socket_getLocalAddress.argtypes = [Socket]
-    if sizeof(c_int) == sizeof(c_void_p):
-        Socket_getLocalAddress.restype = ReturnString
-    else:
-        Socket_getLocalAddress.restype = String
-        Socket_getLocalAddress.errcheck = ReturnString
+def _load_Socket_getLocalAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_getLocalAddress", "cdecl"):
+        Socket_getLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("Socket_getLocalAddress", "cdecl")
+        Socket_getLocalAddress.argtypes = [Socket]
+        if sizeof(c_int) == sizeof(c_void_p):
+            Socket_getLocalAddress.restype = ReturnString
+        else:
+            Socket_getLocalAddress.restype = String
+            Socket_getLocalAddress.errcheck = ReturnString
+    return locals().get("Socket_getLocalAddress")
+_loaders["Socket_getLocalAddress"] = _load_Socket_getLocalAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 317
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_getPeerAddress", "cdecl"):
-    Socket_getPeerAddress = _libs["/usr/local/lib/lib60870.so"].get("Socket_getPeerAddress", "cdecl")
-    Socket_getPeerAddress.argtypes = [Socket]
-    if sizeof(c_int) == sizeof(c_void_p):
-        Socket_getPeerAddress.restype = ReturnString
-    else:
-        Socket_getPeerAddress.restype = String
-        Socket_getPeerAddress.errcheck = ReturnString
+def _load_Socket_getPeerAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_getPeerAddress", "cdecl"):
+        Socket_getPeerAddress = _libs["/usr/local/lib/lib60870.so"].get("Socket_getPeerAddress", "cdecl")
+        Socket_getPeerAddress.argtypes = [Socket]
+        if sizeof(c_int) == sizeof(c_void_p):
+            Socket_getPeerAddress.restype = ReturnString
+        else:
+            Socket_getPeerAddress.restype = String
+            Socket_getPeerAddress.errcheck = ReturnString
+    return locals().get("Socket_getPeerAddress")
+_loaders["Socket_getPeerAddress"] = _load_Socket_getPeerAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 334
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_getPeerAddressStatic", "cdecl"):
-    Socket_getPeerAddressStatic = _libs["/usr/local/lib/lib60870.so"].get("Socket_getPeerAddressStatic", "cdecl")
-    Socket_getPeerAddressStatic.argtypes = [Socket, String]
-    if sizeof(c_int) == sizeof(c_void_p):
-        Socket_getPeerAddressStatic.restype = ReturnString
-    else:
-        Socket_getPeerAddressStatic.restype = String
-        Socket_getPeerAddressStatic.errcheck = ReturnString
+def _load_Socket_getPeerAddressStatic():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_getPeerAddressStatic", "cdecl"):
+        Socket_getPeerAddressStatic = _libs["/usr/local/lib/lib60870.so"].get("Socket_getPeerAddressStatic", "cdecl")
+        Socket_getPeerAddressStatic.argtypes = [Socket, String]
+        if sizeof(c_int) == sizeof(c_void_p):
+            Socket_getPeerAddressStatic.restype = ReturnString
+        else:
+            Socket_getPeerAddressStatic.restype = String
+            Socket_getPeerAddressStatic.errcheck = ReturnString
+    return locals().get("Socket_getPeerAddressStatic")
+_loaders["Socket_getPeerAddressStatic"] = _load_Socket_getPeerAddressStatic
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/hal_socket.h: 348
-if _libs["/usr/local/lib/lib60870.so"].has("Socket_destroy", "cdecl"):
-    Socket_destroy = _libs["/usr/local/lib/lib60870.so"].get("Socket_destroy", "cdecl")
-    Socket_destroy.argtypes = [Socket]
-    Socket_destroy.restype = None
+def _load_Socket_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Socket_destroy", "cdecl"):
+        Socket_destroy = _libs["/usr/local/lib/lib60870.so"].get("Socket_destroy", "cdecl")
+        Socket_destroy.argtypes = [Socket]
+        Socket_destroy.restype = None
+    return locals().get("Socket_destroy")
+_loaders["Socket_destroy"] = _load_Socket_destroy
 
 MemoryExceptionHandler = CFUNCTYPE(UNCHECKED(None), POINTER(None))# /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 32
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 35
-if _libs["/usr/local/lib/lib60870.so"].has("Memory_installExceptionHandler", "cdecl"):
-    Memory_installExceptionHandler = _libs["/usr/local/lib/lib60870.so"].get("Memory_installExceptionHandler", "cdecl")
-    Memory_installExceptionHandler.argtypes = [MemoryExceptionHandler, POINTER(None)]
-    Memory_installExceptionHandler.restype = None
+def _load_Memory_installExceptionHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("Memory_installExceptionHandler", "cdecl"):
+        Memory_installExceptionHandler = _libs["/usr/local/lib/lib60870.so"].get("Memory_installExceptionHandler", "cdecl")
+        Memory_installExceptionHandler.argtypes = [MemoryExceptionHandler, POINTER(None)]
+        Memory_installExceptionHandler.restype = None
+    return locals().get("Memory_installExceptionHandler")
+_loaders["Memory_installExceptionHandler"] = _load_Memory_installExceptionHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 37
-if _libs["/usr/local/lib/lib60870.so"].has("Memory_malloc", "cdecl"):
-    Memory_malloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_malloc", "cdecl")
-    Memory_malloc.argtypes = [c_size_t]
-    Memory_malloc.restype = POINTER(c_ubyte)
-    Memory_malloc.errcheck = lambda v,*a : cast(v, c_void_p)
+def _load_Memory_malloc():
+    if _libs["/usr/local/lib/lib60870.so"].has("Memory_malloc", "cdecl"):
+        Memory_malloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_malloc", "cdecl")
+        Memory_malloc.argtypes = [c_size_t]
+        Memory_malloc.restype = POINTER(c_ubyte)
+        Memory_malloc.errcheck = lambda v,*a : cast(v, c_void_p)
+    return locals().get("Memory_malloc")
+_loaders["Memory_malloc"] = _load_Memory_malloc
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 40
-if _libs["/usr/local/lib/lib60870.so"].has("Memory_calloc", "cdecl"):
-    Memory_calloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_calloc", "cdecl")
-    Memory_calloc.argtypes = [c_size_t, c_size_t]
-    Memory_calloc.restype = POINTER(c_ubyte)
-    Memory_calloc.errcheck = lambda v,*a : cast(v, c_void_p)
+def _load_Memory_calloc():
+    if _libs["/usr/local/lib/lib60870.so"].has("Memory_calloc", "cdecl"):
+        Memory_calloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_calloc", "cdecl")
+        Memory_calloc.argtypes = [c_size_t, c_size_t]
+        Memory_calloc.restype = POINTER(c_ubyte)
+        Memory_calloc.errcheck = lambda v,*a : cast(v, c_void_p)
+    return locals().get("Memory_calloc")
+_loaders["Memory_calloc"] = _load_Memory_calloc
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 43
-if _libs["/usr/local/lib/lib60870.so"].has("Memory_realloc", "cdecl"):
-    Memory_realloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_realloc", "cdecl")
-    Memory_realloc.argtypes = [POINTER(None), c_size_t]
-    Memory_realloc.restype = POINTER(c_ubyte)
-    Memory_realloc.errcheck = lambda v,*a : cast(v, c_void_p)
+def _load_Memory_realloc():
+    if _libs["/usr/local/lib/lib60870.so"].has("Memory_realloc", "cdecl"):
+        Memory_realloc = _libs["/usr/local/lib/lib60870.so"].get("Memory_realloc", "cdecl")
+        Memory_realloc.argtypes = [POINTER(None), c_size_t]
+        Memory_realloc.restype = POINTER(c_ubyte)
+        Memory_realloc.errcheck = lambda v,*a : cast(v, c_void_p)
+    return locals().get("Memory_realloc")
+_loaders["Memory_realloc"] = _load_Memory_realloc
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 47
-if _libs["/usr/local/lib/lib60870.so"].has("Memory_free", "cdecl"):
-    Memory_free = _libs["/usr/local/lib/lib60870.so"].get("Memory_free", "cdecl")
-    Memory_free.argtypes = [POINTER(None)]
-    Memory_free.restype = None
+def _load_Memory_free():
+    if _libs["/usr/local/lib/lib60870.so"].has("Memory_free", "cdecl"):
+        Memory_free = _libs["/usr/local/lib/lib60870.so"].get("Memory_free", "cdecl")
+        Memory_free.argtypes = [POINTER(None)]
+        Memory_free.restype = None
+    return locals().get("Memory_free")
+_loaders["Memory_free"] = _load_Memory_free
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 42
 class struct_sLinkedList(Structure):
@@ -1243,79 +1435,115 @@ struct_sLinkedList._fields_ = [
 LinkedList = POINTER(struct_sLinkedList)# /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 50
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 58
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_create", "cdecl"):
-    LinkedList_create = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_create", "cdecl")
-    LinkedList_create.argtypes = []
-    LinkedList_create.restype = LinkedList
+def _load_LinkedList_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_create", "cdecl"):
+        LinkedList_create = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_create", "cdecl")
+        LinkedList_create.argtypes = []
+        LinkedList_create.restype = LinkedList
+    return locals().get("LinkedList_create")
+_loaders["LinkedList_create"] = _load_LinkedList_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 70
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroy", "cdecl"):
-    LinkedList_destroy = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroy", "cdecl")
-    LinkedList_destroy.argtypes = [LinkedList]
-    LinkedList_destroy.restype = None
+def _load_LinkedList_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroy", "cdecl"):
+        LinkedList_destroy = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroy", "cdecl")
+        LinkedList_destroy.argtypes = [LinkedList]
+        LinkedList_destroy.restype = None
+    return locals().get("LinkedList_destroy")
+_loaders["LinkedList_destroy"] = _load_LinkedList_destroy
 
 LinkedListValueDeleteFunction = CFUNCTYPE(UNCHECKED(None), POINTER(None))# /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 73
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 87
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroyDeep", "cdecl"):
-    LinkedList_destroyDeep = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroyDeep", "cdecl")
-    LinkedList_destroyDeep.argtypes = [LinkedList, LinkedListValueDeleteFunction]
-    LinkedList_destroyDeep.restype = None
+def _load_LinkedList_destroyDeep():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroyDeep", "cdecl"):
+        LinkedList_destroyDeep = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroyDeep", "cdecl")
+        LinkedList_destroyDeep.argtypes = [LinkedList, LinkedListValueDeleteFunction]
+        LinkedList_destroyDeep.restype = None
+    return locals().get("LinkedList_destroyDeep")
+_loaders["LinkedList_destroyDeep"] = _load_LinkedList_destroyDeep
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 98
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroyStatic", "cdecl"):
-    LinkedList_destroyStatic = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroyStatic", "cdecl")
-    LinkedList_destroyStatic.argtypes = [LinkedList]
-    LinkedList_destroyStatic.restype = None
+def _load_LinkedList_destroyStatic():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_destroyStatic", "cdecl"):
+        LinkedList_destroyStatic = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_destroyStatic", "cdecl")
+        LinkedList_destroyStatic.argtypes = [LinkedList]
+        LinkedList_destroyStatic.restype = None
+    return locals().get("LinkedList_destroyStatic")
+_loaders["LinkedList_destroyStatic"] = _load_LinkedList_destroyStatic
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 110
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_add", "cdecl"):
-    LinkedList_add = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_add", "cdecl")
-    LinkedList_add.argtypes = [LinkedList, POINTER(None)]
-    LinkedList_add.restype = None
+def _load_LinkedList_add():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_add", "cdecl"):
+        LinkedList_add = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_add", "cdecl")
+        LinkedList_add.argtypes = [LinkedList, POINTER(None)]
+        LinkedList_add.restype = None
+    return locals().get("LinkedList_add")
+_loaders["LinkedList_add"] = _load_LinkedList_add
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 119
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_remove", "cdecl"):
-    LinkedList_remove = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_remove", "cdecl")
-    LinkedList_remove.argtypes = [LinkedList, POINTER(None)]
-    LinkedList_remove.restype = c_bool
+def _load_LinkedList_remove():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_remove", "cdecl"):
+        LinkedList_remove = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_remove", "cdecl")
+        LinkedList_remove.argtypes = [LinkedList, POINTER(None)]
+        LinkedList_remove.restype = c_bool
+    return locals().get("LinkedList_remove")
+_loaders["LinkedList_remove"] = _load_LinkedList_remove
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 128
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_get", "cdecl"):
-    LinkedList_get = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_get", "cdecl")
-    LinkedList_get.argtypes = [LinkedList, c_int]
-    LinkedList_get.restype = LinkedList
+def _load_LinkedList_get():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_get", "cdecl"):
+        LinkedList_get = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_get", "cdecl")
+        LinkedList_get.argtypes = [LinkedList, c_int]
+        LinkedList_get.restype = LinkedList
+    return locals().get("LinkedList_get")
+_loaders["LinkedList_get"] = _load_LinkedList_get
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 136
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getNext", "cdecl"):
-    LinkedList_getNext = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getNext", "cdecl")
-    LinkedList_getNext.argtypes = [LinkedList]
-    LinkedList_getNext.restype = LinkedList
+def _load_LinkedList_getNext():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getNext", "cdecl"):
+        LinkedList_getNext = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getNext", "cdecl")
+        LinkedList_getNext.argtypes = [LinkedList]
+        LinkedList_getNext.restype = LinkedList
+    return locals().get("LinkedList_getNext")
+_loaders["LinkedList_getNext"] = _load_LinkedList_getNext
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 144
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getLastElement", "cdecl"):
-    LinkedList_getLastElement = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getLastElement", "cdecl")
-    LinkedList_getLastElement.argtypes = [LinkedList]
-    LinkedList_getLastElement.restype = LinkedList
+def _load_LinkedList_getLastElement():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getLastElement", "cdecl"):
+        LinkedList_getLastElement = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getLastElement", "cdecl")
+        LinkedList_getLastElement.argtypes = [LinkedList]
+        LinkedList_getLastElement.restype = LinkedList
+    return locals().get("LinkedList_getLastElement")
+_loaders["LinkedList_getLastElement"] = _load_LinkedList_getLastElement
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 152
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_insertAfter", "cdecl"):
-    LinkedList_insertAfter = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_insertAfter", "cdecl")
-    LinkedList_insertAfter.argtypes = [LinkedList, POINTER(None)]
-    LinkedList_insertAfter.restype = LinkedList
+def _load_LinkedList_insertAfter():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_insertAfter", "cdecl"):
+        LinkedList_insertAfter = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_insertAfter", "cdecl")
+        LinkedList_insertAfter.argtypes = [LinkedList, POINTER(None)]
+        LinkedList_insertAfter.restype = LinkedList
+    return locals().get("LinkedList_insertAfter")
+_loaders["LinkedList_insertAfter"] = _load_LinkedList_insertAfter
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 162
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_size", "cdecl"):
-    LinkedList_size = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_size", "cdecl")
-    LinkedList_size.argtypes = [LinkedList]
-    LinkedList_size.restype = c_int
+def _load_LinkedList_size():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_size", "cdecl"):
+        LinkedList_size = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_size", "cdecl")
+        LinkedList_size.argtypes = [LinkedList]
+        LinkedList_size.restype = c_int
+    return locals().get("LinkedList_size")
+_loaders["LinkedList_size"] = _load_LinkedList_size
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/common/inc/linked_list.h: 164
-if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getData", "cdecl"):
-    LinkedList_getData = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getData", "cdecl")
-    LinkedList_getData.argtypes = [LinkedList]
-    LinkedList_getData.restype = POINTER(c_ubyte)
-    LinkedList_getData.errcheck = lambda v,*a : cast(v, c_void_p)
+def _load_LinkedList_getData():
+    if _libs["/usr/local/lib/lib60870.so"].has("LinkedList_getData", "cdecl"):
+        LinkedList_getData = _libs["/usr/local/lib/lib60870.so"].get("LinkedList_getData", "cdecl")
+        LinkedList_getData.argtypes = [LinkedList]
+        LinkedList_getData.restype = POINTER(c_ubyte)
+        LinkedList_getData.errcheck = lambda v,*a : cast(v, c_void_p)
+    return locals().get("LinkedList_getData")
+_loaders["LinkedList_getData"] = _load_LinkedList_getData
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 59
 class struct_anon_22(Structure):
@@ -1671,10 +1899,13 @@ IEC60870_5_TypeID = enum_anon_26# /home/user/Desktop/scada/lib60870/lib60870-C/s
 TypeID = IEC60870_5_TypeID# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 128
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 130
-if _libs["/usr/local/lib/lib60870.so"].has("TypeID_toString", "cdecl"):
-    TypeID_toString = _libs["/usr/local/lib/lib60870.so"].get("TypeID_toString", "cdecl")
-    TypeID_toString.argtypes = [TypeID]
-    TypeID_toString.restype = c_char_p
+def _load_TypeID_toString():
+    if _libs["/usr/local/lib/lib60870.so"].has("TypeID_toString", "cdecl"):
+        TypeID_toString = _libs["/usr/local/lib/lib60870.so"].get("TypeID_toString", "cdecl")
+        TypeID_toString.argtypes = [TypeID]
+        TypeID_toString.restype = c_char_p
+    return locals().get("TypeID_toString")
+_loaders["TypeID_toString"] = _load_TypeID_toString
 
 QualityDescriptor = c_uint8# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 133
 
@@ -1743,28 +1974,40 @@ tSingleEvent = c_uint8# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api
 SingleEvent = POINTER(tSingleEvent)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 334
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 337
-if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_setEventState", "cdecl"):
-    SingleEvent_setEventState = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_setEventState", "cdecl")
-    SingleEvent_setEventState.argtypes = [SingleEvent, EventState]
-    SingleEvent_setEventState.restype = None
+def _load_SingleEvent_setEventState():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_setEventState", "cdecl"):
+        SingleEvent_setEventState = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_setEventState", "cdecl")
+        SingleEvent_setEventState.argtypes = [SingleEvent, EventState]
+        SingleEvent_setEventState.restype = None
+    return locals().get("SingleEvent_setEventState")
+_loaders["SingleEvent_setEventState"] = _load_SingleEvent_setEventState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 340
-if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_getEventState", "cdecl"):
-    SingleEvent_getEventState = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_getEventState", "cdecl")
-    SingleEvent_getEventState.argtypes = [SingleEvent]
-    SingleEvent_getEventState.restype = EventState
+def _load_SingleEvent_getEventState():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_getEventState", "cdecl"):
+        SingleEvent_getEventState = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_getEventState", "cdecl")
+        SingleEvent_getEventState.argtypes = [SingleEvent]
+        SingleEvent_getEventState.restype = EventState
+    return locals().get("SingleEvent_getEventState")
+_loaders["SingleEvent_getEventState"] = _load_SingleEvent_getEventState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 343
-if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_setQDP", "cdecl"):
-    SingleEvent_setQDP = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_setQDP", "cdecl")
-    SingleEvent_setQDP.argtypes = [SingleEvent, QualityDescriptorP]
-    SingleEvent_setQDP.restype = None
+def _load_SingleEvent_setQDP():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_setQDP", "cdecl"):
+        SingleEvent_setQDP = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_setQDP", "cdecl")
+        SingleEvent_setQDP.argtypes = [SingleEvent, QualityDescriptorP]
+        SingleEvent_setQDP.restype = None
+    return locals().get("SingleEvent_setQDP")
+_loaders["SingleEvent_setQDP"] = _load_SingleEvent_setQDP
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 346
-if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_getQDP", "cdecl"):
-    SingleEvent_getQDP = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_getQDP", "cdecl")
-    SingleEvent_getQDP.argtypes = [SingleEvent]
-    SingleEvent_getQDP.restype = QualityDescriptorP
+def _load_SingleEvent_getQDP():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleEvent_getQDP", "cdecl"):
+        SingleEvent_getQDP = _libs["/usr/local/lib/lib60870.so"].get("SingleEvent_getQDP", "cdecl")
+        SingleEvent_getQDP.argtypes = [SingleEvent]
+        SingleEvent_getQDP.restype = QualityDescriptorP
+    return locals().get("SingleEvent_getQDP")
+_loaders["SingleEvent_getQDP"] = _load_SingleEvent_getQDP
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 353
 class struct_sStatusAndStatusChangeDetection(Structure):
@@ -1782,34 +2025,49 @@ struct_sStatusAndStatusChangeDetection._fields_ = [
 ]
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 358
-if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getSTn", "cdecl"):
-    StatusAndStatusChangeDetection_getSTn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getSTn", "cdecl")
-    StatusAndStatusChangeDetection_getSTn.argtypes = [StatusAndStatusChangeDetection]
-    StatusAndStatusChangeDetection_getSTn.restype = c_uint16
+def _load_StatusAndStatusChangeDetection_getSTn():
+    if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getSTn", "cdecl"):
+        StatusAndStatusChangeDetection_getSTn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getSTn", "cdecl")
+        StatusAndStatusChangeDetection_getSTn.argtypes = [StatusAndStatusChangeDetection]
+        StatusAndStatusChangeDetection_getSTn.restype = c_uint16
+    return locals().get("StatusAndStatusChangeDetection_getSTn")
+_loaders["StatusAndStatusChangeDetection_getSTn"] = _load_StatusAndStatusChangeDetection_getSTn
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 361
-if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getCDn", "cdecl"):
-    StatusAndStatusChangeDetection_getCDn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getCDn", "cdecl")
-    StatusAndStatusChangeDetection_getCDn.argtypes = [StatusAndStatusChangeDetection]
-    StatusAndStatusChangeDetection_getCDn.restype = c_uint16
+def _load_StatusAndStatusChangeDetection_getCDn():
+    if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getCDn", "cdecl"):
+        StatusAndStatusChangeDetection_getCDn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getCDn", "cdecl")
+        StatusAndStatusChangeDetection_getCDn.argtypes = [StatusAndStatusChangeDetection]
+        StatusAndStatusChangeDetection_getCDn.restype = c_uint16
+    return locals().get("StatusAndStatusChangeDetection_getCDn")
+_loaders["StatusAndStatusChangeDetection_getCDn"] = _load_StatusAndStatusChangeDetection_getCDn
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 364
-if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_setSTn", "cdecl"):
-    StatusAndStatusChangeDetection_setSTn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_setSTn", "cdecl")
-    StatusAndStatusChangeDetection_setSTn.argtypes = [StatusAndStatusChangeDetection, c_uint16]
-    StatusAndStatusChangeDetection_setSTn.restype = None
+def _load_StatusAndStatusChangeDetection_setSTn():
+    if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_setSTn", "cdecl"):
+        StatusAndStatusChangeDetection_setSTn = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_setSTn", "cdecl")
+        StatusAndStatusChangeDetection_setSTn.argtypes = [StatusAndStatusChangeDetection, c_uint16]
+        StatusAndStatusChangeDetection_setSTn.restype = None
+    return locals().get("StatusAndStatusChangeDetection_setSTn")
+_loaders["StatusAndStatusChangeDetection_setSTn"] = _load_StatusAndStatusChangeDetection_setSTn
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 367
-if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getST", "cdecl"):
-    StatusAndStatusChangeDetection_getST = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getST", "cdecl")
-    StatusAndStatusChangeDetection_getST.argtypes = [StatusAndStatusChangeDetection, c_int]
-    StatusAndStatusChangeDetection_getST.restype = c_bool
+def _load_StatusAndStatusChangeDetection_getST():
+    if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getST", "cdecl"):
+        StatusAndStatusChangeDetection_getST = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getST", "cdecl")
+        StatusAndStatusChangeDetection_getST.argtypes = [StatusAndStatusChangeDetection, c_int]
+        StatusAndStatusChangeDetection_getST.restype = c_bool
+    return locals().get("StatusAndStatusChangeDetection_getST")
+_loaders["StatusAndStatusChangeDetection_getST"] = _load_StatusAndStatusChangeDetection_getST
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 370
-if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getCD", "cdecl"):
-    StatusAndStatusChangeDetection_getCD = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getCD", "cdecl")
-    StatusAndStatusChangeDetection_getCD.argtypes = [StatusAndStatusChangeDetection, c_int]
-    StatusAndStatusChangeDetection_getCD.restype = c_bool
+def _load_StatusAndStatusChangeDetection_getCD():
+    if _libs["/usr/local/lib/lib60870.so"].has("StatusAndStatusChangeDetection_getCD", "cdecl"):
+        StatusAndStatusChangeDetection_getCD = _libs["/usr/local/lib/lib60870.so"].get("StatusAndStatusChangeDetection_getCD", "cdecl")
+        StatusAndStatusChangeDetection_getCD.argtypes = [StatusAndStatusChangeDetection, c_int]
+        StatusAndStatusChangeDetection_getCD.restype = c_bool
+    return locals().get("StatusAndStatusChangeDetection_getCD")
+_loaders["StatusAndStatusChangeDetection_getCD"] = _load_StatusAndStatusChangeDetection_getCD
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 377
 class struct_sInformationObject(Structure):
@@ -1818,28 +2076,40 @@ class struct_sInformationObject(Structure):
 InformationObject = POINTER(struct_sInformationObject)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 377
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 385
-if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getMaxSizeInMemory", "cdecl"):
-    InformationObject_getMaxSizeInMemory = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getMaxSizeInMemory", "cdecl")
-    InformationObject_getMaxSizeInMemory.argtypes = []
-    InformationObject_getMaxSizeInMemory.restype = c_int
+def _load_InformationObject_getMaxSizeInMemory():
+    if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getMaxSizeInMemory", "cdecl"):
+        InformationObject_getMaxSizeInMemory = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getMaxSizeInMemory", "cdecl")
+        InformationObject_getMaxSizeInMemory.argtypes = []
+        InformationObject_getMaxSizeInMemory.restype = c_int
+    return locals().get("InformationObject_getMaxSizeInMemory")
+_loaders["InformationObject_getMaxSizeInMemory"] = _load_InformationObject_getMaxSizeInMemory
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 388
-if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getObjectAddress", "cdecl"):
-    InformationObject_getObjectAddress = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getObjectAddress", "cdecl")
-    InformationObject_getObjectAddress.argtypes = [InformationObject]
-    InformationObject_getObjectAddress.restype = c_int
+def _load_InformationObject_getObjectAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getObjectAddress", "cdecl"):
+        InformationObject_getObjectAddress = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getObjectAddress", "cdecl")
+        InformationObject_getObjectAddress.argtypes = [InformationObject]
+        InformationObject_getObjectAddress.restype = c_int
+    return locals().get("InformationObject_getObjectAddress")
+_loaders["InformationObject_getObjectAddress"] = _load_InformationObject_getObjectAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 391
-if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getType", "cdecl"):
-    InformationObject_getType = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getType", "cdecl")
-    InformationObject_getType.argtypes = [InformationObject]
-    InformationObject_getType.restype = TypeID
+def _load_InformationObject_getType():
+    if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_getType", "cdecl"):
+        InformationObject_getType = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_getType", "cdecl")
+        InformationObject_getType.argtypes = [InformationObject]
+        InformationObject_getType.restype = TypeID
+    return locals().get("InformationObject_getType")
+_loaders["InformationObject_getType"] = _load_InformationObject_getType
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 401
-if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_destroy", "cdecl"):
-    InformationObject_destroy = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_destroy", "cdecl")
-    InformationObject_destroy.argtypes = [InformationObject]
-    InformationObject_destroy.restype = None
+def _load_InformationObject_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("InformationObject_destroy", "cdecl"):
+        InformationObject_destroy = _libs["/usr/local/lib/lib60870.so"].get("InformationObject_destroy", "cdecl")
+        InformationObject_destroy.argtypes = [InformationObject]
+        InformationObject_destroy.restype = None
+    return locals().get("InformationObject_destroy")
+_loaders["InformationObject_destroy"] = _load_InformationObject_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 407
 class struct_sSinglePointInformation(Structure):
@@ -1848,28 +2118,40 @@ class struct_sSinglePointInformation(Structure):
 SinglePointInformation = POINTER(struct_sSinglePointInformation)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 407
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 410
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_create", "cdecl"):
-    SinglePointInformation_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_create", "cdecl")
-    SinglePointInformation_create.argtypes = [SinglePointInformation, c_int, c_bool, QualityDescriptor]
-    SinglePointInformation_create.restype = SinglePointInformation
+def _load_SinglePointInformation_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_create", "cdecl"):
+        SinglePointInformation_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_create", "cdecl")
+        SinglePointInformation_create.argtypes = [SinglePointInformation, c_int, c_bool, QualityDescriptor]
+        SinglePointInformation_create.restype = SinglePointInformation
+    return locals().get("SinglePointInformation_create")
+_loaders["SinglePointInformation_create"] = _load_SinglePointInformation_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 414
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_getValue", "cdecl"):
-    SinglePointInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_getValue", "cdecl")
-    SinglePointInformation_getValue.argtypes = [SinglePointInformation]
-    SinglePointInformation_getValue.restype = c_bool
+def _load_SinglePointInformation_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_getValue", "cdecl"):
+        SinglePointInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_getValue", "cdecl")
+        SinglePointInformation_getValue.argtypes = [SinglePointInformation]
+        SinglePointInformation_getValue.restype = c_bool
+    return locals().get("SinglePointInformation_getValue")
+_loaders["SinglePointInformation_getValue"] = _load_SinglePointInformation_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 417
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_getQuality", "cdecl"):
-    SinglePointInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_getQuality", "cdecl")
-    SinglePointInformation_getQuality.argtypes = [SinglePointInformation]
-    SinglePointInformation_getQuality.restype = QualityDescriptor
+def _load_SinglePointInformation_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_getQuality", "cdecl"):
+        SinglePointInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_getQuality", "cdecl")
+        SinglePointInformation_getQuality.argtypes = [SinglePointInformation]
+        SinglePointInformation_getQuality.restype = QualityDescriptor
+    return locals().get("SinglePointInformation_getQuality")
+_loaders["SinglePointInformation_getQuality"] = _load_SinglePointInformation_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 420
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_destroy", "cdecl"):
-    SinglePointInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_destroy", "cdecl")
-    SinglePointInformation_destroy.argtypes = [SinglePointInformation]
-    SinglePointInformation_destroy.restype = None
+def _load_SinglePointInformation_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointInformation_destroy", "cdecl"):
+        SinglePointInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointInformation_destroy", "cdecl")
+        SinglePointInformation_destroy.argtypes = [SinglePointInformation]
+        SinglePointInformation_destroy.restype = None
+    return locals().get("SinglePointInformation_destroy")
+_loaders["SinglePointInformation_destroy"] = _load_SinglePointInformation_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 426
 class struct_sSinglePointWithCP24Time2a(Structure):
@@ -1878,22 +2160,31 @@ class struct_sSinglePointWithCP24Time2a(Structure):
 SinglePointWithCP24Time2a = POINTER(struct_sSinglePointWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 426
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 429
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_create", "cdecl"):
-    SinglePointWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_create", "cdecl")
-    SinglePointWithCP24Time2a_create.argtypes = [SinglePointWithCP24Time2a, c_int, c_bool, QualityDescriptor, CP24Time2a]
-    SinglePointWithCP24Time2a_create.restype = SinglePointWithCP24Time2a
+def _load_SinglePointWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_create", "cdecl"):
+        SinglePointWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_create", "cdecl")
+        SinglePointWithCP24Time2a_create.argtypes = [SinglePointWithCP24Time2a, c_int, c_bool, QualityDescriptor, CP24Time2a]
+        SinglePointWithCP24Time2a_create.restype = SinglePointWithCP24Time2a
+    return locals().get("SinglePointWithCP24Time2a_create")
+_loaders["SinglePointWithCP24Time2a_create"] = _load_SinglePointWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 433
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_destroy", "cdecl"):
-    SinglePointWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_destroy", "cdecl")
-    SinglePointWithCP24Time2a_destroy.argtypes = [SinglePointWithCP24Time2a]
-    SinglePointWithCP24Time2a_destroy.restype = None
+def _load_SinglePointWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_destroy", "cdecl"):
+        SinglePointWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_destroy", "cdecl")
+        SinglePointWithCP24Time2a_destroy.argtypes = [SinglePointWithCP24Time2a]
+        SinglePointWithCP24Time2a_destroy.restype = None
+    return locals().get("SinglePointWithCP24Time2a_destroy")
+_loaders["SinglePointWithCP24Time2a_destroy"] = _load_SinglePointWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 436
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_getTimestamp", "cdecl"):
-    SinglePointWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_getTimestamp", "cdecl")
-    SinglePointWithCP24Time2a_getTimestamp.argtypes = [SinglePointWithCP24Time2a]
-    SinglePointWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_SinglePointWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP24Time2a_getTimestamp", "cdecl"):
+        SinglePointWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP24Time2a_getTimestamp", "cdecl")
+        SinglePointWithCP24Time2a_getTimestamp.argtypes = [SinglePointWithCP24Time2a]
+        SinglePointWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("SinglePointWithCP24Time2a_getTimestamp")
+_loaders["SinglePointWithCP24Time2a_getTimestamp"] = _load_SinglePointWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 442
 class struct_sSinglePointWithCP56Time2a(Structure):
@@ -1902,22 +2193,31 @@ class struct_sSinglePointWithCP56Time2a(Structure):
 SinglePointWithCP56Time2a = POINTER(struct_sSinglePointWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 442
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 445
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_create", "cdecl"):
-    SinglePointWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_create", "cdecl")
-    SinglePointWithCP56Time2a_create.argtypes = [SinglePointWithCP56Time2a, c_int, c_bool, QualityDescriptor, CP56Time2a]
-    SinglePointWithCP56Time2a_create.restype = SinglePointWithCP56Time2a
+def _load_SinglePointWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_create", "cdecl"):
+        SinglePointWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_create", "cdecl")
+        SinglePointWithCP56Time2a_create.argtypes = [SinglePointWithCP56Time2a, c_int, c_bool, QualityDescriptor, CP56Time2a]
+        SinglePointWithCP56Time2a_create.restype = SinglePointWithCP56Time2a
+    return locals().get("SinglePointWithCP56Time2a_create")
+_loaders["SinglePointWithCP56Time2a_create"] = _load_SinglePointWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 449
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_destroy", "cdecl"):
-    SinglePointWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_destroy", "cdecl")
-    SinglePointWithCP56Time2a_destroy.argtypes = [SinglePointWithCP56Time2a]
-    SinglePointWithCP56Time2a_destroy.restype = None
+def _load_SinglePointWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_destroy", "cdecl"):
+        SinglePointWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_destroy", "cdecl")
+        SinglePointWithCP56Time2a_destroy.argtypes = [SinglePointWithCP56Time2a]
+        SinglePointWithCP56Time2a_destroy.restype = None
+    return locals().get("SinglePointWithCP56Time2a_destroy")
+_loaders["SinglePointWithCP56Time2a_destroy"] = _load_SinglePointWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 452
-if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_getTimestamp", "cdecl"):
-    SinglePointWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_getTimestamp", "cdecl")
-    SinglePointWithCP56Time2a_getTimestamp.argtypes = [SinglePointWithCP56Time2a]
-    SinglePointWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_SinglePointWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SinglePointWithCP56Time2a_getTimestamp", "cdecl"):
+        SinglePointWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SinglePointWithCP56Time2a_getTimestamp", "cdecl")
+        SinglePointWithCP56Time2a_getTimestamp.argtypes = [SinglePointWithCP56Time2a]
+        SinglePointWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("SinglePointWithCP56Time2a_getTimestamp")
+_loaders["SinglePointWithCP56Time2a_getTimestamp"] = _load_SinglePointWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 459
 class struct_sDoublePointInformation(Structure):
@@ -1926,28 +2226,40 @@ class struct_sDoublePointInformation(Structure):
 DoublePointInformation = POINTER(struct_sDoublePointInformation)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 459
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 462
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_destroy", "cdecl"):
-    DoublePointInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_destroy", "cdecl")
-    DoublePointInformation_destroy.argtypes = [DoublePointInformation]
-    DoublePointInformation_destroy.restype = None
+def _load_DoublePointInformation_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_destroy", "cdecl"):
+        DoublePointInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_destroy", "cdecl")
+        DoublePointInformation_destroy.argtypes = [DoublePointInformation]
+        DoublePointInformation_destroy.restype = None
+    return locals().get("DoublePointInformation_destroy")
+_loaders["DoublePointInformation_destroy"] = _load_DoublePointInformation_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 465
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_create", "cdecl"):
-    DoublePointInformation_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_create", "cdecl")
-    DoublePointInformation_create.argtypes = [DoublePointInformation, c_int, DoublePointValue, QualityDescriptor]
-    DoublePointInformation_create.restype = DoublePointInformation
+def _load_DoublePointInformation_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_create", "cdecl"):
+        DoublePointInformation_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_create", "cdecl")
+        DoublePointInformation_create.argtypes = [DoublePointInformation, c_int, DoublePointValue, QualityDescriptor]
+        DoublePointInformation_create.restype = DoublePointInformation
+    return locals().get("DoublePointInformation_create")
+_loaders["DoublePointInformation_create"] = _load_DoublePointInformation_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 469
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_getValue", "cdecl"):
-    DoublePointInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_getValue", "cdecl")
-    DoublePointInformation_getValue.argtypes = [DoublePointInformation]
-    DoublePointInformation_getValue.restype = DoublePointValue
+def _load_DoublePointInformation_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_getValue", "cdecl"):
+        DoublePointInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_getValue", "cdecl")
+        DoublePointInformation_getValue.argtypes = [DoublePointInformation]
+        DoublePointInformation_getValue.restype = DoublePointValue
+    return locals().get("DoublePointInformation_getValue")
+_loaders["DoublePointInformation_getValue"] = _load_DoublePointInformation_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 472
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_getQuality", "cdecl"):
-    DoublePointInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_getQuality", "cdecl")
-    DoublePointInformation_getQuality.argtypes = [DoublePointInformation]
-    DoublePointInformation_getQuality.restype = QualityDescriptor
+def _load_DoublePointInformation_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointInformation_getQuality", "cdecl"):
+        DoublePointInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("DoublePointInformation_getQuality", "cdecl")
+        DoublePointInformation_getQuality.argtypes = [DoublePointInformation]
+        DoublePointInformation_getQuality.restype = QualityDescriptor
+    return locals().get("DoublePointInformation_getQuality")
+_loaders["DoublePointInformation_getQuality"] = _load_DoublePointInformation_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 478
 class struct_sDoublePointWithCP24Time2a(Structure):
@@ -1956,22 +2268,31 @@ class struct_sDoublePointWithCP24Time2a(Structure):
 DoublePointWithCP24Time2a = POINTER(struct_sDoublePointWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 478
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 481
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_destroy", "cdecl"):
-    DoublePointWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_destroy", "cdecl")
-    DoublePointWithCP24Time2a_destroy.argtypes = [DoublePointWithCP24Time2a]
-    DoublePointWithCP24Time2a_destroy.restype = None
+def _load_DoublePointWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_destroy", "cdecl"):
+        DoublePointWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_destroy", "cdecl")
+        DoublePointWithCP24Time2a_destroy.argtypes = [DoublePointWithCP24Time2a]
+        DoublePointWithCP24Time2a_destroy.restype = None
+    return locals().get("DoublePointWithCP24Time2a_destroy")
+_loaders["DoublePointWithCP24Time2a_destroy"] = _load_DoublePointWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 484
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_create", "cdecl"):
-    DoublePointWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_create", "cdecl")
-    DoublePointWithCP24Time2a_create.argtypes = [DoublePointWithCP24Time2a, c_int, DoublePointValue, QualityDescriptor, CP24Time2a]
-    DoublePointWithCP24Time2a_create.restype = DoublePointWithCP24Time2a
+def _load_DoublePointWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_create", "cdecl"):
+        DoublePointWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_create", "cdecl")
+        DoublePointWithCP24Time2a_create.argtypes = [DoublePointWithCP24Time2a, c_int, DoublePointValue, QualityDescriptor, CP24Time2a]
+        DoublePointWithCP24Time2a_create.restype = DoublePointWithCP24Time2a
+    return locals().get("DoublePointWithCP24Time2a_create")
+_loaders["DoublePointWithCP24Time2a_create"] = _load_DoublePointWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 488
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_getTimestamp", "cdecl"):
-    DoublePointWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_getTimestamp", "cdecl")
-    DoublePointWithCP24Time2a_getTimestamp.argtypes = [DoublePointWithCP24Time2a]
-    DoublePointWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_DoublePointWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP24Time2a_getTimestamp", "cdecl"):
+        DoublePointWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP24Time2a_getTimestamp", "cdecl")
+        DoublePointWithCP24Time2a_getTimestamp.argtypes = [DoublePointWithCP24Time2a]
+        DoublePointWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("DoublePointWithCP24Time2a_getTimestamp")
+_loaders["DoublePointWithCP24Time2a_getTimestamp"] = _load_DoublePointWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 494
 class struct_sDoublePointWithCP56Time2a(Structure):
@@ -1980,22 +2301,31 @@ class struct_sDoublePointWithCP56Time2a(Structure):
 DoublePointWithCP56Time2a = POINTER(struct_sDoublePointWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 494
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 497
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_create", "cdecl"):
-    DoublePointWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_create", "cdecl")
-    DoublePointWithCP56Time2a_create.argtypes = [DoublePointWithCP56Time2a, c_int, DoublePointValue, QualityDescriptor, CP56Time2a]
-    DoublePointWithCP56Time2a_create.restype = DoublePointWithCP56Time2a
+def _load_DoublePointWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_create", "cdecl"):
+        DoublePointWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_create", "cdecl")
+        DoublePointWithCP56Time2a_create.argtypes = [DoublePointWithCP56Time2a, c_int, DoublePointValue, QualityDescriptor, CP56Time2a]
+        DoublePointWithCP56Time2a_create.restype = DoublePointWithCP56Time2a
+    return locals().get("DoublePointWithCP56Time2a_create")
+_loaders["DoublePointWithCP56Time2a_create"] = _load_DoublePointWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 501
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_destroy", "cdecl"):
-    DoublePointWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_destroy", "cdecl")
-    DoublePointWithCP56Time2a_destroy.argtypes = [DoublePointWithCP56Time2a]
-    DoublePointWithCP56Time2a_destroy.restype = None
+def _load_DoublePointWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_destroy", "cdecl"):
+        DoublePointWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_destroy", "cdecl")
+        DoublePointWithCP56Time2a_destroy.argtypes = [DoublePointWithCP56Time2a]
+        DoublePointWithCP56Time2a_destroy.restype = None
+    return locals().get("DoublePointWithCP56Time2a_destroy")
+_loaders["DoublePointWithCP56Time2a_destroy"] = _load_DoublePointWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 504
-if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_getTimestamp", "cdecl"):
-    DoublePointWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_getTimestamp", "cdecl")
-    DoublePointWithCP56Time2a_getTimestamp.argtypes = [DoublePointWithCP56Time2a]
-    DoublePointWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_DoublePointWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoublePointWithCP56Time2a_getTimestamp", "cdecl"):
+        DoublePointWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoublePointWithCP56Time2a_getTimestamp", "cdecl")
+        DoublePointWithCP56Time2a_getTimestamp.argtypes = [DoublePointWithCP56Time2a]
+        DoublePointWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("DoublePointWithCP56Time2a_getTimestamp")
+_loaders["DoublePointWithCP56Time2a_getTimestamp"] = _load_DoublePointWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 510
 class struct_sStepPositionInformation(Structure):
@@ -2004,40 +2334,58 @@ class struct_sStepPositionInformation(Structure):
 StepPositionInformation = POINTER(struct_sStepPositionInformation)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 510
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 524
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_create", "cdecl"):
-    StepPositionInformation_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_create", "cdecl")
-    StepPositionInformation_create.argtypes = [StepPositionInformation, c_int, c_int, c_bool, QualityDescriptor]
-    StepPositionInformation_create.restype = StepPositionInformation
+def _load_StepPositionInformation_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_create", "cdecl"):
+        StepPositionInformation_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_create", "cdecl")
+        StepPositionInformation_create.argtypes = [StepPositionInformation, c_int, c_int, c_bool, QualityDescriptor]
+        StepPositionInformation_create.restype = StepPositionInformation
+    return locals().get("StepPositionInformation_create")
+_loaders["StepPositionInformation_create"] = _load_StepPositionInformation_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 528
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_destroy", "cdecl"):
-    StepPositionInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_destroy", "cdecl")
-    StepPositionInformation_destroy.argtypes = [StepPositionInformation]
-    StepPositionInformation_destroy.restype = None
+def _load_StepPositionInformation_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_destroy", "cdecl"):
+        StepPositionInformation_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_destroy", "cdecl")
+        StepPositionInformation_destroy.argtypes = [StepPositionInformation]
+        StepPositionInformation_destroy.restype = None
+    return locals().get("StepPositionInformation_destroy")
+_loaders["StepPositionInformation_destroy"] = _load_StepPositionInformation_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 531
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getObjectAddress", "cdecl"):
-    StepPositionInformation_getObjectAddress = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getObjectAddress", "cdecl")
-    StepPositionInformation_getObjectAddress.argtypes = [StepPositionInformation]
-    StepPositionInformation_getObjectAddress.restype = c_int
+def _load_StepPositionInformation_getObjectAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getObjectAddress", "cdecl"):
+        StepPositionInformation_getObjectAddress = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getObjectAddress", "cdecl")
+        StepPositionInformation_getObjectAddress.argtypes = [StepPositionInformation]
+        StepPositionInformation_getObjectAddress.restype = c_int
+    return locals().get("StepPositionInformation_getObjectAddress")
+_loaders["StepPositionInformation_getObjectAddress"] = _load_StepPositionInformation_getObjectAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 537
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getValue", "cdecl"):
-    StepPositionInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getValue", "cdecl")
-    StepPositionInformation_getValue.argtypes = [StepPositionInformation]
-    StepPositionInformation_getValue.restype = c_int
+def _load_StepPositionInformation_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getValue", "cdecl"):
+        StepPositionInformation_getValue = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getValue", "cdecl")
+        StepPositionInformation_getValue.argtypes = [StepPositionInformation]
+        StepPositionInformation_getValue.restype = c_int
+    return locals().get("StepPositionInformation_getValue")
+_loaders["StepPositionInformation_getValue"] = _load_StepPositionInformation_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 540
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_isTransient", "cdecl"):
-    StepPositionInformation_isTransient = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_isTransient", "cdecl")
-    StepPositionInformation_isTransient.argtypes = [StepPositionInformation]
-    StepPositionInformation_isTransient.restype = c_bool
+def _load_StepPositionInformation_isTransient():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_isTransient", "cdecl"):
+        StepPositionInformation_isTransient = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_isTransient", "cdecl")
+        StepPositionInformation_isTransient.argtypes = [StepPositionInformation]
+        StepPositionInformation_isTransient.restype = c_bool
+    return locals().get("StepPositionInformation_isTransient")
+_loaders["StepPositionInformation_isTransient"] = _load_StepPositionInformation_isTransient
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 543
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getQuality", "cdecl"):
-    StepPositionInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getQuality", "cdecl")
-    StepPositionInformation_getQuality.argtypes = [StepPositionInformation]
-    StepPositionInformation_getQuality.restype = QualityDescriptor
+def _load_StepPositionInformation_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionInformation_getQuality", "cdecl"):
+        StepPositionInformation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("StepPositionInformation_getQuality", "cdecl")
+        StepPositionInformation_getQuality.argtypes = [StepPositionInformation]
+        StepPositionInformation_getQuality.restype = QualityDescriptor
+    return locals().get("StepPositionInformation_getQuality")
+_loaders["StepPositionInformation_getQuality"] = _load_StepPositionInformation_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 549
 class struct_sStepPositionWithCP24Time2a(Structure):
@@ -2046,22 +2394,31 @@ class struct_sStepPositionWithCP24Time2a(Structure):
 StepPositionWithCP24Time2a = POINTER(struct_sStepPositionWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 549
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 552
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_destroy", "cdecl"):
-    StepPositionWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_destroy", "cdecl")
-    StepPositionWithCP24Time2a_destroy.argtypes = [StepPositionWithCP24Time2a]
-    StepPositionWithCP24Time2a_destroy.restype = None
+def _load_StepPositionWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_destroy", "cdecl"):
+        StepPositionWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_destroy", "cdecl")
+        StepPositionWithCP24Time2a_destroy.argtypes = [StepPositionWithCP24Time2a]
+        StepPositionWithCP24Time2a_destroy.restype = None
+    return locals().get("StepPositionWithCP24Time2a_destroy")
+_loaders["StepPositionWithCP24Time2a_destroy"] = _load_StepPositionWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 555
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_create", "cdecl"):
-    StepPositionWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_create", "cdecl")
-    StepPositionWithCP24Time2a_create.argtypes = [StepPositionWithCP24Time2a, c_int, c_int, c_bool, QualityDescriptor, CP24Time2a]
-    StepPositionWithCP24Time2a_create.restype = StepPositionWithCP24Time2a
+def _load_StepPositionWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_create", "cdecl"):
+        StepPositionWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_create", "cdecl")
+        StepPositionWithCP24Time2a_create.argtypes = [StepPositionWithCP24Time2a, c_int, c_int, c_bool, QualityDescriptor, CP24Time2a]
+        StepPositionWithCP24Time2a_create.restype = StepPositionWithCP24Time2a
+    return locals().get("StepPositionWithCP24Time2a_create")
+_loaders["StepPositionWithCP24Time2a_create"] = _load_StepPositionWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 559
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_getTimestamp", "cdecl"):
-    StepPositionWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_getTimestamp", "cdecl")
-    StepPositionWithCP24Time2a_getTimestamp.argtypes = [StepPositionWithCP24Time2a]
-    StepPositionWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_StepPositionWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP24Time2a_getTimestamp", "cdecl"):
+        StepPositionWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP24Time2a_getTimestamp", "cdecl")
+        StepPositionWithCP24Time2a_getTimestamp.argtypes = [StepPositionWithCP24Time2a]
+        StepPositionWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("StepPositionWithCP24Time2a_getTimestamp")
+_loaders["StepPositionWithCP24Time2a_getTimestamp"] = _load_StepPositionWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 566
 class struct_sStepPositionWithCP56Time2a(Structure):
@@ -2070,22 +2427,31 @@ class struct_sStepPositionWithCP56Time2a(Structure):
 StepPositionWithCP56Time2a = POINTER(struct_sStepPositionWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 566
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 569
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_destroy", "cdecl"):
-    StepPositionWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_destroy", "cdecl")
-    StepPositionWithCP56Time2a_destroy.argtypes = [StepPositionWithCP56Time2a]
-    StepPositionWithCP56Time2a_destroy.restype = None
+def _load_StepPositionWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_destroy", "cdecl"):
+        StepPositionWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_destroy", "cdecl")
+        StepPositionWithCP56Time2a_destroy.argtypes = [StepPositionWithCP56Time2a]
+        StepPositionWithCP56Time2a_destroy.restype = None
+    return locals().get("StepPositionWithCP56Time2a_destroy")
+_loaders["StepPositionWithCP56Time2a_destroy"] = _load_StepPositionWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 572
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_create", "cdecl"):
-    StepPositionWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_create", "cdecl")
-    StepPositionWithCP56Time2a_create.argtypes = [StepPositionWithCP56Time2a, c_int, c_int, c_bool, QualityDescriptor, CP56Time2a]
-    StepPositionWithCP56Time2a_create.restype = StepPositionWithCP56Time2a
+def _load_StepPositionWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_create", "cdecl"):
+        StepPositionWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_create", "cdecl")
+        StepPositionWithCP56Time2a_create.argtypes = [StepPositionWithCP56Time2a, c_int, c_int, c_bool, QualityDescriptor, CP56Time2a]
+        StepPositionWithCP56Time2a_create.restype = StepPositionWithCP56Time2a
+    return locals().get("StepPositionWithCP56Time2a_create")
+_loaders["StepPositionWithCP56Time2a_create"] = _load_StepPositionWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 576
-if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_getTimestamp", "cdecl"):
-    StepPositionWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_getTimestamp", "cdecl")
-    StepPositionWithCP56Time2a_getTimestamp.argtypes = [StepPositionWithCP56Time2a]
-    StepPositionWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_StepPositionWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepPositionWithCP56Time2a_getTimestamp", "cdecl"):
+        StepPositionWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepPositionWithCP56Time2a_getTimestamp", "cdecl")
+        StepPositionWithCP56Time2a_getTimestamp.argtypes = [StepPositionWithCP56Time2a]
+        StepPositionWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("StepPositionWithCP56Time2a_getTimestamp")
+_loaders["StepPositionWithCP56Time2a_getTimestamp"] = _load_StepPositionWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 582
 class struct_sBitString32(Structure):
@@ -2094,34 +2460,49 @@ class struct_sBitString32(Structure):
 BitString32 = POINTER(struct_sBitString32)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 582
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 585
-if _libs["/usr/local/lib/lib60870.so"].has("BitString32_destroy", "cdecl"):
-    BitString32_destroy = _libs["/usr/local/lib/lib60870.so"].get("BitString32_destroy", "cdecl")
-    BitString32_destroy.argtypes = [BitString32]
-    BitString32_destroy.restype = None
+def _load_BitString32_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("BitString32_destroy", "cdecl"):
+        BitString32_destroy = _libs["/usr/local/lib/lib60870.so"].get("BitString32_destroy", "cdecl")
+        BitString32_destroy.argtypes = [BitString32]
+        BitString32_destroy.restype = None
+    return locals().get("BitString32_destroy")
+_loaders["BitString32_destroy"] = _load_BitString32_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 588
-if _libs["/usr/local/lib/lib60870.so"].has("BitString32_create", "cdecl"):
-    BitString32_create = _libs["/usr/local/lib/lib60870.so"].get("BitString32_create", "cdecl")
-    BitString32_create.argtypes = [BitString32, c_int, c_uint32]
-    BitString32_create.restype = BitString32
+def _load_BitString32_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("BitString32_create", "cdecl"):
+        BitString32_create = _libs["/usr/local/lib/lib60870.so"].get("BitString32_create", "cdecl")
+        BitString32_create.argtypes = [BitString32, c_int, c_uint32]
+        BitString32_create.restype = BitString32
+    return locals().get("BitString32_create")
+_loaders["BitString32_create"] = _load_BitString32_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 591
-if _libs["/usr/local/lib/lib60870.so"].has("BitString32_createEx", "cdecl"):
-    BitString32_createEx = _libs["/usr/local/lib/lib60870.so"].get("BitString32_createEx", "cdecl")
-    BitString32_createEx.argtypes = [BitString32, c_int, c_uint32, QualityDescriptor]
-    BitString32_createEx.restype = BitString32
+def _load_BitString32_createEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("BitString32_createEx", "cdecl"):
+        BitString32_createEx = _libs["/usr/local/lib/lib60870.so"].get("BitString32_createEx", "cdecl")
+        BitString32_createEx.argtypes = [BitString32, c_int, c_uint32, QualityDescriptor]
+        BitString32_createEx.restype = BitString32
+    return locals().get("BitString32_createEx")
+_loaders["BitString32_createEx"] = _load_BitString32_createEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 594
-if _libs["/usr/local/lib/lib60870.so"].has("BitString32_getValue", "cdecl"):
-    BitString32_getValue = _libs["/usr/local/lib/lib60870.so"].get("BitString32_getValue", "cdecl")
-    BitString32_getValue.argtypes = [BitString32]
-    BitString32_getValue.restype = c_uint32
+def _load_BitString32_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("BitString32_getValue", "cdecl"):
+        BitString32_getValue = _libs["/usr/local/lib/lib60870.so"].get("BitString32_getValue", "cdecl")
+        BitString32_getValue.argtypes = [BitString32]
+        BitString32_getValue.restype = c_uint32
+    return locals().get("BitString32_getValue")
+_loaders["BitString32_getValue"] = _load_BitString32_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 597
-if _libs["/usr/local/lib/lib60870.so"].has("BitString32_getQuality", "cdecl"):
-    BitString32_getQuality = _libs["/usr/local/lib/lib60870.so"].get("BitString32_getQuality", "cdecl")
-    BitString32_getQuality.argtypes = [BitString32]
-    BitString32_getQuality.restype = QualityDescriptor
+def _load_BitString32_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("BitString32_getQuality", "cdecl"):
+        BitString32_getQuality = _libs["/usr/local/lib/lib60870.so"].get("BitString32_getQuality", "cdecl")
+        BitString32_getQuality.argtypes = [BitString32]
+        BitString32_getQuality.restype = QualityDescriptor
+    return locals().get("BitString32_getQuality")
+_loaders["BitString32_getQuality"] = _load_BitString32_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 603
 class struct_sBitstring32WithCP24Time2a(Structure):
@@ -2130,28 +2511,40 @@ class struct_sBitstring32WithCP24Time2a(Structure):
 Bitstring32WithCP24Time2a = POINTER(struct_sBitstring32WithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 603
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 606
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_destroy", "cdecl"):
-    Bitstring32WithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_destroy", "cdecl")
-    Bitstring32WithCP24Time2a_destroy.argtypes = [Bitstring32WithCP24Time2a]
-    Bitstring32WithCP24Time2a_destroy.restype = None
+def _load_Bitstring32WithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_destroy", "cdecl"):
+        Bitstring32WithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_destroy", "cdecl")
+        Bitstring32WithCP24Time2a_destroy.argtypes = [Bitstring32WithCP24Time2a]
+        Bitstring32WithCP24Time2a_destroy.restype = None
+    return locals().get("Bitstring32WithCP24Time2a_destroy")
+_loaders["Bitstring32WithCP24Time2a_destroy"] = _load_Bitstring32WithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 609
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_create", "cdecl"):
-    Bitstring32WithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_create", "cdecl")
-    Bitstring32WithCP24Time2a_create.argtypes = [Bitstring32WithCP24Time2a, c_int, c_uint32, CP24Time2a]
-    Bitstring32WithCP24Time2a_create.restype = Bitstring32WithCP24Time2a
+def _load_Bitstring32WithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_create", "cdecl"):
+        Bitstring32WithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_create", "cdecl")
+        Bitstring32WithCP24Time2a_create.argtypes = [Bitstring32WithCP24Time2a, c_int, c_uint32, CP24Time2a]
+        Bitstring32WithCP24Time2a_create.restype = Bitstring32WithCP24Time2a
+    return locals().get("Bitstring32WithCP24Time2a_create")
+_loaders["Bitstring32WithCP24Time2a_create"] = _load_Bitstring32WithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 612
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_createEx", "cdecl"):
-    Bitstring32WithCP24Time2a_createEx = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_createEx", "cdecl")
-    Bitstring32WithCP24Time2a_createEx.argtypes = [Bitstring32WithCP24Time2a, c_int, c_uint32, QualityDescriptor, CP24Time2a]
-    Bitstring32WithCP24Time2a_createEx.restype = Bitstring32WithCP24Time2a
+def _load_Bitstring32WithCP24Time2a_createEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_createEx", "cdecl"):
+        Bitstring32WithCP24Time2a_createEx = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_createEx", "cdecl")
+        Bitstring32WithCP24Time2a_createEx.argtypes = [Bitstring32WithCP24Time2a, c_int, c_uint32, QualityDescriptor, CP24Time2a]
+        Bitstring32WithCP24Time2a_createEx.restype = Bitstring32WithCP24Time2a
+    return locals().get("Bitstring32WithCP24Time2a_createEx")
+_loaders["Bitstring32WithCP24Time2a_createEx"] = _load_Bitstring32WithCP24Time2a_createEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 615
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_getTimestamp", "cdecl"):
-    Bitstring32WithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_getTimestamp", "cdecl")
-    Bitstring32WithCP24Time2a_getTimestamp.argtypes = [Bitstring32WithCP24Time2a]
-    Bitstring32WithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_Bitstring32WithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP24Time2a_getTimestamp", "cdecl"):
+        Bitstring32WithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP24Time2a_getTimestamp", "cdecl")
+        Bitstring32WithCP24Time2a_getTimestamp.argtypes = [Bitstring32WithCP24Time2a]
+        Bitstring32WithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("Bitstring32WithCP24Time2a_getTimestamp")
+_loaders["Bitstring32WithCP24Time2a_getTimestamp"] = _load_Bitstring32WithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 621
 class struct_sBitstring32WithCP56Time2a(Structure):
@@ -2160,28 +2553,40 @@ class struct_sBitstring32WithCP56Time2a(Structure):
 Bitstring32WithCP56Time2a = POINTER(struct_sBitstring32WithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 621
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 624
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_destroy", "cdecl"):
-    Bitstring32WithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_destroy", "cdecl")
-    Bitstring32WithCP56Time2a_destroy.argtypes = [Bitstring32WithCP56Time2a]
-    Bitstring32WithCP56Time2a_destroy.restype = None
+def _load_Bitstring32WithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_destroy", "cdecl"):
+        Bitstring32WithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_destroy", "cdecl")
+        Bitstring32WithCP56Time2a_destroy.argtypes = [Bitstring32WithCP56Time2a]
+        Bitstring32WithCP56Time2a_destroy.restype = None
+    return locals().get("Bitstring32WithCP56Time2a_destroy")
+_loaders["Bitstring32WithCP56Time2a_destroy"] = _load_Bitstring32WithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 627
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_create", "cdecl"):
-    Bitstring32WithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_create", "cdecl")
-    Bitstring32WithCP56Time2a_create.argtypes = [Bitstring32WithCP56Time2a, c_int, c_uint32, CP56Time2a]
-    Bitstring32WithCP56Time2a_create.restype = Bitstring32WithCP56Time2a
+def _load_Bitstring32WithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_create", "cdecl"):
+        Bitstring32WithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_create", "cdecl")
+        Bitstring32WithCP56Time2a_create.argtypes = [Bitstring32WithCP56Time2a, c_int, c_uint32, CP56Time2a]
+        Bitstring32WithCP56Time2a_create.restype = Bitstring32WithCP56Time2a
+    return locals().get("Bitstring32WithCP56Time2a_create")
+_loaders["Bitstring32WithCP56Time2a_create"] = _load_Bitstring32WithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 630
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_createEx", "cdecl"):
-    Bitstring32WithCP56Time2a_createEx = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_createEx", "cdecl")
-    Bitstring32WithCP56Time2a_createEx.argtypes = [Bitstring32WithCP56Time2a, c_int, c_uint32, QualityDescriptor, CP56Time2a]
-    Bitstring32WithCP56Time2a_createEx.restype = Bitstring32WithCP56Time2a
+def _load_Bitstring32WithCP56Time2a_createEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_createEx", "cdecl"):
+        Bitstring32WithCP56Time2a_createEx = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_createEx", "cdecl")
+        Bitstring32WithCP56Time2a_createEx.argtypes = [Bitstring32WithCP56Time2a, c_int, c_uint32, QualityDescriptor, CP56Time2a]
+        Bitstring32WithCP56Time2a_createEx.restype = Bitstring32WithCP56Time2a
+    return locals().get("Bitstring32WithCP56Time2a_createEx")
+_loaders["Bitstring32WithCP56Time2a_createEx"] = _load_Bitstring32WithCP56Time2a_createEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 633
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_getTimestamp", "cdecl"):
-    Bitstring32WithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_getTimestamp", "cdecl")
-    Bitstring32WithCP56Time2a_getTimestamp.argtypes = [Bitstring32WithCP56Time2a]
-    Bitstring32WithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_Bitstring32WithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32WithCP56Time2a_getTimestamp", "cdecl"):
+        Bitstring32WithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32WithCP56Time2a_getTimestamp", "cdecl")
+        Bitstring32WithCP56Time2a_getTimestamp.argtypes = [Bitstring32WithCP56Time2a]
+        Bitstring32WithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("Bitstring32WithCP56Time2a_getTimestamp")
+_loaders["Bitstring32WithCP56Time2a_getTimestamp"] = _load_Bitstring32WithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 639
 class struct_sMeasuredValueNormalizedWithoutQuality(Structure):
@@ -2190,28 +2595,40 @@ class struct_sMeasuredValueNormalizedWithoutQuality(Structure):
 MeasuredValueNormalizedWithoutQuality = POINTER(struct_sMeasuredValueNormalizedWithoutQuality)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 639
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 642
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_destroy", "cdecl"):
-    MeasuredValueNormalizedWithoutQuality_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_destroy", "cdecl")
-    MeasuredValueNormalizedWithoutQuality_destroy.argtypes = [MeasuredValueNormalizedWithoutQuality]
-    MeasuredValueNormalizedWithoutQuality_destroy.restype = None
+def _load_MeasuredValueNormalizedWithoutQuality_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_destroy", "cdecl"):
+        MeasuredValueNormalizedWithoutQuality_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_destroy", "cdecl")
+        MeasuredValueNormalizedWithoutQuality_destroy.argtypes = [MeasuredValueNormalizedWithoutQuality]
+        MeasuredValueNormalizedWithoutQuality_destroy.restype = None
+    return locals().get("MeasuredValueNormalizedWithoutQuality_destroy")
+_loaders["MeasuredValueNormalizedWithoutQuality_destroy"] = _load_MeasuredValueNormalizedWithoutQuality_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 645
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_create", "cdecl"):
-    MeasuredValueNormalizedWithoutQuality_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_create", "cdecl")
-    MeasuredValueNormalizedWithoutQuality_create.argtypes = [MeasuredValueNormalizedWithoutQuality, c_int, c_float]
-    MeasuredValueNormalizedWithoutQuality_create.restype = MeasuredValueNormalizedWithoutQuality
+def _load_MeasuredValueNormalizedWithoutQuality_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_create", "cdecl"):
+        MeasuredValueNormalizedWithoutQuality_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_create", "cdecl")
+        MeasuredValueNormalizedWithoutQuality_create.argtypes = [MeasuredValueNormalizedWithoutQuality, c_int, c_float]
+        MeasuredValueNormalizedWithoutQuality_create.restype = MeasuredValueNormalizedWithoutQuality
+    return locals().get("MeasuredValueNormalizedWithoutQuality_create")
+_loaders["MeasuredValueNormalizedWithoutQuality_create"] = _load_MeasuredValueNormalizedWithoutQuality_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 648
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_getValue", "cdecl"):
-    MeasuredValueNormalizedWithoutQuality_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_getValue", "cdecl")
-    MeasuredValueNormalizedWithoutQuality_getValue.argtypes = [MeasuredValueNormalizedWithoutQuality]
-    MeasuredValueNormalizedWithoutQuality_getValue.restype = c_float
+def _load_MeasuredValueNormalizedWithoutQuality_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_getValue", "cdecl"):
+        MeasuredValueNormalizedWithoutQuality_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_getValue", "cdecl")
+        MeasuredValueNormalizedWithoutQuality_getValue.argtypes = [MeasuredValueNormalizedWithoutQuality]
+        MeasuredValueNormalizedWithoutQuality_getValue.restype = c_float
+    return locals().get("MeasuredValueNormalizedWithoutQuality_getValue")
+_loaders["MeasuredValueNormalizedWithoutQuality_getValue"] = _load_MeasuredValueNormalizedWithoutQuality_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 651
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_setValue", "cdecl"):
-    MeasuredValueNormalizedWithoutQuality_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_setValue", "cdecl")
-    MeasuredValueNormalizedWithoutQuality_setValue.argtypes = [MeasuredValueNormalizedWithoutQuality, c_float]
-    MeasuredValueNormalizedWithoutQuality_setValue.restype = None
+def _load_MeasuredValueNormalizedWithoutQuality_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithoutQuality_setValue", "cdecl"):
+        MeasuredValueNormalizedWithoutQuality_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithoutQuality_setValue", "cdecl")
+        MeasuredValueNormalizedWithoutQuality_setValue.argtypes = [MeasuredValueNormalizedWithoutQuality, c_float]
+        MeasuredValueNormalizedWithoutQuality_setValue.restype = None
+    return locals().get("MeasuredValueNormalizedWithoutQuality_setValue")
+_loaders["MeasuredValueNormalizedWithoutQuality_setValue"] = _load_MeasuredValueNormalizedWithoutQuality_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 657
 class struct_sMeasuredValueNormalized(Structure):
@@ -2220,34 +2637,49 @@ class struct_sMeasuredValueNormalized(Structure):
 MeasuredValueNormalized = POINTER(struct_sMeasuredValueNormalized)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 657
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 660
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_destroy", "cdecl"):
-    MeasuredValueNormalized_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_destroy", "cdecl")
-    MeasuredValueNormalized_destroy.argtypes = [MeasuredValueNormalized]
-    MeasuredValueNormalized_destroy.restype = None
+def _load_MeasuredValueNormalized_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_destroy", "cdecl"):
+        MeasuredValueNormalized_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_destroy", "cdecl")
+        MeasuredValueNormalized_destroy.argtypes = [MeasuredValueNormalized]
+        MeasuredValueNormalized_destroy.restype = None
+    return locals().get("MeasuredValueNormalized_destroy")
+_loaders["MeasuredValueNormalized_destroy"] = _load_MeasuredValueNormalized_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 663
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_create", "cdecl"):
-    MeasuredValueNormalized_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_create", "cdecl")
-    MeasuredValueNormalized_create.argtypes = [MeasuredValueNormalized, c_int, c_float, QualityDescriptor]
-    MeasuredValueNormalized_create.restype = MeasuredValueNormalized
+def _load_MeasuredValueNormalized_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_create", "cdecl"):
+        MeasuredValueNormalized_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_create", "cdecl")
+        MeasuredValueNormalized_create.argtypes = [MeasuredValueNormalized, c_int, c_float, QualityDescriptor]
+        MeasuredValueNormalized_create.restype = MeasuredValueNormalized
+    return locals().get("MeasuredValueNormalized_create")
+_loaders["MeasuredValueNormalized_create"] = _load_MeasuredValueNormalized_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 666
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_getValue", "cdecl"):
-    MeasuredValueNormalized_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_getValue", "cdecl")
-    MeasuredValueNormalized_getValue.argtypes = [MeasuredValueNormalized]
-    MeasuredValueNormalized_getValue.restype = c_float
+def _load_MeasuredValueNormalized_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_getValue", "cdecl"):
+        MeasuredValueNormalized_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_getValue", "cdecl")
+        MeasuredValueNormalized_getValue.argtypes = [MeasuredValueNormalized]
+        MeasuredValueNormalized_getValue.restype = c_float
+    return locals().get("MeasuredValueNormalized_getValue")
+_loaders["MeasuredValueNormalized_getValue"] = _load_MeasuredValueNormalized_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 669
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_setValue", "cdecl"):
-    MeasuredValueNormalized_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_setValue", "cdecl")
-    MeasuredValueNormalized_setValue.argtypes = [MeasuredValueNormalized, c_float]
-    MeasuredValueNormalized_setValue.restype = None
+def _load_MeasuredValueNormalized_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_setValue", "cdecl"):
+        MeasuredValueNormalized_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_setValue", "cdecl")
+        MeasuredValueNormalized_setValue.argtypes = [MeasuredValueNormalized, c_float]
+        MeasuredValueNormalized_setValue.restype = None
+    return locals().get("MeasuredValueNormalized_setValue")
+_loaders["MeasuredValueNormalized_setValue"] = _load_MeasuredValueNormalized_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 672
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_getQuality", "cdecl"):
-    MeasuredValueNormalized_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_getQuality", "cdecl")
-    MeasuredValueNormalized_getQuality.argtypes = [MeasuredValueNormalized]
-    MeasuredValueNormalized_getQuality.restype = QualityDescriptor
+def _load_MeasuredValueNormalized_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalized_getQuality", "cdecl"):
+        MeasuredValueNormalized_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalized_getQuality", "cdecl")
+        MeasuredValueNormalized_getQuality.argtypes = [MeasuredValueNormalized]
+        MeasuredValueNormalized_getQuality.restype = QualityDescriptor
+    return locals().get("MeasuredValueNormalized_getQuality")
+_loaders["MeasuredValueNormalized_getQuality"] = _load_MeasuredValueNormalized_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 678
 class struct_sMeasuredValueNormalizedWithCP24Time2a(Structure):
@@ -2256,28 +2688,40 @@ class struct_sMeasuredValueNormalizedWithCP24Time2a(Structure):
 MeasuredValueNormalizedWithCP24Time2a = POINTER(struct_sMeasuredValueNormalizedWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 678
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 681
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_destroy", "cdecl"):
-    MeasuredValueNormalizedWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_destroy", "cdecl")
-    MeasuredValueNormalizedWithCP24Time2a_destroy.argtypes = [MeasuredValueNormalizedWithCP24Time2a]
-    MeasuredValueNormalizedWithCP24Time2a_destroy.restype = None
+def _load_MeasuredValueNormalizedWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_destroy", "cdecl"):
+        MeasuredValueNormalizedWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_destroy", "cdecl")
+        MeasuredValueNormalizedWithCP24Time2a_destroy.argtypes = [MeasuredValueNormalizedWithCP24Time2a]
+        MeasuredValueNormalizedWithCP24Time2a_destroy.restype = None
+    return locals().get("MeasuredValueNormalizedWithCP24Time2a_destroy")
+_loaders["MeasuredValueNormalizedWithCP24Time2a_destroy"] = _load_MeasuredValueNormalizedWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 684
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_create", "cdecl"):
-    MeasuredValueNormalizedWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_create", "cdecl")
-    MeasuredValueNormalizedWithCP24Time2a_create.argtypes = [MeasuredValueNormalizedWithCP24Time2a, c_int, c_float, QualityDescriptor, CP24Time2a]
-    MeasuredValueNormalizedWithCP24Time2a_create.restype = MeasuredValueNormalizedWithCP24Time2a
+def _load_MeasuredValueNormalizedWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_create", "cdecl"):
+        MeasuredValueNormalizedWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_create", "cdecl")
+        MeasuredValueNormalizedWithCP24Time2a_create.argtypes = [MeasuredValueNormalizedWithCP24Time2a, c_int, c_float, QualityDescriptor, CP24Time2a]
+        MeasuredValueNormalizedWithCP24Time2a_create.restype = MeasuredValueNormalizedWithCP24Time2a
+    return locals().get("MeasuredValueNormalizedWithCP24Time2a_create")
+_loaders["MeasuredValueNormalizedWithCP24Time2a_create"] = _load_MeasuredValueNormalizedWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 688
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_getTimestamp", "cdecl"):
-    MeasuredValueNormalizedWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_getTimestamp", "cdecl")
-    MeasuredValueNormalizedWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueNormalizedWithCP24Time2a]
-    MeasuredValueNormalizedWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_MeasuredValueNormalizedWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_getTimestamp", "cdecl"):
+        MeasuredValueNormalizedWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_getTimestamp", "cdecl")
+        MeasuredValueNormalizedWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueNormalizedWithCP24Time2a]
+        MeasuredValueNormalizedWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("MeasuredValueNormalizedWithCP24Time2a_getTimestamp")
+_loaders["MeasuredValueNormalizedWithCP24Time2a_getTimestamp"] = _load_MeasuredValueNormalizedWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 691
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_setTimestamp", "cdecl"):
-    MeasuredValueNormalizedWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_setTimestamp", "cdecl")
-    MeasuredValueNormalizedWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueNormalizedWithCP24Time2a, CP24Time2a]
-    MeasuredValueNormalizedWithCP24Time2a_setTimestamp.restype = None
+def _load_MeasuredValueNormalizedWithCP24Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP24Time2a_setTimestamp", "cdecl"):
+        MeasuredValueNormalizedWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP24Time2a_setTimestamp", "cdecl")
+        MeasuredValueNormalizedWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueNormalizedWithCP24Time2a, CP24Time2a]
+        MeasuredValueNormalizedWithCP24Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueNormalizedWithCP24Time2a_setTimestamp")
+_loaders["MeasuredValueNormalizedWithCP24Time2a_setTimestamp"] = _load_MeasuredValueNormalizedWithCP24Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 697
 class struct_sMeasuredValueNormalizedWithCP56Time2a(Structure):
@@ -2286,28 +2730,40 @@ class struct_sMeasuredValueNormalizedWithCP56Time2a(Structure):
 MeasuredValueNormalizedWithCP56Time2a = POINTER(struct_sMeasuredValueNormalizedWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 697
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 700
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_destroy", "cdecl"):
-    MeasuredValueNormalizedWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_destroy", "cdecl")
-    MeasuredValueNormalizedWithCP56Time2a_destroy.argtypes = [MeasuredValueNormalizedWithCP56Time2a]
-    MeasuredValueNormalizedWithCP56Time2a_destroy.restype = None
+def _load_MeasuredValueNormalizedWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_destroy", "cdecl"):
+        MeasuredValueNormalizedWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_destroy", "cdecl")
+        MeasuredValueNormalizedWithCP56Time2a_destroy.argtypes = [MeasuredValueNormalizedWithCP56Time2a]
+        MeasuredValueNormalizedWithCP56Time2a_destroy.restype = None
+    return locals().get("MeasuredValueNormalizedWithCP56Time2a_destroy")
+_loaders["MeasuredValueNormalizedWithCP56Time2a_destroy"] = _load_MeasuredValueNormalizedWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 703
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_create", "cdecl"):
-    MeasuredValueNormalizedWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_create", "cdecl")
-    MeasuredValueNormalizedWithCP56Time2a_create.argtypes = [MeasuredValueNormalizedWithCP56Time2a, c_int, c_float, QualityDescriptor, CP56Time2a]
-    MeasuredValueNormalizedWithCP56Time2a_create.restype = MeasuredValueNormalizedWithCP56Time2a
+def _load_MeasuredValueNormalizedWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_create", "cdecl"):
+        MeasuredValueNormalizedWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_create", "cdecl")
+        MeasuredValueNormalizedWithCP56Time2a_create.argtypes = [MeasuredValueNormalizedWithCP56Time2a, c_int, c_float, QualityDescriptor, CP56Time2a]
+        MeasuredValueNormalizedWithCP56Time2a_create.restype = MeasuredValueNormalizedWithCP56Time2a
+    return locals().get("MeasuredValueNormalizedWithCP56Time2a_create")
+_loaders["MeasuredValueNormalizedWithCP56Time2a_create"] = _load_MeasuredValueNormalizedWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 707
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_getTimestamp", "cdecl"):
-    MeasuredValueNormalizedWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_getTimestamp", "cdecl")
-    MeasuredValueNormalizedWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueNormalizedWithCP56Time2a]
-    MeasuredValueNormalizedWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_MeasuredValueNormalizedWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_getTimestamp", "cdecl"):
+        MeasuredValueNormalizedWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_getTimestamp", "cdecl")
+        MeasuredValueNormalizedWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueNormalizedWithCP56Time2a]
+        MeasuredValueNormalizedWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("MeasuredValueNormalizedWithCP56Time2a_getTimestamp")
+_loaders["MeasuredValueNormalizedWithCP56Time2a_getTimestamp"] = _load_MeasuredValueNormalizedWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 710
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_setTimestamp", "cdecl"):
-    MeasuredValueNormalizedWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_setTimestamp", "cdecl")
-    MeasuredValueNormalizedWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueNormalizedWithCP56Time2a, CP56Time2a]
-    MeasuredValueNormalizedWithCP56Time2a_setTimestamp.restype = None
+def _load_MeasuredValueNormalizedWithCP56Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueNormalizedWithCP56Time2a_setTimestamp", "cdecl"):
+        MeasuredValueNormalizedWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueNormalizedWithCP56Time2a_setTimestamp", "cdecl")
+        MeasuredValueNormalizedWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueNormalizedWithCP56Time2a, CP56Time2a]
+        MeasuredValueNormalizedWithCP56Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueNormalizedWithCP56Time2a_setTimestamp")
+_loaders["MeasuredValueNormalizedWithCP56Time2a_setTimestamp"] = _load_MeasuredValueNormalizedWithCP56Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 717
 class struct_sMeasuredValueScaled(Structure):
@@ -2316,40 +2772,58 @@ class struct_sMeasuredValueScaled(Structure):
 MeasuredValueScaled = POINTER(struct_sMeasuredValueScaled)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 717
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 730
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_create", "cdecl"):
-    MeasuredValueScaled_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_create", "cdecl")
-    MeasuredValueScaled_create.argtypes = [MeasuredValueScaled, c_int, c_int, QualityDescriptor]
-    MeasuredValueScaled_create.restype = MeasuredValueScaled
+def _load_MeasuredValueScaled_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_create", "cdecl"):
+        MeasuredValueScaled_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_create", "cdecl")
+        MeasuredValueScaled_create.argtypes = [MeasuredValueScaled, c_int, c_int, QualityDescriptor]
+        MeasuredValueScaled_create.restype = MeasuredValueScaled
+    return locals().get("MeasuredValueScaled_create")
+_loaders["MeasuredValueScaled_create"] = _load_MeasuredValueScaled_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 733
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_destroy", "cdecl"):
-    MeasuredValueScaled_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_destroy", "cdecl")
-    MeasuredValueScaled_destroy.argtypes = [MeasuredValueScaled]
-    MeasuredValueScaled_destroy.restype = None
+def _load_MeasuredValueScaled_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_destroy", "cdecl"):
+        MeasuredValueScaled_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_destroy", "cdecl")
+        MeasuredValueScaled_destroy.argtypes = [MeasuredValueScaled]
+        MeasuredValueScaled_destroy.restype = None
+    return locals().get("MeasuredValueScaled_destroy")
+_loaders["MeasuredValueScaled_destroy"] = _load_MeasuredValueScaled_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 736
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_getValue", "cdecl"):
-    MeasuredValueScaled_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_getValue", "cdecl")
-    MeasuredValueScaled_getValue.argtypes = [MeasuredValueScaled]
-    MeasuredValueScaled_getValue.restype = c_int
+def _load_MeasuredValueScaled_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_getValue", "cdecl"):
+        MeasuredValueScaled_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_getValue", "cdecl")
+        MeasuredValueScaled_getValue.argtypes = [MeasuredValueScaled]
+        MeasuredValueScaled_getValue.restype = c_int
+    return locals().get("MeasuredValueScaled_getValue")
+_loaders["MeasuredValueScaled_getValue"] = _load_MeasuredValueScaled_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 739
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_setValue", "cdecl"):
-    MeasuredValueScaled_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_setValue", "cdecl")
-    MeasuredValueScaled_setValue.argtypes = [MeasuredValueScaled, c_int]
-    MeasuredValueScaled_setValue.restype = None
+def _load_MeasuredValueScaled_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_setValue", "cdecl"):
+        MeasuredValueScaled_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_setValue", "cdecl")
+        MeasuredValueScaled_setValue.argtypes = [MeasuredValueScaled, c_int]
+        MeasuredValueScaled_setValue.restype = None
+    return locals().get("MeasuredValueScaled_setValue")
+_loaders["MeasuredValueScaled_setValue"] = _load_MeasuredValueScaled_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 742
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_getQuality", "cdecl"):
-    MeasuredValueScaled_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_getQuality", "cdecl")
-    MeasuredValueScaled_getQuality.argtypes = [MeasuredValueScaled]
-    MeasuredValueScaled_getQuality.restype = QualityDescriptor
+def _load_MeasuredValueScaled_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_getQuality", "cdecl"):
+        MeasuredValueScaled_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_getQuality", "cdecl")
+        MeasuredValueScaled_getQuality.argtypes = [MeasuredValueScaled]
+        MeasuredValueScaled_getQuality.restype = QualityDescriptor
+    return locals().get("MeasuredValueScaled_getQuality")
+_loaders["MeasuredValueScaled_getQuality"] = _load_MeasuredValueScaled_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 745
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_setQuality", "cdecl"):
-    MeasuredValueScaled_setQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_setQuality", "cdecl")
-    MeasuredValueScaled_setQuality.argtypes = [MeasuredValueScaled, QualityDescriptor]
-    MeasuredValueScaled_setQuality.restype = None
+def _load_MeasuredValueScaled_setQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaled_setQuality", "cdecl"):
+        MeasuredValueScaled_setQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaled_setQuality", "cdecl")
+        MeasuredValueScaled_setQuality.argtypes = [MeasuredValueScaled, QualityDescriptor]
+        MeasuredValueScaled_setQuality.restype = None
+    return locals().get("MeasuredValueScaled_setQuality")
+_loaders["MeasuredValueScaled_setQuality"] = _load_MeasuredValueScaled_setQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 751
 class struct_sMeasuredValueScaledWithCP24Time2a(Structure):
@@ -2358,28 +2832,40 @@ class struct_sMeasuredValueScaledWithCP24Time2a(Structure):
 MeasuredValueScaledWithCP24Time2a = POINTER(struct_sMeasuredValueScaledWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 751
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 754
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_destroy", "cdecl"):
-    MeasuredValueScaledWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_destroy", "cdecl")
-    MeasuredValueScaledWithCP24Time2a_destroy.argtypes = [MeasuredValueScaledWithCP24Time2a]
-    MeasuredValueScaledWithCP24Time2a_destroy.restype = None
+def _load_MeasuredValueScaledWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_destroy", "cdecl"):
+        MeasuredValueScaledWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_destroy", "cdecl")
+        MeasuredValueScaledWithCP24Time2a_destroy.argtypes = [MeasuredValueScaledWithCP24Time2a]
+        MeasuredValueScaledWithCP24Time2a_destroy.restype = None
+    return locals().get("MeasuredValueScaledWithCP24Time2a_destroy")
+_loaders["MeasuredValueScaledWithCP24Time2a_destroy"] = _load_MeasuredValueScaledWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 757
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_create", "cdecl"):
-    MeasuredValueScaledWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_create", "cdecl")
-    MeasuredValueScaledWithCP24Time2a_create.argtypes = [MeasuredValueScaledWithCP24Time2a, c_int, c_int, QualityDescriptor, CP24Time2a]
-    MeasuredValueScaledWithCP24Time2a_create.restype = MeasuredValueScaledWithCP24Time2a
+def _load_MeasuredValueScaledWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_create", "cdecl"):
+        MeasuredValueScaledWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_create", "cdecl")
+        MeasuredValueScaledWithCP24Time2a_create.argtypes = [MeasuredValueScaledWithCP24Time2a, c_int, c_int, QualityDescriptor, CP24Time2a]
+        MeasuredValueScaledWithCP24Time2a_create.restype = MeasuredValueScaledWithCP24Time2a
+    return locals().get("MeasuredValueScaledWithCP24Time2a_create")
+_loaders["MeasuredValueScaledWithCP24Time2a_create"] = _load_MeasuredValueScaledWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 761
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_getTimestamp", "cdecl"):
-    MeasuredValueScaledWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_getTimestamp", "cdecl")
-    MeasuredValueScaledWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueScaledWithCP24Time2a]
-    MeasuredValueScaledWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_MeasuredValueScaledWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_getTimestamp", "cdecl"):
+        MeasuredValueScaledWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_getTimestamp", "cdecl")
+        MeasuredValueScaledWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueScaledWithCP24Time2a]
+        MeasuredValueScaledWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("MeasuredValueScaledWithCP24Time2a_getTimestamp")
+_loaders["MeasuredValueScaledWithCP24Time2a_getTimestamp"] = _load_MeasuredValueScaledWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 764
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_setTimestamp", "cdecl"):
-    MeasuredValueScaledWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_setTimestamp", "cdecl")
-    MeasuredValueScaledWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueScaledWithCP24Time2a, CP24Time2a]
-    MeasuredValueScaledWithCP24Time2a_setTimestamp.restype = None
+def _load_MeasuredValueScaledWithCP24Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP24Time2a_setTimestamp", "cdecl"):
+        MeasuredValueScaledWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP24Time2a_setTimestamp", "cdecl")
+        MeasuredValueScaledWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueScaledWithCP24Time2a, CP24Time2a]
+        MeasuredValueScaledWithCP24Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueScaledWithCP24Time2a_setTimestamp")
+_loaders["MeasuredValueScaledWithCP24Time2a_setTimestamp"] = _load_MeasuredValueScaledWithCP24Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 770
 class struct_sMeasuredValueScaledWithCP56Time2a(Structure):
@@ -2388,28 +2874,40 @@ class struct_sMeasuredValueScaledWithCP56Time2a(Structure):
 MeasuredValueScaledWithCP56Time2a = POINTER(struct_sMeasuredValueScaledWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 770
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 773
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_destroy", "cdecl"):
-    MeasuredValueScaledWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_destroy", "cdecl")
-    MeasuredValueScaledWithCP56Time2a_destroy.argtypes = [MeasuredValueScaledWithCP56Time2a]
-    MeasuredValueScaledWithCP56Time2a_destroy.restype = None
+def _load_MeasuredValueScaledWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_destroy", "cdecl"):
+        MeasuredValueScaledWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_destroy", "cdecl")
+        MeasuredValueScaledWithCP56Time2a_destroy.argtypes = [MeasuredValueScaledWithCP56Time2a]
+        MeasuredValueScaledWithCP56Time2a_destroy.restype = None
+    return locals().get("MeasuredValueScaledWithCP56Time2a_destroy")
+_loaders["MeasuredValueScaledWithCP56Time2a_destroy"] = _load_MeasuredValueScaledWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 776
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_create", "cdecl"):
-    MeasuredValueScaledWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_create", "cdecl")
-    MeasuredValueScaledWithCP56Time2a_create.argtypes = [MeasuredValueScaledWithCP56Time2a, c_int, c_int, QualityDescriptor, CP56Time2a]
-    MeasuredValueScaledWithCP56Time2a_create.restype = MeasuredValueScaledWithCP56Time2a
+def _load_MeasuredValueScaledWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_create", "cdecl"):
+        MeasuredValueScaledWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_create", "cdecl")
+        MeasuredValueScaledWithCP56Time2a_create.argtypes = [MeasuredValueScaledWithCP56Time2a, c_int, c_int, QualityDescriptor, CP56Time2a]
+        MeasuredValueScaledWithCP56Time2a_create.restype = MeasuredValueScaledWithCP56Time2a
+    return locals().get("MeasuredValueScaledWithCP56Time2a_create")
+_loaders["MeasuredValueScaledWithCP56Time2a_create"] = _load_MeasuredValueScaledWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 780
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_getTimestamp", "cdecl"):
-    MeasuredValueScaledWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_getTimestamp", "cdecl")
-    MeasuredValueScaledWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueScaledWithCP56Time2a]
-    MeasuredValueScaledWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_MeasuredValueScaledWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_getTimestamp", "cdecl"):
+        MeasuredValueScaledWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_getTimestamp", "cdecl")
+        MeasuredValueScaledWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueScaledWithCP56Time2a]
+        MeasuredValueScaledWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("MeasuredValueScaledWithCP56Time2a_getTimestamp")
+_loaders["MeasuredValueScaledWithCP56Time2a_getTimestamp"] = _load_MeasuredValueScaledWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 783
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_setTimestamp", "cdecl"):
-    MeasuredValueScaledWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_setTimestamp", "cdecl")
-    MeasuredValueScaledWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueScaledWithCP56Time2a, CP56Time2a]
-    MeasuredValueScaledWithCP56Time2a_setTimestamp.restype = None
+def _load_MeasuredValueScaledWithCP56Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueScaledWithCP56Time2a_setTimestamp", "cdecl"):
+        MeasuredValueScaledWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueScaledWithCP56Time2a_setTimestamp", "cdecl")
+        MeasuredValueScaledWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueScaledWithCP56Time2a, CP56Time2a]
+        MeasuredValueScaledWithCP56Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueScaledWithCP56Time2a_setTimestamp")
+_loaders["MeasuredValueScaledWithCP56Time2a_setTimestamp"] = _load_MeasuredValueScaledWithCP56Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 789
 class struct_sMeasuredValueShort(Structure):
@@ -2418,34 +2916,49 @@ class struct_sMeasuredValueShort(Structure):
 MeasuredValueShort = POINTER(struct_sMeasuredValueShort)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 789
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 792
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_destroy", "cdecl"):
-    MeasuredValueShort_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_destroy", "cdecl")
-    MeasuredValueShort_destroy.argtypes = [MeasuredValueShort]
-    MeasuredValueShort_destroy.restype = None
+def _load_MeasuredValueShort_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_destroy", "cdecl"):
+        MeasuredValueShort_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_destroy", "cdecl")
+        MeasuredValueShort_destroy.argtypes = [MeasuredValueShort]
+        MeasuredValueShort_destroy.restype = None
+    return locals().get("MeasuredValueShort_destroy")
+_loaders["MeasuredValueShort_destroy"] = _load_MeasuredValueShort_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 795
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_create", "cdecl"):
-    MeasuredValueShort_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_create", "cdecl")
-    MeasuredValueShort_create.argtypes = [MeasuredValueShort, c_int, c_float, QualityDescriptor]
-    MeasuredValueShort_create.restype = MeasuredValueShort
+def _load_MeasuredValueShort_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_create", "cdecl"):
+        MeasuredValueShort_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_create", "cdecl")
+        MeasuredValueShort_create.argtypes = [MeasuredValueShort, c_int, c_float, QualityDescriptor]
+        MeasuredValueShort_create.restype = MeasuredValueShort
+    return locals().get("MeasuredValueShort_create")
+_loaders["MeasuredValueShort_create"] = _load_MeasuredValueShort_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 798
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_getValue", "cdecl"):
-    MeasuredValueShort_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_getValue", "cdecl")
-    MeasuredValueShort_getValue.argtypes = [MeasuredValueShort]
-    MeasuredValueShort_getValue.restype = c_float
+def _load_MeasuredValueShort_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_getValue", "cdecl"):
+        MeasuredValueShort_getValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_getValue", "cdecl")
+        MeasuredValueShort_getValue.argtypes = [MeasuredValueShort]
+        MeasuredValueShort_getValue.restype = c_float
+    return locals().get("MeasuredValueShort_getValue")
+_loaders["MeasuredValueShort_getValue"] = _load_MeasuredValueShort_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 801
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_setValue", "cdecl"):
-    MeasuredValueShort_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_setValue", "cdecl")
-    MeasuredValueShort_setValue.argtypes = [MeasuredValueShort, c_float]
-    MeasuredValueShort_setValue.restype = None
+def _load_MeasuredValueShort_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_setValue", "cdecl"):
+        MeasuredValueShort_setValue = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_setValue", "cdecl")
+        MeasuredValueShort_setValue.argtypes = [MeasuredValueShort, c_float]
+        MeasuredValueShort_setValue.restype = None
+    return locals().get("MeasuredValueShort_setValue")
+_loaders["MeasuredValueShort_setValue"] = _load_MeasuredValueShort_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 804
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_getQuality", "cdecl"):
-    MeasuredValueShort_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_getQuality", "cdecl")
-    MeasuredValueShort_getQuality.argtypes = [MeasuredValueShort]
-    MeasuredValueShort_getQuality.restype = QualityDescriptor
+def _load_MeasuredValueShort_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShort_getQuality", "cdecl"):
+        MeasuredValueShort_getQuality = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShort_getQuality", "cdecl")
+        MeasuredValueShort_getQuality.argtypes = [MeasuredValueShort]
+        MeasuredValueShort_getQuality.restype = QualityDescriptor
+    return locals().get("MeasuredValueShort_getQuality")
+_loaders["MeasuredValueShort_getQuality"] = _load_MeasuredValueShort_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 810
 class struct_sMeasuredValueShortWithCP24Time2a(Structure):
@@ -2454,28 +2967,40 @@ class struct_sMeasuredValueShortWithCP24Time2a(Structure):
 MeasuredValueShortWithCP24Time2a = POINTER(struct_sMeasuredValueShortWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 810
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 813
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_destroy", "cdecl"):
-    MeasuredValueShortWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_destroy", "cdecl")
-    MeasuredValueShortWithCP24Time2a_destroy.argtypes = [MeasuredValueShortWithCP24Time2a]
-    MeasuredValueShortWithCP24Time2a_destroy.restype = None
+def _load_MeasuredValueShortWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_destroy", "cdecl"):
+        MeasuredValueShortWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_destroy", "cdecl")
+        MeasuredValueShortWithCP24Time2a_destroy.argtypes = [MeasuredValueShortWithCP24Time2a]
+        MeasuredValueShortWithCP24Time2a_destroy.restype = None
+    return locals().get("MeasuredValueShortWithCP24Time2a_destroy")
+_loaders["MeasuredValueShortWithCP24Time2a_destroy"] = _load_MeasuredValueShortWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 816
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_create", "cdecl"):
-    MeasuredValueShortWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_create", "cdecl")
-    MeasuredValueShortWithCP24Time2a_create.argtypes = [MeasuredValueShortWithCP24Time2a, c_int, c_float, QualityDescriptor, CP24Time2a]
-    MeasuredValueShortWithCP24Time2a_create.restype = MeasuredValueShortWithCP24Time2a
+def _load_MeasuredValueShortWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_create", "cdecl"):
+        MeasuredValueShortWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_create", "cdecl")
+        MeasuredValueShortWithCP24Time2a_create.argtypes = [MeasuredValueShortWithCP24Time2a, c_int, c_float, QualityDescriptor, CP24Time2a]
+        MeasuredValueShortWithCP24Time2a_create.restype = MeasuredValueShortWithCP24Time2a
+    return locals().get("MeasuredValueShortWithCP24Time2a_create")
+_loaders["MeasuredValueShortWithCP24Time2a_create"] = _load_MeasuredValueShortWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 820
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_getTimestamp", "cdecl"):
-    MeasuredValueShortWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_getTimestamp", "cdecl")
-    MeasuredValueShortWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueShortWithCP24Time2a]
-    MeasuredValueShortWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_MeasuredValueShortWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_getTimestamp", "cdecl"):
+        MeasuredValueShortWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_getTimestamp", "cdecl")
+        MeasuredValueShortWithCP24Time2a_getTimestamp.argtypes = [MeasuredValueShortWithCP24Time2a]
+        MeasuredValueShortWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("MeasuredValueShortWithCP24Time2a_getTimestamp")
+_loaders["MeasuredValueShortWithCP24Time2a_getTimestamp"] = _load_MeasuredValueShortWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 823
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_setTimestamp", "cdecl"):
-    MeasuredValueShortWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_setTimestamp", "cdecl")
-    MeasuredValueShortWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueShortWithCP24Time2a, CP24Time2a]
-    MeasuredValueShortWithCP24Time2a_setTimestamp.restype = None
+def _load_MeasuredValueShortWithCP24Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP24Time2a_setTimestamp", "cdecl"):
+        MeasuredValueShortWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP24Time2a_setTimestamp", "cdecl")
+        MeasuredValueShortWithCP24Time2a_setTimestamp.argtypes = [MeasuredValueShortWithCP24Time2a, CP24Time2a]
+        MeasuredValueShortWithCP24Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueShortWithCP24Time2a_setTimestamp")
+_loaders["MeasuredValueShortWithCP24Time2a_setTimestamp"] = _load_MeasuredValueShortWithCP24Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 830
 class struct_sMeasuredValueShortWithCP56Time2a(Structure):
@@ -2484,28 +3009,40 @@ class struct_sMeasuredValueShortWithCP56Time2a(Structure):
 MeasuredValueShortWithCP56Time2a = POINTER(struct_sMeasuredValueShortWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 830
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 833
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_destroy", "cdecl"):
-    MeasuredValueShortWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_destroy", "cdecl")
-    MeasuredValueShortWithCP56Time2a_destroy.argtypes = [MeasuredValueShortWithCP56Time2a]
-    MeasuredValueShortWithCP56Time2a_destroy.restype = None
+def _load_MeasuredValueShortWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_destroy", "cdecl"):
+        MeasuredValueShortWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_destroy", "cdecl")
+        MeasuredValueShortWithCP56Time2a_destroy.argtypes = [MeasuredValueShortWithCP56Time2a]
+        MeasuredValueShortWithCP56Time2a_destroy.restype = None
+    return locals().get("MeasuredValueShortWithCP56Time2a_destroy")
+_loaders["MeasuredValueShortWithCP56Time2a_destroy"] = _load_MeasuredValueShortWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 836
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_create", "cdecl"):
-    MeasuredValueShortWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_create", "cdecl")
-    MeasuredValueShortWithCP56Time2a_create.argtypes = [MeasuredValueShortWithCP56Time2a, c_int, c_float, QualityDescriptor, CP56Time2a]
-    MeasuredValueShortWithCP56Time2a_create.restype = MeasuredValueShortWithCP56Time2a
+def _load_MeasuredValueShortWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_create", "cdecl"):
+        MeasuredValueShortWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_create", "cdecl")
+        MeasuredValueShortWithCP56Time2a_create.argtypes = [MeasuredValueShortWithCP56Time2a, c_int, c_float, QualityDescriptor, CP56Time2a]
+        MeasuredValueShortWithCP56Time2a_create.restype = MeasuredValueShortWithCP56Time2a
+    return locals().get("MeasuredValueShortWithCP56Time2a_create")
+_loaders["MeasuredValueShortWithCP56Time2a_create"] = _load_MeasuredValueShortWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 840
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_getTimestamp", "cdecl"):
-    MeasuredValueShortWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_getTimestamp", "cdecl")
-    MeasuredValueShortWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueShortWithCP56Time2a]
-    MeasuredValueShortWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_MeasuredValueShortWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_getTimestamp", "cdecl"):
+        MeasuredValueShortWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_getTimestamp", "cdecl")
+        MeasuredValueShortWithCP56Time2a_getTimestamp.argtypes = [MeasuredValueShortWithCP56Time2a]
+        MeasuredValueShortWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("MeasuredValueShortWithCP56Time2a_getTimestamp")
+_loaders["MeasuredValueShortWithCP56Time2a_getTimestamp"] = _load_MeasuredValueShortWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 843
-if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_setTimestamp", "cdecl"):
-    MeasuredValueShortWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_setTimestamp", "cdecl")
-    MeasuredValueShortWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueShortWithCP56Time2a, CP56Time2a]
-    MeasuredValueShortWithCP56Time2a_setTimestamp.restype = None
+def _load_MeasuredValueShortWithCP56Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("MeasuredValueShortWithCP56Time2a_setTimestamp", "cdecl"):
+        MeasuredValueShortWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("MeasuredValueShortWithCP56Time2a_setTimestamp", "cdecl")
+        MeasuredValueShortWithCP56Time2a_setTimestamp.argtypes = [MeasuredValueShortWithCP56Time2a, CP56Time2a]
+        MeasuredValueShortWithCP56Time2a_setTimestamp.restype = None
+    return locals().get("MeasuredValueShortWithCP56Time2a_setTimestamp")
+_loaders["MeasuredValueShortWithCP56Time2a_setTimestamp"] = _load_MeasuredValueShortWithCP56Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 850
 class struct_sIntegratedTotals(Structure):
@@ -2514,28 +3051,40 @@ class struct_sIntegratedTotals(Structure):
 IntegratedTotals = POINTER(struct_sIntegratedTotals)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 850
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 853
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_destroy", "cdecl"):
-    IntegratedTotals_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_destroy", "cdecl")
-    IntegratedTotals_destroy.argtypes = [IntegratedTotals]
-    IntegratedTotals_destroy.restype = None
+def _load_IntegratedTotals_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_destroy", "cdecl"):
+        IntegratedTotals_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_destroy", "cdecl")
+        IntegratedTotals_destroy.argtypes = [IntegratedTotals]
+        IntegratedTotals_destroy.restype = None
+    return locals().get("IntegratedTotals_destroy")
+_loaders["IntegratedTotals_destroy"] = _load_IntegratedTotals_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 867
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_create", "cdecl"):
-    IntegratedTotals_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_create", "cdecl")
-    IntegratedTotals_create.argtypes = [IntegratedTotals, c_int, BinaryCounterReading]
-    IntegratedTotals_create.restype = IntegratedTotals
+def _load_IntegratedTotals_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_create", "cdecl"):
+        IntegratedTotals_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_create", "cdecl")
+        IntegratedTotals_create.argtypes = [IntegratedTotals, c_int, BinaryCounterReading]
+        IntegratedTotals_create.restype = IntegratedTotals
+    return locals().get("IntegratedTotals_create")
+_loaders["IntegratedTotals_create"] = _load_IntegratedTotals_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 870
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_getBCR", "cdecl"):
-    IntegratedTotals_getBCR = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_getBCR", "cdecl")
-    IntegratedTotals_getBCR.argtypes = [IntegratedTotals]
-    IntegratedTotals_getBCR.restype = BinaryCounterReading
+def _load_IntegratedTotals_getBCR():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_getBCR", "cdecl"):
+        IntegratedTotals_getBCR = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_getBCR", "cdecl")
+        IntegratedTotals_getBCR.argtypes = [IntegratedTotals]
+        IntegratedTotals_getBCR.restype = BinaryCounterReading
+    return locals().get("IntegratedTotals_getBCR")
+_loaders["IntegratedTotals_getBCR"] = _load_IntegratedTotals_getBCR
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 873
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_setBCR", "cdecl"):
-    IntegratedTotals_setBCR = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_setBCR", "cdecl")
-    IntegratedTotals_setBCR.argtypes = [IntegratedTotals, BinaryCounterReading]
-    IntegratedTotals_setBCR.restype = None
+def _load_IntegratedTotals_setBCR():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotals_setBCR", "cdecl"):
+        IntegratedTotals_setBCR = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotals_setBCR", "cdecl")
+        IntegratedTotals_setBCR.argtypes = [IntegratedTotals, BinaryCounterReading]
+        IntegratedTotals_setBCR.restype = None
+    return locals().get("IntegratedTotals_setBCR")
+_loaders["IntegratedTotals_setBCR"] = _load_IntegratedTotals_setBCR
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 879
 class struct_sIntegratedTotalsWithCP24Time2a(Structure):
@@ -2544,28 +3093,40 @@ class struct_sIntegratedTotalsWithCP24Time2a(Structure):
 IntegratedTotalsWithCP24Time2a = POINTER(struct_sIntegratedTotalsWithCP24Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 879
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 894
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_create", "cdecl"):
-    IntegratedTotalsWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_create", "cdecl")
-    IntegratedTotalsWithCP24Time2a_create.argtypes = [IntegratedTotalsWithCP24Time2a, c_int, BinaryCounterReading, CP24Time2a]
-    IntegratedTotalsWithCP24Time2a_create.restype = IntegratedTotalsWithCP24Time2a
+def _load_IntegratedTotalsWithCP24Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_create", "cdecl"):
+        IntegratedTotalsWithCP24Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_create", "cdecl")
+        IntegratedTotalsWithCP24Time2a_create.argtypes = [IntegratedTotalsWithCP24Time2a, c_int, BinaryCounterReading, CP24Time2a]
+        IntegratedTotalsWithCP24Time2a_create.restype = IntegratedTotalsWithCP24Time2a
+    return locals().get("IntegratedTotalsWithCP24Time2a_create")
+_loaders["IntegratedTotalsWithCP24Time2a_create"] = _load_IntegratedTotalsWithCP24Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 898
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_destroy", "cdecl"):
-    IntegratedTotalsWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_destroy", "cdecl")
-    IntegratedTotalsWithCP24Time2a_destroy.argtypes = [IntegratedTotalsWithCP24Time2a]
-    IntegratedTotalsWithCP24Time2a_destroy.restype = None
+def _load_IntegratedTotalsWithCP24Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_destroy", "cdecl"):
+        IntegratedTotalsWithCP24Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_destroy", "cdecl")
+        IntegratedTotalsWithCP24Time2a_destroy.argtypes = [IntegratedTotalsWithCP24Time2a]
+        IntegratedTotalsWithCP24Time2a_destroy.restype = None
+    return locals().get("IntegratedTotalsWithCP24Time2a_destroy")
+_loaders["IntegratedTotalsWithCP24Time2a_destroy"] = _load_IntegratedTotalsWithCP24Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 901
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_getTimestamp", "cdecl"):
-    IntegratedTotalsWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_getTimestamp", "cdecl")
-    IntegratedTotalsWithCP24Time2a_getTimestamp.argtypes = [IntegratedTotalsWithCP24Time2a]
-    IntegratedTotalsWithCP24Time2a_getTimestamp.restype = CP24Time2a
+def _load_IntegratedTotalsWithCP24Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_getTimestamp", "cdecl"):
+        IntegratedTotalsWithCP24Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_getTimestamp", "cdecl")
+        IntegratedTotalsWithCP24Time2a_getTimestamp.argtypes = [IntegratedTotalsWithCP24Time2a]
+        IntegratedTotalsWithCP24Time2a_getTimestamp.restype = CP24Time2a
+    return locals().get("IntegratedTotalsWithCP24Time2a_getTimestamp")
+_loaders["IntegratedTotalsWithCP24Time2a_getTimestamp"] = _load_IntegratedTotalsWithCP24Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 904
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_setTimestamp", "cdecl"):
-    IntegratedTotalsWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_setTimestamp", "cdecl")
-    IntegratedTotalsWithCP24Time2a_setTimestamp.argtypes = [IntegratedTotalsWithCP24Time2a, CP24Time2a]
-    IntegratedTotalsWithCP24Time2a_setTimestamp.restype = None
+def _load_IntegratedTotalsWithCP24Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP24Time2a_setTimestamp", "cdecl"):
+        IntegratedTotalsWithCP24Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP24Time2a_setTimestamp", "cdecl")
+        IntegratedTotalsWithCP24Time2a_setTimestamp.argtypes = [IntegratedTotalsWithCP24Time2a, CP24Time2a]
+        IntegratedTotalsWithCP24Time2a_setTimestamp.restype = None
+    return locals().get("IntegratedTotalsWithCP24Time2a_setTimestamp")
+_loaders["IntegratedTotalsWithCP24Time2a_setTimestamp"] = _load_IntegratedTotalsWithCP24Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 911
 class struct_sIntegratedTotalsWithCP56Time2a(Structure):
@@ -2574,28 +3135,40 @@ class struct_sIntegratedTotalsWithCP56Time2a(Structure):
 IntegratedTotalsWithCP56Time2a = POINTER(struct_sIntegratedTotalsWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 911
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 926
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_create", "cdecl"):
-    IntegratedTotalsWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_create", "cdecl")
-    IntegratedTotalsWithCP56Time2a_create.argtypes = [IntegratedTotalsWithCP56Time2a, c_int, BinaryCounterReading, CP56Time2a]
-    IntegratedTotalsWithCP56Time2a_create.restype = IntegratedTotalsWithCP56Time2a
+def _load_IntegratedTotalsWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_create", "cdecl"):
+        IntegratedTotalsWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_create", "cdecl")
+        IntegratedTotalsWithCP56Time2a_create.argtypes = [IntegratedTotalsWithCP56Time2a, c_int, BinaryCounterReading, CP56Time2a]
+        IntegratedTotalsWithCP56Time2a_create.restype = IntegratedTotalsWithCP56Time2a
+    return locals().get("IntegratedTotalsWithCP56Time2a_create")
+_loaders["IntegratedTotalsWithCP56Time2a_create"] = _load_IntegratedTotalsWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 930
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_destroy", "cdecl"):
-    IntegratedTotalsWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_destroy", "cdecl")
-    IntegratedTotalsWithCP56Time2a_destroy.argtypes = [IntegratedTotalsWithCP56Time2a]
-    IntegratedTotalsWithCP56Time2a_destroy.restype = None
+def _load_IntegratedTotalsWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_destroy", "cdecl"):
+        IntegratedTotalsWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_destroy", "cdecl")
+        IntegratedTotalsWithCP56Time2a_destroy.argtypes = [IntegratedTotalsWithCP56Time2a]
+        IntegratedTotalsWithCP56Time2a_destroy.restype = None
+    return locals().get("IntegratedTotalsWithCP56Time2a_destroy")
+_loaders["IntegratedTotalsWithCP56Time2a_destroy"] = _load_IntegratedTotalsWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 933
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_getTimestamp", "cdecl"):
-    IntegratedTotalsWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_getTimestamp", "cdecl")
-    IntegratedTotalsWithCP56Time2a_getTimestamp.argtypes = [IntegratedTotalsWithCP56Time2a]
-    IntegratedTotalsWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_IntegratedTotalsWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_getTimestamp", "cdecl"):
+        IntegratedTotalsWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_getTimestamp", "cdecl")
+        IntegratedTotalsWithCP56Time2a_getTimestamp.argtypes = [IntegratedTotalsWithCP56Time2a]
+        IntegratedTotalsWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("IntegratedTotalsWithCP56Time2a_getTimestamp")
+_loaders["IntegratedTotalsWithCP56Time2a_getTimestamp"] = _load_IntegratedTotalsWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 936
-if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_setTimestamp", "cdecl"):
-    IntegratedTotalsWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_setTimestamp", "cdecl")
-    IntegratedTotalsWithCP56Time2a_setTimestamp.argtypes = [IntegratedTotalsWithCP56Time2a, CP56Time2a]
-    IntegratedTotalsWithCP56Time2a_setTimestamp.restype = None
+def _load_IntegratedTotalsWithCP56Time2a_setTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("IntegratedTotalsWithCP56Time2a_setTimestamp", "cdecl"):
+        IntegratedTotalsWithCP56Time2a_setTimestamp = _libs["/usr/local/lib/lib60870.so"].get("IntegratedTotalsWithCP56Time2a_setTimestamp", "cdecl")
+        IntegratedTotalsWithCP56Time2a_setTimestamp.argtypes = [IntegratedTotalsWithCP56Time2a, CP56Time2a]
+        IntegratedTotalsWithCP56Time2a_setTimestamp.restype = None
+    return locals().get("IntegratedTotalsWithCP56Time2a_setTimestamp")
+_loaders["IntegratedTotalsWithCP56Time2a_setTimestamp"] = _load_IntegratedTotalsWithCP56Time2a_setTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 943
 class struct_sEventOfProtectionEquipment(Structure):
@@ -2604,34 +3177,49 @@ class struct_sEventOfProtectionEquipment(Structure):
 EventOfProtectionEquipment = POINTER(struct_sEventOfProtectionEquipment)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 943
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 946
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_destroy", "cdecl"):
-    EventOfProtectionEquipment_destroy = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_destroy", "cdecl")
-    EventOfProtectionEquipment_destroy.argtypes = [EventOfProtectionEquipment]
-    EventOfProtectionEquipment_destroy.restype = None
+def _load_EventOfProtectionEquipment_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_destroy", "cdecl"):
+        EventOfProtectionEquipment_destroy = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_destroy", "cdecl")
+        EventOfProtectionEquipment_destroy.argtypes = [EventOfProtectionEquipment]
+        EventOfProtectionEquipment_destroy.restype = None
+    return locals().get("EventOfProtectionEquipment_destroy")
+_loaders["EventOfProtectionEquipment_destroy"] = _load_EventOfProtectionEquipment_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 949
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_create", "cdecl"):
-    EventOfProtectionEquipment_create = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_create", "cdecl")
-    EventOfProtectionEquipment_create.argtypes = [EventOfProtectionEquipment, c_int, SingleEvent, CP16Time2a, CP24Time2a]
-    EventOfProtectionEquipment_create.restype = EventOfProtectionEquipment
+def _load_EventOfProtectionEquipment_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_create", "cdecl"):
+        EventOfProtectionEquipment_create = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_create", "cdecl")
+        EventOfProtectionEquipment_create.argtypes = [EventOfProtectionEquipment, c_int, SingleEvent, CP16Time2a, CP24Time2a]
+        EventOfProtectionEquipment_create.restype = EventOfProtectionEquipment
+    return locals().get("EventOfProtectionEquipment_create")
+_loaders["EventOfProtectionEquipment_create"] = _load_EventOfProtectionEquipment_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 953
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getEvent", "cdecl"):
-    EventOfProtectionEquipment_getEvent = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getEvent", "cdecl")
-    EventOfProtectionEquipment_getEvent.argtypes = [EventOfProtectionEquipment]
-    EventOfProtectionEquipment_getEvent.restype = SingleEvent
+def _load_EventOfProtectionEquipment_getEvent():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getEvent", "cdecl"):
+        EventOfProtectionEquipment_getEvent = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getEvent", "cdecl")
+        EventOfProtectionEquipment_getEvent.argtypes = [EventOfProtectionEquipment]
+        EventOfProtectionEquipment_getEvent.restype = SingleEvent
+    return locals().get("EventOfProtectionEquipment_getEvent")
+_loaders["EventOfProtectionEquipment_getEvent"] = _load_EventOfProtectionEquipment_getEvent
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 956
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getElapsedTime", "cdecl"):
-    EventOfProtectionEquipment_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getElapsedTime", "cdecl")
-    EventOfProtectionEquipment_getElapsedTime.argtypes = [EventOfProtectionEquipment]
-    EventOfProtectionEquipment_getElapsedTime.restype = CP16Time2a
+def _load_EventOfProtectionEquipment_getElapsedTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getElapsedTime", "cdecl"):
+        EventOfProtectionEquipment_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getElapsedTime", "cdecl")
+        EventOfProtectionEquipment_getElapsedTime.argtypes = [EventOfProtectionEquipment]
+        EventOfProtectionEquipment_getElapsedTime.restype = CP16Time2a
+    return locals().get("EventOfProtectionEquipment_getElapsedTime")
+_loaders["EventOfProtectionEquipment_getElapsedTime"] = _load_EventOfProtectionEquipment_getElapsedTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 959
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getTimestamp", "cdecl"):
-    EventOfProtectionEquipment_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getTimestamp", "cdecl")
-    EventOfProtectionEquipment_getTimestamp.argtypes = [EventOfProtectionEquipment]
-    EventOfProtectionEquipment_getTimestamp.restype = CP24Time2a
+def _load_EventOfProtectionEquipment_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipment_getTimestamp", "cdecl"):
+        EventOfProtectionEquipment_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipment_getTimestamp", "cdecl")
+        EventOfProtectionEquipment_getTimestamp.argtypes = [EventOfProtectionEquipment]
+        EventOfProtectionEquipment_getTimestamp.restype = CP24Time2a
+    return locals().get("EventOfProtectionEquipment_getTimestamp")
+_loaders["EventOfProtectionEquipment_getTimestamp"] = _load_EventOfProtectionEquipment_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 965
 class struct_sPackedStartEventsOfProtectionEquipment(Structure):
@@ -2640,40 +3228,58 @@ class struct_sPackedStartEventsOfProtectionEquipment(Structure):
 PackedStartEventsOfProtectionEquipment = POINTER(struct_sPackedStartEventsOfProtectionEquipment)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 965
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 968
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_create", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_create = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_create", "cdecl")
-    PackedStartEventsOfProtectionEquipment_create.argtypes = [PackedStartEventsOfProtectionEquipment, c_int, StartEvent, QualityDescriptorP, CP16Time2a, CP24Time2a]
-    PackedStartEventsOfProtectionEquipment_create.restype = PackedStartEventsOfProtectionEquipment
+def _load_PackedStartEventsOfProtectionEquipment_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_create", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_create = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_create", "cdecl")
+        PackedStartEventsOfProtectionEquipment_create.argtypes = [PackedStartEventsOfProtectionEquipment, c_int, StartEvent, QualityDescriptorP, CP16Time2a, CP24Time2a]
+        PackedStartEventsOfProtectionEquipment_create.restype = PackedStartEventsOfProtectionEquipment
+    return locals().get("PackedStartEventsOfProtectionEquipment_create")
+_loaders["PackedStartEventsOfProtectionEquipment_create"] = _load_PackedStartEventsOfProtectionEquipment_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 972
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_destroy", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_destroy", "cdecl")
-    PackedStartEventsOfProtectionEquipment_destroy.argtypes = [PackedStartEventsOfProtectionEquipment]
-    PackedStartEventsOfProtectionEquipment_destroy.restype = None
+def _load_PackedStartEventsOfProtectionEquipment_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_destroy", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_destroy", "cdecl")
+        PackedStartEventsOfProtectionEquipment_destroy.argtypes = [PackedStartEventsOfProtectionEquipment]
+        PackedStartEventsOfProtectionEquipment_destroy.restype = None
+    return locals().get("PackedStartEventsOfProtectionEquipment_destroy")
+_loaders["PackedStartEventsOfProtectionEquipment_destroy"] = _load_PackedStartEventsOfProtectionEquipment_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 975
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getEvent", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_getEvent = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getEvent", "cdecl")
-    PackedStartEventsOfProtectionEquipment_getEvent.argtypes = [PackedStartEventsOfProtectionEquipment]
-    PackedStartEventsOfProtectionEquipment_getEvent.restype = StartEvent
+def _load_PackedStartEventsOfProtectionEquipment_getEvent():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getEvent", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_getEvent = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getEvent", "cdecl")
+        PackedStartEventsOfProtectionEquipment_getEvent.argtypes = [PackedStartEventsOfProtectionEquipment]
+        PackedStartEventsOfProtectionEquipment_getEvent.restype = StartEvent
+    return locals().get("PackedStartEventsOfProtectionEquipment_getEvent")
+_loaders["PackedStartEventsOfProtectionEquipment_getEvent"] = _load_PackedStartEventsOfProtectionEquipment_getEvent
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 978
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getQuality", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getQuality", "cdecl")
-    PackedStartEventsOfProtectionEquipment_getQuality.argtypes = [PackedStartEventsOfProtectionEquipment]
-    PackedStartEventsOfProtectionEquipment_getQuality.restype = QualityDescriptorP
+def _load_PackedStartEventsOfProtectionEquipment_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getQuality", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getQuality", "cdecl")
+        PackedStartEventsOfProtectionEquipment_getQuality.argtypes = [PackedStartEventsOfProtectionEquipment]
+        PackedStartEventsOfProtectionEquipment_getQuality.restype = QualityDescriptorP
+    return locals().get("PackedStartEventsOfProtectionEquipment_getQuality")
+_loaders["PackedStartEventsOfProtectionEquipment_getQuality"] = _load_PackedStartEventsOfProtectionEquipment_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 981
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getElapsedTime", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getElapsedTime", "cdecl")
-    PackedStartEventsOfProtectionEquipment_getElapsedTime.argtypes = [PackedStartEventsOfProtectionEquipment]
-    PackedStartEventsOfProtectionEquipment_getElapsedTime.restype = CP16Time2a
+def _load_PackedStartEventsOfProtectionEquipment_getElapsedTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getElapsedTime", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getElapsedTime", "cdecl")
+        PackedStartEventsOfProtectionEquipment_getElapsedTime.argtypes = [PackedStartEventsOfProtectionEquipment]
+        PackedStartEventsOfProtectionEquipment_getElapsedTime.restype = CP16Time2a
+    return locals().get("PackedStartEventsOfProtectionEquipment_getElapsedTime")
+_loaders["PackedStartEventsOfProtectionEquipment_getElapsedTime"] = _load_PackedStartEventsOfProtectionEquipment_getElapsedTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 984
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getTimestamp", "cdecl"):
-    PackedStartEventsOfProtectionEquipment_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getTimestamp", "cdecl")
-    PackedStartEventsOfProtectionEquipment_getTimestamp.argtypes = [PackedStartEventsOfProtectionEquipment]
-    PackedStartEventsOfProtectionEquipment_getTimestamp.restype = CP24Time2a
+def _load_PackedStartEventsOfProtectionEquipment_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipment_getTimestamp", "cdecl"):
+        PackedStartEventsOfProtectionEquipment_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipment_getTimestamp", "cdecl")
+        PackedStartEventsOfProtectionEquipment_getTimestamp.argtypes = [PackedStartEventsOfProtectionEquipment]
+        PackedStartEventsOfProtectionEquipment_getTimestamp.restype = CP24Time2a
+    return locals().get("PackedStartEventsOfProtectionEquipment_getTimestamp")
+_loaders["PackedStartEventsOfProtectionEquipment_getTimestamp"] = _load_PackedStartEventsOfProtectionEquipment_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 990
 class struct_sPackedOutputCircuitInfo(Structure):
@@ -2682,40 +3288,58 @@ class struct_sPackedOutputCircuitInfo(Structure):
 PackedOutputCircuitInfo = POINTER(struct_sPackedOutputCircuitInfo)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 990
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 993
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_destroy", "cdecl"):
-    PackedOutputCircuitInfo_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_destroy", "cdecl")
-    PackedOutputCircuitInfo_destroy.argtypes = [PackedOutputCircuitInfo]
-    PackedOutputCircuitInfo_destroy.restype = None
+def _load_PackedOutputCircuitInfo_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_destroy", "cdecl"):
+        PackedOutputCircuitInfo_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_destroy", "cdecl")
+        PackedOutputCircuitInfo_destroy.argtypes = [PackedOutputCircuitInfo]
+        PackedOutputCircuitInfo_destroy.restype = None
+    return locals().get("PackedOutputCircuitInfo_destroy")
+_loaders["PackedOutputCircuitInfo_destroy"] = _load_PackedOutputCircuitInfo_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 996
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_create", "cdecl"):
-    PackedOutputCircuitInfo_create = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_create", "cdecl")
-    PackedOutputCircuitInfo_create.argtypes = [PackedOutputCircuitInfo, c_int, OutputCircuitInfo, QualityDescriptorP, CP16Time2a, CP24Time2a]
-    PackedOutputCircuitInfo_create.restype = PackedOutputCircuitInfo
+def _load_PackedOutputCircuitInfo_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_create", "cdecl"):
+        PackedOutputCircuitInfo_create = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_create", "cdecl")
+        PackedOutputCircuitInfo_create.argtypes = [PackedOutputCircuitInfo, c_int, OutputCircuitInfo, QualityDescriptorP, CP16Time2a, CP24Time2a]
+        PackedOutputCircuitInfo_create.restype = PackedOutputCircuitInfo
+    return locals().get("PackedOutputCircuitInfo_create")
+_loaders["PackedOutputCircuitInfo_create"] = _load_PackedOutputCircuitInfo_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1000
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getOCI", "cdecl"):
-    PackedOutputCircuitInfo_getOCI = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getOCI", "cdecl")
-    PackedOutputCircuitInfo_getOCI.argtypes = [PackedOutputCircuitInfo]
-    PackedOutputCircuitInfo_getOCI.restype = OutputCircuitInfo
+def _load_PackedOutputCircuitInfo_getOCI():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getOCI", "cdecl"):
+        PackedOutputCircuitInfo_getOCI = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getOCI", "cdecl")
+        PackedOutputCircuitInfo_getOCI.argtypes = [PackedOutputCircuitInfo]
+        PackedOutputCircuitInfo_getOCI.restype = OutputCircuitInfo
+    return locals().get("PackedOutputCircuitInfo_getOCI")
+_loaders["PackedOutputCircuitInfo_getOCI"] = _load_PackedOutputCircuitInfo_getOCI
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1003
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getQuality", "cdecl"):
-    PackedOutputCircuitInfo_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getQuality", "cdecl")
-    PackedOutputCircuitInfo_getQuality.argtypes = [PackedOutputCircuitInfo]
-    PackedOutputCircuitInfo_getQuality.restype = QualityDescriptorP
+def _load_PackedOutputCircuitInfo_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getQuality", "cdecl"):
+        PackedOutputCircuitInfo_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getQuality", "cdecl")
+        PackedOutputCircuitInfo_getQuality.argtypes = [PackedOutputCircuitInfo]
+        PackedOutputCircuitInfo_getQuality.restype = QualityDescriptorP
+    return locals().get("PackedOutputCircuitInfo_getQuality")
+_loaders["PackedOutputCircuitInfo_getQuality"] = _load_PackedOutputCircuitInfo_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1006
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getOperatingTime", "cdecl"):
-    PackedOutputCircuitInfo_getOperatingTime = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getOperatingTime", "cdecl")
-    PackedOutputCircuitInfo_getOperatingTime.argtypes = [PackedOutputCircuitInfo]
-    PackedOutputCircuitInfo_getOperatingTime.restype = CP16Time2a
+def _load_PackedOutputCircuitInfo_getOperatingTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getOperatingTime", "cdecl"):
+        PackedOutputCircuitInfo_getOperatingTime = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getOperatingTime", "cdecl")
+        PackedOutputCircuitInfo_getOperatingTime.argtypes = [PackedOutputCircuitInfo]
+        PackedOutputCircuitInfo_getOperatingTime.restype = CP16Time2a
+    return locals().get("PackedOutputCircuitInfo_getOperatingTime")
+_loaders["PackedOutputCircuitInfo_getOperatingTime"] = _load_PackedOutputCircuitInfo_getOperatingTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1009
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getTimestamp", "cdecl"):
-    PackedOutputCircuitInfo_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getTimestamp", "cdecl")
-    PackedOutputCircuitInfo_getTimestamp.argtypes = [PackedOutputCircuitInfo]
-    PackedOutputCircuitInfo_getTimestamp.restype = CP24Time2a
+def _load_PackedOutputCircuitInfo_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfo_getTimestamp", "cdecl"):
+        PackedOutputCircuitInfo_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfo_getTimestamp", "cdecl")
+        PackedOutputCircuitInfo_getTimestamp.argtypes = [PackedOutputCircuitInfo]
+        PackedOutputCircuitInfo_getTimestamp.restype = CP24Time2a
+    return locals().get("PackedOutputCircuitInfo_getTimestamp")
+_loaders["PackedOutputCircuitInfo_getTimestamp"] = _load_PackedOutputCircuitInfo_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1015
 class struct_sPackedSinglePointWithSCD(Structure):
@@ -2724,28 +3348,40 @@ class struct_sPackedSinglePointWithSCD(Structure):
 PackedSinglePointWithSCD = POINTER(struct_sPackedSinglePointWithSCD)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1015
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1018
-if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_destroy", "cdecl"):
-    PackedSinglePointWithSCD_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_destroy", "cdecl")
-    PackedSinglePointWithSCD_destroy.argtypes = [PackedSinglePointWithSCD]
-    PackedSinglePointWithSCD_destroy.restype = None
+def _load_PackedSinglePointWithSCD_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_destroy", "cdecl"):
+        PackedSinglePointWithSCD_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_destroy", "cdecl")
+        PackedSinglePointWithSCD_destroy.argtypes = [PackedSinglePointWithSCD]
+        PackedSinglePointWithSCD_destroy.restype = None
+    return locals().get("PackedSinglePointWithSCD_destroy")
+_loaders["PackedSinglePointWithSCD_destroy"] = _load_PackedSinglePointWithSCD_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1021
-if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_create", "cdecl"):
-    PackedSinglePointWithSCD_create = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_create", "cdecl")
-    PackedSinglePointWithSCD_create.argtypes = [PackedSinglePointWithSCD, c_int, StatusAndStatusChangeDetection, QualityDescriptor]
-    PackedSinglePointWithSCD_create.restype = PackedSinglePointWithSCD
+def _load_PackedSinglePointWithSCD_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_create", "cdecl"):
+        PackedSinglePointWithSCD_create = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_create", "cdecl")
+        PackedSinglePointWithSCD_create.argtypes = [PackedSinglePointWithSCD, c_int, StatusAndStatusChangeDetection, QualityDescriptor]
+        PackedSinglePointWithSCD_create.restype = PackedSinglePointWithSCD
+    return locals().get("PackedSinglePointWithSCD_create")
+_loaders["PackedSinglePointWithSCD_create"] = _load_PackedSinglePointWithSCD_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1025
-if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_getQuality", "cdecl"):
-    PackedSinglePointWithSCD_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_getQuality", "cdecl")
-    PackedSinglePointWithSCD_getQuality.argtypes = [PackedSinglePointWithSCD]
-    PackedSinglePointWithSCD_getQuality.restype = QualityDescriptor
+def _load_PackedSinglePointWithSCD_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_getQuality", "cdecl"):
+        PackedSinglePointWithSCD_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_getQuality", "cdecl")
+        PackedSinglePointWithSCD_getQuality.argtypes = [PackedSinglePointWithSCD]
+        PackedSinglePointWithSCD_getQuality.restype = QualityDescriptor
+    return locals().get("PackedSinglePointWithSCD_getQuality")
+_loaders["PackedSinglePointWithSCD_getQuality"] = _load_PackedSinglePointWithSCD_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1028
-if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_getSCD", "cdecl"):
-    PackedSinglePointWithSCD_getSCD = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_getSCD", "cdecl")
-    PackedSinglePointWithSCD_getSCD.argtypes = [PackedSinglePointWithSCD]
-    PackedSinglePointWithSCD_getSCD.restype = StatusAndStatusChangeDetection
+def _load_PackedSinglePointWithSCD_getSCD():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedSinglePointWithSCD_getSCD", "cdecl"):
+        PackedSinglePointWithSCD_getSCD = _libs["/usr/local/lib/lib60870.so"].get("PackedSinglePointWithSCD_getSCD", "cdecl")
+        PackedSinglePointWithSCD_getSCD.argtypes = [PackedSinglePointWithSCD]
+        PackedSinglePointWithSCD_getSCD.restype = StatusAndStatusChangeDetection
+    return locals().get("PackedSinglePointWithSCD_getSCD")
+_loaders["PackedSinglePointWithSCD_getSCD"] = _load_PackedSinglePointWithSCD_getSCD
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1035
 class struct_sSingleCommand(Structure):
@@ -2754,34 +3390,49 @@ class struct_sSingleCommand(Structure):
 SingleCommand = POINTER(struct_sSingleCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1035
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1049
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_create", "cdecl"):
-    SingleCommand_create = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_create", "cdecl")
-    SingleCommand_create.argtypes = [SingleCommand, c_int, c_bool, c_bool, c_int]
-    SingleCommand_create.restype = SingleCommand
+def _load_SingleCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_create", "cdecl"):
+        SingleCommand_create = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_create", "cdecl")
+        SingleCommand_create.argtypes = [SingleCommand, c_int, c_bool, c_bool, c_int]
+        SingleCommand_create.restype = SingleCommand
+    return locals().get("SingleCommand_create")
+_loaders["SingleCommand_create"] = _load_SingleCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1052
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_destroy", "cdecl"):
-    SingleCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_destroy", "cdecl")
-    SingleCommand_destroy.argtypes = [SingleCommand]
-    SingleCommand_destroy.restype = None
+def _load_SingleCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_destroy", "cdecl"):
+        SingleCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_destroy", "cdecl")
+        SingleCommand_destroy.argtypes = [SingleCommand]
+        SingleCommand_destroy.restype = None
+    return locals().get("SingleCommand_destroy")
+_loaders["SingleCommand_destroy"] = _load_SingleCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1060
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_getQU", "cdecl"):
-    SingleCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_getQU", "cdecl")
-    SingleCommand_getQU.argtypes = [SingleCommand]
-    SingleCommand_getQU.restype = c_int
+def _load_SingleCommand_getQU():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_getQU", "cdecl"):
+        SingleCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_getQU", "cdecl")
+        SingleCommand_getQU.argtypes = [SingleCommand]
+        SingleCommand_getQU.restype = c_int
+    return locals().get("SingleCommand_getQU")
+_loaders["SingleCommand_getQU"] = _load_SingleCommand_getQU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1066
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_getState", "cdecl"):
-    SingleCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_getState", "cdecl")
-    SingleCommand_getState.argtypes = [SingleCommand]
-    SingleCommand_getState.restype = c_bool
+def _load_SingleCommand_getState():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_getState", "cdecl"):
+        SingleCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_getState", "cdecl")
+        SingleCommand_getState.argtypes = [SingleCommand]
+        SingleCommand_getState.restype = c_bool
+    return locals().get("SingleCommand_getState")
+_loaders["SingleCommand_getState"] = _load_SingleCommand_getState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1074
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_isSelect", "cdecl"):
-    SingleCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_isSelect", "cdecl")
-    SingleCommand_isSelect.argtypes = [SingleCommand]
-    SingleCommand_isSelect.restype = c_bool
+def _load_SingleCommand_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommand_isSelect", "cdecl"):
+        SingleCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SingleCommand_isSelect", "cdecl")
+        SingleCommand_isSelect.argtypes = [SingleCommand]
+        SingleCommand_isSelect.restype = c_bool
+    return locals().get("SingleCommand_isSelect")
+_loaders["SingleCommand_isSelect"] = _load_SingleCommand_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1080
 class struct_sSingleCommandWithCP56Time2a(Structure):
@@ -2790,22 +3441,31 @@ class struct_sSingleCommandWithCP56Time2a(Structure):
 SingleCommandWithCP56Time2a = POINTER(struct_sSingleCommandWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1080
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1083
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_destroy", "cdecl"):
-    SingleCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_destroy", "cdecl")
-    SingleCommandWithCP56Time2a_destroy.argtypes = [SingleCommandWithCP56Time2a]
-    SingleCommandWithCP56Time2a_destroy.restype = None
+def _load_SingleCommandWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_destroy", "cdecl"):
+        SingleCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_destroy", "cdecl")
+        SingleCommandWithCP56Time2a_destroy.argtypes = [SingleCommandWithCP56Time2a]
+        SingleCommandWithCP56Time2a_destroy.restype = None
+    return locals().get("SingleCommandWithCP56Time2a_destroy")
+_loaders["SingleCommandWithCP56Time2a_destroy"] = _load_SingleCommandWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1098
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_create", "cdecl"):
-    SingleCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_create", "cdecl")
-    SingleCommandWithCP56Time2a_create.argtypes = [SingleCommandWithCP56Time2a, c_int, c_bool, c_bool, c_int, CP56Time2a]
-    SingleCommandWithCP56Time2a_create.restype = SingleCommandWithCP56Time2a
+def _load_SingleCommandWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_create", "cdecl"):
+        SingleCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_create", "cdecl")
+        SingleCommandWithCP56Time2a_create.argtypes = [SingleCommandWithCP56Time2a, c_int, c_bool, c_bool, c_int, CP56Time2a]
+        SingleCommandWithCP56Time2a_create.restype = SingleCommandWithCP56Time2a
+    return locals().get("SingleCommandWithCP56Time2a_create")
+_loaders["SingleCommandWithCP56Time2a_create"] = _load_SingleCommandWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1109
-if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_getTimestamp", "cdecl"):
-    SingleCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_getTimestamp", "cdecl")
-    SingleCommandWithCP56Time2a_getTimestamp.argtypes = [SingleCommandWithCP56Time2a]
-    SingleCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_SingleCommandWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SingleCommandWithCP56Time2a_getTimestamp", "cdecl"):
+        SingleCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SingleCommandWithCP56Time2a_getTimestamp", "cdecl")
+        SingleCommandWithCP56Time2a_getTimestamp.argtypes = [SingleCommandWithCP56Time2a]
+        SingleCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("SingleCommandWithCP56Time2a_getTimestamp")
+_loaders["SingleCommandWithCP56Time2a_getTimestamp"] = _load_SingleCommandWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1115
 class struct_sDoubleCommand(Structure):
@@ -2814,34 +3474,49 @@ class struct_sDoubleCommand(Structure):
 DoubleCommand = POINTER(struct_sDoubleCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1115
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1118
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_destroy", "cdecl"):
-    DoubleCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_destroy", "cdecl")
-    DoubleCommand_destroy.argtypes = [DoubleCommand]
-    DoubleCommand_destroy.restype = None
+def _load_DoubleCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_destroy", "cdecl"):
+        DoubleCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_destroy", "cdecl")
+        DoubleCommand_destroy.argtypes = [DoubleCommand]
+        DoubleCommand_destroy.restype = None
+    return locals().get("DoubleCommand_destroy")
+_loaders["DoubleCommand_destroy"] = _load_DoubleCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1132
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_create", "cdecl"):
-    DoubleCommand_create = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_create", "cdecl")
-    DoubleCommand_create.argtypes = [DoubleCommand, c_int, c_int, c_bool, c_int]
-    DoubleCommand_create.restype = DoubleCommand
+def _load_DoubleCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_create", "cdecl"):
+        DoubleCommand_create = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_create", "cdecl")
+        DoubleCommand_create.argtypes = [DoubleCommand, c_int, c_int, c_bool, c_int]
+        DoubleCommand_create.restype = DoubleCommand
+    return locals().get("DoubleCommand_create")
+_loaders["DoubleCommand_create"] = _load_DoubleCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1140
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_getQU", "cdecl"):
-    DoubleCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_getQU", "cdecl")
-    DoubleCommand_getQU.argtypes = [DoubleCommand]
-    DoubleCommand_getQU.restype = c_int
+def _load_DoubleCommand_getQU():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_getQU", "cdecl"):
+        DoubleCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_getQU", "cdecl")
+        DoubleCommand_getQU.argtypes = [DoubleCommand]
+        DoubleCommand_getQU.restype = c_int
+    return locals().get("DoubleCommand_getQU")
+_loaders["DoubleCommand_getQU"] = _load_DoubleCommand_getQU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1148
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_getState", "cdecl"):
-    DoubleCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_getState", "cdecl")
-    DoubleCommand_getState.argtypes = [DoubleCommand]
-    DoubleCommand_getState.restype = c_int
+def _load_DoubleCommand_getState():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_getState", "cdecl"):
+        DoubleCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_getState", "cdecl")
+        DoubleCommand_getState.argtypes = [DoubleCommand]
+        DoubleCommand_getState.restype = c_int
+    return locals().get("DoubleCommand_getState")
+_loaders["DoubleCommand_getState"] = _load_DoubleCommand_getState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1156
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_isSelect", "cdecl"):
-    DoubleCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_isSelect", "cdecl")
-    DoubleCommand_isSelect.argtypes = [DoubleCommand]
-    DoubleCommand_isSelect.restype = c_bool
+def _load_DoubleCommand_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommand_isSelect", "cdecl"):
+        DoubleCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommand_isSelect", "cdecl")
+        DoubleCommand_isSelect.argtypes = [DoubleCommand]
+        DoubleCommand_isSelect.restype = c_bool
+    return locals().get("DoubleCommand_isSelect")
+_loaders["DoubleCommand_isSelect"] = _load_DoubleCommand_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1162
 class struct_sStepCommand(Structure):
@@ -2850,34 +3525,49 @@ class struct_sStepCommand(Structure):
 StepCommand = POINTER(struct_sStepCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1162
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1165
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_destroy", "cdecl"):
-    StepCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_destroy", "cdecl")
-    StepCommand_destroy.argtypes = [StepCommand]
-    StepCommand_destroy.restype = None
+def _load_StepCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_destroy", "cdecl"):
+        StepCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_destroy", "cdecl")
+        StepCommand_destroy.argtypes = [StepCommand]
+        StepCommand_destroy.restype = None
+    return locals().get("StepCommand_destroy")
+_loaders["StepCommand_destroy"] = _load_StepCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1168
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_create", "cdecl"):
-    StepCommand_create = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_create", "cdecl")
-    StepCommand_create.argtypes = [StepCommand, c_int, StepCommandValue, c_bool, c_int]
-    StepCommand_create.restype = StepCommand
+def _load_StepCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_create", "cdecl"):
+        StepCommand_create = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_create", "cdecl")
+        StepCommand_create.argtypes = [StepCommand, c_int, StepCommandValue, c_bool, c_int]
+        StepCommand_create.restype = StepCommand
+    return locals().get("StepCommand_create")
+_loaders["StepCommand_create"] = _load_StepCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1176
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_getQU", "cdecl"):
-    StepCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_getQU", "cdecl")
-    StepCommand_getQU.argtypes = [StepCommand]
-    StepCommand_getQU.restype = c_int
+def _load_StepCommand_getQU():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_getQU", "cdecl"):
+        StepCommand_getQU = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_getQU", "cdecl")
+        StepCommand_getQU.argtypes = [StepCommand]
+        StepCommand_getQU.restype = c_int
+    return locals().get("StepCommand_getQU")
+_loaders["StepCommand_getQU"] = _load_StepCommand_getQU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1179
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_getState", "cdecl"):
-    StepCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_getState", "cdecl")
-    StepCommand_getState.argtypes = [StepCommand]
-    StepCommand_getState.restype = StepCommandValue
+def _load_StepCommand_getState():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_getState", "cdecl"):
+        StepCommand_getState = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_getState", "cdecl")
+        StepCommand_getState.argtypes = [StepCommand]
+        StepCommand_getState.restype = StepCommandValue
+    return locals().get("StepCommand_getState")
+_loaders["StepCommand_getState"] = _load_StepCommand_getState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1187
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_isSelect", "cdecl"):
-    StepCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_isSelect", "cdecl")
-    StepCommand_isSelect.argtypes = [StepCommand]
-    StepCommand_isSelect.restype = c_bool
+def _load_StepCommand_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommand_isSelect", "cdecl"):
+        StepCommand_isSelect = _libs["/usr/local/lib/lib60870.so"].get("StepCommand_isSelect", "cdecl")
+        StepCommand_isSelect.argtypes = [StepCommand]
+        StepCommand_isSelect.restype = c_bool
+    return locals().get("StepCommand_isSelect")
+_loaders["StepCommand_isSelect"] = _load_StepCommand_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1193
 class struct_sSetpointCommandNormalized(Structure):
@@ -2886,34 +3576,49 @@ class struct_sSetpointCommandNormalized(Structure):
 SetpointCommandNormalized = POINTER(struct_sSetpointCommandNormalized)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1193
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1196
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_destroy", "cdecl"):
-    SetpointCommandNormalized_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_destroy", "cdecl")
-    SetpointCommandNormalized_destroy.argtypes = [SetpointCommandNormalized]
-    SetpointCommandNormalized_destroy.restype = None
+def _load_SetpointCommandNormalized_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_destroy", "cdecl"):
+        SetpointCommandNormalized_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_destroy", "cdecl")
+        SetpointCommandNormalized_destroy.argtypes = [SetpointCommandNormalized]
+        SetpointCommandNormalized_destroy.restype = None
+    return locals().get("SetpointCommandNormalized_destroy")
+_loaders["SetpointCommandNormalized_destroy"] = _load_SetpointCommandNormalized_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1210
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_create", "cdecl"):
-    SetpointCommandNormalized_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_create", "cdecl")
-    SetpointCommandNormalized_create.argtypes = [SetpointCommandNormalized, c_int, c_float, c_bool, c_int]
-    SetpointCommandNormalized_create.restype = SetpointCommandNormalized
+def _load_SetpointCommandNormalized_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_create", "cdecl"):
+        SetpointCommandNormalized_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_create", "cdecl")
+        SetpointCommandNormalized_create.argtypes = [SetpointCommandNormalized, c_int, c_float, c_bool, c_int]
+        SetpointCommandNormalized_create.restype = SetpointCommandNormalized
+    return locals().get("SetpointCommandNormalized_create")
+_loaders["SetpointCommandNormalized_create"] = _load_SetpointCommandNormalized_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1213
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_getValue", "cdecl"):
-    SetpointCommandNormalized_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_getValue", "cdecl")
-    SetpointCommandNormalized_getValue.argtypes = [SetpointCommandNormalized]
-    SetpointCommandNormalized_getValue.restype = c_float
+def _load_SetpointCommandNormalized_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_getValue", "cdecl"):
+        SetpointCommandNormalized_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_getValue", "cdecl")
+        SetpointCommandNormalized_getValue.argtypes = [SetpointCommandNormalized]
+        SetpointCommandNormalized_getValue.restype = c_float
+    return locals().get("SetpointCommandNormalized_getValue")
+_loaders["SetpointCommandNormalized_getValue"] = _load_SetpointCommandNormalized_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1216
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_getQL", "cdecl"):
-    SetpointCommandNormalized_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_getQL", "cdecl")
-    SetpointCommandNormalized_getQL.argtypes = [SetpointCommandNormalized]
-    SetpointCommandNormalized_getQL.restype = c_int
+def _load_SetpointCommandNormalized_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_getQL", "cdecl"):
+        SetpointCommandNormalized_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_getQL", "cdecl")
+        SetpointCommandNormalized_getQL.argtypes = [SetpointCommandNormalized]
+        SetpointCommandNormalized_getQL.restype = c_int
+    return locals().get("SetpointCommandNormalized_getQL")
+_loaders["SetpointCommandNormalized_getQL"] = _load_SetpointCommandNormalized_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1224
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_isSelect", "cdecl"):
-    SetpointCommandNormalized_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_isSelect", "cdecl")
-    SetpointCommandNormalized_isSelect.argtypes = [SetpointCommandNormalized]
-    SetpointCommandNormalized_isSelect.restype = c_bool
+def _load_SetpointCommandNormalized_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalized_isSelect", "cdecl"):
+        SetpointCommandNormalized_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalized_isSelect", "cdecl")
+        SetpointCommandNormalized_isSelect.argtypes = [SetpointCommandNormalized]
+        SetpointCommandNormalized_isSelect.restype = c_bool
+    return locals().get("SetpointCommandNormalized_isSelect")
+_loaders["SetpointCommandNormalized_isSelect"] = _load_SetpointCommandNormalized_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1230
 class struct_sSetpointCommandScaled(Structure):
@@ -2922,34 +3627,49 @@ class struct_sSetpointCommandScaled(Structure):
 SetpointCommandScaled = POINTER(struct_sSetpointCommandScaled)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1230
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1233
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_destroy", "cdecl"):
-    SetpointCommandScaled_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_destroy", "cdecl")
-    SetpointCommandScaled_destroy.argtypes = [SetpointCommandScaled]
-    SetpointCommandScaled_destroy.restype = None
+def _load_SetpointCommandScaled_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_destroy", "cdecl"):
+        SetpointCommandScaled_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_destroy", "cdecl")
+        SetpointCommandScaled_destroy.argtypes = [SetpointCommandScaled]
+        SetpointCommandScaled_destroy.restype = None
+    return locals().get("SetpointCommandScaled_destroy")
+_loaders["SetpointCommandScaled_destroy"] = _load_SetpointCommandScaled_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1247
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_create", "cdecl"):
-    SetpointCommandScaled_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_create", "cdecl")
-    SetpointCommandScaled_create.argtypes = [SetpointCommandScaled, c_int, c_int, c_bool, c_int]
-    SetpointCommandScaled_create.restype = SetpointCommandScaled
+def _load_SetpointCommandScaled_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_create", "cdecl"):
+        SetpointCommandScaled_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_create", "cdecl")
+        SetpointCommandScaled_create.argtypes = [SetpointCommandScaled, c_int, c_int, c_bool, c_int]
+        SetpointCommandScaled_create.restype = SetpointCommandScaled
+    return locals().get("SetpointCommandScaled_create")
+_loaders["SetpointCommandScaled_create"] = _load_SetpointCommandScaled_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1250
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_getValue", "cdecl"):
-    SetpointCommandScaled_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_getValue", "cdecl")
-    SetpointCommandScaled_getValue.argtypes = [SetpointCommandScaled]
-    SetpointCommandScaled_getValue.restype = c_int
+def _load_SetpointCommandScaled_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_getValue", "cdecl"):
+        SetpointCommandScaled_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_getValue", "cdecl")
+        SetpointCommandScaled_getValue.argtypes = [SetpointCommandScaled]
+        SetpointCommandScaled_getValue.restype = c_int
+    return locals().get("SetpointCommandScaled_getValue")
+_loaders["SetpointCommandScaled_getValue"] = _load_SetpointCommandScaled_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1253
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_getQL", "cdecl"):
-    SetpointCommandScaled_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_getQL", "cdecl")
-    SetpointCommandScaled_getQL.argtypes = [SetpointCommandScaled]
-    SetpointCommandScaled_getQL.restype = c_int
+def _load_SetpointCommandScaled_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_getQL", "cdecl"):
+        SetpointCommandScaled_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_getQL", "cdecl")
+        SetpointCommandScaled_getQL.argtypes = [SetpointCommandScaled]
+        SetpointCommandScaled_getQL.restype = c_int
+    return locals().get("SetpointCommandScaled_getQL")
+_loaders["SetpointCommandScaled_getQL"] = _load_SetpointCommandScaled_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1261
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_isSelect", "cdecl"):
-    SetpointCommandScaled_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_isSelect", "cdecl")
-    SetpointCommandScaled_isSelect.argtypes = [SetpointCommandScaled]
-    SetpointCommandScaled_isSelect.restype = c_bool
+def _load_SetpointCommandScaled_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaled_isSelect", "cdecl"):
+        SetpointCommandScaled_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaled_isSelect", "cdecl")
+        SetpointCommandScaled_isSelect.argtypes = [SetpointCommandScaled]
+        SetpointCommandScaled_isSelect.restype = c_bool
+    return locals().get("SetpointCommandScaled_isSelect")
+_loaders["SetpointCommandScaled_isSelect"] = _load_SetpointCommandScaled_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1267
 class struct_sSetpointCommandShort(Structure):
@@ -2958,34 +3678,49 @@ class struct_sSetpointCommandShort(Structure):
 SetpointCommandShort = POINTER(struct_sSetpointCommandShort)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1267
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1270
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_destroy", "cdecl"):
-    SetpointCommandShort_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_destroy", "cdecl")
-    SetpointCommandShort_destroy.argtypes = [SetpointCommandShort]
-    SetpointCommandShort_destroy.restype = None
+def _load_SetpointCommandShort_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_destroy", "cdecl"):
+        SetpointCommandShort_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_destroy", "cdecl")
+        SetpointCommandShort_destroy.argtypes = [SetpointCommandShort]
+        SetpointCommandShort_destroy.restype = None
+    return locals().get("SetpointCommandShort_destroy")
+_loaders["SetpointCommandShort_destroy"] = _load_SetpointCommandShort_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1284
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_create", "cdecl"):
-    SetpointCommandShort_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_create", "cdecl")
-    SetpointCommandShort_create.argtypes = [SetpointCommandShort, c_int, c_float, c_bool, c_int]
-    SetpointCommandShort_create.restype = SetpointCommandShort
+def _load_SetpointCommandShort_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_create", "cdecl"):
+        SetpointCommandShort_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_create", "cdecl")
+        SetpointCommandShort_create.argtypes = [SetpointCommandShort, c_int, c_float, c_bool, c_int]
+        SetpointCommandShort_create.restype = SetpointCommandShort
+    return locals().get("SetpointCommandShort_create")
+_loaders["SetpointCommandShort_create"] = _load_SetpointCommandShort_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1287
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_getValue", "cdecl"):
-    SetpointCommandShort_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_getValue", "cdecl")
-    SetpointCommandShort_getValue.argtypes = [SetpointCommandShort]
-    SetpointCommandShort_getValue.restype = c_float
+def _load_SetpointCommandShort_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_getValue", "cdecl"):
+        SetpointCommandShort_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_getValue", "cdecl")
+        SetpointCommandShort_getValue.argtypes = [SetpointCommandShort]
+        SetpointCommandShort_getValue.restype = c_float
+    return locals().get("SetpointCommandShort_getValue")
+_loaders["SetpointCommandShort_getValue"] = _load_SetpointCommandShort_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1290
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_getQL", "cdecl"):
-    SetpointCommandShort_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_getQL", "cdecl")
-    SetpointCommandShort_getQL.argtypes = [SetpointCommandShort]
-    SetpointCommandShort_getQL.restype = c_int
+def _load_SetpointCommandShort_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_getQL", "cdecl"):
+        SetpointCommandShort_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_getQL", "cdecl")
+        SetpointCommandShort_getQL.argtypes = [SetpointCommandShort]
+        SetpointCommandShort_getQL.restype = c_int
+    return locals().get("SetpointCommandShort_getQL")
+_loaders["SetpointCommandShort_getQL"] = _load_SetpointCommandShort_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1298
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_isSelect", "cdecl"):
-    SetpointCommandShort_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_isSelect", "cdecl")
-    SetpointCommandShort_isSelect.argtypes = [SetpointCommandShort]
-    SetpointCommandShort_isSelect.restype = c_bool
+def _load_SetpointCommandShort_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShort_isSelect", "cdecl"):
+        SetpointCommandShort_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShort_isSelect", "cdecl")
+        SetpointCommandShort_isSelect.argtypes = [SetpointCommandShort]
+        SetpointCommandShort_isSelect.restype = c_bool
+    return locals().get("SetpointCommandShort_isSelect")
+_loaders["SetpointCommandShort_isSelect"] = _load_SetpointCommandShort_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1304
 class struct_sBitstring32Command(Structure):
@@ -2994,22 +3729,31 @@ class struct_sBitstring32Command(Structure):
 Bitstring32Command = POINTER(struct_sBitstring32Command)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1304
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1307
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_create", "cdecl"):
-    Bitstring32Command_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_create", "cdecl")
-    Bitstring32Command_create.argtypes = [Bitstring32Command, c_int, c_uint32]
-    Bitstring32Command_create.restype = Bitstring32Command
+def _load_Bitstring32Command_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_create", "cdecl"):
+        Bitstring32Command_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_create", "cdecl")
+        Bitstring32Command_create.argtypes = [Bitstring32Command, c_int, c_uint32]
+        Bitstring32Command_create.restype = Bitstring32Command
+    return locals().get("Bitstring32Command_create")
+_loaders["Bitstring32Command_create"] = _load_Bitstring32Command_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1310
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_destroy", "cdecl"):
-    Bitstring32Command_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_destroy", "cdecl")
-    Bitstring32Command_destroy.argtypes = [Bitstring32Command]
-    Bitstring32Command_destroy.restype = None
+def _load_Bitstring32Command_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_destroy", "cdecl"):
+        Bitstring32Command_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_destroy", "cdecl")
+        Bitstring32Command_destroy.argtypes = [Bitstring32Command]
+        Bitstring32Command_destroy.restype = None
+    return locals().get("Bitstring32Command_destroy")
+_loaders["Bitstring32Command_destroy"] = _load_Bitstring32Command_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1313
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_getValue", "cdecl"):
-    Bitstring32Command_getValue = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_getValue", "cdecl")
-    Bitstring32Command_getValue.argtypes = [Bitstring32Command]
-    Bitstring32Command_getValue.restype = c_uint32
+def _load_Bitstring32Command_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32Command_getValue", "cdecl"):
+        Bitstring32Command_getValue = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32Command_getValue", "cdecl")
+        Bitstring32Command_getValue.argtypes = [Bitstring32Command]
+        Bitstring32Command_getValue.restype = c_uint32
+    return locals().get("Bitstring32Command_getValue")
+_loaders["Bitstring32Command_getValue"] = _load_Bitstring32Command_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1319
 class struct_sInterrogationCommand(Structure):
@@ -3018,22 +3762,31 @@ class struct_sInterrogationCommand(Structure):
 InterrogationCommand = POINTER(struct_sInterrogationCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1319
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1322
-if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_create", "cdecl"):
-    InterrogationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_create", "cdecl")
-    InterrogationCommand_create.argtypes = [InterrogationCommand, c_int, c_uint8]
-    InterrogationCommand_create.restype = InterrogationCommand
+def _load_InterrogationCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_create", "cdecl"):
+        InterrogationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_create", "cdecl")
+        InterrogationCommand_create.argtypes = [InterrogationCommand, c_int, c_uint8]
+        InterrogationCommand_create.restype = InterrogationCommand
+    return locals().get("InterrogationCommand_create")
+_loaders["InterrogationCommand_create"] = _load_InterrogationCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1325
-if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_destroy", "cdecl"):
-    InterrogationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_destroy", "cdecl")
-    InterrogationCommand_destroy.argtypes = [InterrogationCommand]
-    InterrogationCommand_destroy.restype = None
+def _load_InterrogationCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_destroy", "cdecl"):
+        InterrogationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_destroy", "cdecl")
+        InterrogationCommand_destroy.argtypes = [InterrogationCommand]
+        InterrogationCommand_destroy.restype = None
+    return locals().get("InterrogationCommand_destroy")
+_loaders["InterrogationCommand_destroy"] = _load_InterrogationCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1328
-if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_getQOI", "cdecl"):
-    InterrogationCommand_getQOI = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_getQOI", "cdecl")
-    InterrogationCommand_getQOI.argtypes = [InterrogationCommand]
-    InterrogationCommand_getQOI.restype = c_uint8
+def _load_InterrogationCommand_getQOI():
+    if _libs["/usr/local/lib/lib60870.so"].has("InterrogationCommand_getQOI", "cdecl"):
+        InterrogationCommand_getQOI = _libs["/usr/local/lib/lib60870.so"].get("InterrogationCommand_getQOI", "cdecl")
+        InterrogationCommand_getQOI.argtypes = [InterrogationCommand]
+        InterrogationCommand_getQOI.restype = c_uint8
+    return locals().get("InterrogationCommand_getQOI")
+_loaders["InterrogationCommand_getQOI"] = _load_InterrogationCommand_getQOI
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1334
 class struct_sReadCommand(Structure):
@@ -3042,16 +3795,22 @@ class struct_sReadCommand(Structure):
 ReadCommand = POINTER(struct_sReadCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1334
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1337
-if _libs["/usr/local/lib/lib60870.so"].has("ReadCommand_create", "cdecl"):
-    ReadCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ReadCommand_create", "cdecl")
-    ReadCommand_create.argtypes = [ReadCommand, c_int]
-    ReadCommand_create.restype = ReadCommand
+def _load_ReadCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ReadCommand_create", "cdecl"):
+        ReadCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ReadCommand_create", "cdecl")
+        ReadCommand_create.argtypes = [ReadCommand, c_int]
+        ReadCommand_create.restype = ReadCommand
+    return locals().get("ReadCommand_create")
+_loaders["ReadCommand_create"] = _load_ReadCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1340
-if _libs["/usr/local/lib/lib60870.so"].has("ReadCommand_destroy", "cdecl"):
-    ReadCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ReadCommand_destroy", "cdecl")
-    ReadCommand_destroy.argtypes = [ReadCommand]
-    ReadCommand_destroy.restype = None
+def _load_ReadCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ReadCommand_destroy", "cdecl"):
+        ReadCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ReadCommand_destroy", "cdecl")
+        ReadCommand_destroy.argtypes = [ReadCommand]
+        ReadCommand_destroy.restype = None
+    return locals().get("ReadCommand_destroy")
+_loaders["ReadCommand_destroy"] = _load_ReadCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1346
 class struct_sClockSynchronizationCommand(Structure):
@@ -3060,118 +3819,172 @@ class struct_sClockSynchronizationCommand(Structure):
 ClockSynchronizationCommand = POINTER(struct_sClockSynchronizationCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1346
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1349
-if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_create", "cdecl"):
-    ClockSynchronizationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_create", "cdecl")
-    ClockSynchronizationCommand_create.argtypes = [ClockSynchronizationCommand, c_int, CP56Time2a]
-    ClockSynchronizationCommand_create.restype = ClockSynchronizationCommand
+def _load_ClockSynchronizationCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_create", "cdecl"):
+        ClockSynchronizationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_create", "cdecl")
+        ClockSynchronizationCommand_create.argtypes = [ClockSynchronizationCommand, c_int, CP56Time2a]
+        ClockSynchronizationCommand_create.restype = ClockSynchronizationCommand
+    return locals().get("ClockSynchronizationCommand_create")
+_loaders["ClockSynchronizationCommand_create"] = _load_ClockSynchronizationCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1352
-if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_destroy", "cdecl"):
-    ClockSynchronizationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_destroy", "cdecl")
-    ClockSynchronizationCommand_destroy.argtypes = [ClockSynchronizationCommand]
-    ClockSynchronizationCommand_destroy.restype = None
+def _load_ClockSynchronizationCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_destroy", "cdecl"):
+        ClockSynchronizationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_destroy", "cdecl")
+        ClockSynchronizationCommand_destroy.argtypes = [ClockSynchronizationCommand]
+        ClockSynchronizationCommand_destroy.restype = None
+    return locals().get("ClockSynchronizationCommand_destroy")
+_loaders["ClockSynchronizationCommand_destroy"] = _load_ClockSynchronizationCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1355
-if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_getTime", "cdecl"):
-    ClockSynchronizationCommand_getTime = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_getTime", "cdecl")
-    ClockSynchronizationCommand_getTime.argtypes = [ClockSynchronizationCommand]
-    ClockSynchronizationCommand_getTime.restype = CP56Time2a
+def _load_ClockSynchronizationCommand_getTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("ClockSynchronizationCommand_getTime", "cdecl"):
+        ClockSynchronizationCommand_getTime = _libs["/usr/local/lib/lib60870.so"].get("ClockSynchronizationCommand_getTime", "cdecl")
+        ClockSynchronizationCommand_getTime.argtypes = [ClockSynchronizationCommand]
+        ClockSynchronizationCommand_getTime.restype = CP56Time2a
+    return locals().get("ClockSynchronizationCommand_getTime")
+_loaders["ClockSynchronizationCommand_getTime"] = _load_ClockSynchronizationCommand_getTime
 
 ParameterNormalizedValue = POINTER(struct_sMeasuredValueNormalized)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1361
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1364
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_destroy", "cdecl"):
-    ParameterNormalizedValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_destroy", "cdecl")
-    ParameterNormalizedValue_destroy.argtypes = [ParameterNormalizedValue]
-    ParameterNormalizedValue_destroy.restype = None
+def _load_ParameterNormalizedValue_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_destroy", "cdecl"):
+        ParameterNormalizedValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_destroy", "cdecl")
+        ParameterNormalizedValue_destroy.argtypes = [ParameterNormalizedValue]
+        ParameterNormalizedValue_destroy.restype = None
+    return locals().get("ParameterNormalizedValue_destroy")
+_loaders["ParameterNormalizedValue_destroy"] = _load_ParameterNormalizedValue_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1389
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_create", "cdecl"):
-    ParameterNormalizedValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_create", "cdecl")
-    ParameterNormalizedValue_create.argtypes = [ParameterNormalizedValue, c_int, c_float, QualifierOfParameterMV]
-    ParameterNormalizedValue_create.restype = ParameterNormalizedValue
+def _load_ParameterNormalizedValue_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_create", "cdecl"):
+        ParameterNormalizedValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_create", "cdecl")
+        ParameterNormalizedValue_create.argtypes = [ParameterNormalizedValue, c_int, c_float, QualifierOfParameterMV]
+        ParameterNormalizedValue_create.restype = ParameterNormalizedValue
+    return locals().get("ParameterNormalizedValue_create")
+_loaders["ParameterNormalizedValue_create"] = _load_ParameterNormalizedValue_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1392
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_getValue", "cdecl"):
-    ParameterNormalizedValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_getValue", "cdecl")
-    ParameterNormalizedValue_getValue.argtypes = [ParameterNormalizedValue]
-    ParameterNormalizedValue_getValue.restype = c_float
+def _load_ParameterNormalizedValue_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_getValue", "cdecl"):
+        ParameterNormalizedValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_getValue", "cdecl")
+        ParameterNormalizedValue_getValue.argtypes = [ParameterNormalizedValue]
+        ParameterNormalizedValue_getValue.restype = c_float
+    return locals().get("ParameterNormalizedValue_getValue")
+_loaders["ParameterNormalizedValue_getValue"] = _load_ParameterNormalizedValue_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1395
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_setValue", "cdecl"):
-    ParameterNormalizedValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_setValue", "cdecl")
-    ParameterNormalizedValue_setValue.argtypes = [ParameterNormalizedValue, c_float]
-    ParameterNormalizedValue_setValue.restype = None
+def _load_ParameterNormalizedValue_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_setValue", "cdecl"):
+        ParameterNormalizedValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_setValue", "cdecl")
+        ParameterNormalizedValue_setValue.argtypes = [ParameterNormalizedValue, c_float]
+        ParameterNormalizedValue_setValue.restype = None
+    return locals().get("ParameterNormalizedValue_setValue")
+_loaders["ParameterNormalizedValue_setValue"] = _load_ParameterNormalizedValue_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1403
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_getQPM", "cdecl"):
-    ParameterNormalizedValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_getQPM", "cdecl")
-    ParameterNormalizedValue_getQPM.argtypes = [ParameterNormalizedValue]
-    ParameterNormalizedValue_getQPM.restype = QualifierOfParameterMV
+def _load_ParameterNormalizedValue_getQPM():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterNormalizedValue_getQPM", "cdecl"):
+        ParameterNormalizedValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterNormalizedValue_getQPM", "cdecl")
+        ParameterNormalizedValue_getQPM.argtypes = [ParameterNormalizedValue]
+        ParameterNormalizedValue_getQPM.restype = QualifierOfParameterMV
+    return locals().get("ParameterNormalizedValue_getQPM")
+_loaders["ParameterNormalizedValue_getQPM"] = _load_ParameterNormalizedValue_getQPM
 
 ParameterScaledValue = POINTER(struct_sMeasuredValueScaled)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1409
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1412
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_destroy", "cdecl"):
-    ParameterScaledValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_destroy", "cdecl")
-    ParameterScaledValue_destroy.argtypes = [ParameterScaledValue]
-    ParameterScaledValue_destroy.restype = None
+def _load_ParameterScaledValue_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_destroy", "cdecl"):
+        ParameterScaledValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_destroy", "cdecl")
+        ParameterScaledValue_destroy.argtypes = [ParameterScaledValue]
+        ParameterScaledValue_destroy.restype = None
+    return locals().get("ParameterScaledValue_destroy")
+_loaders["ParameterScaledValue_destroy"] = _load_ParameterScaledValue_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1437
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_create", "cdecl"):
-    ParameterScaledValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_create", "cdecl")
-    ParameterScaledValue_create.argtypes = [ParameterScaledValue, c_int, c_int, QualifierOfParameterMV]
-    ParameterScaledValue_create.restype = ParameterScaledValue
+def _load_ParameterScaledValue_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_create", "cdecl"):
+        ParameterScaledValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_create", "cdecl")
+        ParameterScaledValue_create.argtypes = [ParameterScaledValue, c_int, c_int, QualifierOfParameterMV]
+        ParameterScaledValue_create.restype = ParameterScaledValue
+    return locals().get("ParameterScaledValue_create")
+_loaders["ParameterScaledValue_create"] = _load_ParameterScaledValue_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1440
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_getValue", "cdecl"):
-    ParameterScaledValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_getValue", "cdecl")
-    ParameterScaledValue_getValue.argtypes = [ParameterScaledValue]
-    ParameterScaledValue_getValue.restype = c_int
+def _load_ParameterScaledValue_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_getValue", "cdecl"):
+        ParameterScaledValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_getValue", "cdecl")
+        ParameterScaledValue_getValue.argtypes = [ParameterScaledValue]
+        ParameterScaledValue_getValue.restype = c_int
+    return locals().get("ParameterScaledValue_getValue")
+_loaders["ParameterScaledValue_getValue"] = _load_ParameterScaledValue_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1443
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_setValue", "cdecl"):
-    ParameterScaledValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_setValue", "cdecl")
-    ParameterScaledValue_setValue.argtypes = [ParameterScaledValue, c_int]
-    ParameterScaledValue_setValue.restype = None
+def _load_ParameterScaledValue_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_setValue", "cdecl"):
+        ParameterScaledValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_setValue", "cdecl")
+        ParameterScaledValue_setValue.argtypes = [ParameterScaledValue, c_int]
+        ParameterScaledValue_setValue.restype = None
+    return locals().get("ParameterScaledValue_setValue")
+_loaders["ParameterScaledValue_setValue"] = _load_ParameterScaledValue_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1451
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_getQPM", "cdecl"):
-    ParameterScaledValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_getQPM", "cdecl")
-    ParameterScaledValue_getQPM.argtypes = [ParameterScaledValue]
-    ParameterScaledValue_getQPM.restype = QualifierOfParameterMV
+def _load_ParameterScaledValue_getQPM():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterScaledValue_getQPM", "cdecl"):
+        ParameterScaledValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterScaledValue_getQPM", "cdecl")
+        ParameterScaledValue_getQPM.argtypes = [ParameterScaledValue]
+        ParameterScaledValue_getQPM.restype = QualifierOfParameterMV
+    return locals().get("ParameterScaledValue_getQPM")
+_loaders["ParameterScaledValue_getQPM"] = _load_ParameterScaledValue_getQPM
 
 ParameterFloatValue = POINTER(struct_sMeasuredValueShort)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1457
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1460
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_destroy", "cdecl"):
-    ParameterFloatValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_destroy", "cdecl")
-    ParameterFloatValue_destroy.argtypes = [ParameterFloatValue]
-    ParameterFloatValue_destroy.restype = None
+def _load_ParameterFloatValue_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_destroy", "cdecl"):
+        ParameterFloatValue_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_destroy", "cdecl")
+        ParameterFloatValue_destroy.argtypes = [ParameterFloatValue]
+        ParameterFloatValue_destroy.restype = None
+    return locals().get("ParameterFloatValue_destroy")
+_loaders["ParameterFloatValue_destroy"] = _load_ParameterFloatValue_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1485
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_create", "cdecl"):
-    ParameterFloatValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_create", "cdecl")
-    ParameterFloatValue_create.argtypes = [ParameterFloatValue, c_int, c_float, QualifierOfParameterMV]
-    ParameterFloatValue_create.restype = ParameterFloatValue
+def _load_ParameterFloatValue_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_create", "cdecl"):
+        ParameterFloatValue_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_create", "cdecl")
+        ParameterFloatValue_create.argtypes = [ParameterFloatValue, c_int, c_float, QualifierOfParameterMV]
+        ParameterFloatValue_create.restype = ParameterFloatValue
+    return locals().get("ParameterFloatValue_create")
+_loaders["ParameterFloatValue_create"] = _load_ParameterFloatValue_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1488
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_getValue", "cdecl"):
-    ParameterFloatValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_getValue", "cdecl")
-    ParameterFloatValue_getValue.argtypes = [ParameterFloatValue]
-    ParameterFloatValue_getValue.restype = c_float
+def _load_ParameterFloatValue_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_getValue", "cdecl"):
+        ParameterFloatValue_getValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_getValue", "cdecl")
+        ParameterFloatValue_getValue.argtypes = [ParameterFloatValue]
+        ParameterFloatValue_getValue.restype = c_float
+    return locals().get("ParameterFloatValue_getValue")
+_loaders["ParameterFloatValue_getValue"] = _load_ParameterFloatValue_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1491
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_setValue", "cdecl"):
-    ParameterFloatValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_setValue", "cdecl")
-    ParameterFloatValue_setValue.argtypes = [ParameterFloatValue, c_float]
-    ParameterFloatValue_setValue.restype = None
+def _load_ParameterFloatValue_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_setValue", "cdecl"):
+        ParameterFloatValue_setValue = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_setValue", "cdecl")
+        ParameterFloatValue_setValue.argtypes = [ParameterFloatValue, c_float]
+        ParameterFloatValue_setValue.restype = None
+    return locals().get("ParameterFloatValue_setValue")
+_loaders["ParameterFloatValue_setValue"] = _load_ParameterFloatValue_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1499
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_getQPM", "cdecl"):
-    ParameterFloatValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_getQPM", "cdecl")
-    ParameterFloatValue_getQPM.argtypes = [ParameterFloatValue]
-    ParameterFloatValue_getQPM.restype = QualifierOfParameterMV
+def _load_ParameterFloatValue_getQPM():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterFloatValue_getQPM", "cdecl"):
+        ParameterFloatValue_getQPM = _libs["/usr/local/lib/lib60870.so"].get("ParameterFloatValue_getQPM", "cdecl")
+        ParameterFloatValue_getQPM.argtypes = [ParameterFloatValue]
+        ParameterFloatValue_getQPM.restype = QualifierOfParameterMV
+    return locals().get("ParameterFloatValue_getQPM")
+_loaders["ParameterFloatValue_getQPM"] = _load_ParameterFloatValue_getQPM
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1505
 class struct_sParameterActivation(Structure):
@@ -3180,22 +3993,31 @@ class struct_sParameterActivation(Structure):
 ParameterActivation = POINTER(struct_sParameterActivation)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1505
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1508
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_destroy", "cdecl"):
-    ParameterActivation_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_destroy", "cdecl")
-    ParameterActivation_destroy.argtypes = [ParameterActivation]
-    ParameterActivation_destroy.restype = None
+def _load_ParameterActivation_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_destroy", "cdecl"):
+        ParameterActivation_destroy = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_destroy", "cdecl")
+        ParameterActivation_destroy.argtypes = [ParameterActivation]
+        ParameterActivation_destroy.restype = None
+    return locals().get("ParameterActivation_destroy")
+_loaders["ParameterActivation_destroy"] = _load_ParameterActivation_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1520
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_create", "cdecl"):
-    ParameterActivation_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_create", "cdecl")
-    ParameterActivation_create.argtypes = [ParameterActivation, c_int, QualifierOfParameterActivation]
-    ParameterActivation_create.restype = ParameterActivation
+def _load_ParameterActivation_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_create", "cdecl"):
+        ParameterActivation_create = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_create", "cdecl")
+        ParameterActivation_create.argtypes = [ParameterActivation, c_int, QualifierOfParameterActivation]
+        ParameterActivation_create.restype = ParameterActivation
+    return locals().get("ParameterActivation_create")
+_loaders["ParameterActivation_create"] = _load_ParameterActivation_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1528
-if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_getQuality", "cdecl"):
-    ParameterActivation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_getQuality", "cdecl")
-    ParameterActivation_getQuality.argtypes = [ParameterActivation]
-    ParameterActivation_getQuality.restype = QualifierOfParameterActivation
+def _load_ParameterActivation_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("ParameterActivation_getQuality", "cdecl"):
+        ParameterActivation_getQuality = _libs["/usr/local/lib/lib60870.so"].get("ParameterActivation_getQuality", "cdecl")
+        ParameterActivation_getQuality.argtypes = [ParameterActivation]
+        ParameterActivation_getQuality.restype = QualifierOfParameterActivation
+    return locals().get("ParameterActivation_getQuality")
+_loaders["ParameterActivation_getQuality"] = _load_ParameterActivation_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1534
 class struct_sEventOfProtectionEquipmentWithCP56Time2a(Structure):
@@ -3204,34 +4026,49 @@ class struct_sEventOfProtectionEquipmentWithCP56Time2a(Structure):
 EventOfProtectionEquipmentWithCP56Time2a = POINTER(struct_sEventOfProtectionEquipmentWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1534
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1537
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl"):
-    EventOfProtectionEquipmentWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl")
-    EventOfProtectionEquipmentWithCP56Time2a_destroy.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
-    EventOfProtectionEquipmentWithCP56Time2a_destroy.restype = None
+def _load_EventOfProtectionEquipmentWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl"):
+        EventOfProtectionEquipmentWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl")
+        EventOfProtectionEquipmentWithCP56Time2a_destroy.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
+        EventOfProtectionEquipmentWithCP56Time2a_destroy.restype = None
+    return locals().get("EventOfProtectionEquipmentWithCP56Time2a_destroy")
+_loaders["EventOfProtectionEquipmentWithCP56Time2a_destroy"] = _load_EventOfProtectionEquipmentWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1540
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_create", "cdecl"):
-    EventOfProtectionEquipmentWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_create", "cdecl")
-    EventOfProtectionEquipmentWithCP56Time2a_create.argtypes = [EventOfProtectionEquipmentWithCP56Time2a, c_int, SingleEvent, CP16Time2a, CP56Time2a]
-    EventOfProtectionEquipmentWithCP56Time2a_create.restype = EventOfProtectionEquipmentWithCP56Time2a
+def _load_EventOfProtectionEquipmentWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_create", "cdecl"):
+        EventOfProtectionEquipmentWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_create", "cdecl")
+        EventOfProtectionEquipmentWithCP56Time2a_create.argtypes = [EventOfProtectionEquipmentWithCP56Time2a, c_int, SingleEvent, CP16Time2a, CP56Time2a]
+        EventOfProtectionEquipmentWithCP56Time2a_create.restype = EventOfProtectionEquipmentWithCP56Time2a
+    return locals().get("EventOfProtectionEquipmentWithCP56Time2a_create")
+_loaders["EventOfProtectionEquipmentWithCP56Time2a_create"] = _load_EventOfProtectionEquipmentWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1544
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl"):
-    EventOfProtectionEquipmentWithCP56Time2a_getEvent = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl")
-    EventOfProtectionEquipmentWithCP56Time2a_getEvent.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
-    EventOfProtectionEquipmentWithCP56Time2a_getEvent.restype = SingleEvent
+def _load_EventOfProtectionEquipmentWithCP56Time2a_getEvent():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl"):
+        EventOfProtectionEquipmentWithCP56Time2a_getEvent = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl")
+        EventOfProtectionEquipmentWithCP56Time2a_getEvent.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
+        EventOfProtectionEquipmentWithCP56Time2a_getEvent.restype = SingleEvent
+    return locals().get("EventOfProtectionEquipmentWithCP56Time2a_getEvent")
+_loaders["EventOfProtectionEquipmentWithCP56Time2a_getEvent"] = _load_EventOfProtectionEquipmentWithCP56Time2a_getEvent
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1547
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl"):
-    EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl")
-    EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
-    EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime.restype = CP16Time2a
+def _load_EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl"):
+        EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl")
+        EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
+        EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime.restype = CP16Time2a
+    return locals().get("EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime")
+_loaders["EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime"] = _load_EventOfProtectionEquipmentWithCP56Time2a_getElapsedTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1550
-if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl"):
-    EventOfProtectionEquipmentWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl")
-    EventOfProtectionEquipmentWithCP56Time2a_getTimestamp.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
-    EventOfProtectionEquipmentWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_EventOfProtectionEquipmentWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("EventOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl"):
+        EventOfProtectionEquipmentWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("EventOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl")
+        EventOfProtectionEquipmentWithCP56Time2a_getTimestamp.argtypes = [EventOfProtectionEquipmentWithCP56Time2a]
+        EventOfProtectionEquipmentWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("EventOfProtectionEquipmentWithCP56Time2a_getTimestamp")
+_loaders["EventOfProtectionEquipmentWithCP56Time2a_getTimestamp"] = _load_EventOfProtectionEquipmentWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1556
 class struct_sPackedStartEventsOfProtectionEquipmentWithCP56Time2a(Structure):
@@ -3240,40 +4077,58 @@ class struct_sPackedStartEventsOfProtectionEquipmentWithCP56Time2a(Structure):
 PackedStartEventsOfProtectionEquipmentWithCP56Time2a = POINTER(struct_sPackedStartEventsOfProtectionEquipmentWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1556
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1559
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy.restype = None
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy.restype = None
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1562
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a, c_int, StartEvent, QualityDescriptorP, CP16Time2a, CP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create.restype = PackedStartEventsOfProtectionEquipmentWithCP56Time2a
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a, c_int, StartEvent, QualityDescriptorP, CP16Time2a, CP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create.restype = PackedStartEventsOfProtectionEquipmentWithCP56Time2a
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1566
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent.restype = StartEvent
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent.restype = StartEvent
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getEvent
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1569
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality.restype = QualityDescriptorP
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality.restype = QualityDescriptorP
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1572
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime.restype = CP16Time2a
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime.restype = CP16Time2a
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getElapsedTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1575
-if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl"):
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl")
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
-    PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl"):
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp", "cdecl")
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp.argtypes = [PackedStartEventsOfProtectionEquipmentWithCP56Time2a]
+        PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp")
+_loaders["PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp"] = _load_PackedStartEventsOfProtectionEquipmentWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1581
 class struct_sPackedOutputCircuitInfoWithCP56Time2a(Structure):
@@ -3282,40 +4137,58 @@ class struct_sPackedOutputCircuitInfoWithCP56Time2a(Structure):
 PackedOutputCircuitInfoWithCP56Time2a = POINTER(struct_sPackedOutputCircuitInfoWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1581
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1584
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_destroy", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_destroy", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_destroy.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_destroy.restype = None
+def _load_PackedOutputCircuitInfoWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_destroy", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_destroy", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_destroy.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_destroy.restype = None
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_destroy")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_destroy"] = _load_PackedOutputCircuitInfoWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1587
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_create", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_create", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_create.argtypes = [PackedOutputCircuitInfoWithCP56Time2a, c_int, OutputCircuitInfo, QualityDescriptorP, CP16Time2a, CP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_create.restype = PackedOutputCircuitInfoWithCP56Time2a
+def _load_PackedOutputCircuitInfoWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_create", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_create", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_create.argtypes = [PackedOutputCircuitInfoWithCP56Time2a, c_int, OutputCircuitInfo, QualityDescriptorP, CP16Time2a, CP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_create.restype = PackedOutputCircuitInfoWithCP56Time2a
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_create")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_create"] = _load_PackedOutputCircuitInfoWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1591
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getOCI", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_getOCI = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getOCI", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_getOCI.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_getOCI.restype = OutputCircuitInfo
+def _load_PackedOutputCircuitInfoWithCP56Time2a_getOCI():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getOCI", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_getOCI = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getOCI", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_getOCI.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_getOCI.restype = OutputCircuitInfo
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_getOCI")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_getOCI"] = _load_PackedOutputCircuitInfoWithCP56Time2a_getOCI
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1594
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getQuality", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getQuality", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_getQuality.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_getQuality.restype = QualityDescriptorP
+def _load_PackedOutputCircuitInfoWithCP56Time2a_getQuality():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getQuality", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_getQuality = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getQuality", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_getQuality.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_getQuality.restype = QualityDescriptorP
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_getQuality")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_getQuality"] = _load_PackedOutputCircuitInfoWithCP56Time2a_getQuality
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1597
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime.restype = CP16Time2a
+def _load_PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime.restype = CP16Time2a
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime"] = _load_PackedOutputCircuitInfoWithCP56Time2a_getOperatingTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1600
-if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getTimestamp", "cdecl"):
-    PackedOutputCircuitInfoWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getTimestamp", "cdecl")
-    PackedOutputCircuitInfoWithCP56Time2a_getTimestamp.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
-    PackedOutputCircuitInfoWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_PackedOutputCircuitInfoWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("PackedOutputCircuitInfoWithCP56Time2a_getTimestamp", "cdecl"):
+        PackedOutputCircuitInfoWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("PackedOutputCircuitInfoWithCP56Time2a_getTimestamp", "cdecl")
+        PackedOutputCircuitInfoWithCP56Time2a_getTimestamp.argtypes = [PackedOutputCircuitInfoWithCP56Time2a]
+        PackedOutputCircuitInfoWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("PackedOutputCircuitInfoWithCP56Time2a_getTimestamp")
+_loaders["PackedOutputCircuitInfoWithCP56Time2a_getTimestamp"] = _load_PackedOutputCircuitInfoWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1606
 class struct_sDoubleCommandWithCP56Time2a(Structure):
@@ -3324,40 +4197,58 @@ class struct_sDoubleCommandWithCP56Time2a(Structure):
 DoubleCommandWithCP56Time2a = POINTER(struct_sDoubleCommandWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1606
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1609
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_destroy", "cdecl"):
-    DoubleCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_destroy", "cdecl")
-    DoubleCommandWithCP56Time2a_destroy.argtypes = [DoubleCommandWithCP56Time2a]
-    DoubleCommandWithCP56Time2a_destroy.restype = None
+def _load_DoubleCommandWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_destroy", "cdecl"):
+        DoubleCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_destroy", "cdecl")
+        DoubleCommandWithCP56Time2a_destroy.argtypes = [DoubleCommandWithCP56Time2a]
+        DoubleCommandWithCP56Time2a_destroy.restype = None
+    return locals().get("DoubleCommandWithCP56Time2a_destroy")
+_loaders["DoubleCommandWithCP56Time2a_destroy"] = _load_DoubleCommandWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1612
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_create", "cdecl"):
-    DoubleCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_create", "cdecl")
-    DoubleCommandWithCP56Time2a_create.argtypes = [DoubleCommandWithCP56Time2a, c_int, c_int, c_bool, c_int, CP56Time2a]
-    DoubleCommandWithCP56Time2a_create.restype = DoubleCommandWithCP56Time2a
+def _load_DoubleCommandWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_create", "cdecl"):
+        DoubleCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_create", "cdecl")
+        DoubleCommandWithCP56Time2a_create.argtypes = [DoubleCommandWithCP56Time2a, c_int, c_int, c_bool, c_int, CP56Time2a]
+        DoubleCommandWithCP56Time2a_create.restype = DoubleCommandWithCP56Time2a
+    return locals().get("DoubleCommandWithCP56Time2a_create")
+_loaders["DoubleCommandWithCP56Time2a_create"] = _load_DoubleCommandWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1615
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getQU", "cdecl"):
-    DoubleCommandWithCP56Time2a_getQU = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getQU", "cdecl")
-    DoubleCommandWithCP56Time2a_getQU.argtypes = [DoubleCommandWithCP56Time2a]
-    DoubleCommandWithCP56Time2a_getQU.restype = c_int
+def _load_DoubleCommandWithCP56Time2a_getQU():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getQU", "cdecl"):
+        DoubleCommandWithCP56Time2a_getQU = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getQU", "cdecl")
+        DoubleCommandWithCP56Time2a_getQU.argtypes = [DoubleCommandWithCP56Time2a]
+        DoubleCommandWithCP56Time2a_getQU.restype = c_int
+    return locals().get("DoubleCommandWithCP56Time2a_getQU")
+_loaders["DoubleCommandWithCP56Time2a_getQU"] = _load_DoubleCommandWithCP56Time2a_getQU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1618
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getState", "cdecl"):
-    DoubleCommandWithCP56Time2a_getState = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getState", "cdecl")
-    DoubleCommandWithCP56Time2a_getState.argtypes = [DoubleCommandWithCP56Time2a]
-    DoubleCommandWithCP56Time2a_getState.restype = c_int
+def _load_DoubleCommandWithCP56Time2a_getState():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getState", "cdecl"):
+        DoubleCommandWithCP56Time2a_getState = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getState", "cdecl")
+        DoubleCommandWithCP56Time2a_getState.argtypes = [DoubleCommandWithCP56Time2a]
+        DoubleCommandWithCP56Time2a_getState.restype = c_int
+    return locals().get("DoubleCommandWithCP56Time2a_getState")
+_loaders["DoubleCommandWithCP56Time2a_getState"] = _load_DoubleCommandWithCP56Time2a_getState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1621
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_isSelect", "cdecl"):
-    DoubleCommandWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_isSelect", "cdecl")
-    DoubleCommandWithCP56Time2a_isSelect.argtypes = [DoubleCommandWithCP56Time2a]
-    DoubleCommandWithCP56Time2a_isSelect.restype = c_bool
+def _load_DoubleCommandWithCP56Time2a_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_isSelect", "cdecl"):
+        DoubleCommandWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_isSelect", "cdecl")
+        DoubleCommandWithCP56Time2a_isSelect.argtypes = [DoubleCommandWithCP56Time2a]
+        DoubleCommandWithCP56Time2a_isSelect.restype = c_bool
+    return locals().get("DoubleCommandWithCP56Time2a_isSelect")
+_loaders["DoubleCommandWithCP56Time2a_isSelect"] = _load_DoubleCommandWithCP56Time2a_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1624
-if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getTimestamp", "cdecl"):
-    DoubleCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getTimestamp", "cdecl")
-    DoubleCommandWithCP56Time2a_getTimestamp.argtypes = [DoubleCommandWithCP56Time2a]
-    DoubleCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_DoubleCommandWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("DoubleCommandWithCP56Time2a_getTimestamp", "cdecl"):
+        DoubleCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("DoubleCommandWithCP56Time2a_getTimestamp", "cdecl")
+        DoubleCommandWithCP56Time2a_getTimestamp.argtypes = [DoubleCommandWithCP56Time2a]
+        DoubleCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("DoubleCommandWithCP56Time2a_getTimestamp")
+_loaders["DoubleCommandWithCP56Time2a_getTimestamp"] = _load_DoubleCommandWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1630
 class struct_sStepCommandWithCP56Time2a(Structure):
@@ -3366,40 +4257,58 @@ class struct_sStepCommandWithCP56Time2a(Structure):
 StepCommandWithCP56Time2a = POINTER(struct_sStepCommandWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1630
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1633
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_destroy", "cdecl"):
-    StepCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_destroy", "cdecl")
-    StepCommandWithCP56Time2a_destroy.argtypes = [StepCommandWithCP56Time2a]
-    StepCommandWithCP56Time2a_destroy.restype = None
+def _load_StepCommandWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_destroy", "cdecl"):
+        StepCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_destroy", "cdecl")
+        StepCommandWithCP56Time2a_destroy.argtypes = [StepCommandWithCP56Time2a]
+        StepCommandWithCP56Time2a_destroy.restype = None
+    return locals().get("StepCommandWithCP56Time2a_destroy")
+_loaders["StepCommandWithCP56Time2a_destroy"] = _load_StepCommandWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1636
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_create", "cdecl"):
-    StepCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_create", "cdecl")
-    StepCommandWithCP56Time2a_create.argtypes = [StepCommandWithCP56Time2a, c_int, StepCommandValue, c_bool, c_int, CP56Time2a]
-    StepCommandWithCP56Time2a_create.restype = StepCommandWithCP56Time2a
+def _load_StepCommandWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_create", "cdecl"):
+        StepCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_create", "cdecl")
+        StepCommandWithCP56Time2a_create.argtypes = [StepCommandWithCP56Time2a, c_int, StepCommandValue, c_bool, c_int, CP56Time2a]
+        StepCommandWithCP56Time2a_create.restype = StepCommandWithCP56Time2a
+    return locals().get("StepCommandWithCP56Time2a_create")
+_loaders["StepCommandWithCP56Time2a_create"] = _load_StepCommandWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1639
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getQU", "cdecl"):
-    StepCommandWithCP56Time2a_getQU = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getQU", "cdecl")
-    StepCommandWithCP56Time2a_getQU.argtypes = [StepCommandWithCP56Time2a]
-    StepCommandWithCP56Time2a_getQU.restype = c_int
+def _load_StepCommandWithCP56Time2a_getQU():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getQU", "cdecl"):
+        StepCommandWithCP56Time2a_getQU = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getQU", "cdecl")
+        StepCommandWithCP56Time2a_getQU.argtypes = [StepCommandWithCP56Time2a]
+        StepCommandWithCP56Time2a_getQU.restype = c_int
+    return locals().get("StepCommandWithCP56Time2a_getQU")
+_loaders["StepCommandWithCP56Time2a_getQU"] = _load_StepCommandWithCP56Time2a_getQU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1642
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getState", "cdecl"):
-    StepCommandWithCP56Time2a_getState = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getState", "cdecl")
-    StepCommandWithCP56Time2a_getState.argtypes = [StepCommandWithCP56Time2a]
-    StepCommandWithCP56Time2a_getState.restype = StepCommandValue
+def _load_StepCommandWithCP56Time2a_getState():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getState", "cdecl"):
+        StepCommandWithCP56Time2a_getState = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getState", "cdecl")
+        StepCommandWithCP56Time2a_getState.argtypes = [StepCommandWithCP56Time2a]
+        StepCommandWithCP56Time2a_getState.restype = StepCommandValue
+    return locals().get("StepCommandWithCP56Time2a_getState")
+_loaders["StepCommandWithCP56Time2a_getState"] = _load_StepCommandWithCP56Time2a_getState
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1645
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_isSelect", "cdecl"):
-    StepCommandWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_isSelect", "cdecl")
-    StepCommandWithCP56Time2a_isSelect.argtypes = [StepCommandWithCP56Time2a]
-    StepCommandWithCP56Time2a_isSelect.restype = c_bool
+def _load_StepCommandWithCP56Time2a_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_isSelect", "cdecl"):
+        StepCommandWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_isSelect", "cdecl")
+        StepCommandWithCP56Time2a_isSelect.argtypes = [StepCommandWithCP56Time2a]
+        StepCommandWithCP56Time2a_isSelect.restype = c_bool
+    return locals().get("StepCommandWithCP56Time2a_isSelect")
+_loaders["StepCommandWithCP56Time2a_isSelect"] = _load_StepCommandWithCP56Time2a_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1648
-if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getTimestamp", "cdecl"):
-    StepCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getTimestamp", "cdecl")
-    StepCommandWithCP56Time2a_getTimestamp.argtypes = [StepCommandWithCP56Time2a]
-    StepCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_StepCommandWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("StepCommandWithCP56Time2a_getTimestamp", "cdecl"):
+        StepCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("StepCommandWithCP56Time2a_getTimestamp", "cdecl")
+        StepCommandWithCP56Time2a_getTimestamp.argtypes = [StepCommandWithCP56Time2a]
+        StepCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("StepCommandWithCP56Time2a_getTimestamp")
+_loaders["StepCommandWithCP56Time2a_getTimestamp"] = _load_StepCommandWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1654
 class struct_sSetpointCommandNormalizedWithCP56Time2a(Structure):
@@ -3408,40 +4317,58 @@ class struct_sSetpointCommandNormalizedWithCP56Time2a(Structure):
 SetpointCommandNormalizedWithCP56Time2a = POINTER(struct_sSetpointCommandNormalizedWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1654
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1657
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_destroy", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_destroy", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_destroy.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_destroy.restype = None
+def _load_SetpointCommandNormalizedWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_destroy", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_destroy", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_destroy.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_destroy.restype = None
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_destroy")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_destroy"] = _load_SetpointCommandNormalizedWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1660
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_create", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_create", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_create.argtypes = [SetpointCommandNormalizedWithCP56Time2a, c_int, c_float, c_bool, c_int, CP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_create.restype = SetpointCommandNormalizedWithCP56Time2a
+def _load_SetpointCommandNormalizedWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_create", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_create", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_create.argtypes = [SetpointCommandNormalizedWithCP56Time2a, c_int, c_float, c_bool, c_int, CP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_create.restype = SetpointCommandNormalizedWithCP56Time2a
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_create")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_create"] = _load_SetpointCommandNormalizedWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1663
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getValue", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getValue", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_getValue.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_getValue.restype = c_float
+def _load_SetpointCommandNormalizedWithCP56Time2a_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getValue", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getValue", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_getValue.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_getValue.restype = c_float
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_getValue")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_getValue"] = _load_SetpointCommandNormalizedWithCP56Time2a_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1666
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getQL", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getQL", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_getQL.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_getQL.restype = c_int
+def _load_SetpointCommandNormalizedWithCP56Time2a_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getQL", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getQL", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_getQL.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_getQL.restype = c_int
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_getQL")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_getQL"] = _load_SetpointCommandNormalizedWithCP56Time2a_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1669
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_isSelect", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_isSelect", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_isSelect.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_isSelect.restype = c_bool
+def _load_SetpointCommandNormalizedWithCP56Time2a_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_isSelect", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_isSelect", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_isSelect.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_isSelect.restype = c_bool
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_isSelect")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_isSelect"] = _load_SetpointCommandNormalizedWithCP56Time2a_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1672
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getTimestamp", "cdecl"):
-    SetpointCommandNormalizedWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getTimestamp", "cdecl")
-    SetpointCommandNormalizedWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
-    SetpointCommandNormalizedWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_SetpointCommandNormalizedWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandNormalizedWithCP56Time2a_getTimestamp", "cdecl"):
+        SetpointCommandNormalizedWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandNormalizedWithCP56Time2a_getTimestamp", "cdecl")
+        SetpointCommandNormalizedWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandNormalizedWithCP56Time2a]
+        SetpointCommandNormalizedWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("SetpointCommandNormalizedWithCP56Time2a_getTimestamp")
+_loaders["SetpointCommandNormalizedWithCP56Time2a_getTimestamp"] = _load_SetpointCommandNormalizedWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1678
 class struct_sSetpointCommandScaledWithCP56Time2a(Structure):
@@ -3450,40 +4377,58 @@ class struct_sSetpointCommandScaledWithCP56Time2a(Structure):
 SetpointCommandScaledWithCP56Time2a = POINTER(struct_sSetpointCommandScaledWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1678
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1681
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_destroy", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_destroy", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_destroy.argtypes = [SetpointCommandScaledWithCP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_destroy.restype = None
+def _load_SetpointCommandScaledWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_destroy", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_destroy", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_destroy.argtypes = [SetpointCommandScaledWithCP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_destroy.restype = None
+    return locals().get("SetpointCommandScaledWithCP56Time2a_destroy")
+_loaders["SetpointCommandScaledWithCP56Time2a_destroy"] = _load_SetpointCommandScaledWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1684
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_create", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_create", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_create.argtypes = [SetpointCommandScaledWithCP56Time2a, c_int, c_int, c_bool, c_int, CP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_create.restype = SetpointCommandScaledWithCP56Time2a
+def _load_SetpointCommandScaledWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_create", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_create", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_create.argtypes = [SetpointCommandScaledWithCP56Time2a, c_int, c_int, c_bool, c_int, CP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_create.restype = SetpointCommandScaledWithCP56Time2a
+    return locals().get("SetpointCommandScaledWithCP56Time2a_create")
+_loaders["SetpointCommandScaledWithCP56Time2a_create"] = _load_SetpointCommandScaledWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1687
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getValue", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getValue", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_getValue.argtypes = [SetpointCommandScaledWithCP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_getValue.restype = c_int
+def _load_SetpointCommandScaledWithCP56Time2a_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getValue", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getValue", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_getValue.argtypes = [SetpointCommandScaledWithCP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_getValue.restype = c_int
+    return locals().get("SetpointCommandScaledWithCP56Time2a_getValue")
+_loaders["SetpointCommandScaledWithCP56Time2a_getValue"] = _load_SetpointCommandScaledWithCP56Time2a_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1690
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getQL", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getQL", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_getQL.argtypes = [SetpointCommandScaledWithCP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_getQL.restype = c_int
+def _load_SetpointCommandScaledWithCP56Time2a_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getQL", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getQL", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_getQL.argtypes = [SetpointCommandScaledWithCP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_getQL.restype = c_int
+    return locals().get("SetpointCommandScaledWithCP56Time2a_getQL")
+_loaders["SetpointCommandScaledWithCP56Time2a_getQL"] = _load_SetpointCommandScaledWithCP56Time2a_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1693
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_isSelect", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_isSelect", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_isSelect.argtypes = [SetpointCommandScaledWithCP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_isSelect.restype = c_bool
+def _load_SetpointCommandScaledWithCP56Time2a_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_isSelect", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_isSelect", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_isSelect.argtypes = [SetpointCommandScaledWithCP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_isSelect.restype = c_bool
+    return locals().get("SetpointCommandScaledWithCP56Time2a_isSelect")
+_loaders["SetpointCommandScaledWithCP56Time2a_isSelect"] = _load_SetpointCommandScaledWithCP56Time2a_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1696
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getTimestamp", "cdecl"):
-    SetpointCommandScaledWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getTimestamp", "cdecl")
-    SetpointCommandScaledWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandScaledWithCP56Time2a]
-    SetpointCommandScaledWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_SetpointCommandScaledWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandScaledWithCP56Time2a_getTimestamp", "cdecl"):
+        SetpointCommandScaledWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandScaledWithCP56Time2a_getTimestamp", "cdecl")
+        SetpointCommandScaledWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandScaledWithCP56Time2a]
+        SetpointCommandScaledWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("SetpointCommandScaledWithCP56Time2a_getTimestamp")
+_loaders["SetpointCommandScaledWithCP56Time2a_getTimestamp"] = _load_SetpointCommandScaledWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1702
 class struct_sSetpointCommandShortWithCP56Time2a(Structure):
@@ -3492,40 +4437,58 @@ class struct_sSetpointCommandShortWithCP56Time2a(Structure):
 SetpointCommandShortWithCP56Time2a = POINTER(struct_sSetpointCommandShortWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1702
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1705
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_destroy", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_destroy", "cdecl")
-    SetpointCommandShortWithCP56Time2a_destroy.argtypes = [SetpointCommandShortWithCP56Time2a]
-    SetpointCommandShortWithCP56Time2a_destroy.restype = None
+def _load_SetpointCommandShortWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_destroy", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_destroy", "cdecl")
+        SetpointCommandShortWithCP56Time2a_destroy.argtypes = [SetpointCommandShortWithCP56Time2a]
+        SetpointCommandShortWithCP56Time2a_destroy.restype = None
+    return locals().get("SetpointCommandShortWithCP56Time2a_destroy")
+_loaders["SetpointCommandShortWithCP56Time2a_destroy"] = _load_SetpointCommandShortWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1708
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_create", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_create", "cdecl")
-    SetpointCommandShortWithCP56Time2a_create.argtypes = [SetpointCommandShortWithCP56Time2a, c_int, c_float, c_bool, c_int, CP56Time2a]
-    SetpointCommandShortWithCP56Time2a_create.restype = SetpointCommandShortWithCP56Time2a
+def _load_SetpointCommandShortWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_create", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_create", "cdecl")
+        SetpointCommandShortWithCP56Time2a_create.argtypes = [SetpointCommandShortWithCP56Time2a, c_int, c_float, c_bool, c_int, CP56Time2a]
+        SetpointCommandShortWithCP56Time2a_create.restype = SetpointCommandShortWithCP56Time2a
+    return locals().get("SetpointCommandShortWithCP56Time2a_create")
+_loaders["SetpointCommandShortWithCP56Time2a_create"] = _load_SetpointCommandShortWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1711
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getValue", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getValue", "cdecl")
-    SetpointCommandShortWithCP56Time2a_getValue.argtypes = [SetpointCommandShortWithCP56Time2a]
-    SetpointCommandShortWithCP56Time2a_getValue.restype = c_float
+def _load_SetpointCommandShortWithCP56Time2a_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getValue", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getValue", "cdecl")
+        SetpointCommandShortWithCP56Time2a_getValue.argtypes = [SetpointCommandShortWithCP56Time2a]
+        SetpointCommandShortWithCP56Time2a_getValue.restype = c_float
+    return locals().get("SetpointCommandShortWithCP56Time2a_getValue")
+_loaders["SetpointCommandShortWithCP56Time2a_getValue"] = _load_SetpointCommandShortWithCP56Time2a_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1714
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getQL", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getQL", "cdecl")
-    SetpointCommandShortWithCP56Time2a_getQL.argtypes = [SetpointCommandShortWithCP56Time2a]
-    SetpointCommandShortWithCP56Time2a_getQL.restype = c_int
+def _load_SetpointCommandShortWithCP56Time2a_getQL():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getQL", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_getQL = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getQL", "cdecl")
+        SetpointCommandShortWithCP56Time2a_getQL.argtypes = [SetpointCommandShortWithCP56Time2a]
+        SetpointCommandShortWithCP56Time2a_getQL.restype = c_int
+    return locals().get("SetpointCommandShortWithCP56Time2a_getQL")
+_loaders["SetpointCommandShortWithCP56Time2a_getQL"] = _load_SetpointCommandShortWithCP56Time2a_getQL
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1717
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_isSelect", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_isSelect", "cdecl")
-    SetpointCommandShortWithCP56Time2a_isSelect.argtypes = [SetpointCommandShortWithCP56Time2a]
-    SetpointCommandShortWithCP56Time2a_isSelect.restype = c_bool
+def _load_SetpointCommandShortWithCP56Time2a_isSelect():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_isSelect", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_isSelect = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_isSelect", "cdecl")
+        SetpointCommandShortWithCP56Time2a_isSelect.argtypes = [SetpointCommandShortWithCP56Time2a]
+        SetpointCommandShortWithCP56Time2a_isSelect.restype = c_bool
+    return locals().get("SetpointCommandShortWithCP56Time2a_isSelect")
+_loaders["SetpointCommandShortWithCP56Time2a_isSelect"] = _load_SetpointCommandShortWithCP56Time2a_isSelect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1720
-if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getTimestamp", "cdecl"):
-    SetpointCommandShortWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getTimestamp", "cdecl")
-    SetpointCommandShortWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandShortWithCP56Time2a]
-    SetpointCommandShortWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_SetpointCommandShortWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("SetpointCommandShortWithCP56Time2a_getTimestamp", "cdecl"):
+        SetpointCommandShortWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("SetpointCommandShortWithCP56Time2a_getTimestamp", "cdecl")
+        SetpointCommandShortWithCP56Time2a_getTimestamp.argtypes = [SetpointCommandShortWithCP56Time2a]
+        SetpointCommandShortWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("SetpointCommandShortWithCP56Time2a_getTimestamp")
+_loaders["SetpointCommandShortWithCP56Time2a_getTimestamp"] = _load_SetpointCommandShortWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1726
 class struct_sBitstring32CommandWithCP56Time2a(Structure):
@@ -3534,28 +4497,40 @@ class struct_sBitstring32CommandWithCP56Time2a(Structure):
 Bitstring32CommandWithCP56Time2a = POINTER(struct_sBitstring32CommandWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1726
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1729
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_create", "cdecl"):
-    Bitstring32CommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_create", "cdecl")
-    Bitstring32CommandWithCP56Time2a_create.argtypes = [Bitstring32CommandWithCP56Time2a, c_int, c_uint32, CP56Time2a]
-    Bitstring32CommandWithCP56Time2a_create.restype = Bitstring32CommandWithCP56Time2a
+def _load_Bitstring32CommandWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_create", "cdecl"):
+        Bitstring32CommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_create", "cdecl")
+        Bitstring32CommandWithCP56Time2a_create.argtypes = [Bitstring32CommandWithCP56Time2a, c_int, c_uint32, CP56Time2a]
+        Bitstring32CommandWithCP56Time2a_create.restype = Bitstring32CommandWithCP56Time2a
+    return locals().get("Bitstring32CommandWithCP56Time2a_create")
+_loaders["Bitstring32CommandWithCP56Time2a_create"] = _load_Bitstring32CommandWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1732
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_destroy", "cdecl"):
-    Bitstring32CommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_destroy", "cdecl")
-    Bitstring32CommandWithCP56Time2a_destroy.argtypes = [Bitstring32CommandWithCP56Time2a]
-    Bitstring32CommandWithCP56Time2a_destroy.restype = None
+def _load_Bitstring32CommandWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_destroy", "cdecl"):
+        Bitstring32CommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_destroy", "cdecl")
+        Bitstring32CommandWithCP56Time2a_destroy.argtypes = [Bitstring32CommandWithCP56Time2a]
+        Bitstring32CommandWithCP56Time2a_destroy.restype = None
+    return locals().get("Bitstring32CommandWithCP56Time2a_destroy")
+_loaders["Bitstring32CommandWithCP56Time2a_destroy"] = _load_Bitstring32CommandWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1735
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_getValue", "cdecl"):
-    Bitstring32CommandWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_getValue", "cdecl")
-    Bitstring32CommandWithCP56Time2a_getValue.argtypes = [Bitstring32CommandWithCP56Time2a]
-    Bitstring32CommandWithCP56Time2a_getValue.restype = c_uint32
+def _load_Bitstring32CommandWithCP56Time2a_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_getValue", "cdecl"):
+        Bitstring32CommandWithCP56Time2a_getValue = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_getValue", "cdecl")
+        Bitstring32CommandWithCP56Time2a_getValue.argtypes = [Bitstring32CommandWithCP56Time2a]
+        Bitstring32CommandWithCP56Time2a_getValue.restype = c_uint32
+    return locals().get("Bitstring32CommandWithCP56Time2a_getValue")
+_loaders["Bitstring32CommandWithCP56Time2a_getValue"] = _load_Bitstring32CommandWithCP56Time2a_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1738
-if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_getTimestamp", "cdecl"):
-    Bitstring32CommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_getTimestamp", "cdecl")
-    Bitstring32CommandWithCP56Time2a_getTimestamp.argtypes = [Bitstring32CommandWithCP56Time2a]
-    Bitstring32CommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_Bitstring32CommandWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("Bitstring32CommandWithCP56Time2a_getTimestamp", "cdecl"):
+        Bitstring32CommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("Bitstring32CommandWithCP56Time2a_getTimestamp", "cdecl")
+        Bitstring32CommandWithCP56Time2a_getTimestamp.argtypes = [Bitstring32CommandWithCP56Time2a]
+        Bitstring32CommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("Bitstring32CommandWithCP56Time2a_getTimestamp")
+_loaders["Bitstring32CommandWithCP56Time2a_getTimestamp"] = _load_Bitstring32CommandWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1745
 class struct_sCounterInterrogationCommand(Structure):
@@ -3564,22 +4539,31 @@ class struct_sCounterInterrogationCommand(Structure):
 CounterInterrogationCommand = POINTER(struct_sCounterInterrogationCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1745
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1748
-if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_create", "cdecl"):
-    CounterInterrogationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_create", "cdecl")
-    CounterInterrogationCommand_create.argtypes = [CounterInterrogationCommand, c_int, QualifierOfCIC]
-    CounterInterrogationCommand_create.restype = CounterInterrogationCommand
+def _load_CounterInterrogationCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_create", "cdecl"):
+        CounterInterrogationCommand_create = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_create", "cdecl")
+        CounterInterrogationCommand_create.argtypes = [CounterInterrogationCommand, c_int, QualifierOfCIC]
+        CounterInterrogationCommand_create.restype = CounterInterrogationCommand
+    return locals().get("CounterInterrogationCommand_create")
+_loaders["CounterInterrogationCommand_create"] = _load_CounterInterrogationCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1751
-if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_destroy", "cdecl"):
-    CounterInterrogationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_destroy", "cdecl")
-    CounterInterrogationCommand_destroy.argtypes = [CounterInterrogationCommand]
-    CounterInterrogationCommand_destroy.restype = None
+def _load_CounterInterrogationCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_destroy", "cdecl"):
+        CounterInterrogationCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_destroy", "cdecl")
+        CounterInterrogationCommand_destroy.argtypes = [CounterInterrogationCommand]
+        CounterInterrogationCommand_destroy.restype = None
+    return locals().get("CounterInterrogationCommand_destroy")
+_loaders["CounterInterrogationCommand_destroy"] = _load_CounterInterrogationCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1754
-if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_getQCC", "cdecl"):
-    CounterInterrogationCommand_getQCC = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_getQCC", "cdecl")
-    CounterInterrogationCommand_getQCC.argtypes = [CounterInterrogationCommand]
-    CounterInterrogationCommand_getQCC.restype = QualifierOfCIC
+def _load_CounterInterrogationCommand_getQCC():
+    if _libs["/usr/local/lib/lib60870.so"].has("CounterInterrogationCommand_getQCC", "cdecl"):
+        CounterInterrogationCommand_getQCC = _libs["/usr/local/lib/lib60870.so"].get("CounterInterrogationCommand_getQCC", "cdecl")
+        CounterInterrogationCommand_getQCC.argtypes = [CounterInterrogationCommand]
+        CounterInterrogationCommand_getQCC.restype = QualifierOfCIC
+    return locals().get("CounterInterrogationCommand_getQCC")
+_loaders["CounterInterrogationCommand_getQCC"] = _load_CounterInterrogationCommand_getQCC
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1760
 class struct_sTestCommand(Structure):
@@ -3588,22 +4572,31 @@ class struct_sTestCommand(Structure):
 TestCommand = POINTER(struct_sTestCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1760
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1763
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_create", "cdecl"):
-    TestCommand_create = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_create", "cdecl")
-    TestCommand_create.argtypes = [TestCommand]
-    TestCommand_create.restype = TestCommand
+def _load_TestCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_create", "cdecl"):
+        TestCommand_create = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_create", "cdecl")
+        TestCommand_create.argtypes = [TestCommand]
+        TestCommand_create.restype = TestCommand
+    return locals().get("TestCommand_create")
+_loaders["TestCommand_create"] = _load_TestCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1766
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_destroy", "cdecl"):
-    TestCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_destroy", "cdecl")
-    TestCommand_destroy.argtypes = [TestCommand]
-    TestCommand_destroy.restype = None
+def _load_TestCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_destroy", "cdecl"):
+        TestCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_destroy", "cdecl")
+        TestCommand_destroy.argtypes = [TestCommand]
+        TestCommand_destroy.restype = None
+    return locals().get("TestCommand_destroy")
+_loaders["TestCommand_destroy"] = _load_TestCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1769
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_isValid", "cdecl"):
-    TestCommand_isValid = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_isValid", "cdecl")
-    TestCommand_isValid.argtypes = [TestCommand]
-    TestCommand_isValid.restype = c_bool
+def _load_TestCommand_isValid():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommand_isValid", "cdecl"):
+        TestCommand_isValid = _libs["/usr/local/lib/lib60870.so"].get("TestCommand_isValid", "cdecl")
+        TestCommand_isValid.argtypes = [TestCommand]
+        TestCommand_isValid.restype = c_bool
+    return locals().get("TestCommand_isValid")
+_loaders["TestCommand_isValid"] = _load_TestCommand_isValid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1775
 class struct_sTestCommandWithCP56Time2a(Structure):
@@ -3612,28 +4605,40 @@ class struct_sTestCommandWithCP56Time2a(Structure):
 TestCommandWithCP56Time2a = POINTER(struct_sTestCommandWithCP56Time2a)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1775
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1787
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_create", "cdecl"):
-    TestCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_create", "cdecl")
-    TestCommandWithCP56Time2a_create.argtypes = [TestCommandWithCP56Time2a, c_uint16, CP56Time2a]
-    TestCommandWithCP56Time2a_create.restype = TestCommandWithCP56Time2a
+def _load_TestCommandWithCP56Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_create", "cdecl"):
+        TestCommandWithCP56Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_create", "cdecl")
+        TestCommandWithCP56Time2a_create.argtypes = [TestCommandWithCP56Time2a, c_uint16, CP56Time2a]
+        TestCommandWithCP56Time2a_create.restype = TestCommandWithCP56Time2a
+    return locals().get("TestCommandWithCP56Time2a_create")
+_loaders["TestCommandWithCP56Time2a_create"] = _load_TestCommandWithCP56Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1790
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_destroy", "cdecl"):
-    TestCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_destroy", "cdecl")
-    TestCommandWithCP56Time2a_destroy.argtypes = [TestCommandWithCP56Time2a]
-    TestCommandWithCP56Time2a_destroy.restype = None
+def _load_TestCommandWithCP56Time2a_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_destroy", "cdecl"):
+        TestCommandWithCP56Time2a_destroy = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_destroy", "cdecl")
+        TestCommandWithCP56Time2a_destroy.argtypes = [TestCommandWithCP56Time2a]
+        TestCommandWithCP56Time2a_destroy.restype = None
+    return locals().get("TestCommandWithCP56Time2a_destroy")
+_loaders["TestCommandWithCP56Time2a_destroy"] = _load_TestCommandWithCP56Time2a_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1793
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_getCounter", "cdecl"):
-    TestCommandWithCP56Time2a_getCounter = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_getCounter", "cdecl")
-    TestCommandWithCP56Time2a_getCounter.argtypes = [TestCommandWithCP56Time2a]
-    TestCommandWithCP56Time2a_getCounter.restype = c_uint16
+def _load_TestCommandWithCP56Time2a_getCounter():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_getCounter", "cdecl"):
+        TestCommandWithCP56Time2a_getCounter = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_getCounter", "cdecl")
+        TestCommandWithCP56Time2a_getCounter.argtypes = [TestCommandWithCP56Time2a]
+        TestCommandWithCP56Time2a_getCounter.restype = c_uint16
+    return locals().get("TestCommandWithCP56Time2a_getCounter")
+_loaders["TestCommandWithCP56Time2a_getCounter"] = _load_TestCommandWithCP56Time2a_getCounter
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1796
-if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_getTimestamp", "cdecl"):
-    TestCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_getTimestamp", "cdecl")
-    TestCommandWithCP56Time2a_getTimestamp.argtypes = [TestCommandWithCP56Time2a]
-    TestCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+def _load_TestCommandWithCP56Time2a_getTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("TestCommandWithCP56Time2a_getTimestamp", "cdecl"):
+        TestCommandWithCP56Time2a_getTimestamp = _libs["/usr/local/lib/lib60870.so"].get("TestCommandWithCP56Time2a_getTimestamp", "cdecl")
+        TestCommandWithCP56Time2a_getTimestamp.argtypes = [TestCommandWithCP56Time2a]
+        TestCommandWithCP56Time2a_getTimestamp.restype = CP56Time2a
+    return locals().get("TestCommandWithCP56Time2a_getTimestamp")
+_loaders["TestCommandWithCP56Time2a_getTimestamp"] = _load_TestCommandWithCP56Time2a_getTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1802
 class struct_sResetProcessCommand(Structure):
@@ -3642,22 +4647,31 @@ class struct_sResetProcessCommand(Structure):
 ResetProcessCommand = POINTER(struct_sResetProcessCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1802
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1805
-if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_create", "cdecl"):
-    ResetProcessCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_create", "cdecl")
-    ResetProcessCommand_create.argtypes = [ResetProcessCommand, c_int, QualifierOfRPC]
-    ResetProcessCommand_create.restype = ResetProcessCommand
+def _load_ResetProcessCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_create", "cdecl"):
+        ResetProcessCommand_create = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_create", "cdecl")
+        ResetProcessCommand_create.argtypes = [ResetProcessCommand, c_int, QualifierOfRPC]
+        ResetProcessCommand_create.restype = ResetProcessCommand
+    return locals().get("ResetProcessCommand_create")
+_loaders["ResetProcessCommand_create"] = _load_ResetProcessCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1808
-if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_destroy", "cdecl"):
-    ResetProcessCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_destroy", "cdecl")
-    ResetProcessCommand_destroy.argtypes = [ResetProcessCommand]
-    ResetProcessCommand_destroy.restype = None
+def _load_ResetProcessCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_destroy", "cdecl"):
+        ResetProcessCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_destroy", "cdecl")
+        ResetProcessCommand_destroy.argtypes = [ResetProcessCommand]
+        ResetProcessCommand_destroy.restype = None
+    return locals().get("ResetProcessCommand_destroy")
+_loaders["ResetProcessCommand_destroy"] = _load_ResetProcessCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1811
-if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_getQRP", "cdecl"):
-    ResetProcessCommand_getQRP = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_getQRP", "cdecl")
-    ResetProcessCommand_getQRP.argtypes = [ResetProcessCommand]
-    ResetProcessCommand_getQRP.restype = QualifierOfRPC
+def _load_ResetProcessCommand_getQRP():
+    if _libs["/usr/local/lib/lib60870.so"].has("ResetProcessCommand_getQRP", "cdecl"):
+        ResetProcessCommand_getQRP = _libs["/usr/local/lib/lib60870.so"].get("ResetProcessCommand_getQRP", "cdecl")
+        ResetProcessCommand_getQRP.argtypes = [ResetProcessCommand]
+        ResetProcessCommand_getQRP.restype = QualifierOfRPC
+    return locals().get("ResetProcessCommand_getQRP")
+_loaders["ResetProcessCommand_getQRP"] = _load_ResetProcessCommand_getQRP
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1817
 class struct_sDelayAcquisitionCommand(Structure):
@@ -3666,22 +4680,31 @@ class struct_sDelayAcquisitionCommand(Structure):
 DelayAcquisitionCommand = POINTER(struct_sDelayAcquisitionCommand)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1817
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1820
-if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_create", "cdecl"):
-    DelayAcquisitionCommand_create = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_create", "cdecl")
-    DelayAcquisitionCommand_create.argtypes = [DelayAcquisitionCommand, c_int, CP16Time2a]
-    DelayAcquisitionCommand_create.restype = DelayAcquisitionCommand
+def _load_DelayAcquisitionCommand_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_create", "cdecl"):
+        DelayAcquisitionCommand_create = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_create", "cdecl")
+        DelayAcquisitionCommand_create.argtypes = [DelayAcquisitionCommand, c_int, CP16Time2a]
+        DelayAcquisitionCommand_create.restype = DelayAcquisitionCommand
+    return locals().get("DelayAcquisitionCommand_create")
+_loaders["DelayAcquisitionCommand_create"] = _load_DelayAcquisitionCommand_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1823
-if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_destroy", "cdecl"):
-    DelayAcquisitionCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_destroy", "cdecl")
-    DelayAcquisitionCommand_destroy.argtypes = [DelayAcquisitionCommand]
-    DelayAcquisitionCommand_destroy.restype = None
+def _load_DelayAcquisitionCommand_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_destroy", "cdecl"):
+        DelayAcquisitionCommand_destroy = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_destroy", "cdecl")
+        DelayAcquisitionCommand_destroy.argtypes = [DelayAcquisitionCommand]
+        DelayAcquisitionCommand_destroy.restype = None
+    return locals().get("DelayAcquisitionCommand_destroy")
+_loaders["DelayAcquisitionCommand_destroy"] = _load_DelayAcquisitionCommand_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1826
-if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_getDelay", "cdecl"):
-    DelayAcquisitionCommand_getDelay = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_getDelay", "cdecl")
-    DelayAcquisitionCommand_getDelay.argtypes = [DelayAcquisitionCommand]
-    DelayAcquisitionCommand_getDelay.restype = CP16Time2a
+def _load_DelayAcquisitionCommand_getDelay():
+    if _libs["/usr/local/lib/lib60870.so"].has("DelayAcquisitionCommand_getDelay", "cdecl"):
+        DelayAcquisitionCommand_getDelay = _libs["/usr/local/lib/lib60870.so"].get("DelayAcquisitionCommand_getDelay", "cdecl")
+        DelayAcquisitionCommand_getDelay.argtypes = [DelayAcquisitionCommand]
+        DelayAcquisitionCommand_getDelay.restype = CP16Time2a
+    return locals().get("DelayAcquisitionCommand_getDelay")
+_loaders["DelayAcquisitionCommand_getDelay"] = _load_DelayAcquisitionCommand_getDelay
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1832
 class struct_sEndOfInitialization(Structure):
@@ -3690,22 +4713,31 @@ class struct_sEndOfInitialization(Structure):
 EndOfInitialization = POINTER(struct_sEndOfInitialization)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1832
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1835
-if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_create", "cdecl"):
-    EndOfInitialization_create = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_create", "cdecl")
-    EndOfInitialization_create.argtypes = [EndOfInitialization, c_uint8]
-    EndOfInitialization_create.restype = EndOfInitialization
+def _load_EndOfInitialization_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_create", "cdecl"):
+        EndOfInitialization_create = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_create", "cdecl")
+        EndOfInitialization_create.argtypes = [EndOfInitialization, c_uint8]
+        EndOfInitialization_create.restype = EndOfInitialization
+    return locals().get("EndOfInitialization_create")
+_loaders["EndOfInitialization_create"] = _load_EndOfInitialization_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1838
-if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_destroy", "cdecl"):
-    EndOfInitialization_destroy = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_destroy", "cdecl")
-    EndOfInitialization_destroy.argtypes = [EndOfInitialization]
-    EndOfInitialization_destroy.restype = None
+def _load_EndOfInitialization_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_destroy", "cdecl"):
+        EndOfInitialization_destroy = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_destroy", "cdecl")
+        EndOfInitialization_destroy.argtypes = [EndOfInitialization]
+        EndOfInitialization_destroy.restype = None
+    return locals().get("EndOfInitialization_destroy")
+_loaders["EndOfInitialization_destroy"] = _load_EndOfInitialization_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1841
-if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_getCOI", "cdecl"):
-    EndOfInitialization_getCOI = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_getCOI", "cdecl")
-    EndOfInitialization_getCOI.argtypes = [EndOfInitialization]
-    EndOfInitialization_getCOI.restype = c_uint8
+def _load_EndOfInitialization_getCOI():
+    if _libs["/usr/local/lib/lib60870.so"].has("EndOfInitialization_getCOI", "cdecl"):
+        EndOfInitialization_getCOI = _libs["/usr/local/lib/lib60870.so"].get("EndOfInitialization_getCOI", "cdecl")
+        EndOfInitialization_getCOI.argtypes = [EndOfInitialization]
+        EndOfInitialization_getCOI.restype = c_uint8
+    return locals().get("EndOfInitialization_getCOI")
+_loaders["EndOfInitialization_getCOI"] = _load_EndOfInitialization_getCOI
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1973
 class struct_sFileReady(Structure):
@@ -3714,52 +4746,76 @@ class struct_sFileReady(Structure):
 FileReady = POINTER(struct_sFileReady)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1973
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1987
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_create", "cdecl"):
-    FileReady_create = _libs["/usr/local/lib/lib60870.so"].get("FileReady_create", "cdecl")
-    FileReady_create.argtypes = [FileReady, c_int, c_uint16, c_uint32, c_bool]
-    FileReady_create.restype = FileReady
+def _load_FileReady_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_create", "cdecl"):
+        FileReady_create = _libs["/usr/local/lib/lib60870.so"].get("FileReady_create", "cdecl")
+        FileReady_create.argtypes = [FileReady, c_int, c_uint16, c_uint32, c_bool]
+        FileReady_create.restype = FileReady
+    return locals().get("FileReady_create")
+_loaders["FileReady_create"] = _load_FileReady_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1990
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_destroy", "cdecl"):
-    FileReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileReady_destroy", "cdecl")
-    FileReady_destroy.argtypes = [FileReady]
-    FileReady_destroy.restype = None
+def _load_FileReady_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_destroy", "cdecl"):
+        FileReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileReady_destroy", "cdecl")
+        FileReady_destroy.argtypes = [FileReady]
+        FileReady_destroy.restype = None
+    return locals().get("FileReady_destroy")
+_loaders["FileReady_destroy"] = _load_FileReady_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1993
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getFRQ", "cdecl"):
-    FileReady_getFRQ = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getFRQ", "cdecl")
-    FileReady_getFRQ.argtypes = [FileReady]
-    FileReady_getFRQ.restype = c_uint8
+def _load_FileReady_getFRQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getFRQ", "cdecl"):
+        FileReady_getFRQ = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getFRQ", "cdecl")
+        FileReady_getFRQ.argtypes = [FileReady]
+        FileReady_getFRQ.restype = c_uint8
+    return locals().get("FileReady_getFRQ")
+_loaders["FileReady_getFRQ"] = _load_FileReady_getFRQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1996
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_setFRQ", "cdecl"):
-    FileReady_setFRQ = _libs["/usr/local/lib/lib60870.so"].get("FileReady_setFRQ", "cdecl")
-    FileReady_setFRQ.argtypes = [FileReady, c_uint8]
-    FileReady_setFRQ.restype = None
+def _load_FileReady_setFRQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_setFRQ", "cdecl"):
+        FileReady_setFRQ = _libs["/usr/local/lib/lib60870.so"].get("FileReady_setFRQ", "cdecl")
+        FileReady_setFRQ.argtypes = [FileReady, c_uint8]
+        FileReady_setFRQ.restype = None
+    return locals().get("FileReady_setFRQ")
+_loaders["FileReady_setFRQ"] = _load_FileReady_setFRQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 1999
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_isPositive", "cdecl"):
-    FileReady_isPositive = _libs["/usr/local/lib/lib60870.so"].get("FileReady_isPositive", "cdecl")
-    FileReady_isPositive.argtypes = [FileReady]
-    FileReady_isPositive.restype = c_bool
+def _load_FileReady_isPositive():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_isPositive", "cdecl"):
+        FileReady_isPositive = _libs["/usr/local/lib/lib60870.so"].get("FileReady_isPositive", "cdecl")
+        FileReady_isPositive.argtypes = [FileReady]
+        FileReady_isPositive.restype = c_bool
+    return locals().get("FileReady_isPositive")
+_loaders["FileReady_isPositive"] = _load_FileReady_isPositive
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2002
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getNOF", "cdecl"):
-    FileReady_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getNOF", "cdecl")
-    FileReady_getNOF.argtypes = [FileReady]
-    FileReady_getNOF.restype = c_uint16
+def _load_FileReady_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getNOF", "cdecl"):
+        FileReady_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getNOF", "cdecl")
+        FileReady_getNOF.argtypes = [FileReady]
+        FileReady_getNOF.restype = c_uint16
+    return locals().get("FileReady_getNOF")
+_loaders["FileReady_getNOF"] = _load_FileReady_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2005
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getLengthOfFile", "cdecl"):
-    FileReady_getLengthOfFile = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getLengthOfFile", "cdecl")
-    FileReady_getLengthOfFile.argtypes = [FileReady]
-    FileReady_getLengthOfFile.restype = c_uint32
+def _load_FileReady_getLengthOfFile():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_getLengthOfFile", "cdecl"):
+        FileReady_getLengthOfFile = _libs["/usr/local/lib/lib60870.so"].get("FileReady_getLengthOfFile", "cdecl")
+        FileReady_getLengthOfFile.argtypes = [FileReady]
+        FileReady_getLengthOfFile.restype = c_uint32
+    return locals().get("FileReady_getLengthOfFile")
+_loaders["FileReady_getLengthOfFile"] = _load_FileReady_getLengthOfFile
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2008
-if _libs["/usr/local/lib/lib60870.so"].has("FileReady_destroy", "cdecl"):
-    FileReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileReady_destroy", "cdecl")
-    FileReady_destroy.argtypes = [FileReady]
-    FileReady_destroy.restype = None
+def _load_FileReady_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileReady_destroy", "cdecl"):
+        FileReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileReady_destroy", "cdecl")
+        FileReady_destroy.argtypes = [FileReady]
+        FileReady_destroy.restype = None
+    return locals().get("FileReady_destroy")
+_loaders["FileReady_destroy"] = _load_FileReady_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2014
 class struct_sSectionReady(Structure):
@@ -3768,52 +4824,76 @@ class struct_sSectionReady(Structure):
 SectionReady = POINTER(struct_sSectionReady)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2014
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2017
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_create", "cdecl"):
-    SectionReady_create = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_create", "cdecl")
-    SectionReady_create.argtypes = [SectionReady, c_int, c_uint16, c_uint8, c_uint32, c_bool]
-    SectionReady_create.restype = SectionReady
+def _load_SectionReady_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_create", "cdecl"):
+        SectionReady_create = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_create", "cdecl")
+        SectionReady_create.argtypes = [SectionReady, c_int, c_uint16, c_uint8, c_uint32, c_bool]
+        SectionReady_create.restype = SectionReady
+    return locals().get("SectionReady_create")
+_loaders["SectionReady_create"] = _load_SectionReady_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2021
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_isNotReady", "cdecl"):
-    SectionReady_isNotReady = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_isNotReady", "cdecl")
-    SectionReady_isNotReady.argtypes = [SectionReady]
-    SectionReady_isNotReady.restype = c_bool
+def _load_SectionReady_isNotReady():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_isNotReady", "cdecl"):
+        SectionReady_isNotReady = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_isNotReady", "cdecl")
+        SectionReady_isNotReady.argtypes = [SectionReady]
+        SectionReady_isNotReady.restype = c_bool
+    return locals().get("SectionReady_isNotReady")
+_loaders["SectionReady_isNotReady"] = _load_SectionReady_isNotReady
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2024
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getSRQ", "cdecl"):
-    SectionReady_getSRQ = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getSRQ", "cdecl")
-    SectionReady_getSRQ.argtypes = [SectionReady]
-    SectionReady_getSRQ.restype = c_uint8
+def _load_SectionReady_getSRQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getSRQ", "cdecl"):
+        SectionReady_getSRQ = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getSRQ", "cdecl")
+        SectionReady_getSRQ.argtypes = [SectionReady]
+        SectionReady_getSRQ.restype = c_uint8
+    return locals().get("SectionReady_getSRQ")
+_loaders["SectionReady_getSRQ"] = _load_SectionReady_getSRQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2027
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_setSRQ", "cdecl"):
-    SectionReady_setSRQ = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_setSRQ", "cdecl")
-    SectionReady_setSRQ.argtypes = [SectionReady, c_uint8]
-    SectionReady_setSRQ.restype = None
+def _load_SectionReady_setSRQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_setSRQ", "cdecl"):
+        SectionReady_setSRQ = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_setSRQ", "cdecl")
+        SectionReady_setSRQ.argtypes = [SectionReady, c_uint8]
+        SectionReady_setSRQ.restype = None
+    return locals().get("SectionReady_setSRQ")
+_loaders["SectionReady_setSRQ"] = _load_SectionReady_setSRQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2030
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getNOF", "cdecl"):
-    SectionReady_getNOF = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getNOF", "cdecl")
-    SectionReady_getNOF.argtypes = [SectionReady]
-    SectionReady_getNOF.restype = c_uint16
+def _load_SectionReady_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getNOF", "cdecl"):
+        SectionReady_getNOF = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getNOF", "cdecl")
+        SectionReady_getNOF.argtypes = [SectionReady]
+        SectionReady_getNOF.restype = c_uint16
+    return locals().get("SectionReady_getNOF")
+_loaders["SectionReady_getNOF"] = _load_SectionReady_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2033
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getNameOfSection", "cdecl"):
-    SectionReady_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getNameOfSection", "cdecl")
-    SectionReady_getNameOfSection.argtypes = [SectionReady]
-    SectionReady_getNameOfSection.restype = c_uint8
+def _load_SectionReady_getNameOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getNameOfSection", "cdecl"):
+        SectionReady_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getNameOfSection", "cdecl")
+        SectionReady_getNameOfSection.argtypes = [SectionReady]
+        SectionReady_getNameOfSection.restype = c_uint8
+    return locals().get("SectionReady_getNameOfSection")
+_loaders["SectionReady_getNameOfSection"] = _load_SectionReady_getNameOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2036
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getLengthOfSection", "cdecl"):
-    SectionReady_getLengthOfSection = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getLengthOfSection", "cdecl")
-    SectionReady_getLengthOfSection.argtypes = [SectionReady]
-    SectionReady_getLengthOfSection.restype = c_uint32
+def _load_SectionReady_getLengthOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_getLengthOfSection", "cdecl"):
+        SectionReady_getLengthOfSection = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_getLengthOfSection", "cdecl")
+        SectionReady_getLengthOfSection.argtypes = [SectionReady]
+        SectionReady_getLengthOfSection.restype = c_uint32
+    return locals().get("SectionReady_getLengthOfSection")
+_loaders["SectionReady_getLengthOfSection"] = _load_SectionReady_getLengthOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2039
-if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_destroy", "cdecl"):
-    SectionReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_destroy", "cdecl")
-    SectionReady_destroy.argtypes = [SectionReady]
-    SectionReady_destroy.restype = None
+def _load_SectionReady_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("SectionReady_destroy", "cdecl"):
+        SectionReady_destroy = _libs["/usr/local/lib/lib60870.so"].get("SectionReady_destroy", "cdecl")
+        SectionReady_destroy.argtypes = [SectionReady]
+        SectionReady_destroy.restype = None
+    return locals().get("SectionReady_destroy")
+_loaders["SectionReady_destroy"] = _load_SectionReady_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2046
 class struct_sFileCallOrSelect(Structure):
@@ -3822,34 +4902,49 @@ class struct_sFileCallOrSelect(Structure):
 FileCallOrSelect = POINTER(struct_sFileCallOrSelect)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2046
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2049
-if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_create", "cdecl"):
-    FileCallOrSelect_create = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_create", "cdecl")
-    FileCallOrSelect_create.argtypes = [FileCallOrSelect, c_int, c_uint16, c_uint8, c_uint8]
-    FileCallOrSelect_create.restype = FileCallOrSelect
+def _load_FileCallOrSelect_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_create", "cdecl"):
+        FileCallOrSelect_create = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_create", "cdecl")
+        FileCallOrSelect_create.argtypes = [FileCallOrSelect, c_int, c_uint16, c_uint8, c_uint8]
+        FileCallOrSelect_create.restype = FileCallOrSelect
+    return locals().get("FileCallOrSelect_create")
+_loaders["FileCallOrSelect_create"] = _load_FileCallOrSelect_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2052
-if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getNOF", "cdecl"):
-    FileCallOrSelect_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getNOF", "cdecl")
-    FileCallOrSelect_getNOF.argtypes = [FileCallOrSelect]
-    FileCallOrSelect_getNOF.restype = c_uint16
+def _load_FileCallOrSelect_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getNOF", "cdecl"):
+        FileCallOrSelect_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getNOF", "cdecl")
+        FileCallOrSelect_getNOF.argtypes = [FileCallOrSelect]
+        FileCallOrSelect_getNOF.restype = c_uint16
+    return locals().get("FileCallOrSelect_getNOF")
+_loaders["FileCallOrSelect_getNOF"] = _load_FileCallOrSelect_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2055
-if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getNameOfSection", "cdecl"):
-    FileCallOrSelect_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getNameOfSection", "cdecl")
-    FileCallOrSelect_getNameOfSection.argtypes = [FileCallOrSelect]
-    FileCallOrSelect_getNameOfSection.restype = c_uint8
+def _load_FileCallOrSelect_getNameOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getNameOfSection", "cdecl"):
+        FileCallOrSelect_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getNameOfSection", "cdecl")
+        FileCallOrSelect_getNameOfSection.argtypes = [FileCallOrSelect]
+        FileCallOrSelect_getNameOfSection.restype = c_uint8
+    return locals().get("FileCallOrSelect_getNameOfSection")
+_loaders["FileCallOrSelect_getNameOfSection"] = _load_FileCallOrSelect_getNameOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2058
-if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getSCQ", "cdecl"):
-    FileCallOrSelect_getSCQ = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getSCQ", "cdecl")
-    FileCallOrSelect_getSCQ.argtypes = [FileCallOrSelect]
-    FileCallOrSelect_getSCQ.restype = c_uint8
+def _load_FileCallOrSelect_getSCQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_getSCQ", "cdecl"):
+        FileCallOrSelect_getSCQ = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_getSCQ", "cdecl")
+        FileCallOrSelect_getSCQ.argtypes = [FileCallOrSelect]
+        FileCallOrSelect_getSCQ.restype = c_uint8
+    return locals().get("FileCallOrSelect_getSCQ")
+_loaders["FileCallOrSelect_getSCQ"] = _load_FileCallOrSelect_getSCQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2061
-if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_destroy", "cdecl"):
-    FileCallOrSelect_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_destroy", "cdecl")
-    FileCallOrSelect_destroy.argtypes = [FileCallOrSelect]
-    FileCallOrSelect_destroy.restype = None
+def _load_FileCallOrSelect_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileCallOrSelect_destroy", "cdecl"):
+        FileCallOrSelect_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileCallOrSelect_destroy", "cdecl")
+        FileCallOrSelect_destroy.argtypes = [FileCallOrSelect]
+        FileCallOrSelect_destroy.restype = None
+    return locals().get("FileCallOrSelect_destroy")
+_loaders["FileCallOrSelect_destroy"] = _load_FileCallOrSelect_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2067
 class struct_sFileLastSegmentOrSection(Structure):
@@ -3858,40 +4953,58 @@ class struct_sFileLastSegmentOrSection(Structure):
 FileLastSegmentOrSection = POINTER(struct_sFileLastSegmentOrSection)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2067
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2070
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_create", "cdecl"):
-    FileLastSegmentOrSection_create = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_create", "cdecl")
-    FileLastSegmentOrSection_create.argtypes = [FileLastSegmentOrSection, c_int, c_uint16, c_uint8, c_uint8, c_uint8]
-    FileLastSegmentOrSection_create.restype = FileLastSegmentOrSection
+def _load_FileLastSegmentOrSection_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_create", "cdecl"):
+        FileLastSegmentOrSection_create = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_create", "cdecl")
+        FileLastSegmentOrSection_create.argtypes = [FileLastSegmentOrSection, c_int, c_uint16, c_uint8, c_uint8, c_uint8]
+        FileLastSegmentOrSection_create.restype = FileLastSegmentOrSection
+    return locals().get("FileLastSegmentOrSection_create")
+_loaders["FileLastSegmentOrSection_create"] = _load_FileLastSegmentOrSection_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2073
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getNOF", "cdecl"):
-    FileLastSegmentOrSection_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getNOF", "cdecl")
-    FileLastSegmentOrSection_getNOF.argtypes = [FileLastSegmentOrSection]
-    FileLastSegmentOrSection_getNOF.restype = c_uint16
+def _load_FileLastSegmentOrSection_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getNOF", "cdecl"):
+        FileLastSegmentOrSection_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getNOF", "cdecl")
+        FileLastSegmentOrSection_getNOF.argtypes = [FileLastSegmentOrSection]
+        FileLastSegmentOrSection_getNOF.restype = c_uint16
+    return locals().get("FileLastSegmentOrSection_getNOF")
+_loaders["FileLastSegmentOrSection_getNOF"] = _load_FileLastSegmentOrSection_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2076
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getNameOfSection", "cdecl"):
-    FileLastSegmentOrSection_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getNameOfSection", "cdecl")
-    FileLastSegmentOrSection_getNameOfSection.argtypes = [FileLastSegmentOrSection]
-    FileLastSegmentOrSection_getNameOfSection.restype = c_uint8
+def _load_FileLastSegmentOrSection_getNameOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getNameOfSection", "cdecl"):
+        FileLastSegmentOrSection_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getNameOfSection", "cdecl")
+        FileLastSegmentOrSection_getNameOfSection.argtypes = [FileLastSegmentOrSection]
+        FileLastSegmentOrSection_getNameOfSection.restype = c_uint8
+    return locals().get("FileLastSegmentOrSection_getNameOfSection")
+_loaders["FileLastSegmentOrSection_getNameOfSection"] = _load_FileLastSegmentOrSection_getNameOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2079
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getLSQ", "cdecl"):
-    FileLastSegmentOrSection_getLSQ = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getLSQ", "cdecl")
-    FileLastSegmentOrSection_getLSQ.argtypes = [FileLastSegmentOrSection]
-    FileLastSegmentOrSection_getLSQ.restype = c_uint8
+def _load_FileLastSegmentOrSection_getLSQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getLSQ", "cdecl"):
+        FileLastSegmentOrSection_getLSQ = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getLSQ", "cdecl")
+        FileLastSegmentOrSection_getLSQ.argtypes = [FileLastSegmentOrSection]
+        FileLastSegmentOrSection_getLSQ.restype = c_uint8
+    return locals().get("FileLastSegmentOrSection_getLSQ")
+_loaders["FileLastSegmentOrSection_getLSQ"] = _load_FileLastSegmentOrSection_getLSQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2082
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getCHS", "cdecl"):
-    FileLastSegmentOrSection_getCHS = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getCHS", "cdecl")
-    FileLastSegmentOrSection_getCHS.argtypes = [FileLastSegmentOrSection]
-    FileLastSegmentOrSection_getCHS.restype = c_uint8
+def _load_FileLastSegmentOrSection_getCHS():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_getCHS", "cdecl"):
+        FileLastSegmentOrSection_getCHS = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_getCHS", "cdecl")
+        FileLastSegmentOrSection_getCHS.argtypes = [FileLastSegmentOrSection]
+        FileLastSegmentOrSection_getCHS.restype = c_uint8
+    return locals().get("FileLastSegmentOrSection_getCHS")
+_loaders["FileLastSegmentOrSection_getCHS"] = _load_FileLastSegmentOrSection_getCHS
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2085
-if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_destroy", "cdecl"):
-    FileLastSegmentOrSection_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_destroy", "cdecl")
-    FileLastSegmentOrSection_destroy.argtypes = [FileLastSegmentOrSection]
-    FileLastSegmentOrSection_destroy.restype = None
+def _load_FileLastSegmentOrSection_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileLastSegmentOrSection_destroy", "cdecl"):
+        FileLastSegmentOrSection_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileLastSegmentOrSection_destroy", "cdecl")
+        FileLastSegmentOrSection_destroy.argtypes = [FileLastSegmentOrSection]
+        FileLastSegmentOrSection_destroy.restype = None
+    return locals().get("FileLastSegmentOrSection_destroy")
+_loaders["FileLastSegmentOrSection_destroy"] = _load_FileLastSegmentOrSection_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2091
 class struct_sFileACK(Structure):
@@ -3900,34 +5013,49 @@ class struct_sFileACK(Structure):
 FileACK = POINTER(struct_sFileACK)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2091
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2094
-if _libs["/usr/local/lib/lib60870.so"].has("FileACK_create", "cdecl"):
-    FileACK_create = _libs["/usr/local/lib/lib60870.so"].get("FileACK_create", "cdecl")
-    FileACK_create.argtypes = [FileACK, c_int, c_uint16, c_uint8, c_uint8]
-    FileACK_create.restype = FileACK
+def _load_FileACK_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileACK_create", "cdecl"):
+        FileACK_create = _libs["/usr/local/lib/lib60870.so"].get("FileACK_create", "cdecl")
+        FileACK_create.argtypes = [FileACK, c_int, c_uint16, c_uint8, c_uint8]
+        FileACK_create.restype = FileACK
+    return locals().get("FileACK_create")
+_loaders["FileACK_create"] = _load_FileACK_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2097
-if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getNOF", "cdecl"):
-    FileACK_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getNOF", "cdecl")
-    FileACK_getNOF.argtypes = [FileACK]
-    FileACK_getNOF.restype = c_uint16
+def _load_FileACK_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getNOF", "cdecl"):
+        FileACK_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getNOF", "cdecl")
+        FileACK_getNOF.argtypes = [FileACK]
+        FileACK_getNOF.restype = c_uint16
+    return locals().get("FileACK_getNOF")
+_loaders["FileACK_getNOF"] = _load_FileACK_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2100
-if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getNameOfSection", "cdecl"):
-    FileACK_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getNameOfSection", "cdecl")
-    FileACK_getNameOfSection.argtypes = [FileACK]
-    FileACK_getNameOfSection.restype = c_uint8
+def _load_FileACK_getNameOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getNameOfSection", "cdecl"):
+        FileACK_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getNameOfSection", "cdecl")
+        FileACK_getNameOfSection.argtypes = [FileACK]
+        FileACK_getNameOfSection.restype = c_uint8
+    return locals().get("FileACK_getNameOfSection")
+_loaders["FileACK_getNameOfSection"] = _load_FileACK_getNameOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2103
-if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getAFQ", "cdecl"):
-    FileACK_getAFQ = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getAFQ", "cdecl")
-    FileACK_getAFQ.argtypes = [FileACK]
-    FileACK_getAFQ.restype = c_uint8
+def _load_FileACK_getAFQ():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileACK_getAFQ", "cdecl"):
+        FileACK_getAFQ = _libs["/usr/local/lib/lib60870.so"].get("FileACK_getAFQ", "cdecl")
+        FileACK_getAFQ.argtypes = [FileACK]
+        FileACK_getAFQ.restype = c_uint8
+    return locals().get("FileACK_getAFQ")
+_loaders["FileACK_getAFQ"] = _load_FileACK_getAFQ
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2106
-if _libs["/usr/local/lib/lib60870.so"].has("FileACK_destroy", "cdecl"):
-    FileACK_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileACK_destroy", "cdecl")
-    FileACK_destroy.argtypes = [FileACK]
-    FileACK_destroy.restype = None
+def _load_FileACK_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileACK_destroy", "cdecl"):
+        FileACK_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileACK_destroy", "cdecl")
+        FileACK_destroy.argtypes = [FileACK]
+        FileACK_destroy.restype = None
+    return locals().get("FileACK_destroy")
+_loaders["FileACK_destroy"] = _load_FileACK_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2112
 class struct_sFileSegment(Structure):
@@ -3936,46 +5064,67 @@ class struct_sFileSegment(Structure):
 FileSegment = POINTER(struct_sFileSegment)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2112
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2115
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_create", "cdecl"):
-    FileSegment_create = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_create", "cdecl")
-    FileSegment_create.argtypes = [FileSegment, c_int, c_uint16, c_uint8, POINTER(c_uint8), c_uint8]
-    FileSegment_create.restype = FileSegment
+def _load_FileSegment_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_create", "cdecl"):
+        FileSegment_create = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_create", "cdecl")
+        FileSegment_create.argtypes = [FileSegment, c_int, c_uint16, c_uint8, POINTER(c_uint8), c_uint8]
+        FileSegment_create.restype = FileSegment
+    return locals().get("FileSegment_create")
+_loaders["FileSegment_create"] = _load_FileSegment_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2118
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getNOF", "cdecl"):
-    FileSegment_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getNOF", "cdecl")
-    FileSegment_getNOF.argtypes = [FileSegment]
-    FileSegment_getNOF.restype = c_uint16
+def _load_FileSegment_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getNOF", "cdecl"):
+        FileSegment_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getNOF", "cdecl")
+        FileSegment_getNOF.argtypes = [FileSegment]
+        FileSegment_getNOF.restype = c_uint16
+    return locals().get("FileSegment_getNOF")
+_loaders["FileSegment_getNOF"] = _load_FileSegment_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2121
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getNameOfSection", "cdecl"):
-    FileSegment_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getNameOfSection", "cdecl")
-    FileSegment_getNameOfSection.argtypes = [FileSegment]
-    FileSegment_getNameOfSection.restype = c_uint8
+def _load_FileSegment_getNameOfSection():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getNameOfSection", "cdecl"):
+        FileSegment_getNameOfSection = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getNameOfSection", "cdecl")
+        FileSegment_getNameOfSection.argtypes = [FileSegment]
+        FileSegment_getNameOfSection.restype = c_uint8
+    return locals().get("FileSegment_getNameOfSection")
+_loaders["FileSegment_getNameOfSection"] = _load_FileSegment_getNameOfSection
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2124
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getLengthOfSegment", "cdecl"):
-    FileSegment_getLengthOfSegment = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getLengthOfSegment", "cdecl")
-    FileSegment_getLengthOfSegment.argtypes = [FileSegment]
-    FileSegment_getLengthOfSegment.restype = c_uint8
+def _load_FileSegment_getLengthOfSegment():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getLengthOfSegment", "cdecl"):
+        FileSegment_getLengthOfSegment = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getLengthOfSegment", "cdecl")
+        FileSegment_getLengthOfSegment.argtypes = [FileSegment]
+        FileSegment_getLengthOfSegment.restype = c_uint8
+    return locals().get("FileSegment_getLengthOfSegment")
+_loaders["FileSegment_getLengthOfSegment"] = _load_FileSegment_getLengthOfSegment
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2126
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getSegmentData", "cdecl"):
-    FileSegment_getSegmentData = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getSegmentData", "cdecl")
-    FileSegment_getSegmentData.argtypes = [FileSegment]
-    FileSegment_getSegmentData.restype = POINTER(c_uint8)
+def _load_FileSegment_getSegmentData():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_getSegmentData", "cdecl"):
+        FileSegment_getSegmentData = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_getSegmentData", "cdecl")
+        FileSegment_getSegmentData.argtypes = [FileSegment]
+        FileSegment_getSegmentData.restype = POINTER(c_uint8)
+    return locals().get("FileSegment_getSegmentData")
+_loaders["FileSegment_getSegmentData"] = _load_FileSegment_getSegmentData
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2130
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_GetMaxDataSize", "cdecl"):
-    FileSegment_GetMaxDataSize = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_GetMaxDataSize", "cdecl")
-    FileSegment_GetMaxDataSize.argtypes = [CS101_AppLayerParameters]
-    FileSegment_GetMaxDataSize.restype = c_int
+def _load_FileSegment_GetMaxDataSize():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_GetMaxDataSize", "cdecl"):
+        FileSegment_GetMaxDataSize = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_GetMaxDataSize", "cdecl")
+        FileSegment_GetMaxDataSize.argtypes = [CS101_AppLayerParameters]
+        FileSegment_GetMaxDataSize.restype = c_int
+    return locals().get("FileSegment_GetMaxDataSize")
+_loaders["FileSegment_GetMaxDataSize"] = _load_FileSegment_GetMaxDataSize
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2133
-if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_destroy", "cdecl"):
-    FileSegment_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_destroy", "cdecl")
-    FileSegment_destroy.argtypes = [FileSegment]
-    FileSegment_destroy.restype = None
+def _load_FileSegment_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileSegment_destroy", "cdecl"):
+        FileSegment_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileSegment_destroy", "cdecl")
+        FileSegment_destroy.argtypes = [FileSegment]
+        FileSegment_destroy.restype = None
+    return locals().get("FileSegment_destroy")
+_loaders["FileSegment_destroy"] = _load_FileSegment_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2139
 class struct_sFileDirectory(Structure):
@@ -3984,64 +5133,94 @@ class struct_sFileDirectory(Structure):
 FileDirectory = POINTER(struct_sFileDirectory)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2139
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2142
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_create", "cdecl"):
-    FileDirectory_create = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_create", "cdecl")
-    FileDirectory_create.argtypes = [FileDirectory, c_int, c_uint16, c_int, c_uint8, CP56Time2a]
-    FileDirectory_create.restype = FileDirectory
+def _load_FileDirectory_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_create", "cdecl"):
+        FileDirectory_create = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_create", "cdecl")
+        FileDirectory_create.argtypes = [FileDirectory, c_int, c_uint16, c_int, c_uint8, CP56Time2a]
+        FileDirectory_create.restype = FileDirectory
+    return locals().get("FileDirectory_create")
+_loaders["FileDirectory_create"] = _load_FileDirectory_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2145
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getNOF", "cdecl"):
-    FileDirectory_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getNOF", "cdecl")
-    FileDirectory_getNOF.argtypes = [FileDirectory]
-    FileDirectory_getNOF.restype = c_uint16
+def _load_FileDirectory_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getNOF", "cdecl"):
+        FileDirectory_getNOF = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getNOF", "cdecl")
+        FileDirectory_getNOF.argtypes = [FileDirectory]
+        FileDirectory_getNOF.restype = c_uint16
+    return locals().get("FileDirectory_getNOF")
+_loaders["FileDirectory_getNOF"] = _load_FileDirectory_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2148
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getSOF", "cdecl"):
-    FileDirectory_getSOF = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getSOF", "cdecl")
-    FileDirectory_getSOF.argtypes = [FileDirectory]
-    FileDirectory_getSOF.restype = c_uint8
+def _load_FileDirectory_getSOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getSOF", "cdecl"):
+        FileDirectory_getSOF = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getSOF", "cdecl")
+        FileDirectory_getSOF.argtypes = [FileDirectory]
+        FileDirectory_getSOF.restype = c_uint8
+    return locals().get("FileDirectory_getSOF")
+_loaders["FileDirectory_getSOF"] = _load_FileDirectory_getSOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2151
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getSTATUS", "cdecl"):
-    FileDirectory_getSTATUS = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getSTATUS", "cdecl")
-    FileDirectory_getSTATUS.argtypes = [FileDirectory]
-    FileDirectory_getSTATUS.restype = c_int
+def _load_FileDirectory_getSTATUS():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getSTATUS", "cdecl"):
+        FileDirectory_getSTATUS = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getSTATUS", "cdecl")
+        FileDirectory_getSTATUS.argtypes = [FileDirectory]
+        FileDirectory_getSTATUS.restype = c_int
+    return locals().get("FileDirectory_getSTATUS")
+_loaders["FileDirectory_getSTATUS"] = _load_FileDirectory_getSTATUS
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2154
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getLFD", "cdecl"):
-    FileDirectory_getLFD = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getLFD", "cdecl")
-    FileDirectory_getLFD.argtypes = [FileDirectory]
-    FileDirectory_getLFD.restype = c_bool
+def _load_FileDirectory_getLFD():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getLFD", "cdecl"):
+        FileDirectory_getLFD = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getLFD", "cdecl")
+        FileDirectory_getLFD.argtypes = [FileDirectory]
+        FileDirectory_getLFD.restype = c_bool
+    return locals().get("FileDirectory_getLFD")
+_loaders["FileDirectory_getLFD"] = _load_FileDirectory_getLFD
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2157
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getFOR", "cdecl"):
-    FileDirectory_getFOR = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getFOR", "cdecl")
-    FileDirectory_getFOR.argtypes = [FileDirectory]
-    FileDirectory_getFOR.restype = c_bool
+def _load_FileDirectory_getFOR():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getFOR", "cdecl"):
+        FileDirectory_getFOR = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getFOR", "cdecl")
+        FileDirectory_getFOR.argtypes = [FileDirectory]
+        FileDirectory_getFOR.restype = c_bool
+    return locals().get("FileDirectory_getFOR")
+_loaders["FileDirectory_getFOR"] = _load_FileDirectory_getFOR
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2160
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getFA", "cdecl"):
-    FileDirectory_getFA = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getFA", "cdecl")
-    FileDirectory_getFA.argtypes = [FileDirectory]
-    FileDirectory_getFA.restype = c_bool
+def _load_FileDirectory_getFA():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getFA", "cdecl"):
+        FileDirectory_getFA = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getFA", "cdecl")
+        FileDirectory_getFA.argtypes = [FileDirectory]
+        FileDirectory_getFA.restype = c_bool
+    return locals().get("FileDirectory_getFA")
+_loaders["FileDirectory_getFA"] = _load_FileDirectory_getFA
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2163
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getLengthOfFile", "cdecl"):
-    FileDirectory_getLengthOfFile = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getLengthOfFile", "cdecl")
-    FileDirectory_getLengthOfFile.argtypes = [FileDirectory]
-    FileDirectory_getLengthOfFile.restype = c_uint8
+def _load_FileDirectory_getLengthOfFile():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getLengthOfFile", "cdecl"):
+        FileDirectory_getLengthOfFile = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getLengthOfFile", "cdecl")
+        FileDirectory_getLengthOfFile.argtypes = [FileDirectory]
+        FileDirectory_getLengthOfFile.restype = c_uint8
+    return locals().get("FileDirectory_getLengthOfFile")
+_loaders["FileDirectory_getLengthOfFile"] = _load_FileDirectory_getLengthOfFile
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2166
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getCreationTime", "cdecl"):
-    FileDirectory_getCreationTime = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getCreationTime", "cdecl")
-    FileDirectory_getCreationTime.argtypes = [FileDirectory]
-    FileDirectory_getCreationTime.restype = CP56Time2a
+def _load_FileDirectory_getCreationTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_getCreationTime", "cdecl"):
+        FileDirectory_getCreationTime = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_getCreationTime", "cdecl")
+        FileDirectory_getCreationTime.argtypes = [FileDirectory]
+        FileDirectory_getCreationTime.restype = CP56Time2a
+    return locals().get("FileDirectory_getCreationTime")
+_loaders["FileDirectory_getCreationTime"] = _load_FileDirectory_getCreationTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2169
-if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_destroy", "cdecl"):
-    FileDirectory_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_destroy", "cdecl")
-    FileDirectory_destroy.argtypes = [FileDirectory]
-    FileDirectory_destroy.restype = None
+def _load_FileDirectory_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("FileDirectory_destroy", "cdecl"):
+        FileDirectory_destroy = _libs["/usr/local/lib/lib60870.so"].get("FileDirectory_destroy", "cdecl")
+        FileDirectory_destroy.argtypes = [FileDirectory]
+        FileDirectory_destroy.restype = None
+    return locals().get("FileDirectory_destroy")
+_loaders["FileDirectory_destroy"] = _load_FileDirectory_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2175
 class struct_sQueryLog(Structure):
@@ -4050,34 +5229,49 @@ class struct_sQueryLog(Structure):
 QueryLog = POINTER(struct_sQueryLog)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2175
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2178
-if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_create", "cdecl"):
-    QueryLog_create = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_create", "cdecl")
-    QueryLog_create.argtypes = [QueryLog, c_int, c_uint16, CP56Time2a, CP56Time2a]
-    QueryLog_create.restype = QueryLog
+def _load_QueryLog_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_create", "cdecl"):
+        QueryLog_create = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_create", "cdecl")
+        QueryLog_create.argtypes = [QueryLog, c_int, c_uint16, CP56Time2a, CP56Time2a]
+        QueryLog_create.restype = QueryLog
+    return locals().get("QueryLog_create")
+_loaders["QueryLog_create"] = _load_QueryLog_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2181
-if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getNOF", "cdecl"):
-    QueryLog_getNOF = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getNOF", "cdecl")
-    QueryLog_getNOF.argtypes = [QueryLog]
-    QueryLog_getNOF.restype = c_uint16
+def _load_QueryLog_getNOF():
+    if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getNOF", "cdecl"):
+        QueryLog_getNOF = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getNOF", "cdecl")
+        QueryLog_getNOF.argtypes = [QueryLog]
+        QueryLog_getNOF.restype = c_uint16
+    return locals().get("QueryLog_getNOF")
+_loaders["QueryLog_getNOF"] = _load_QueryLog_getNOF
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2184
-if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getRangeStartTime", "cdecl"):
-    QueryLog_getRangeStartTime = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getRangeStartTime", "cdecl")
-    QueryLog_getRangeStartTime.argtypes = [QueryLog]
-    QueryLog_getRangeStartTime.restype = CP56Time2a
+def _load_QueryLog_getRangeStartTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getRangeStartTime", "cdecl"):
+        QueryLog_getRangeStartTime = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getRangeStartTime", "cdecl")
+        QueryLog_getRangeStartTime.argtypes = [QueryLog]
+        QueryLog_getRangeStartTime.restype = CP56Time2a
+    return locals().get("QueryLog_getRangeStartTime")
+_loaders["QueryLog_getRangeStartTime"] = _load_QueryLog_getRangeStartTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2188
-if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getRangeStopTime", "cdecl"):
-    QueryLog_getRangeStopTime = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getRangeStopTime", "cdecl")
-    QueryLog_getRangeStopTime.argtypes = [QueryLog]
-    QueryLog_getRangeStopTime.restype = CP56Time2a
+def _load_QueryLog_getRangeStopTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_getRangeStopTime", "cdecl"):
+        QueryLog_getRangeStopTime = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_getRangeStopTime", "cdecl")
+        QueryLog_getRangeStopTime.argtypes = [QueryLog]
+        QueryLog_getRangeStopTime.restype = CP56Time2a
+    return locals().get("QueryLog_getRangeStopTime")
+_loaders["QueryLog_getRangeStopTime"] = _load_QueryLog_getRangeStopTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_information_objects.h: 2191
-if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_destroy", "cdecl"):
-    QueryLog_destroy = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_destroy", "cdecl")
-    QueryLog_destroy.argtypes = [QueryLog]
-    QueryLog_destroy.restype = None
+def _load_QueryLog_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("QueryLog_destroy", "cdecl"):
+        QueryLog_destroy = _libs["/usr/local/lib/lib60870.so"].get("QueryLog_destroy", "cdecl")
+        QueryLog_destroy.argtypes = [QueryLog]
+        QueryLog_destroy.restype = None
+    return locals().get("QueryLog_destroy")
+_loaders["QueryLog_destroy"] = _load_QueryLog_destroy
 
 enum_anon_30 = c_int# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 236
 
@@ -4168,562 +5362,841 @@ CS101_COT_UNKNOWN_IOA = 47# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc
 CS101_CauseOfTransmission = enum_anon_30# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 236
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 238
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_CauseOfTransmission_toString", "cdecl"):
-    CS101_CauseOfTransmission_toString = _libs["/usr/local/lib/lib60870.so"].get("CS101_CauseOfTransmission_toString", "cdecl")
-    CS101_CauseOfTransmission_toString.argtypes = [CS101_CauseOfTransmission]
-    CS101_CauseOfTransmission_toString.restype = c_char_p
+def _load_CS101_CauseOfTransmission_toString():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_CauseOfTransmission_toString", "cdecl"):
+        CS101_CauseOfTransmission_toString = _libs["/usr/local/lib/lib60870.so"].get("CS101_CauseOfTransmission_toString", "cdecl")
+        CS101_CauseOfTransmission_toString.argtypes = [CS101_CauseOfTransmission]
+        CS101_CauseOfTransmission_toString.restype = c_char_p
+    return locals().get("CS101_CauseOfTransmission_toString")
+_loaders["CS101_CauseOfTransmission_toString"] = _load_CS101_CauseOfTransmission_toString
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 242
-if _libs["/usr/local/lib/lib60870.so"].has("Lib60870_enableDebugOutput", "cdecl"):
-    Lib60870_enableDebugOutput = _libs["/usr/local/lib/lib60870.so"].get("Lib60870_enableDebugOutput", "cdecl")
-    Lib60870_enableDebugOutput.argtypes = [c_bool]
-    Lib60870_enableDebugOutput.restype = None
+def _load_Lib60870_enableDebugOutput():
+    if _libs["/usr/local/lib/lib60870.so"].has("Lib60870_enableDebugOutput", "cdecl"):
+        Lib60870_enableDebugOutput = _libs["/usr/local/lib/lib60870.so"].get("Lib60870_enableDebugOutput", "cdecl")
+        Lib60870_enableDebugOutput.argtypes = [c_bool]
+        Lib60870_enableDebugOutput.restype = None
+    return locals().get("Lib60870_enableDebugOutput")
+_loaders["Lib60870_enableDebugOutput"] = _load_Lib60870_enableDebugOutput
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 245
-if _libs["/usr/local/lib/lib60870.so"].has("Lib60870_getLibraryVersionInfo", "cdecl"):
-    Lib60870_getLibraryVersionInfo = _libs["/usr/local/lib/lib60870.so"].get("Lib60870_getLibraryVersionInfo", "cdecl")
-    Lib60870_getLibraryVersionInfo.argtypes = []
-    Lib60870_getLibraryVersionInfo.restype = Lib60870VersionInfo
+def _load_Lib60870_getLibraryVersionInfo():
+    if _libs["/usr/local/lib/lib60870.so"].has("Lib60870_getLibraryVersionInfo", "cdecl"):
+        Lib60870_getLibraryVersionInfo = _libs["/usr/local/lib/lib60870.so"].get("Lib60870_getLibraryVersionInfo", "cdecl")
+        Lib60870_getLibraryVersionInfo.argtypes = []
+        Lib60870_getLibraryVersionInfo.restype = Lib60870VersionInfo
+    return locals().get("Lib60870_getLibraryVersionInfo")
+_loaders["Lib60870_getLibraryVersionInfo"] = _load_Lib60870_getLibraryVersionInfo
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 251
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isTest", "cdecl"):
-    CS101_ASDU_isTest = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isTest", "cdecl")
-    CS101_ASDU_isTest.argtypes = [CS101_ASDU]
-    CS101_ASDU_isTest.restype = c_bool
+def _load_CS101_ASDU_isTest():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isTest", "cdecl"):
+        CS101_ASDU_isTest = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isTest", "cdecl")
+        CS101_ASDU_isTest.argtypes = [CS101_ASDU]
+        CS101_ASDU_isTest.restype = c_bool
+    return locals().get("CS101_ASDU_isTest")
+_loaders["CS101_ASDU_isTest"] = _load_CS101_ASDU_isTest
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 257
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setTest", "cdecl"):
-    CS101_ASDU_setTest = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setTest", "cdecl")
-    CS101_ASDU_setTest.argtypes = [CS101_ASDU, c_bool]
-    CS101_ASDU_setTest.restype = None
+def _load_CS101_ASDU_setTest():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setTest", "cdecl"):
+        CS101_ASDU_setTest = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setTest", "cdecl")
+        CS101_ASDU_setTest.argtypes = [CS101_ASDU, c_bool]
+        CS101_ASDU_setTest.restype = None
+    return locals().get("CS101_ASDU_setTest")
+_loaders["CS101_ASDU_setTest"] = _load_CS101_ASDU_setTest
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 263
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isNegative", "cdecl"):
-    CS101_ASDU_isNegative = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isNegative", "cdecl")
-    CS101_ASDU_isNegative.argtypes = [CS101_ASDU]
-    CS101_ASDU_isNegative.restype = c_bool
+def _load_CS101_ASDU_isNegative():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isNegative", "cdecl"):
+        CS101_ASDU_isNegative = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isNegative", "cdecl")
+        CS101_ASDU_isNegative.argtypes = [CS101_ASDU]
+        CS101_ASDU_isNegative.restype = c_bool
+    return locals().get("CS101_ASDU_isNegative")
+_loaders["CS101_ASDU_isNegative"] = _load_CS101_ASDU_isNegative
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 269
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setNegative", "cdecl"):
-    CS101_ASDU_setNegative = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setNegative", "cdecl")
-    CS101_ASDU_setNegative.argtypes = [CS101_ASDU, c_bool]
-    CS101_ASDU_setNegative.restype = None
+def _load_CS101_ASDU_setNegative():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setNegative", "cdecl"):
+        CS101_ASDU_setNegative = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setNegative", "cdecl")
+        CS101_ASDU_setNegative.argtypes = [CS101_ASDU, c_bool]
+        CS101_ASDU_setNegative.restype = None
+    return locals().get("CS101_ASDU_setNegative")
+_loaders["CS101_ASDU_setNegative"] = _load_CS101_ASDU_setNegative
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 275
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getOA", "cdecl"):
-    CS101_ASDU_getOA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getOA", "cdecl")
-    CS101_ASDU_getOA.argtypes = [CS101_ASDU]
-    CS101_ASDU_getOA.restype = c_int
+def _load_CS101_ASDU_getOA():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getOA", "cdecl"):
+        CS101_ASDU_getOA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getOA", "cdecl")
+        CS101_ASDU_getOA.argtypes = [CS101_ASDU]
+        CS101_ASDU_getOA.restype = c_int
+    return locals().get("CS101_ASDU_getOA")
+_loaders["CS101_ASDU_getOA"] = _load_CS101_ASDU_getOA
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 281
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getCOT", "cdecl"):
-    CS101_ASDU_getCOT = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getCOT", "cdecl")
-    CS101_ASDU_getCOT.argtypes = [CS101_ASDU]
-    CS101_ASDU_getCOT.restype = CS101_CauseOfTransmission
+def _load_CS101_ASDU_getCOT():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getCOT", "cdecl"):
+        CS101_ASDU_getCOT = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getCOT", "cdecl")
+        CS101_ASDU_getCOT.argtypes = [CS101_ASDU]
+        CS101_ASDU_getCOT.restype = CS101_CauseOfTransmission
+    return locals().get("CS101_ASDU_getCOT")
+_loaders["CS101_ASDU_getCOT"] = _load_CS101_ASDU_getCOT
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 287
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setCOT", "cdecl"):
-    CS101_ASDU_setCOT = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setCOT", "cdecl")
-    CS101_ASDU_setCOT.argtypes = [CS101_ASDU, CS101_CauseOfTransmission]
-    CS101_ASDU_setCOT.restype = None
+def _load_CS101_ASDU_setCOT():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setCOT", "cdecl"):
+        CS101_ASDU_setCOT = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setCOT", "cdecl")
+        CS101_ASDU_setCOT.argtypes = [CS101_ASDU, CS101_CauseOfTransmission]
+        CS101_ASDU_setCOT.restype = None
+    return locals().get("CS101_ASDU_setCOT")
+_loaders["CS101_ASDU_setCOT"] = _load_CS101_ASDU_setCOT
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 293
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getCA", "cdecl"):
-    CS101_ASDU_getCA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getCA", "cdecl")
-    CS101_ASDU_getCA.argtypes = [CS101_ASDU]
-    CS101_ASDU_getCA.restype = c_int
+def _load_CS101_ASDU_getCA():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getCA", "cdecl"):
+        CS101_ASDU_getCA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getCA", "cdecl")
+        CS101_ASDU_getCA.argtypes = [CS101_ASDU]
+        CS101_ASDU_getCA.restype = c_int
+    return locals().get("CS101_ASDU_getCA")
+_loaders["CS101_ASDU_getCA"] = _load_CS101_ASDU_getCA
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 301
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setCA", "cdecl"):
-    CS101_ASDU_setCA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setCA", "cdecl")
-    CS101_ASDU_setCA.argtypes = [CS101_ASDU, c_int]
-    CS101_ASDU_setCA.restype = None
+def _load_CS101_ASDU_setCA():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setCA", "cdecl"):
+        CS101_ASDU_setCA = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setCA", "cdecl")
+        CS101_ASDU_setCA.argtypes = [CS101_ASDU, c_int]
+        CS101_ASDU_setCA.restype = None
+    return locals().get("CS101_ASDU_setCA")
+_loaders["CS101_ASDU_setCA"] = _load_CS101_ASDU_setCA
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 310
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getTypeID", "cdecl"):
-    CS101_ASDU_getTypeID = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getTypeID", "cdecl")
-    CS101_ASDU_getTypeID.argtypes = [CS101_ASDU]
-    CS101_ASDU_getTypeID.restype = IEC60870_5_TypeID
+def _load_CS101_ASDU_getTypeID():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getTypeID", "cdecl"):
+        CS101_ASDU_getTypeID = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getTypeID", "cdecl")
+        CS101_ASDU_getTypeID.argtypes = [CS101_ASDU]
+        CS101_ASDU_getTypeID.restype = IEC60870_5_TypeID
+    return locals().get("CS101_ASDU_getTypeID")
+_loaders["CS101_ASDU_getTypeID"] = _load_CS101_ASDU_getTypeID
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 322
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setTypeID", "cdecl"):
-    CS101_ASDU_setTypeID = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setTypeID", "cdecl")
-    CS101_ASDU_setTypeID.argtypes = [CS101_ASDU, IEC60870_5_TypeID]
-    CS101_ASDU_setTypeID.restype = None
+def _load_CS101_ASDU_setTypeID():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setTypeID", "cdecl"):
+        CS101_ASDU_setTypeID = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setTypeID", "cdecl")
+        CS101_ASDU_setTypeID.argtypes = [CS101_ASDU, IEC60870_5_TypeID]
+        CS101_ASDU_setTypeID.restype = None
+    return locals().get("CS101_ASDU_setTypeID")
+_loaders["CS101_ASDU_setTypeID"] = _load_CS101_ASDU_setTypeID
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 333
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isSequence", "cdecl"):
-    CS101_ASDU_isSequence = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isSequence", "cdecl")
-    CS101_ASDU_isSequence.argtypes = [CS101_ASDU]
-    CS101_ASDU_isSequence.restype = c_bool
+def _load_CS101_ASDU_isSequence():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_isSequence", "cdecl"):
+        CS101_ASDU_isSequence = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_isSequence", "cdecl")
+        CS101_ASDU_isSequence.argtypes = [CS101_ASDU]
+        CS101_ASDU_isSequence.restype = c_bool
+    return locals().get("CS101_ASDU_isSequence")
+_loaders["CS101_ASDU_isSequence"] = _load_CS101_ASDU_isSequence
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 344
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setSequence", "cdecl"):
-    CS101_ASDU_setSequence = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setSequence", "cdecl")
-    CS101_ASDU_setSequence.argtypes = [CS101_ASDU, c_bool]
-    CS101_ASDU_setSequence.restype = None
+def _load_CS101_ASDU_setSequence():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setSequence", "cdecl"):
+        CS101_ASDU_setSequence = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setSequence", "cdecl")
+        CS101_ASDU_setSequence.argtypes = [CS101_ASDU, c_bool]
+        CS101_ASDU_setSequence.restype = None
+    return locals().get("CS101_ASDU_setSequence")
+_loaders["CS101_ASDU_setSequence"] = _load_CS101_ASDU_setSequence
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 352
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getNumberOfElements", "cdecl"):
-    CS101_ASDU_getNumberOfElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getNumberOfElements", "cdecl")
-    CS101_ASDU_getNumberOfElements.argtypes = [CS101_ASDU]
-    CS101_ASDU_getNumberOfElements.restype = c_int
+def _load_CS101_ASDU_getNumberOfElements():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getNumberOfElements", "cdecl"):
+        CS101_ASDU_getNumberOfElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getNumberOfElements", "cdecl")
+        CS101_ASDU_getNumberOfElements.argtypes = [CS101_ASDU]
+        CS101_ASDU_getNumberOfElements.restype = c_int
+    return locals().get("CS101_ASDU_getNumberOfElements")
+_loaders["CS101_ASDU_getNumberOfElements"] = _load_CS101_ASDU_getNumberOfElements
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 364
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setNumberOfElements", "cdecl"):
-    CS101_ASDU_setNumberOfElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setNumberOfElements", "cdecl")
-    CS101_ASDU_setNumberOfElements.argtypes = [CS101_ASDU, c_int]
-    CS101_ASDU_setNumberOfElements.restype = None
+def _load_CS101_ASDU_setNumberOfElements():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_setNumberOfElements", "cdecl"):
+        CS101_ASDU_setNumberOfElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_setNumberOfElements", "cdecl")
+        CS101_ASDU_setNumberOfElements.argtypes = [CS101_ASDU, c_int]
+        CS101_ASDU_setNumberOfElements.restype = None
+    return locals().get("CS101_ASDU_setNumberOfElements")
+_loaders["CS101_ASDU_setNumberOfElements"] = _load_CS101_ASDU_setNumberOfElements
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 374
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getElement", "cdecl"):
-    CS101_ASDU_getElement = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getElement", "cdecl")
-    CS101_ASDU_getElement.argtypes = [CS101_ASDU, c_int]
-    CS101_ASDU_getElement.restype = InformationObject
+def _load_CS101_ASDU_getElement():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getElement", "cdecl"):
+        CS101_ASDU_getElement = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getElement", "cdecl")
+        CS101_ASDU_getElement.argtypes = [CS101_ASDU, c_int]
+        CS101_ASDU_getElement.restype = InformationObject
+    return locals().get("CS101_ASDU_getElement")
+_loaders["CS101_ASDU_getElement"] = _load_CS101_ASDU_getElement
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 385
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getElementEx", "cdecl"):
-    CS101_ASDU_getElementEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getElementEx", "cdecl")
-    CS101_ASDU_getElementEx.argtypes = [CS101_ASDU, InformationObject, c_int]
-    CS101_ASDU_getElementEx.restype = InformationObject
+def _load_CS101_ASDU_getElementEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getElementEx", "cdecl"):
+        CS101_ASDU_getElementEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getElementEx", "cdecl")
+        CS101_ASDU_getElementEx.argtypes = [CS101_ASDU, InformationObject, c_int]
+        CS101_ASDU_getElementEx.restype = InformationObject
+    return locals().get("CS101_ASDU_getElementEx")
+_loaders["CS101_ASDU_getElementEx"] = _load_CS101_ASDU_getElementEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 401
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_create", "cdecl"):
-    CS101_ASDU_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_create", "cdecl")
-    CS101_ASDU_create.argtypes = [CS101_AppLayerParameters, c_bool, CS101_CauseOfTransmission, c_int, c_int, c_bool, c_bool]
-    CS101_ASDU_create.restype = CS101_ASDU
+def _load_CS101_ASDU_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_create", "cdecl"):
+        CS101_ASDU_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_create", "cdecl")
+        CS101_ASDU_create.argtypes = [CS101_AppLayerParameters, c_bool, CS101_CauseOfTransmission, c_int, c_int, c_bool, c_bool]
+        CS101_ASDU_create.restype = CS101_ASDU
+    return locals().get("CS101_ASDU_create")
+_loaders["CS101_ASDU_create"] = _load_CS101_ASDU_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 421
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_initializeStatic", "cdecl"):
-    CS101_ASDU_initializeStatic = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_initializeStatic", "cdecl")
-    CS101_ASDU_initializeStatic.argtypes = [CS101_StaticASDU, CS101_AppLayerParameters, c_bool, CS101_CauseOfTransmission, c_int, c_int, c_bool, c_bool]
-    CS101_ASDU_initializeStatic.restype = CS101_ASDU
+def _load_CS101_ASDU_initializeStatic():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_initializeStatic", "cdecl"):
+        CS101_ASDU_initializeStatic = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_initializeStatic", "cdecl")
+        CS101_ASDU_initializeStatic.argtypes = [CS101_StaticASDU, CS101_AppLayerParameters, c_bool, CS101_CauseOfTransmission, c_int, c_int, c_bool, c_bool]
+        CS101_ASDU_initializeStatic.restype = CS101_ASDU
+    return locals().get("CS101_ASDU_initializeStatic")
+_loaders["CS101_ASDU_initializeStatic"] = _load_CS101_ASDU_initializeStatic
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 431
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getPayload", "cdecl"):
-    CS101_ASDU_getPayload = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getPayload", "cdecl")
-    CS101_ASDU_getPayload.argtypes = [CS101_ASDU]
-    CS101_ASDU_getPayload.restype = POINTER(c_uint8)
+def _load_CS101_ASDU_getPayload():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getPayload", "cdecl"):
+        CS101_ASDU_getPayload = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getPayload", "cdecl")
+        CS101_ASDU_getPayload.argtypes = [CS101_ASDU]
+        CS101_ASDU_getPayload.restype = POINTER(c_uint8)
+    return locals().get("CS101_ASDU_getPayload")
+_loaders["CS101_ASDU_getPayload"] = _load_CS101_ASDU_getPayload
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 447
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_addPayload", "cdecl"):
-    CS101_ASDU_addPayload = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_addPayload", "cdecl")
-    CS101_ASDU_addPayload.argtypes = [CS101_ASDU, POINTER(c_uint8), c_int]
-    CS101_ASDU_addPayload.restype = c_bool
+def _load_CS101_ASDU_addPayload():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_addPayload", "cdecl"):
+        CS101_ASDU_addPayload = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_addPayload", "cdecl")
+        CS101_ASDU_addPayload.argtypes = [CS101_ASDU, POINTER(c_uint8), c_int]
+        CS101_ASDU_addPayload.restype = c_bool
+    return locals().get("CS101_ASDU_addPayload")
+_loaders["CS101_ASDU_addPayload"] = _load_CS101_ASDU_addPayload
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 457
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getPayloadSize", "cdecl"):
-    CS101_ASDU_getPayloadSize = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getPayloadSize", "cdecl")
-    CS101_ASDU_getPayloadSize.argtypes = [CS101_ASDU]
-    CS101_ASDU_getPayloadSize.restype = c_int
+def _load_CS101_ASDU_getPayloadSize():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_getPayloadSize", "cdecl"):
+        CS101_ASDU_getPayloadSize = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_getPayloadSize", "cdecl")
+        CS101_ASDU_getPayloadSize.argtypes = [CS101_ASDU]
+        CS101_ASDU_getPayloadSize.restype = c_int
+    return locals().get("CS101_ASDU_getPayloadSize")
+_loaders["CS101_ASDU_getPayloadSize"] = _load_CS101_ASDU_getPayloadSize
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 463
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_destroy", "cdecl"):
-    CS101_ASDU_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_destroy", "cdecl")
-    CS101_ASDU_destroy.argtypes = [CS101_ASDU]
-    CS101_ASDU_destroy.restype = None
+def _load_CS101_ASDU_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_destroy", "cdecl"):
+        CS101_ASDU_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_destroy", "cdecl")
+        CS101_ASDU_destroy.argtypes = [CS101_ASDU]
+        CS101_ASDU_destroy.restype = None
+    return locals().get("CS101_ASDU_destroy")
+_loaders["CS101_ASDU_destroy"] = _load_CS101_ASDU_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 476
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_addInformationObject", "cdecl"):
-    CS101_ASDU_addInformationObject = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_addInformationObject", "cdecl")
-    CS101_ASDU_addInformationObject.argtypes = [CS101_ASDU, InformationObject]
-    CS101_ASDU_addInformationObject.restype = c_bool
+def _load_CS101_ASDU_addInformationObject():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_addInformationObject", "cdecl"):
+        CS101_ASDU_addInformationObject = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_addInformationObject", "cdecl")
+        CS101_ASDU_addInformationObject.argtypes = [CS101_ASDU, InformationObject]
+        CS101_ASDU_addInformationObject.restype = c_bool
+    return locals().get("CS101_ASDU_addInformationObject")
+_loaders["CS101_ASDU_addInformationObject"] = _load_CS101_ASDU_addInformationObject
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 484
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_removeAllElements", "cdecl"):
-    CS101_ASDU_removeAllElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_removeAllElements", "cdecl")
-    CS101_ASDU_removeAllElements.argtypes = [CS101_ASDU]
-    CS101_ASDU_removeAllElements.restype = None
+def _load_CS101_ASDU_removeAllElements():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_ASDU_removeAllElements", "cdecl"):
+        CS101_ASDU_removeAllElements = _libs["/usr/local/lib/lib60870.so"].get("CS101_ASDU_removeAllElements", "cdecl")
+        CS101_ASDU_removeAllElements.argtypes = [CS101_ASDU]
+        CS101_ASDU_removeAllElements.restype = None
+    return locals().get("CS101_ASDU_removeAllElements")
+_loaders["CS101_ASDU_removeAllElements"] = _load_CS101_ASDU_removeAllElements
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 490
-if _libs["/usr/local/lib/lib60870.so"].has("CP16Time2a_getEplapsedTimeInMs", "cdecl"):
-    CP16Time2a_getEplapsedTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("CP16Time2a_getEplapsedTimeInMs", "cdecl")
-    CP16Time2a_getEplapsedTimeInMs.argtypes = [CP16Time2a]
-    CP16Time2a_getEplapsedTimeInMs.restype = c_int
+def _load_CP16Time2a_getEplapsedTimeInMs():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP16Time2a_getEplapsedTimeInMs", "cdecl"):
+        CP16Time2a_getEplapsedTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("CP16Time2a_getEplapsedTimeInMs", "cdecl")
+        CP16Time2a_getEplapsedTimeInMs.argtypes = [CP16Time2a]
+        CP16Time2a_getEplapsedTimeInMs.restype = c_int
+    return locals().get("CP16Time2a_getEplapsedTimeInMs")
+_loaders["CP16Time2a_getEplapsedTimeInMs"] = _load_CP16Time2a_getEplapsedTimeInMs
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 496
-if _libs["/usr/local/lib/lib60870.so"].has("CP16Time2a_setEplapsedTimeInMs", "cdecl"):
-    CP16Time2a_setEplapsedTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("CP16Time2a_setEplapsedTimeInMs", "cdecl")
-    CP16Time2a_setEplapsedTimeInMs.argtypes = [CP16Time2a, c_int]
-    CP16Time2a_setEplapsedTimeInMs.restype = None
+def _load_CP16Time2a_setEplapsedTimeInMs():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP16Time2a_setEplapsedTimeInMs", "cdecl"):
+        CP16Time2a_setEplapsedTimeInMs = _libs["/usr/local/lib/lib60870.so"].get("CP16Time2a_setEplapsedTimeInMs", "cdecl")
+        CP16Time2a_setEplapsedTimeInMs.argtypes = [CP16Time2a, c_int]
+        CP16Time2a_setEplapsedTimeInMs.restype = None
+    return locals().get("CP16Time2a_setEplapsedTimeInMs")
+_loaders["CP16Time2a_setEplapsedTimeInMs"] = _load_CP16Time2a_setEplapsedTimeInMs
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 502
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getMillisecond", "cdecl"):
-    CP24Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getMillisecond", "cdecl")
-    CP24Time2a_getMillisecond.argtypes = [CP24Time2a]
-    CP24Time2a_getMillisecond.restype = c_int
+def _load_CP24Time2a_getMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getMillisecond", "cdecl"):
+        CP24Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getMillisecond", "cdecl")
+        CP24Time2a_getMillisecond.argtypes = [CP24Time2a]
+        CP24Time2a_getMillisecond.restype = c_int
+    return locals().get("CP24Time2a_getMillisecond")
+_loaders["CP24Time2a_getMillisecond"] = _load_CP24Time2a_getMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 508
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setMillisecond", "cdecl"):
-    CP24Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setMillisecond", "cdecl")
-    CP24Time2a_setMillisecond.argtypes = [CP24Time2a, c_int]
-    CP24Time2a_setMillisecond.restype = None
+def _load_CP24Time2a_setMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setMillisecond", "cdecl"):
+        CP24Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setMillisecond", "cdecl")
+        CP24Time2a_setMillisecond.argtypes = [CP24Time2a, c_int]
+        CP24Time2a_setMillisecond.restype = None
+    return locals().get("CP24Time2a_setMillisecond")
+_loaders["CP24Time2a_setMillisecond"] = _load_CP24Time2a_setMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 514
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getSecond", "cdecl"):
-    CP24Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getSecond", "cdecl")
-    CP24Time2a_getSecond.argtypes = [CP24Time2a]
-    CP24Time2a_getSecond.restype = c_int
+def _load_CP24Time2a_getSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getSecond", "cdecl"):
+        CP24Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getSecond", "cdecl")
+        CP24Time2a_getSecond.argtypes = [CP24Time2a]
+        CP24Time2a_getSecond.restype = c_int
+    return locals().get("CP24Time2a_getSecond")
+_loaders["CP24Time2a_getSecond"] = _load_CP24Time2a_getSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 520
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setSecond", "cdecl"):
-    CP24Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setSecond", "cdecl")
-    CP24Time2a_setSecond.argtypes = [CP24Time2a, c_int]
-    CP24Time2a_setSecond.restype = None
+def _load_CP24Time2a_setSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setSecond", "cdecl"):
+        CP24Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setSecond", "cdecl")
+        CP24Time2a_setSecond.argtypes = [CP24Time2a, c_int]
+        CP24Time2a_setSecond.restype = None
+    return locals().get("CP24Time2a_setSecond")
+_loaders["CP24Time2a_setSecond"] = _load_CP24Time2a_setSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 526
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getMinute", "cdecl"):
-    CP24Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getMinute", "cdecl")
-    CP24Time2a_getMinute.argtypes = [CP24Time2a]
-    CP24Time2a_getMinute.restype = c_int
+def _load_CP24Time2a_getMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_getMinute", "cdecl"):
+        CP24Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_getMinute", "cdecl")
+        CP24Time2a_getMinute.argtypes = [CP24Time2a]
+        CP24Time2a_getMinute.restype = c_int
+    return locals().get("CP24Time2a_getMinute")
+_loaders["CP24Time2a_getMinute"] = _load_CP24Time2a_getMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 532
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setMinute", "cdecl"):
-    CP24Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setMinute", "cdecl")
-    CP24Time2a_setMinute.argtypes = [CP24Time2a, c_int]
-    CP24Time2a_setMinute.restype = None
+def _load_CP24Time2a_setMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setMinute", "cdecl"):
+        CP24Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setMinute", "cdecl")
+        CP24Time2a_setMinute.argtypes = [CP24Time2a, c_int]
+        CP24Time2a_setMinute.restype = None
+    return locals().get("CP24Time2a_setMinute")
+_loaders["CP24Time2a_setMinute"] = _load_CP24Time2a_setMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 538
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_isInvalid", "cdecl"):
-    CP24Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_isInvalid", "cdecl")
-    CP24Time2a_isInvalid.argtypes = [CP24Time2a]
-    CP24Time2a_isInvalid.restype = c_bool
+def _load_CP24Time2a_isInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_isInvalid", "cdecl"):
+        CP24Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_isInvalid", "cdecl")
+        CP24Time2a_isInvalid.argtypes = [CP24Time2a]
+        CP24Time2a_isInvalid.restype = c_bool
+    return locals().get("CP24Time2a_isInvalid")
+_loaders["CP24Time2a_isInvalid"] = _load_CP24Time2a_isInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 544
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setInvalid", "cdecl"):
-    CP24Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setInvalid", "cdecl")
-    CP24Time2a_setInvalid.argtypes = [CP24Time2a, c_bool]
-    CP24Time2a_setInvalid.restype = None
+def _load_CP24Time2a_setInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setInvalid", "cdecl"):
+        CP24Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setInvalid", "cdecl")
+        CP24Time2a_setInvalid.argtypes = [CP24Time2a, c_bool]
+        CP24Time2a_setInvalid.restype = None
+    return locals().get("CP24Time2a_setInvalid")
+_loaders["CP24Time2a_setInvalid"] = _load_CP24Time2a_setInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 550
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_isSubstituted", "cdecl"):
-    CP24Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_isSubstituted", "cdecl")
-    CP24Time2a_isSubstituted.argtypes = [CP24Time2a]
-    CP24Time2a_isSubstituted.restype = c_bool
+def _load_CP24Time2a_isSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_isSubstituted", "cdecl"):
+        CP24Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_isSubstituted", "cdecl")
+        CP24Time2a_isSubstituted.argtypes = [CP24Time2a]
+        CP24Time2a_isSubstituted.restype = c_bool
+    return locals().get("CP24Time2a_isSubstituted")
+_loaders["CP24Time2a_isSubstituted"] = _load_CP24Time2a_isSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 556
-if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setSubstituted", "cdecl"):
-    CP24Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setSubstituted", "cdecl")
-    CP24Time2a_setSubstituted.argtypes = [CP24Time2a, c_bool]
-    CP24Time2a_setSubstituted.restype = None
+def _load_CP24Time2a_setSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP24Time2a_setSubstituted", "cdecl"):
+        CP24Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP24Time2a_setSubstituted", "cdecl")
+        CP24Time2a_setSubstituted.argtypes = [CP24Time2a, c_bool]
+        CP24Time2a_setSubstituted.restype = None
+    return locals().get("CP24Time2a_setSubstituted")
+_loaders["CP24Time2a_setSubstituted"] = _load_CP24Time2a_setSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 562
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_createFromMsTimestamp", "cdecl"):
-    CP56Time2a_createFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_createFromMsTimestamp", "cdecl")
-    CP56Time2a_createFromMsTimestamp.argtypes = [CP56Time2a, c_uint64]
-    CP56Time2a_createFromMsTimestamp.restype = CP56Time2a
+def _load_CP56Time2a_createFromMsTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_createFromMsTimestamp", "cdecl"):
+        CP56Time2a_createFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_createFromMsTimestamp", "cdecl")
+        CP56Time2a_createFromMsTimestamp.argtypes = [CP56Time2a, c_uint64]
+        CP56Time2a_createFromMsTimestamp.restype = CP56Time2a
+    return locals().get("CP56Time2a_createFromMsTimestamp")
+_loaders["CP56Time2a_createFromMsTimestamp"] = _load_CP56Time2a_createFromMsTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 566
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_create", "cdecl"):
-    CP32Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_create", "cdecl")
-    CP32Time2a_create.argtypes = [CP32Time2a]
-    CP32Time2a_create.restype = CP32Time2a
+def _load_CP32Time2a_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_create", "cdecl"):
+        CP32Time2a_create = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_create", "cdecl")
+        CP32Time2a_create.argtypes = [CP32Time2a]
+        CP32Time2a_create.restype = CP32Time2a
+    return locals().get("CP32Time2a_create")
+_loaders["CP32Time2a_create"] = _load_CP32Time2a_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 569
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setFromMsTimestamp", "cdecl"):
-    CP32Time2a_setFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setFromMsTimestamp", "cdecl")
-    CP32Time2a_setFromMsTimestamp.argtypes = [CP32Time2a, c_uint64]
-    CP32Time2a_setFromMsTimestamp.restype = None
+def _load_CP32Time2a_setFromMsTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setFromMsTimestamp", "cdecl"):
+        CP32Time2a_setFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setFromMsTimestamp", "cdecl")
+        CP32Time2a_setFromMsTimestamp.argtypes = [CP32Time2a, c_uint64]
+        CP32Time2a_setFromMsTimestamp.restype = None
+    return locals().get("CP32Time2a_setFromMsTimestamp")
+_loaders["CP32Time2a_setFromMsTimestamp"] = _load_CP32Time2a_setFromMsTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 572
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getMillisecond", "cdecl"):
-    CP32Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getMillisecond", "cdecl")
-    CP32Time2a_getMillisecond.argtypes = [CP32Time2a]
-    CP32Time2a_getMillisecond.restype = c_int
+def _load_CP32Time2a_getMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getMillisecond", "cdecl"):
+        CP32Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getMillisecond", "cdecl")
+        CP32Time2a_getMillisecond.argtypes = [CP32Time2a]
+        CP32Time2a_getMillisecond.restype = c_int
+    return locals().get("CP32Time2a_getMillisecond")
+_loaders["CP32Time2a_getMillisecond"] = _load_CP32Time2a_getMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 575
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setMillisecond", "cdecl"):
-    CP32Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setMillisecond", "cdecl")
-    CP32Time2a_setMillisecond.argtypes = [CP32Time2a, c_int]
-    CP32Time2a_setMillisecond.restype = None
+def _load_CP32Time2a_setMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setMillisecond", "cdecl"):
+        CP32Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setMillisecond", "cdecl")
+        CP32Time2a_setMillisecond.argtypes = [CP32Time2a, c_int]
+        CP32Time2a_setMillisecond.restype = None
+    return locals().get("CP32Time2a_setMillisecond")
+_loaders["CP32Time2a_setMillisecond"] = _load_CP32Time2a_setMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 578
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getSecond", "cdecl"):
-    CP32Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getSecond", "cdecl")
-    CP32Time2a_getSecond.argtypes = [CP32Time2a]
-    CP32Time2a_getSecond.restype = c_int
+def _load_CP32Time2a_getSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getSecond", "cdecl"):
+        CP32Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getSecond", "cdecl")
+        CP32Time2a_getSecond.argtypes = [CP32Time2a]
+        CP32Time2a_getSecond.restype = c_int
+    return locals().get("CP32Time2a_getSecond")
+_loaders["CP32Time2a_getSecond"] = _load_CP32Time2a_getSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 581
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSecond", "cdecl"):
-    CP32Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSecond", "cdecl")
-    CP32Time2a_setSecond.argtypes = [CP32Time2a, c_int]
-    CP32Time2a_setSecond.restype = None
+def _load_CP32Time2a_setSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSecond", "cdecl"):
+        CP32Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSecond", "cdecl")
+        CP32Time2a_setSecond.argtypes = [CP32Time2a, c_int]
+        CP32Time2a_setSecond.restype = None
+    return locals().get("CP32Time2a_setSecond")
+_loaders["CP32Time2a_setSecond"] = _load_CP32Time2a_setSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 584
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getMinute", "cdecl"):
-    CP32Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getMinute", "cdecl")
-    CP32Time2a_getMinute.argtypes = [CP32Time2a]
-    CP32Time2a_getMinute.restype = c_int
+def _load_CP32Time2a_getMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getMinute", "cdecl"):
+        CP32Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getMinute", "cdecl")
+        CP32Time2a_getMinute.argtypes = [CP32Time2a]
+        CP32Time2a_getMinute.restype = c_int
+    return locals().get("CP32Time2a_getMinute")
+_loaders["CP32Time2a_getMinute"] = _load_CP32Time2a_getMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 588
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setMinute", "cdecl"):
-    CP32Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setMinute", "cdecl")
-    CP32Time2a_setMinute.argtypes = [CP32Time2a, c_int]
-    CP32Time2a_setMinute.restype = None
+def _load_CP32Time2a_setMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setMinute", "cdecl"):
+        CP32Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setMinute", "cdecl")
+        CP32Time2a_setMinute.argtypes = [CP32Time2a, c_int]
+        CP32Time2a_setMinute.restype = None
+    return locals().get("CP32Time2a_setMinute")
+_loaders["CP32Time2a_setMinute"] = _load_CP32Time2a_setMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 591
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isInvalid", "cdecl"):
-    CP32Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isInvalid", "cdecl")
-    CP32Time2a_isInvalid.argtypes = [CP32Time2a]
-    CP32Time2a_isInvalid.restype = c_bool
+def _load_CP32Time2a_isInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isInvalid", "cdecl"):
+        CP32Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isInvalid", "cdecl")
+        CP32Time2a_isInvalid.argtypes = [CP32Time2a]
+        CP32Time2a_isInvalid.restype = c_bool
+    return locals().get("CP32Time2a_isInvalid")
+_loaders["CP32Time2a_isInvalid"] = _load_CP32Time2a_isInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 594
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setInvalid", "cdecl"):
-    CP32Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setInvalid", "cdecl")
-    CP32Time2a_setInvalid.argtypes = [CP32Time2a, c_bool]
-    CP32Time2a_setInvalid.restype = None
+def _load_CP32Time2a_setInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setInvalid", "cdecl"):
+        CP32Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setInvalid", "cdecl")
+        CP32Time2a_setInvalid.argtypes = [CP32Time2a, c_bool]
+        CP32Time2a_setInvalid.restype = None
+    return locals().get("CP32Time2a_setInvalid")
+_loaders["CP32Time2a_setInvalid"] = _load_CP32Time2a_setInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 597
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isSubstituted", "cdecl"):
-    CP32Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isSubstituted", "cdecl")
-    CP32Time2a_isSubstituted.argtypes = [CP32Time2a]
-    CP32Time2a_isSubstituted.restype = c_bool
+def _load_CP32Time2a_isSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isSubstituted", "cdecl"):
+        CP32Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isSubstituted", "cdecl")
+        CP32Time2a_isSubstituted.argtypes = [CP32Time2a]
+        CP32Time2a_isSubstituted.restype = c_bool
+    return locals().get("CP32Time2a_isSubstituted")
+_loaders["CP32Time2a_isSubstituted"] = _load_CP32Time2a_isSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 600
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSubstituted", "cdecl"):
-    CP32Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSubstituted", "cdecl")
-    CP32Time2a_setSubstituted.argtypes = [CP32Time2a, c_bool]
-    CP32Time2a_setSubstituted.restype = None
+def _load_CP32Time2a_setSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSubstituted", "cdecl"):
+        CP32Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSubstituted", "cdecl")
+        CP32Time2a_setSubstituted.argtypes = [CP32Time2a, c_bool]
+        CP32Time2a_setSubstituted.restype = None
+    return locals().get("CP32Time2a_setSubstituted")
+_loaders["CP32Time2a_setSubstituted"] = _load_CP32Time2a_setSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 603
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getHour", "cdecl"):
-    CP32Time2a_getHour = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getHour", "cdecl")
-    CP32Time2a_getHour.argtypes = [CP32Time2a]
-    CP32Time2a_getHour.restype = c_int
+def _load_CP32Time2a_getHour():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_getHour", "cdecl"):
+        CP32Time2a_getHour = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_getHour", "cdecl")
+        CP32Time2a_getHour.argtypes = [CP32Time2a]
+        CP32Time2a_getHour.restype = c_int
+    return locals().get("CP32Time2a_getHour")
+_loaders["CP32Time2a_getHour"] = _load_CP32Time2a_getHour
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 606
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setHour", "cdecl"):
-    CP32Time2a_setHour = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setHour", "cdecl")
-    CP32Time2a_setHour.argtypes = [CP32Time2a, c_int]
-    CP32Time2a_setHour.restype = None
+def _load_CP32Time2a_setHour():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setHour", "cdecl"):
+        CP32Time2a_setHour = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setHour", "cdecl")
+        CP32Time2a_setHour.argtypes = [CP32Time2a, c_int]
+        CP32Time2a_setHour.restype = None
+    return locals().get("CP32Time2a_setHour")
+_loaders["CP32Time2a_setHour"] = _load_CP32Time2a_setHour
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 609
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isSummerTime", "cdecl"):
-    CP32Time2a_isSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isSummerTime", "cdecl")
-    CP32Time2a_isSummerTime.argtypes = [CP32Time2a]
-    CP32Time2a_isSummerTime.restype = c_bool
+def _load_CP32Time2a_isSummerTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_isSummerTime", "cdecl"):
+        CP32Time2a_isSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_isSummerTime", "cdecl")
+        CP32Time2a_isSummerTime.argtypes = [CP32Time2a]
+        CP32Time2a_isSummerTime.restype = c_bool
+    return locals().get("CP32Time2a_isSummerTime")
+_loaders["CP32Time2a_isSummerTime"] = _load_CP32Time2a_isSummerTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 612
-if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSummerTime", "cdecl"):
-    CP32Time2a_setSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSummerTime", "cdecl")
-    CP32Time2a_setSummerTime.argtypes = [CP32Time2a, c_bool]
-    CP32Time2a_setSummerTime.restype = None
+def _load_CP32Time2a_setSummerTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP32Time2a_setSummerTime", "cdecl"):
+        CP32Time2a_setSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP32Time2a_setSummerTime", "cdecl")
+        CP32Time2a_setSummerTime.argtypes = [CP32Time2a, c_bool]
+        CP32Time2a_setSummerTime.restype = None
+    return locals().get("CP32Time2a_setSummerTime")
+_loaders["CP32Time2a_setSummerTime"] = _load_CP32Time2a_setSummerTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 618
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setFromMsTimestamp", "cdecl"):
-    CP56Time2a_setFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setFromMsTimestamp", "cdecl")
-    CP56Time2a_setFromMsTimestamp.argtypes = [CP56Time2a, c_uint64]
-    CP56Time2a_setFromMsTimestamp.restype = None
+def _load_CP56Time2a_setFromMsTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setFromMsTimestamp", "cdecl"):
+        CP56Time2a_setFromMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setFromMsTimestamp", "cdecl")
+        CP56Time2a_setFromMsTimestamp.argtypes = [CP56Time2a, c_uint64]
+        CP56Time2a_setFromMsTimestamp.restype = None
+    return locals().get("CP56Time2a_setFromMsTimestamp")
+_loaders["CP56Time2a_setFromMsTimestamp"] = _load_CP56Time2a_setFromMsTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 624
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_toMsTimestamp", "cdecl"):
-    CP56Time2a_toMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_toMsTimestamp", "cdecl")
-    CP56Time2a_toMsTimestamp.argtypes = [CP56Time2a]
-    CP56Time2a_toMsTimestamp.restype = c_uint64
+def _load_CP56Time2a_toMsTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_toMsTimestamp", "cdecl"):
+        CP56Time2a_toMsTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_toMsTimestamp", "cdecl")
+        CP56Time2a_toMsTimestamp.argtypes = [CP56Time2a]
+        CP56Time2a_toMsTimestamp.restype = c_uint64
+    return locals().get("CP56Time2a_toMsTimestamp")
+_loaders["CP56Time2a_toMsTimestamp"] = _load_CP56Time2a_toMsTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 630
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMillisecond", "cdecl"):
-    CP56Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMillisecond", "cdecl")
-    CP56Time2a_getMillisecond.argtypes = [CP56Time2a]
-    CP56Time2a_getMillisecond.restype = c_int
+def _load_CP56Time2a_getMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMillisecond", "cdecl"):
+        CP56Time2a_getMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMillisecond", "cdecl")
+        CP56Time2a_getMillisecond.argtypes = [CP56Time2a]
+        CP56Time2a_getMillisecond.restype = c_int
+    return locals().get("CP56Time2a_getMillisecond")
+_loaders["CP56Time2a_getMillisecond"] = _load_CP56Time2a_getMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 636
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMillisecond", "cdecl"):
-    CP56Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMillisecond", "cdecl")
-    CP56Time2a_setMillisecond.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setMillisecond.restype = None
+def _load_CP56Time2a_setMillisecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMillisecond", "cdecl"):
+        CP56Time2a_setMillisecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMillisecond", "cdecl")
+        CP56Time2a_setMillisecond.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setMillisecond.restype = None
+    return locals().get("CP56Time2a_setMillisecond")
+_loaders["CP56Time2a_setMillisecond"] = _load_CP56Time2a_setMillisecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 639
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getSecond", "cdecl"):
-    CP56Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getSecond", "cdecl")
-    CP56Time2a_getSecond.argtypes = [CP56Time2a]
-    CP56Time2a_getSecond.restype = c_int
+def _load_CP56Time2a_getSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getSecond", "cdecl"):
+        CP56Time2a_getSecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getSecond", "cdecl")
+        CP56Time2a_getSecond.argtypes = [CP56Time2a]
+        CP56Time2a_getSecond.restype = c_int
+    return locals().get("CP56Time2a_getSecond")
+_loaders["CP56Time2a_getSecond"] = _load_CP56Time2a_getSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 642
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSecond", "cdecl"):
-    CP56Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSecond", "cdecl")
-    CP56Time2a_setSecond.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setSecond.restype = None
+def _load_CP56Time2a_setSecond():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSecond", "cdecl"):
+        CP56Time2a_setSecond = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSecond", "cdecl")
+        CP56Time2a_setSecond.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setSecond.restype = None
+    return locals().get("CP56Time2a_setSecond")
+_loaders["CP56Time2a_setSecond"] = _load_CP56Time2a_setSecond
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 645
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMinute", "cdecl"):
-    CP56Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMinute", "cdecl")
-    CP56Time2a_getMinute.argtypes = [CP56Time2a]
-    CP56Time2a_getMinute.restype = c_int
+def _load_CP56Time2a_getMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMinute", "cdecl"):
+        CP56Time2a_getMinute = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMinute", "cdecl")
+        CP56Time2a_getMinute.argtypes = [CP56Time2a]
+        CP56Time2a_getMinute.restype = c_int
+    return locals().get("CP56Time2a_getMinute")
+_loaders["CP56Time2a_getMinute"] = _load_CP56Time2a_getMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 648
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMinute", "cdecl"):
-    CP56Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMinute", "cdecl")
-    CP56Time2a_setMinute.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setMinute.restype = None
+def _load_CP56Time2a_setMinute():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMinute", "cdecl"):
+        CP56Time2a_setMinute = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMinute", "cdecl")
+        CP56Time2a_setMinute.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setMinute.restype = None
+    return locals().get("CP56Time2a_setMinute")
+_loaders["CP56Time2a_setMinute"] = _load_CP56Time2a_setMinute
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 651
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getHour", "cdecl"):
-    CP56Time2a_getHour = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getHour", "cdecl")
-    CP56Time2a_getHour.argtypes = [CP56Time2a]
-    CP56Time2a_getHour.restype = c_int
+def _load_CP56Time2a_getHour():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getHour", "cdecl"):
+        CP56Time2a_getHour = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getHour", "cdecl")
+        CP56Time2a_getHour.argtypes = [CP56Time2a]
+        CP56Time2a_getHour.restype = c_int
+    return locals().get("CP56Time2a_getHour")
+_loaders["CP56Time2a_getHour"] = _load_CP56Time2a_getHour
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 654
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setHour", "cdecl"):
-    CP56Time2a_setHour = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setHour", "cdecl")
-    CP56Time2a_setHour.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setHour.restype = None
+def _load_CP56Time2a_setHour():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setHour", "cdecl"):
+        CP56Time2a_setHour = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setHour", "cdecl")
+        CP56Time2a_setHour.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setHour.restype = None
+    return locals().get("CP56Time2a_setHour")
+_loaders["CP56Time2a_setHour"] = _load_CP56Time2a_setHour
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 657
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getDayOfWeek", "cdecl"):
-    CP56Time2a_getDayOfWeek = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getDayOfWeek", "cdecl")
-    CP56Time2a_getDayOfWeek.argtypes = [CP56Time2a]
-    CP56Time2a_getDayOfWeek.restype = c_int
+def _load_CP56Time2a_getDayOfWeek():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getDayOfWeek", "cdecl"):
+        CP56Time2a_getDayOfWeek = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getDayOfWeek", "cdecl")
+        CP56Time2a_getDayOfWeek.argtypes = [CP56Time2a]
+        CP56Time2a_getDayOfWeek.restype = c_int
+    return locals().get("CP56Time2a_getDayOfWeek")
+_loaders["CP56Time2a_getDayOfWeek"] = _load_CP56Time2a_getDayOfWeek
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 660
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setDayOfWeek", "cdecl"):
-    CP56Time2a_setDayOfWeek = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setDayOfWeek", "cdecl")
-    CP56Time2a_setDayOfWeek.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setDayOfWeek.restype = None
+def _load_CP56Time2a_setDayOfWeek():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setDayOfWeek", "cdecl"):
+        CP56Time2a_setDayOfWeek = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setDayOfWeek", "cdecl")
+        CP56Time2a_setDayOfWeek.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setDayOfWeek.restype = None
+    return locals().get("CP56Time2a_setDayOfWeek")
+_loaders["CP56Time2a_setDayOfWeek"] = _load_CP56Time2a_setDayOfWeek
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 663
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getDayOfMonth", "cdecl"):
-    CP56Time2a_getDayOfMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getDayOfMonth", "cdecl")
-    CP56Time2a_getDayOfMonth.argtypes = [CP56Time2a]
-    CP56Time2a_getDayOfMonth.restype = c_int
+def _load_CP56Time2a_getDayOfMonth():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getDayOfMonth", "cdecl"):
+        CP56Time2a_getDayOfMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getDayOfMonth", "cdecl")
+        CP56Time2a_getDayOfMonth.argtypes = [CP56Time2a]
+        CP56Time2a_getDayOfMonth.restype = c_int
+    return locals().get("CP56Time2a_getDayOfMonth")
+_loaders["CP56Time2a_getDayOfMonth"] = _load_CP56Time2a_getDayOfMonth
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 666
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setDayOfMonth", "cdecl"):
-    CP56Time2a_setDayOfMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setDayOfMonth", "cdecl")
-    CP56Time2a_setDayOfMonth.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setDayOfMonth.restype = None
+def _load_CP56Time2a_setDayOfMonth():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setDayOfMonth", "cdecl"):
+        CP56Time2a_setDayOfMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setDayOfMonth", "cdecl")
+        CP56Time2a_setDayOfMonth.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setDayOfMonth.restype = None
+    return locals().get("CP56Time2a_setDayOfMonth")
+_loaders["CP56Time2a_setDayOfMonth"] = _load_CP56Time2a_setDayOfMonth
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 674
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMonth", "cdecl"):
-    CP56Time2a_getMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMonth", "cdecl")
-    CP56Time2a_getMonth.argtypes = [CP56Time2a]
-    CP56Time2a_getMonth.restype = c_int
+def _load_CP56Time2a_getMonth():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getMonth", "cdecl"):
+        CP56Time2a_getMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getMonth", "cdecl")
+        CP56Time2a_getMonth.argtypes = [CP56Time2a]
+        CP56Time2a_getMonth.restype = c_int
+    return locals().get("CP56Time2a_getMonth")
+_loaders["CP56Time2a_getMonth"] = _load_CP56Time2a_getMonth
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 682
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMonth", "cdecl"):
-    CP56Time2a_setMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMonth", "cdecl")
-    CP56Time2a_setMonth.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setMonth.restype = None
+def _load_CP56Time2a_setMonth():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setMonth", "cdecl"):
+        CP56Time2a_setMonth = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setMonth", "cdecl")
+        CP56Time2a_setMonth.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setMonth.restype = None
+    return locals().get("CP56Time2a_setMonth")
+_loaders["CP56Time2a_setMonth"] = _load_CP56Time2a_setMonth
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 690
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getYear", "cdecl"):
-    CP56Time2a_getYear = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getYear", "cdecl")
-    CP56Time2a_getYear.argtypes = [CP56Time2a]
-    CP56Time2a_getYear.restype = c_int
+def _load_CP56Time2a_getYear():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_getYear", "cdecl"):
+        CP56Time2a_getYear = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_getYear", "cdecl")
+        CP56Time2a_getYear.argtypes = [CP56Time2a]
+        CP56Time2a_getYear.restype = c_int
+    return locals().get("CP56Time2a_getYear")
+_loaders["CP56Time2a_getYear"] = _load_CP56Time2a_getYear
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 698
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setYear", "cdecl"):
-    CP56Time2a_setYear = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setYear", "cdecl")
-    CP56Time2a_setYear.argtypes = [CP56Time2a, c_int]
-    CP56Time2a_setYear.restype = None
+def _load_CP56Time2a_setYear():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setYear", "cdecl"):
+        CP56Time2a_setYear = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setYear", "cdecl")
+        CP56Time2a_setYear.argtypes = [CP56Time2a, c_int]
+        CP56Time2a_setYear.restype = None
+    return locals().get("CP56Time2a_setYear")
+_loaders["CP56Time2a_setYear"] = _load_CP56Time2a_setYear
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 701
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isSummerTime", "cdecl"):
-    CP56Time2a_isSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isSummerTime", "cdecl")
-    CP56Time2a_isSummerTime.argtypes = [CP56Time2a]
-    CP56Time2a_isSummerTime.restype = c_bool
+def _load_CP56Time2a_isSummerTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isSummerTime", "cdecl"):
+        CP56Time2a_isSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isSummerTime", "cdecl")
+        CP56Time2a_isSummerTime.argtypes = [CP56Time2a]
+        CP56Time2a_isSummerTime.restype = c_bool
+    return locals().get("CP56Time2a_isSummerTime")
+_loaders["CP56Time2a_isSummerTime"] = _load_CP56Time2a_isSummerTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 704
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSummerTime", "cdecl"):
-    CP56Time2a_setSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSummerTime", "cdecl")
-    CP56Time2a_setSummerTime.argtypes = [CP56Time2a, c_bool]
-    CP56Time2a_setSummerTime.restype = None
+def _load_CP56Time2a_setSummerTime():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSummerTime", "cdecl"):
+        CP56Time2a_setSummerTime = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSummerTime", "cdecl")
+        CP56Time2a_setSummerTime.argtypes = [CP56Time2a, c_bool]
+        CP56Time2a_setSummerTime.restype = None
+    return locals().get("CP56Time2a_setSummerTime")
+_loaders["CP56Time2a_setSummerTime"] = _load_CP56Time2a_setSummerTime
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 707
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isInvalid", "cdecl"):
-    CP56Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isInvalid", "cdecl")
-    CP56Time2a_isInvalid.argtypes = [CP56Time2a]
-    CP56Time2a_isInvalid.restype = c_bool
+def _load_CP56Time2a_isInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isInvalid", "cdecl"):
+        CP56Time2a_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isInvalid", "cdecl")
+        CP56Time2a_isInvalid.argtypes = [CP56Time2a]
+        CP56Time2a_isInvalid.restype = c_bool
+    return locals().get("CP56Time2a_isInvalid")
+_loaders["CP56Time2a_isInvalid"] = _load_CP56Time2a_isInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 710
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setInvalid", "cdecl"):
-    CP56Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setInvalid", "cdecl")
-    CP56Time2a_setInvalid.argtypes = [CP56Time2a, c_bool]
-    CP56Time2a_setInvalid.restype = None
+def _load_CP56Time2a_setInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setInvalid", "cdecl"):
+        CP56Time2a_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setInvalid", "cdecl")
+        CP56Time2a_setInvalid.argtypes = [CP56Time2a, c_bool]
+        CP56Time2a_setInvalid.restype = None
+    return locals().get("CP56Time2a_setInvalid")
+_loaders["CP56Time2a_setInvalid"] = _load_CP56Time2a_setInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 713
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isSubstituted", "cdecl"):
-    CP56Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isSubstituted", "cdecl")
-    CP56Time2a_isSubstituted.argtypes = [CP56Time2a]
-    CP56Time2a_isSubstituted.restype = c_bool
+def _load_CP56Time2a_isSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_isSubstituted", "cdecl"):
+        CP56Time2a_isSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_isSubstituted", "cdecl")
+        CP56Time2a_isSubstituted.argtypes = [CP56Time2a]
+        CP56Time2a_isSubstituted.restype = c_bool
+    return locals().get("CP56Time2a_isSubstituted")
+_loaders["CP56Time2a_isSubstituted"] = _load_CP56Time2a_isSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 716
-if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSubstituted", "cdecl"):
-    CP56Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSubstituted", "cdecl")
-    CP56Time2a_setSubstituted.argtypes = [CP56Time2a, c_bool]
-    CP56Time2a_setSubstituted.restype = None
+def _load_CP56Time2a_setSubstituted():
+    if _libs["/usr/local/lib/lib60870.so"].has("CP56Time2a_setSubstituted", "cdecl"):
+        CP56Time2a_setSubstituted = _libs["/usr/local/lib/lib60870.so"].get("CP56Time2a_setSubstituted", "cdecl")
+        CP56Time2a_setSubstituted.argtypes = [CP56Time2a, c_bool]
+        CP56Time2a_setSubstituted.restype = None
+    return locals().get("CP56Time2a_setSubstituted")
+_loaders["CP56Time2a_setSubstituted"] = _load_CP56Time2a_setSubstituted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 719
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_create", "cdecl"):
-    BinaryCounterReading_create = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_create", "cdecl")
-    BinaryCounterReading_create.argtypes = [BinaryCounterReading, c_int32, c_int, c_bool, c_bool, c_bool]
-    BinaryCounterReading_create.restype = BinaryCounterReading
+def _load_BinaryCounterReading_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_create", "cdecl"):
+        BinaryCounterReading_create = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_create", "cdecl")
+        BinaryCounterReading_create.argtypes = [BinaryCounterReading, c_int32, c_int, c_bool, c_bool, c_bool]
+        BinaryCounterReading_create.restype = BinaryCounterReading
+    return locals().get("BinaryCounterReading_create")
+_loaders["BinaryCounterReading_create"] = _load_BinaryCounterReading_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 723
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_destroy", "cdecl"):
-    BinaryCounterReading_destroy = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_destroy", "cdecl")
-    BinaryCounterReading_destroy.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_destroy.restype = None
+def _load_BinaryCounterReading_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_destroy", "cdecl"):
+        BinaryCounterReading_destroy = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_destroy", "cdecl")
+        BinaryCounterReading_destroy.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_destroy.restype = None
+    return locals().get("BinaryCounterReading_destroy")
+_loaders["BinaryCounterReading_destroy"] = _load_BinaryCounterReading_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 726
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_getValue", "cdecl"):
-    BinaryCounterReading_getValue = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_getValue", "cdecl")
-    BinaryCounterReading_getValue.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_getValue.restype = c_int32
+def _load_BinaryCounterReading_getValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_getValue", "cdecl"):
+        BinaryCounterReading_getValue = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_getValue", "cdecl")
+        BinaryCounterReading_getValue.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_getValue.restype = c_int32
+    return locals().get("BinaryCounterReading_getValue")
+_loaders["BinaryCounterReading_getValue"] = _load_BinaryCounterReading_getValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 729
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setValue", "cdecl"):
-    BinaryCounterReading_setValue = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setValue", "cdecl")
-    BinaryCounterReading_setValue.argtypes = [BinaryCounterReading, c_int32]
-    BinaryCounterReading_setValue.restype = None
+def _load_BinaryCounterReading_setValue():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setValue", "cdecl"):
+        BinaryCounterReading_setValue = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setValue", "cdecl")
+        BinaryCounterReading_setValue.argtypes = [BinaryCounterReading, c_int32]
+        BinaryCounterReading_setValue.restype = None
+    return locals().get("BinaryCounterReading_setValue")
+_loaders["BinaryCounterReading_setValue"] = _load_BinaryCounterReading_setValue
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 732
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_getSequenceNumber", "cdecl"):
-    BinaryCounterReading_getSequenceNumber = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_getSequenceNumber", "cdecl")
-    BinaryCounterReading_getSequenceNumber.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_getSequenceNumber.restype = c_int
+def _load_BinaryCounterReading_getSequenceNumber():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_getSequenceNumber", "cdecl"):
+        BinaryCounterReading_getSequenceNumber = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_getSequenceNumber", "cdecl")
+        BinaryCounterReading_getSequenceNumber.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_getSequenceNumber.restype = c_int
+    return locals().get("BinaryCounterReading_getSequenceNumber")
+_loaders["BinaryCounterReading_getSequenceNumber"] = _load_BinaryCounterReading_getSequenceNumber
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 735
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_hasCarry", "cdecl"):
-    BinaryCounterReading_hasCarry = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_hasCarry", "cdecl")
-    BinaryCounterReading_hasCarry.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_hasCarry.restype = c_bool
+def _load_BinaryCounterReading_hasCarry():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_hasCarry", "cdecl"):
+        BinaryCounterReading_hasCarry = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_hasCarry", "cdecl")
+        BinaryCounterReading_hasCarry.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_hasCarry.restype = c_bool
+    return locals().get("BinaryCounterReading_hasCarry")
+_loaders["BinaryCounterReading_hasCarry"] = _load_BinaryCounterReading_hasCarry
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 738
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_isAdjusted", "cdecl"):
-    BinaryCounterReading_isAdjusted = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_isAdjusted", "cdecl")
-    BinaryCounterReading_isAdjusted.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_isAdjusted.restype = c_bool
+def _load_BinaryCounterReading_isAdjusted():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_isAdjusted", "cdecl"):
+        BinaryCounterReading_isAdjusted = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_isAdjusted", "cdecl")
+        BinaryCounterReading_isAdjusted.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_isAdjusted.restype = c_bool
+    return locals().get("BinaryCounterReading_isAdjusted")
+_loaders["BinaryCounterReading_isAdjusted"] = _load_BinaryCounterReading_isAdjusted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 741
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_isInvalid", "cdecl"):
-    BinaryCounterReading_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_isInvalid", "cdecl")
-    BinaryCounterReading_isInvalid.argtypes = [BinaryCounterReading]
-    BinaryCounterReading_isInvalid.restype = c_bool
+def _load_BinaryCounterReading_isInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_isInvalid", "cdecl"):
+        BinaryCounterReading_isInvalid = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_isInvalid", "cdecl")
+        BinaryCounterReading_isInvalid.argtypes = [BinaryCounterReading]
+        BinaryCounterReading_isInvalid.restype = c_bool
+    return locals().get("BinaryCounterReading_isInvalid")
+_loaders["BinaryCounterReading_isInvalid"] = _load_BinaryCounterReading_isInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 744
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setSequenceNumber", "cdecl"):
-    BinaryCounterReading_setSequenceNumber = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setSequenceNumber", "cdecl")
-    BinaryCounterReading_setSequenceNumber.argtypes = [BinaryCounterReading, c_int]
-    BinaryCounterReading_setSequenceNumber.restype = None
+def _load_BinaryCounterReading_setSequenceNumber():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setSequenceNumber", "cdecl"):
+        BinaryCounterReading_setSequenceNumber = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setSequenceNumber", "cdecl")
+        BinaryCounterReading_setSequenceNumber.argtypes = [BinaryCounterReading, c_int]
+        BinaryCounterReading_setSequenceNumber.restype = None
+    return locals().get("BinaryCounterReading_setSequenceNumber")
+_loaders["BinaryCounterReading_setSequenceNumber"] = _load_BinaryCounterReading_setSequenceNumber
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 747
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setCarry", "cdecl"):
-    BinaryCounterReading_setCarry = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setCarry", "cdecl")
-    BinaryCounterReading_setCarry.argtypes = [BinaryCounterReading, c_bool]
-    BinaryCounterReading_setCarry.restype = None
+def _load_BinaryCounterReading_setCarry():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setCarry", "cdecl"):
+        BinaryCounterReading_setCarry = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setCarry", "cdecl")
+        BinaryCounterReading_setCarry.argtypes = [BinaryCounterReading, c_bool]
+        BinaryCounterReading_setCarry.restype = None
+    return locals().get("BinaryCounterReading_setCarry")
+_loaders["BinaryCounterReading_setCarry"] = _load_BinaryCounterReading_setCarry
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 750
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setAdjusted", "cdecl"):
-    BinaryCounterReading_setAdjusted = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setAdjusted", "cdecl")
-    BinaryCounterReading_setAdjusted.argtypes = [BinaryCounterReading, c_bool]
-    BinaryCounterReading_setAdjusted.restype = None
+def _load_BinaryCounterReading_setAdjusted():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setAdjusted", "cdecl"):
+        BinaryCounterReading_setAdjusted = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setAdjusted", "cdecl")
+        BinaryCounterReading_setAdjusted.argtypes = [BinaryCounterReading, c_bool]
+        BinaryCounterReading_setAdjusted.restype = None
+    return locals().get("BinaryCounterReading_setAdjusted")
+_loaders["BinaryCounterReading_setAdjusted"] = _load_BinaryCounterReading_setAdjusted
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 753
-if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setInvalid", "cdecl"):
-    BinaryCounterReading_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setInvalid", "cdecl")
-    BinaryCounterReading_setInvalid.argtypes = [BinaryCounterReading, c_bool]
-    BinaryCounterReading_setInvalid.restype = None
+def _load_BinaryCounterReading_setInvalid():
+    if _libs["/usr/local/lib/lib60870.so"].has("BinaryCounterReading_setInvalid", "cdecl"):
+        BinaryCounterReading_setInvalid = _libs["/usr/local/lib/lib60870.so"].get("BinaryCounterReading_setInvalid", "cdecl")
+        BinaryCounterReading_setInvalid.argtypes = [BinaryCounterReading, c_bool]
+        BinaryCounterReading_setInvalid.restype = None
+    return locals().get("BinaryCounterReading_setInvalid")
+_loaders["BinaryCounterReading_setInvalid"] = _load_BinaryCounterReading_setInvalid
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 759
 class struct_sFrame(Structure):
@@ -4732,46 +6205,67 @@ class struct_sFrame(Structure):
 Frame = POINTER(struct_sFrame)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 759
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 762
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_destroy", "cdecl"):
-    Frame_destroy = _libs["/usr/local/lib/lib60870.so"].get("Frame_destroy", "cdecl")
-    Frame_destroy.argtypes = [Frame]
-    Frame_destroy.restype = None
+def _load_Frame_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_destroy", "cdecl"):
+        Frame_destroy = _libs["/usr/local/lib/lib60870.so"].get("Frame_destroy", "cdecl")
+        Frame_destroy.argtypes = [Frame]
+        Frame_destroy.restype = None
+    return locals().get("Frame_destroy")
+_loaders["Frame_destroy"] = _load_Frame_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 765
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_resetFrame", "cdecl"):
-    Frame_resetFrame = _libs["/usr/local/lib/lib60870.so"].get("Frame_resetFrame", "cdecl")
-    Frame_resetFrame.argtypes = [Frame]
-    Frame_resetFrame.restype = None
+def _load_Frame_resetFrame():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_resetFrame", "cdecl"):
+        Frame_resetFrame = _libs["/usr/local/lib/lib60870.so"].get("Frame_resetFrame", "cdecl")
+        Frame_resetFrame.argtypes = [Frame]
+        Frame_resetFrame.restype = None
+    return locals().get("Frame_resetFrame")
+_loaders["Frame_resetFrame"] = _load_Frame_resetFrame
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 768
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_setNextByte", "cdecl"):
-    Frame_setNextByte = _libs["/usr/local/lib/lib60870.so"].get("Frame_setNextByte", "cdecl")
-    Frame_setNextByte.argtypes = [Frame, c_uint8]
-    Frame_setNextByte.restype = None
+def _load_Frame_setNextByte():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_setNextByte", "cdecl"):
+        Frame_setNextByte = _libs["/usr/local/lib/lib60870.so"].get("Frame_setNextByte", "cdecl")
+        Frame_setNextByte.argtypes = [Frame, c_uint8]
+        Frame_setNextByte.restype = None
+    return locals().get("Frame_setNextByte")
+_loaders["Frame_setNextByte"] = _load_Frame_setNextByte
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 771
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_appendBytes", "cdecl"):
-    Frame_appendBytes = _libs["/usr/local/lib/lib60870.so"].get("Frame_appendBytes", "cdecl")
-    Frame_appendBytes.argtypes = [Frame, POINTER(c_uint8), c_int]
-    Frame_appendBytes.restype = None
+def _load_Frame_appendBytes():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_appendBytes", "cdecl"):
+        Frame_appendBytes = _libs["/usr/local/lib/lib60870.so"].get("Frame_appendBytes", "cdecl")
+        Frame_appendBytes.argtypes = [Frame, POINTER(c_uint8), c_int]
+        Frame_appendBytes.restype = None
+    return locals().get("Frame_appendBytes")
+_loaders["Frame_appendBytes"] = _load_Frame_appendBytes
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 774
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_getMsgSize", "cdecl"):
-    Frame_getMsgSize = _libs["/usr/local/lib/lib60870.so"].get("Frame_getMsgSize", "cdecl")
-    Frame_getMsgSize.argtypes = [Frame]
-    Frame_getMsgSize.restype = c_int
+def _load_Frame_getMsgSize():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_getMsgSize", "cdecl"):
+        Frame_getMsgSize = _libs["/usr/local/lib/lib60870.so"].get("Frame_getMsgSize", "cdecl")
+        Frame_getMsgSize.argtypes = [Frame]
+        Frame_getMsgSize.restype = c_int
+    return locals().get("Frame_getMsgSize")
+_loaders["Frame_getMsgSize"] = _load_Frame_getMsgSize
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 776
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_getBuffer", "cdecl"):
-    Frame_getBuffer = _libs["/usr/local/lib/lib60870.so"].get("Frame_getBuffer", "cdecl")
-    Frame_getBuffer.argtypes = [Frame]
-    Frame_getBuffer.restype = POINTER(c_uint8)
+def _load_Frame_getBuffer():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_getBuffer", "cdecl"):
+        Frame_getBuffer = _libs["/usr/local/lib/lib60870.so"].get("Frame_getBuffer", "cdecl")
+        Frame_getBuffer.argtypes = [Frame]
+        Frame_getBuffer.restype = POINTER(c_uint8)
+    return locals().get("Frame_getBuffer")
+_loaders["Frame_getBuffer"] = _load_Frame_getBuffer
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_common.h: 780
-if _libs["/usr/local/lib/lib60870.so"].has("Frame_getSpaceLeft", "cdecl"):
-    Frame_getSpaceLeft = _libs["/usr/local/lib/lib60870.so"].get("Frame_getSpaceLeft", "cdecl")
-    Frame_getSpaceLeft.argtypes = [Frame]
-    Frame_getSpaceLeft.restype = c_int
+def _load_Frame_getSpaceLeft():
+    if _libs["/usr/local/lib/lib60870.so"].has("Frame_getSpaceLeft", "cdecl"):
+        Frame_getSpaceLeft = _libs["/usr/local/lib/lib60870.so"].get("Frame_getSpaceLeft", "cdecl")
+        Frame_getSpaceLeft.argtypes = [Frame]
+        Frame_getSpaceLeft.restype = c_int
+    return locals().get("Frame_getSpaceLeft")
+_loaders["Frame_getSpaceLeft"] = _load_Frame_getSpaceLeft
 
 # ./lib60870-C/src/hal/inc/tls_config.h: 37
 class struct_sTLSConfiguration(Structure):
@@ -4807,46 +6301,67 @@ struct_sIMasterConnection._fields_ = [
 ]
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 90
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_isReady", "cdecl"):
-    IMasterConnection_isReady = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_isReady", "cdecl")
-    IMasterConnection_isReady.argtypes = [IMasterConnection]
-    IMasterConnection_isReady.restype = c_bool
+def _load_IMasterConnection_isReady():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_isReady", "cdecl"):
+        IMasterConnection_isReady = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_isReady", "cdecl")
+        IMasterConnection_isReady.argtypes = [IMasterConnection]
+        IMasterConnection_isReady.restype = c_bool
+    return locals().get("IMasterConnection_isReady")
+_loaders["IMasterConnection_isReady"] = _load_IMasterConnection_isReady
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 103
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendASDU", "cdecl"):
-    IMasterConnection_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendASDU", "cdecl")
-    IMasterConnection_sendASDU.argtypes = [IMasterConnection, CS101_ASDU]
-    IMasterConnection_sendASDU.restype = c_bool
+def _load_IMasterConnection_sendASDU():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendASDU", "cdecl"):
+        IMasterConnection_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendASDU", "cdecl")
+        IMasterConnection_sendASDU.argtypes = [IMasterConnection, CS101_ASDU]
+        IMasterConnection_sendASDU.restype = c_bool
+    return locals().get("IMasterConnection_sendASDU")
+_loaders["IMasterConnection_sendASDU"] = _load_IMasterConnection_sendASDU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 116
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendACT_CON", "cdecl"):
-    IMasterConnection_sendACT_CON = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendACT_CON", "cdecl")
-    IMasterConnection_sendACT_CON.argtypes = [IMasterConnection, CS101_ASDU, c_bool]
-    IMasterConnection_sendACT_CON.restype = c_bool
+def _load_IMasterConnection_sendACT_CON():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendACT_CON", "cdecl"):
+        IMasterConnection_sendACT_CON = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendACT_CON", "cdecl")
+        IMasterConnection_sendACT_CON.argtypes = [IMasterConnection, CS101_ASDU, c_bool]
+        IMasterConnection_sendACT_CON.restype = c_bool
+    return locals().get("IMasterConnection_sendACT_CON")
+_loaders["IMasterConnection_sendACT_CON"] = _load_IMasterConnection_sendACT_CON
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 128
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendACT_TERM", "cdecl"):
-    IMasterConnection_sendACT_TERM = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendACT_TERM", "cdecl")
-    IMasterConnection_sendACT_TERM.argtypes = [IMasterConnection, CS101_ASDU]
-    IMasterConnection_sendACT_TERM.restype = c_bool
+def _load_IMasterConnection_sendACT_TERM():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_sendACT_TERM", "cdecl"):
+        IMasterConnection_sendACT_TERM = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_sendACT_TERM", "cdecl")
+        IMasterConnection_sendACT_TERM.argtypes = [IMasterConnection, CS101_ASDU]
+        IMasterConnection_sendACT_TERM.restype = c_bool
+    return locals().get("IMasterConnection_sendACT_TERM")
+_loaders["IMasterConnection_sendACT_TERM"] = _load_IMasterConnection_sendACT_TERM
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 139
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_getPeerAddress", "cdecl"):
-    IMasterConnection_getPeerAddress = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_getPeerAddress", "cdecl")
-    IMasterConnection_getPeerAddress.argtypes = [IMasterConnection, String, c_int]
-    IMasterConnection_getPeerAddress.restype = c_int
+def _load_IMasterConnection_getPeerAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_getPeerAddress", "cdecl"):
+        IMasterConnection_getPeerAddress = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_getPeerAddress", "cdecl")
+        IMasterConnection_getPeerAddress.argtypes = [IMasterConnection, String, c_int]
+        IMasterConnection_getPeerAddress.restype = c_int
+    return locals().get("IMasterConnection_getPeerAddress")
+_loaders["IMasterConnection_getPeerAddress"] = _load_IMasterConnection_getPeerAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 147
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_close", "cdecl"):
-    IMasterConnection_close = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_close", "cdecl")
-    IMasterConnection_close.argtypes = [IMasterConnection]
-    IMasterConnection_close.restype = None
+def _load_IMasterConnection_close():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_close", "cdecl"):
+        IMasterConnection_close = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_close", "cdecl")
+        IMasterConnection_close.argtypes = [IMasterConnection]
+        IMasterConnection_close.restype = None
+    return locals().get("IMasterConnection_close")
+_loaders["IMasterConnection_close"] = _load_IMasterConnection_close
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 153
-if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_getApplicationLayerParameters", "cdecl"):
-    IMasterConnection_getApplicationLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_getApplicationLayerParameters", "cdecl")
-    IMasterConnection_getApplicationLayerParameters.argtypes = [IMasterConnection]
-    IMasterConnection_getApplicationLayerParameters.restype = CS101_AppLayerParameters
+def _load_IMasterConnection_getApplicationLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("IMasterConnection_getApplicationLayerParameters", "cdecl"):
+        IMasterConnection_getApplicationLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("IMasterConnection_getApplicationLayerParameters", "cdecl")
+        IMasterConnection_getApplicationLayerParameters.argtypes = [IMasterConnection]
+        IMasterConnection_getApplicationLayerParameters.restype = CS101_AppLayerParameters
+    return locals().get("IMasterConnection_getApplicationLayerParameters")
+_loaders["IMasterConnection_getApplicationLayerParameters"] = _load_IMasterConnection_getApplicationLayerParameters
 
 enum_anon_32 = c_int# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_slave.h: 171
 
@@ -4940,199 +6455,295 @@ CS104_ConnectionEventHandler = CFUNCTYPE(UNCHECKED(None), POINTER(None), IMaster
 CS104_SlaveRawMessageHandler = CFUNCTYPE(UNCHECKED(None), POINTER(None), IMasterConnection, POINTER(c_uint8), c_int, c_bool)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 106
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 118
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_create", "cdecl"):
-    CS104_Slave_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_create", "cdecl")
-    CS104_Slave_create.argtypes = [c_int, c_int]
-    CS104_Slave_create.restype = CS104_Slave
+def _load_CS104_Slave_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_create", "cdecl"):
+        CS104_Slave_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_create", "cdecl")
+        CS104_Slave_create.argtypes = [c_int, c_int]
+        CS104_Slave_create.restype = CS104_Slave
+    return locals().get("CS104_Slave_create")
+_loaders["CS104_Slave_create"] = _load_CS104_Slave_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 130
-for _lib in _libs.values():
-    if not _lib.has("CS104_Slave_createSecure", "cdecl"):
-        continue
-    CS104_Slave_createSecure = _lib.get("CS104_Slave_createSecure", "cdecl")
-    CS104_Slave_createSecure.argtypes = [c_int, c_int, TLSConfiguration]
-    CS104_Slave_createSecure.restype = CS104_Slave
-    break
+def _load_CS104_Slave_createSecure():
+    for _lib in _libs.values():
+        if not _lib.has("CS104_Slave_createSecure", "cdecl"):
+            continue
+        CS104_Slave_createSecure = _lib.get("CS104_Slave_createSecure", "cdecl")
+        CS104_Slave_createSecure.argtypes = [c_int, c_int, TLSConfiguration]
+        CS104_Slave_createSecure.restype = CS104_Slave
+        break
+    return locals().get("CS104_Slave_createSecure")
+_loaders["CS104_Slave_createSecure"] = _load_CS104_Slave_createSecure
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 133
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_addPlugin", "cdecl"):
-    CS104_Slave_addPlugin = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_addPlugin", "cdecl")
-    CS104_Slave_addPlugin.argtypes = [CS104_Slave, CS101_SlavePlugin]
-    CS104_Slave_addPlugin.restype = None
+def _load_CS104_Slave_addPlugin():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_addPlugin", "cdecl"):
+        CS104_Slave_addPlugin = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_addPlugin", "cdecl")
+        CS104_Slave_addPlugin.argtypes = [CS104_Slave, CS101_SlavePlugin]
+        CS104_Slave_addPlugin.restype = None
+    return locals().get("CS104_Slave_addPlugin")
+_loaders["CS104_Slave_addPlugin"] = _load_CS104_Slave_addPlugin
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 143
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setLocalAddress", "cdecl"):
-    CS104_Slave_setLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setLocalAddress", "cdecl")
-    CS104_Slave_setLocalAddress.argtypes = [CS104_Slave, String]
-    CS104_Slave_setLocalAddress.restype = None
+def _load_CS104_Slave_setLocalAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setLocalAddress", "cdecl"):
+        CS104_Slave_setLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setLocalAddress", "cdecl")
+        CS104_Slave_setLocalAddress.argtypes = [CS104_Slave, String]
+        CS104_Slave_setLocalAddress.restype = None
+    return locals().get("CS104_Slave_setLocalAddress")
+_loaders["CS104_Slave_setLocalAddress"] = _load_CS104_Slave_setLocalAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 152
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setLocalPort", "cdecl"):
-    CS104_Slave_setLocalPort = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setLocalPort", "cdecl")
-    CS104_Slave_setLocalPort.argtypes = [CS104_Slave, c_int]
-    CS104_Slave_setLocalPort.restype = None
+def _load_CS104_Slave_setLocalPort():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setLocalPort", "cdecl"):
+        CS104_Slave_setLocalPort = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setLocalPort", "cdecl")
+        CS104_Slave_setLocalPort.argtypes = [CS104_Slave, c_int]
+        CS104_Slave_setLocalPort.restype = None
+    return locals().get("CS104_Slave_setLocalPort")
+_loaders["CS104_Slave_setLocalPort"] = _load_CS104_Slave_setLocalPort
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 160
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getOpenConnections", "cdecl"):
-    CS104_Slave_getOpenConnections = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getOpenConnections", "cdecl")
-    CS104_Slave_getOpenConnections.argtypes = [CS104_Slave]
-    CS104_Slave_getOpenConnections.restype = c_int
+def _load_CS104_Slave_getOpenConnections():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getOpenConnections", "cdecl"):
+        CS104_Slave_getOpenConnections = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getOpenConnections", "cdecl")
+        CS104_Slave_getOpenConnections.argtypes = [CS104_Slave]
+        CS104_Slave_getOpenConnections.restype = c_int
+    return locals().get("CS104_Slave_getOpenConnections")
+_loaders["CS104_Slave_getOpenConnections"] = _load_CS104_Slave_getOpenConnections
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 171
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setMaxOpenConnections", "cdecl"):
-    CS104_Slave_setMaxOpenConnections = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setMaxOpenConnections", "cdecl")
-    CS104_Slave_setMaxOpenConnections.argtypes = [CS104_Slave, c_int]
-    CS104_Slave_setMaxOpenConnections.restype = None
+def _load_CS104_Slave_setMaxOpenConnections():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setMaxOpenConnections", "cdecl"):
+        CS104_Slave_setMaxOpenConnections = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setMaxOpenConnections", "cdecl")
+        CS104_Slave_setMaxOpenConnections.argtypes = [CS104_Slave, c_int]
+        CS104_Slave_setMaxOpenConnections.restype = None
+    return locals().get("CS104_Slave_setMaxOpenConnections")
+_loaders["CS104_Slave_setMaxOpenConnections"] = _load_CS104_Slave_setMaxOpenConnections
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 180
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setServerMode", "cdecl"):
-    CS104_Slave_setServerMode = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setServerMode", "cdecl")
-    CS104_Slave_setServerMode.argtypes = [CS104_Slave, CS104_ServerMode]
-    CS104_Slave_setServerMode.restype = None
+def _load_CS104_Slave_setServerMode():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setServerMode", "cdecl"):
+        CS104_Slave_setServerMode = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setServerMode", "cdecl")
+        CS104_Slave_setServerMode.argtypes = [CS104_Slave, CS104_ServerMode]
+        CS104_Slave_setServerMode.restype = None
+    return locals().get("CS104_Slave_setServerMode")
+_loaders["CS104_Slave_setServerMode"] = _load_CS104_Slave_setServerMode
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 194
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setConnectionRequestHandler", "cdecl"):
-    CS104_Slave_setConnectionRequestHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setConnectionRequestHandler", "cdecl")
-    CS104_Slave_setConnectionRequestHandler.argtypes = [CS104_Slave, CS104_ConnectionRequestHandler, POINTER(None)]
-    CS104_Slave_setConnectionRequestHandler.restype = None
+def _load_CS104_Slave_setConnectionRequestHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setConnectionRequestHandler", "cdecl"):
+        CS104_Slave_setConnectionRequestHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setConnectionRequestHandler", "cdecl")
+        CS104_Slave_setConnectionRequestHandler.argtypes = [CS104_Slave, CS104_ConnectionRequestHandler, POINTER(None)]
+        CS104_Slave_setConnectionRequestHandler.restype = None
+    return locals().get("CS104_Slave_setConnectionRequestHandler")
+_loaders["CS104_Slave_setConnectionRequestHandler"] = _load_CS104_Slave_setConnectionRequestHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 207
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setConnectionEventHandler", "cdecl"):
-    CS104_Slave_setConnectionEventHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setConnectionEventHandler", "cdecl")
-    CS104_Slave_setConnectionEventHandler.argtypes = [CS104_Slave, CS104_ConnectionEventHandler, POINTER(None)]
-    CS104_Slave_setConnectionEventHandler.restype = None
+def _load_CS104_Slave_setConnectionEventHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setConnectionEventHandler", "cdecl"):
+        CS104_Slave_setConnectionEventHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setConnectionEventHandler", "cdecl")
+        CS104_Slave_setConnectionEventHandler.argtypes = [CS104_Slave, CS104_ConnectionEventHandler, POINTER(None)]
+        CS104_Slave_setConnectionEventHandler.restype = None
+    return locals().get("CS104_Slave_setConnectionEventHandler")
+_loaders["CS104_Slave_setConnectionEventHandler"] = _load_CS104_Slave_setConnectionEventHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 210
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setInterrogationHandler", "cdecl"):
-    CS104_Slave_setInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setInterrogationHandler", "cdecl")
-    CS104_Slave_setInterrogationHandler.argtypes = [CS104_Slave, CS101_InterrogationHandler, POINTER(None)]
-    CS104_Slave_setInterrogationHandler.restype = None
+def _load_CS104_Slave_setInterrogationHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setInterrogationHandler", "cdecl"):
+        CS104_Slave_setInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setInterrogationHandler", "cdecl")
+        CS104_Slave_setInterrogationHandler.argtypes = [CS104_Slave, CS101_InterrogationHandler, POINTER(None)]
+        CS104_Slave_setInterrogationHandler.restype = None
+    return locals().get("CS104_Slave_setInterrogationHandler")
+_loaders["CS104_Slave_setInterrogationHandler"] = _load_CS104_Slave_setInterrogationHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 213
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setCounterInterrogationHandler", "cdecl"):
-    CS104_Slave_setCounterInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setCounterInterrogationHandler", "cdecl")
-    CS104_Slave_setCounterInterrogationHandler.argtypes = [CS104_Slave, CS101_CounterInterrogationHandler, POINTER(None)]
-    CS104_Slave_setCounterInterrogationHandler.restype = None
+def _load_CS104_Slave_setCounterInterrogationHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setCounterInterrogationHandler", "cdecl"):
+        CS104_Slave_setCounterInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setCounterInterrogationHandler", "cdecl")
+        CS104_Slave_setCounterInterrogationHandler.argtypes = [CS104_Slave, CS101_CounterInterrogationHandler, POINTER(None)]
+        CS104_Slave_setCounterInterrogationHandler.restype = None
+    return locals().get("CS104_Slave_setCounterInterrogationHandler")
+_loaders["CS104_Slave_setCounterInterrogationHandler"] = _load_CS104_Slave_setCounterInterrogationHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 219
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setReadHandler", "cdecl"):
-    CS104_Slave_setReadHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setReadHandler", "cdecl")
-    CS104_Slave_setReadHandler.argtypes = [CS104_Slave, CS101_ReadHandler, POINTER(None)]
-    CS104_Slave_setReadHandler.restype = None
+def _load_CS104_Slave_setReadHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setReadHandler", "cdecl"):
+        CS104_Slave_setReadHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setReadHandler", "cdecl")
+        CS104_Slave_setReadHandler.argtypes = [CS104_Slave, CS101_ReadHandler, POINTER(None)]
+        CS104_Slave_setReadHandler.restype = None
+    return locals().get("CS104_Slave_setReadHandler")
+_loaders["CS104_Slave_setReadHandler"] = _load_CS104_Slave_setReadHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 222
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setASDUHandler", "cdecl"):
-    CS104_Slave_setASDUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setASDUHandler", "cdecl")
-    CS104_Slave_setASDUHandler.argtypes = [CS104_Slave, CS101_ASDUHandler, POINTER(None)]
-    CS104_Slave_setASDUHandler.restype = None
+def _load_CS104_Slave_setASDUHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setASDUHandler", "cdecl"):
+        CS104_Slave_setASDUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setASDUHandler", "cdecl")
+        CS104_Slave_setASDUHandler.argtypes = [CS104_Slave, CS101_ASDUHandler, POINTER(None)]
+        CS104_Slave_setASDUHandler.restype = None
+    return locals().get("CS104_Slave_setASDUHandler")
+_loaders["CS104_Slave_setASDUHandler"] = _load_CS104_Slave_setASDUHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 225
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setClockSyncHandler", "cdecl"):
-    CS104_Slave_setClockSyncHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setClockSyncHandler", "cdecl")
-    CS104_Slave_setClockSyncHandler.argtypes = [CS104_Slave, CS101_ClockSynchronizationHandler, POINTER(None)]
-    CS104_Slave_setClockSyncHandler.restype = None
+def _load_CS104_Slave_setClockSyncHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setClockSyncHandler", "cdecl"):
+        CS104_Slave_setClockSyncHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setClockSyncHandler", "cdecl")
+        CS104_Slave_setClockSyncHandler.argtypes = [CS104_Slave, CS101_ClockSynchronizationHandler, POINTER(None)]
+        CS104_Slave_setClockSyncHandler.restype = None
+    return locals().get("CS104_Slave_setClockSyncHandler")
+_loaders["CS104_Slave_setClockSyncHandler"] = _load_CS104_Slave_setClockSyncHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 234
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setRawMessageHandler", "cdecl"):
-    CS104_Slave_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setRawMessageHandler", "cdecl")
-    CS104_Slave_setRawMessageHandler.argtypes = [CS104_Slave, CS104_SlaveRawMessageHandler, POINTER(None)]
-    CS104_Slave_setRawMessageHandler.restype = None
+def _load_CS104_Slave_setRawMessageHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_setRawMessageHandler", "cdecl"):
+        CS104_Slave_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_setRawMessageHandler", "cdecl")
+        CS104_Slave_setRawMessageHandler.argtypes = [CS104_Slave, CS104_SlaveRawMessageHandler, POINTER(None)]
+        CS104_Slave_setRawMessageHandler.restype = None
+    return locals().get("CS104_Slave_setRawMessageHandler")
+_loaders["CS104_Slave_setRawMessageHandler"] = _load_CS104_Slave_setRawMessageHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 240
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getConnectionParameters", "cdecl"):
-    CS104_Slave_getConnectionParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getConnectionParameters", "cdecl")
-    CS104_Slave_getConnectionParameters.argtypes = [CS104_Slave]
-    CS104_Slave_getConnectionParameters.restype = CS104_APCIParameters
+def _load_CS104_Slave_getConnectionParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getConnectionParameters", "cdecl"):
+        CS104_Slave_getConnectionParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getConnectionParameters", "cdecl")
+        CS104_Slave_getConnectionParameters.argtypes = [CS104_Slave]
+        CS104_Slave_getConnectionParameters.restype = CS104_APCIParameters
+    return locals().get("CS104_Slave_getConnectionParameters")
+_loaders["CS104_Slave_getConnectionParameters"] = _load_CS104_Slave_getConnectionParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 246
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getAppLayerParameters", "cdecl"):
-    CS104_Slave_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getAppLayerParameters", "cdecl")
-    CS104_Slave_getAppLayerParameters.argtypes = [CS104_Slave]
-    CS104_Slave_getAppLayerParameters.restype = CS101_AppLayerParameters
+def _load_CS104_Slave_getAppLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getAppLayerParameters", "cdecl"):
+        CS104_Slave_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getAppLayerParameters", "cdecl")
+        CS104_Slave_getAppLayerParameters.argtypes = [CS104_Slave]
+        CS104_Slave_getAppLayerParameters.restype = CS101_AppLayerParameters
+    return locals().get("CS104_Slave_getAppLayerParameters")
+_loaders["CS104_Slave_getAppLayerParameters"] = _load_CS104_Slave_getAppLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 257
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_start", "cdecl"):
-    CS104_Slave_start = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_start", "cdecl")
-    CS104_Slave_start.argtypes = [CS104_Slave]
-    CS104_Slave_start.restype = None
+def _load_CS104_Slave_start():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_start", "cdecl"):
+        CS104_Slave_start = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_start", "cdecl")
+        CS104_Slave_start.argtypes = [CS104_Slave]
+        CS104_Slave_start.restype = None
+    return locals().get("CS104_Slave_start")
+_loaders["CS104_Slave_start"] = _load_CS104_Slave_start
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 267
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_isRunning", "cdecl"):
-    CS104_Slave_isRunning = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_isRunning", "cdecl")
-    CS104_Slave_isRunning.argtypes = [CS104_Slave]
-    CS104_Slave_isRunning.restype = c_bool
+def _load_CS104_Slave_isRunning():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_isRunning", "cdecl"):
+        CS104_Slave_isRunning = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_isRunning", "cdecl")
+        CS104_Slave_isRunning.argtypes = [CS104_Slave]
+        CS104_Slave_isRunning.restype = c_bool
+    return locals().get("CS104_Slave_isRunning")
+_loaders["CS104_Slave_isRunning"] = _load_CS104_Slave_isRunning
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 276
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_stop", "cdecl"):
-    CS104_Slave_stop = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_stop", "cdecl")
-    CS104_Slave_stop.argtypes = [CS104_Slave]
-    CS104_Slave_stop.restype = None
+def _load_CS104_Slave_stop():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_stop", "cdecl"):
+        CS104_Slave_stop = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_stop", "cdecl")
+        CS104_Slave_stop.argtypes = [CS104_Slave]
+        CS104_Slave_stop.restype = None
+    return locals().get("CS104_Slave_stop")
+_loaders["CS104_Slave_stop"] = _load_CS104_Slave_stop
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 286
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_startThreadless", "cdecl"):
-    CS104_Slave_startThreadless = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_startThreadless", "cdecl")
-    CS104_Slave_startThreadless.argtypes = [CS104_Slave]
-    CS104_Slave_startThreadless.restype = None
+def _load_CS104_Slave_startThreadless():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_startThreadless", "cdecl"):
+        CS104_Slave_startThreadless = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_startThreadless", "cdecl")
+        CS104_Slave_startThreadless.argtypes = [CS104_Slave]
+        CS104_Slave_startThreadless.restype = None
+    return locals().get("CS104_Slave_startThreadless")
+_loaders["CS104_Slave_startThreadless"] = _load_CS104_Slave_startThreadless
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 295
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_stopThreadless", "cdecl"):
-    CS104_Slave_stopThreadless = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_stopThreadless", "cdecl")
-    CS104_Slave_stopThreadless.argtypes = [CS104_Slave]
-    CS104_Slave_stopThreadless.restype = None
+def _load_CS104_Slave_stopThreadless():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_stopThreadless", "cdecl"):
+        CS104_Slave_stopThreadless = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_stopThreadless", "cdecl")
+        CS104_Slave_stopThreadless.argtypes = [CS104_Slave]
+        CS104_Slave_stopThreadless.restype = None
+    return locals().get("CS104_Slave_stopThreadless")
+_loaders["CS104_Slave_stopThreadless"] = _load_CS104_Slave_stopThreadless
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 306
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_tick", "cdecl"):
-    CS104_Slave_tick = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_tick", "cdecl")
-    CS104_Slave_tick.argtypes = [CS104_Slave]
-    CS104_Slave_tick.restype = None
+def _load_CS104_Slave_tick():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_tick", "cdecl"):
+        CS104_Slave_tick = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_tick", "cdecl")
+        CS104_Slave_tick.argtypes = [CS104_Slave]
+        CS104_Slave_tick.restype = None
+    return locals().get("CS104_Slave_tick")
+_loaders["CS104_Slave_tick"] = _load_CS104_Slave_tick
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 318
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getNumberOfQueueEntries", "cdecl"):
-    CS104_Slave_getNumberOfQueueEntries = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getNumberOfQueueEntries", "cdecl")
-    CS104_Slave_getNumberOfQueueEntries.argtypes = [CS104_Slave, CS104_RedundancyGroup]
-    CS104_Slave_getNumberOfQueueEntries.restype = c_int
+def _load_CS104_Slave_getNumberOfQueueEntries():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_getNumberOfQueueEntries", "cdecl"):
+        CS104_Slave_getNumberOfQueueEntries = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_getNumberOfQueueEntries", "cdecl")
+        CS104_Slave_getNumberOfQueueEntries.argtypes = [CS104_Slave, CS104_RedundancyGroup]
+        CS104_Slave_getNumberOfQueueEntries.restype = c_int
+    return locals().get("CS104_Slave_getNumberOfQueueEntries")
+_loaders["CS104_Slave_getNumberOfQueueEntries"] = _load_CS104_Slave_getNumberOfQueueEntries
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 326
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_enqueueASDU", "cdecl"):
-    CS104_Slave_enqueueASDU = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_enqueueASDU", "cdecl")
-    CS104_Slave_enqueueASDU.argtypes = [CS104_Slave, CS101_ASDU]
-    CS104_Slave_enqueueASDU.restype = None
+def _load_CS104_Slave_enqueueASDU():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_enqueueASDU", "cdecl"):
+        CS104_Slave_enqueueASDU = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_enqueueASDU", "cdecl")
+        CS104_Slave_enqueueASDU.argtypes = [CS104_Slave, CS101_ASDU]
+        CS104_Slave_enqueueASDU.restype = None
+    return locals().get("CS104_Slave_enqueueASDU")
+_loaders["CS104_Slave_enqueueASDU"] = _load_CS104_Slave_enqueueASDU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 339
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_addRedundancyGroup", "cdecl"):
-    CS104_Slave_addRedundancyGroup = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_addRedundancyGroup", "cdecl")
-    CS104_Slave_addRedundancyGroup.argtypes = [CS104_Slave, CS104_RedundancyGroup]
-    CS104_Slave_addRedundancyGroup.restype = None
+def _load_CS104_Slave_addRedundancyGroup():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_addRedundancyGroup", "cdecl"):
+        CS104_Slave_addRedundancyGroup = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_addRedundancyGroup", "cdecl")
+        CS104_Slave_addRedundancyGroup.argtypes = [CS104_Slave, CS104_RedundancyGroup]
+        CS104_Slave_addRedundancyGroup.restype = None
+    return locals().get("CS104_Slave_addRedundancyGroup")
+_loaders["CS104_Slave_addRedundancyGroup"] = _load_CS104_Slave_addRedundancyGroup
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 345
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_destroy", "cdecl"):
-    CS104_Slave_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_destroy", "cdecl")
-    CS104_Slave_destroy.argtypes = [CS104_Slave]
-    CS104_Slave_destroy.restype = None
+def _load_CS104_Slave_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Slave_destroy", "cdecl"):
+        CS104_Slave_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_Slave_destroy", "cdecl")
+        CS104_Slave_destroy.argtypes = [CS104_Slave]
+        CS104_Slave_destroy.restype = None
+    return locals().get("CS104_Slave_destroy")
+_loaders["CS104_Slave_destroy"] = _load_CS104_Slave_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 354
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_create", "cdecl"):
-    CS104_RedundancyGroup_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_create", "cdecl")
-    CS104_RedundancyGroup_create.argtypes = [String]
-    CS104_RedundancyGroup_create.restype = CS104_RedundancyGroup
+def _load_CS104_RedundancyGroup_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_create", "cdecl"):
+        CS104_RedundancyGroup_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_create", "cdecl")
+        CS104_RedundancyGroup_create.argtypes = [String]
+        CS104_RedundancyGroup_create.restype = CS104_RedundancyGroup
+    return locals().get("CS104_RedundancyGroup_create")
+_loaders["CS104_RedundancyGroup_create"] = _load_CS104_RedundancyGroup_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 362
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_addAllowedClient", "cdecl"):
-    CS104_RedundancyGroup_addAllowedClient = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_addAllowedClient", "cdecl")
-    CS104_RedundancyGroup_addAllowedClient.argtypes = [CS104_RedundancyGroup, String]
-    CS104_RedundancyGroup_addAllowedClient.restype = None
+def _load_CS104_RedundancyGroup_addAllowedClient():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_addAllowedClient", "cdecl"):
+        CS104_RedundancyGroup_addAllowedClient = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_addAllowedClient", "cdecl")
+        CS104_RedundancyGroup_addAllowedClient.argtypes = [CS104_RedundancyGroup, String]
+        CS104_RedundancyGroup_addAllowedClient.restype = None
+    return locals().get("CS104_RedundancyGroup_addAllowedClient")
+_loaders["CS104_RedundancyGroup_addAllowedClient"] = _load_CS104_RedundancyGroup_addAllowedClient
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 371
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_addAllowedClientEx", "cdecl"):
-    CS104_RedundancyGroup_addAllowedClientEx = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_addAllowedClientEx", "cdecl")
-    CS104_RedundancyGroup_addAllowedClientEx.argtypes = [CS104_RedundancyGroup, POINTER(c_uint8), eCS104_IPAddressType]
-    CS104_RedundancyGroup_addAllowedClientEx.restype = None
+def _load_CS104_RedundancyGroup_addAllowedClientEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_addAllowedClientEx", "cdecl"):
+        CS104_RedundancyGroup_addAllowedClientEx = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_addAllowedClientEx", "cdecl")
+        CS104_RedundancyGroup_addAllowedClientEx.argtypes = [CS104_RedundancyGroup, POINTER(c_uint8), eCS104_IPAddressType]
+        CS104_RedundancyGroup_addAllowedClientEx.restype = None
+    return locals().get("CS104_RedundancyGroup_addAllowedClientEx")
+_loaders["CS104_RedundancyGroup_addAllowedClientEx"] = _load_CS104_RedundancyGroup_addAllowedClientEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_slave.h: 381
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_destroy", "cdecl"):
-    CS104_RedundancyGroup_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_destroy", "cdecl")
-    CS104_RedundancyGroup_destroy.argtypes = [CS104_RedundancyGroup]
-    CS104_RedundancyGroup_destroy.restype = None
+def _load_CS104_RedundancyGroup_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_RedundancyGroup_destroy", "cdecl"):
+        CS104_RedundancyGroup_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_RedundancyGroup_destroy", "cdecl")
+        CS104_RedundancyGroup_destroy.argtypes = [CS104_RedundancyGroup]
+        CS104_RedundancyGroup_destroy.restype = None
+    return locals().get("CS104_RedundancyGroup_destroy")
+_loaders["CS104_RedundancyGroup_destroy"] = _load_CS104_RedundancyGroup_destroy
 
 CS101_ASDUReceivedHandler = CFUNCTYPE(UNCHECKED(c_bool), POINTER(None), c_int, CS101_ASDU)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/iec60870_master.h: 53
 
@@ -5143,145 +6754,214 @@ class struct_sCS104_Connection(Structure):
 CS104_Connection = POINTER(struct_sCS104_Connection)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 52
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 63
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_create", "cdecl"):
-    CS104_Connection_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_create", "cdecl")
-    CS104_Connection_create.argtypes = [String, c_int]
-    CS104_Connection_create.restype = CS104_Connection
+def _load_CS104_Connection_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_create", "cdecl"):
+        CS104_Connection_create = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_create", "cdecl")
+        CS104_Connection_create.argtypes = [String, c_int]
+        CS104_Connection_create.restype = CS104_Connection
+    return locals().get("CS104_Connection_create")
+_loaders["CS104_Connection_create"] = _load_CS104_Connection_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 75
-for _lib in _libs.values():
-    if not _lib.has("CS104_Connection_createSecure", "cdecl"):
-        continue
-    CS104_Connection_createSecure = _lib.get("CS104_Connection_createSecure", "cdecl")
-    CS104_Connection_createSecure.argtypes = [String, c_int, TLSConfiguration]
-    CS104_Connection_createSecure.restype = CS104_Connection
-    break
+def _load_CS104_Connection_createSecure():
+    for _lib in _libs.values():
+        if not _lib.has("CS104_Connection_createSecure", "cdecl"):
+            continue
+        CS104_Connection_createSecure = _lib.get("CS104_Connection_createSecure", "cdecl")
+        CS104_Connection_createSecure.argtypes = [String, c_int, TLSConfiguration]
+        CS104_Connection_createSecure.restype = CS104_Connection
+        break
+    return locals().get("CS104_Connection_createSecure")
+_loaders["CS104_Connection_createSecure"] = _load_CS104_Connection_createSecure
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 88
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setLocalAddress", "cdecl"):
-    CS104_Connection_setLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setLocalAddress", "cdecl")
-    CS104_Connection_setLocalAddress.argtypes = [CS104_Connection, String, c_int]
-    CS104_Connection_setLocalAddress.restype = None
+def _load_CS104_Connection_setLocalAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setLocalAddress", "cdecl"):
+        CS104_Connection_setLocalAddress = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setLocalAddress", "cdecl")
+        CS104_Connection_setLocalAddress.argtypes = [CS104_Connection, String, c_int]
+        CS104_Connection_setLocalAddress.restype = None
+    return locals().get("CS104_Connection_setLocalAddress")
+_loaders["CS104_Connection_setLocalAddress"] = _load_CS104_Connection_setLocalAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 100
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setAPCIParameters", "cdecl"):
-    CS104_Connection_setAPCIParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setAPCIParameters", "cdecl")
-    CS104_Connection_setAPCIParameters.argtypes = [CS104_Connection, CS104_APCIParameters]
-    CS104_Connection_setAPCIParameters.restype = None
+def _load_CS104_Connection_setAPCIParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setAPCIParameters", "cdecl"):
+        CS104_Connection_setAPCIParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setAPCIParameters", "cdecl")
+        CS104_Connection_setAPCIParameters.argtypes = [CS104_Connection, CS104_APCIParameters]
+        CS104_Connection_setAPCIParameters.restype = None
+    return locals().get("CS104_Connection_setAPCIParameters")
+_loaders["CS104_Connection_setAPCIParameters"] = _load_CS104_Connection_setAPCIParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 106
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_getAPCIParameters", "cdecl"):
-    CS104_Connection_getAPCIParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_getAPCIParameters", "cdecl")
-    CS104_Connection_getAPCIParameters.argtypes = [CS104_Connection]
-    CS104_Connection_getAPCIParameters.restype = CS104_APCIParameters
+def _load_CS104_Connection_getAPCIParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_getAPCIParameters", "cdecl"):
+        CS104_Connection_getAPCIParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_getAPCIParameters", "cdecl")
+        CS104_Connection_getAPCIParameters.argtypes = [CS104_Connection]
+        CS104_Connection_getAPCIParameters.restype = CS104_APCIParameters
+    return locals().get("CS104_Connection_getAPCIParameters")
+_loaders["CS104_Connection_getAPCIParameters"] = _load_CS104_Connection_getAPCIParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 119
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setAppLayerParameters", "cdecl"):
-    CS104_Connection_setAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setAppLayerParameters", "cdecl")
-    CS104_Connection_setAppLayerParameters.argtypes = [CS104_Connection, CS101_AppLayerParameters]
-    CS104_Connection_setAppLayerParameters.restype = None
+def _load_CS104_Connection_setAppLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setAppLayerParameters", "cdecl"):
+        CS104_Connection_setAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setAppLayerParameters", "cdecl")
+        CS104_Connection_setAppLayerParameters.argtypes = [CS104_Connection, CS101_AppLayerParameters]
+        CS104_Connection_setAppLayerParameters.restype = None
+    return locals().get("CS104_Connection_setAppLayerParameters")
+_loaders["CS104_Connection_setAppLayerParameters"] = _load_CS104_Connection_setAppLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 131
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_getAppLayerParameters", "cdecl"):
-    CS104_Connection_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_getAppLayerParameters", "cdecl")
-    CS104_Connection_getAppLayerParameters.argtypes = [CS104_Connection]
-    CS104_Connection_getAppLayerParameters.restype = CS101_AppLayerParameters
+def _load_CS104_Connection_getAppLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_getAppLayerParameters", "cdecl"):
+        CS104_Connection_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_getAppLayerParameters", "cdecl")
+        CS104_Connection_getAppLayerParameters.argtypes = [CS104_Connection]
+        CS104_Connection_getAppLayerParameters.restype = CS101_AppLayerParameters
+    return locals().get("CS104_Connection_getAppLayerParameters")
+_loaders["CS104_Connection_getAppLayerParameters"] = _load_CS104_Connection_getAppLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 140
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setConnectTimeout", "cdecl"):
-    CS104_Connection_setConnectTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setConnectTimeout", "cdecl")
-    CS104_Connection_setConnectTimeout.argtypes = [CS104_Connection, c_int]
-    CS104_Connection_setConnectTimeout.restype = None
+def _load_CS104_Connection_setConnectTimeout():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setConnectTimeout", "cdecl"):
+        CS104_Connection_setConnectTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setConnectTimeout", "cdecl")
+        CS104_Connection_setConnectTimeout.argtypes = [CS104_Connection, c_int]
+        CS104_Connection_setConnectTimeout.restype = None
+    return locals().get("CS104_Connection_setConnectTimeout")
+_loaders["CS104_Connection_setConnectTimeout"] = _load_CS104_Connection_setConnectTimeout
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 150
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_connectAsync", "cdecl"):
-    CS104_Connection_connectAsync = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_connectAsync", "cdecl")
-    CS104_Connection_connectAsync.argtypes = [CS104_Connection]
-    CS104_Connection_connectAsync.restype = None
+def _load_CS104_Connection_connectAsync():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_connectAsync", "cdecl"):
+        CS104_Connection_connectAsync = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_connectAsync", "cdecl")
+        CS104_Connection_connectAsync.argtypes = [CS104_Connection]
+        CS104_Connection_connectAsync.restype = None
+    return locals().get("CS104_Connection_connectAsync")
+_loaders["CS104_Connection_connectAsync"] = _load_CS104_Connection_connectAsync
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 162
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_connect", "cdecl"):
-    CS104_Connection_connect = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_connect", "cdecl")
-    CS104_Connection_connect.argtypes = [CS104_Connection]
-    CS104_Connection_connect.restype = c_bool
+def _load_CS104_Connection_connect():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_connect", "cdecl"):
+        CS104_Connection_connect = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_connect", "cdecl")
+        CS104_Connection_connect.argtypes = [CS104_Connection]
+        CS104_Connection_connect.restype = c_bool
+    return locals().get("CS104_Connection_connect")
+_loaders["CS104_Connection_connect"] = _load_CS104_Connection_connect
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 171
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendStartDT", "cdecl"):
-    CS104_Connection_sendStartDT = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendStartDT", "cdecl")
-    CS104_Connection_sendStartDT.argtypes = [CS104_Connection]
-    CS104_Connection_sendStartDT.restype = None
+def _load_CS104_Connection_sendStartDT():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendStartDT", "cdecl"):
+        CS104_Connection_sendStartDT = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendStartDT", "cdecl")
+        CS104_Connection_sendStartDT.argtypes = [CS104_Connection]
+        CS104_Connection_sendStartDT.restype = None
+    return locals().get("CS104_Connection_sendStartDT")
+_loaders["CS104_Connection_sendStartDT"] = _load_CS104_Connection_sendStartDT
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 177
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendStopDT", "cdecl"):
-    CS104_Connection_sendStopDT = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendStopDT", "cdecl")
-    CS104_Connection_sendStopDT.argtypes = [CS104_Connection]
-    CS104_Connection_sendStopDT.restype = None
+def _load_CS104_Connection_sendStopDT():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendStopDT", "cdecl"):
+        CS104_Connection_sendStopDT = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendStopDT", "cdecl")
+        CS104_Connection_sendStopDT.argtypes = [CS104_Connection]
+        CS104_Connection_sendStopDT.restype = None
+    return locals().get("CS104_Connection_sendStopDT")
+_loaders["CS104_Connection_sendStopDT"] = _load_CS104_Connection_sendStopDT
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 187
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_isTransmitBufferFull", "cdecl"):
-    CS104_Connection_isTransmitBufferFull = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_isTransmitBufferFull", "cdecl")
-    CS104_Connection_isTransmitBufferFull.argtypes = [CS104_Connection]
-    CS104_Connection_isTransmitBufferFull.restype = c_bool
+def _load_CS104_Connection_isTransmitBufferFull():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_isTransmitBufferFull", "cdecl"):
+        CS104_Connection_isTransmitBufferFull = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_isTransmitBufferFull", "cdecl")
+        CS104_Connection_isTransmitBufferFull.argtypes = [CS104_Connection]
+        CS104_Connection_isTransmitBufferFull.restype = c_bool
+    return locals().get("CS104_Connection_isTransmitBufferFull")
+_loaders["CS104_Connection_isTransmitBufferFull"] = _load_CS104_Connection_isTransmitBufferFull
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 199
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendInterrogationCommand", "cdecl"):
-    CS104_Connection_sendInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendInterrogationCommand", "cdecl")
-    CS104_Connection_sendInterrogationCommand.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, QualifierOfInterrogation]
-    CS104_Connection_sendInterrogationCommand.restype = c_bool
+def _load_CS104_Connection_sendInterrogationCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendInterrogationCommand", "cdecl"):
+        CS104_Connection_sendInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendInterrogationCommand", "cdecl")
+        CS104_Connection_sendInterrogationCommand.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, QualifierOfInterrogation]
+        CS104_Connection_sendInterrogationCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendInterrogationCommand")
+_loaders["CS104_Connection_sendInterrogationCommand"] = _load_CS104_Connection_sendInterrogationCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 211
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendCounterInterrogationCommand", "cdecl"):
-    CS104_Connection_sendCounterInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendCounterInterrogationCommand", "cdecl")
-    CS104_Connection_sendCounterInterrogationCommand.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, c_uint8]
-    CS104_Connection_sendCounterInterrogationCommand.restype = c_bool
+def _load_CS104_Connection_sendCounterInterrogationCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendCounterInterrogationCommand", "cdecl"):
+        CS104_Connection_sendCounterInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendCounterInterrogationCommand", "cdecl")
+        CS104_Connection_sendCounterInterrogationCommand.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, c_uint8]
+        CS104_Connection_sendCounterInterrogationCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendCounterInterrogationCommand")
+_loaders["CS104_Connection_sendCounterInterrogationCommand"] = _load_CS104_Connection_sendCounterInterrogationCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 225
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendReadCommand", "cdecl"):
-    CS104_Connection_sendReadCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendReadCommand", "cdecl")
-    CS104_Connection_sendReadCommand.argtypes = [CS104_Connection, c_int, c_int]
-    CS104_Connection_sendReadCommand.restype = c_bool
+def _load_CS104_Connection_sendReadCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendReadCommand", "cdecl"):
+        CS104_Connection_sendReadCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendReadCommand", "cdecl")
+        CS104_Connection_sendReadCommand.argtypes = [CS104_Connection, c_int, c_int]
+        CS104_Connection_sendReadCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendReadCommand")
+_loaders["CS104_Connection_sendReadCommand"] = _load_CS104_Connection_sendReadCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 236
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendClockSyncCommand", "cdecl"):
-    CS104_Connection_sendClockSyncCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendClockSyncCommand", "cdecl")
-    CS104_Connection_sendClockSyncCommand.argtypes = [CS104_Connection, c_int, CP56Time2a]
-    CS104_Connection_sendClockSyncCommand.restype = c_bool
+def _load_CS104_Connection_sendClockSyncCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendClockSyncCommand", "cdecl"):
+        CS104_Connection_sendClockSyncCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendClockSyncCommand", "cdecl")
+        CS104_Connection_sendClockSyncCommand.argtypes = [CS104_Connection, c_int, CP56Time2a]
+        CS104_Connection_sendClockSyncCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendClockSyncCommand")
+_loaders["CS104_Connection_sendClockSyncCommand"] = _load_CS104_Connection_sendClockSyncCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 248
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendTestCommand", "cdecl"):
-    CS104_Connection_sendTestCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendTestCommand", "cdecl")
-    CS104_Connection_sendTestCommand.argtypes = [CS104_Connection, c_int]
-    CS104_Connection_sendTestCommand.restype = c_bool
+def _load_CS104_Connection_sendTestCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendTestCommand", "cdecl"):
+        CS104_Connection_sendTestCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendTestCommand", "cdecl")
+        CS104_Connection_sendTestCommand.argtypes = [CS104_Connection, c_int]
+        CS104_Connection_sendTestCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendTestCommand")
+_loaders["CS104_Connection_sendTestCommand"] = _load_CS104_Connection_sendTestCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 260
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendTestCommandWithTimestamp", "cdecl"):
-    CS104_Connection_sendTestCommandWithTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendTestCommandWithTimestamp", "cdecl")
-    CS104_Connection_sendTestCommandWithTimestamp.argtypes = [CS104_Connection, c_int, c_uint16, CP56Time2a]
-    CS104_Connection_sendTestCommandWithTimestamp.restype = c_bool
+def _load_CS104_Connection_sendTestCommandWithTimestamp():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendTestCommandWithTimestamp", "cdecl"):
+        CS104_Connection_sendTestCommandWithTimestamp = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendTestCommandWithTimestamp", "cdecl")
+        CS104_Connection_sendTestCommandWithTimestamp.argtypes = [CS104_Connection, c_int, c_uint16, CP56Time2a]
+        CS104_Connection_sendTestCommandWithTimestamp.restype = c_bool
+    return locals().get("CS104_Connection_sendTestCommandWithTimestamp")
+_loaders["CS104_Connection_sendTestCommandWithTimestamp"] = _load_CS104_Connection_sendTestCommandWithTimestamp
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 275
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendProcessCommand", "cdecl"):
-    CS104_Connection_sendProcessCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendProcessCommand", "cdecl")
-    CS104_Connection_sendProcessCommand.argtypes = [CS104_Connection, TypeID, CS101_CauseOfTransmission, c_int, InformationObject]
-    CS104_Connection_sendProcessCommand.restype = c_bool
+def _load_CS104_Connection_sendProcessCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendProcessCommand", "cdecl"):
+        CS104_Connection_sendProcessCommand = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendProcessCommand", "cdecl")
+        CS104_Connection_sendProcessCommand.argtypes = [CS104_Connection, TypeID, CS101_CauseOfTransmission, c_int, InformationObject]
+        CS104_Connection_sendProcessCommand.restype = c_bool
+    return locals().get("CS104_Connection_sendProcessCommand")
+_loaders["CS104_Connection_sendProcessCommand"] = _load_CS104_Connection_sendProcessCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 288
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendProcessCommandEx", "cdecl"):
-    CS104_Connection_sendProcessCommandEx = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendProcessCommandEx", "cdecl")
-    CS104_Connection_sendProcessCommandEx.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, InformationObject]
-    CS104_Connection_sendProcessCommandEx.restype = c_bool
+def _load_CS104_Connection_sendProcessCommandEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendProcessCommandEx", "cdecl"):
+        CS104_Connection_sendProcessCommandEx = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendProcessCommandEx", "cdecl")
+        CS104_Connection_sendProcessCommandEx.argtypes = [CS104_Connection, CS101_CauseOfTransmission, c_int, InformationObject]
+        CS104_Connection_sendProcessCommandEx.restype = c_bool
+    return locals().get("CS104_Connection_sendProcessCommandEx")
+_loaders["CS104_Connection_sendProcessCommandEx"] = _load_CS104_Connection_sendProcessCommandEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 299
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendASDU", "cdecl"):
-    CS104_Connection_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendASDU", "cdecl")
-    CS104_Connection_sendASDU.argtypes = [CS104_Connection, CS101_ASDU]
-    CS104_Connection_sendASDU.restype = c_bool
+def _load_CS104_Connection_sendASDU():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_sendASDU", "cdecl"):
+        CS104_Connection_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_sendASDU", "cdecl")
+        CS104_Connection_sendASDU.argtypes = [CS104_Connection, CS101_ASDU]
+        CS104_Connection_sendASDU.restype = c_bool
+    return locals().get("CS104_Connection_sendASDU")
+_loaders["CS104_Connection_sendASDU"] = _load_CS104_Connection_sendASDU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 308
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setASDUReceivedHandler", "cdecl"):
-    CS104_Connection_setASDUReceivedHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setASDUReceivedHandler", "cdecl")
-    CS104_Connection_setASDUReceivedHandler.argtypes = [CS104_Connection, CS101_ASDUReceivedHandler, POINTER(None)]
-    CS104_Connection_setASDUReceivedHandler.restype = None
+def _load_CS104_Connection_setASDUReceivedHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setASDUReceivedHandler", "cdecl"):
+        CS104_Connection_setASDUReceivedHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setASDUReceivedHandler", "cdecl")
+        CS104_Connection_setASDUReceivedHandler.argtypes = [CS104_Connection, CS101_ASDUReceivedHandler, POINTER(None)]
+        CS104_Connection_setASDUReceivedHandler.restype = None
+    return locals().get("CS104_Connection_setASDUReceivedHandler")
+_loaders["CS104_Connection_setASDUReceivedHandler"] = _load_CS104_Connection_setASDUReceivedHandler
 
 enum_anon_36 = c_int# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 316
 
@@ -5298,28 +6978,40 @@ CS104_ConnectionEvent = enum_anon_36# /home/user/Desktop/scada/lib60870/lib60870
 CS104_ConnectionHandler = CFUNCTYPE(UNCHECKED(None), POINTER(None), CS104_Connection, CS104_ConnectionEvent)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 325
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 334
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setConnectionHandler", "cdecl"):
-    CS104_Connection_setConnectionHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setConnectionHandler", "cdecl")
-    CS104_Connection_setConnectionHandler.argtypes = [CS104_Connection, CS104_ConnectionHandler, POINTER(None)]
-    CS104_Connection_setConnectionHandler.restype = None
+def _load_CS104_Connection_setConnectionHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setConnectionHandler", "cdecl"):
+        CS104_Connection_setConnectionHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setConnectionHandler", "cdecl")
+        CS104_Connection_setConnectionHandler.argtypes = [CS104_Connection, CS104_ConnectionHandler, POINTER(None)]
+        CS104_Connection_setConnectionHandler.restype = None
+    return locals().get("CS104_Connection_setConnectionHandler")
+_loaders["CS104_Connection_setConnectionHandler"] = _load_CS104_Connection_setConnectionHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 344
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setRawMessageHandler", "cdecl"):
-    CS104_Connection_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setRawMessageHandler", "cdecl")
-    CS104_Connection_setRawMessageHandler.argtypes = [CS104_Connection, IEC60870_RawMessageHandler, POINTER(None)]
-    CS104_Connection_setRawMessageHandler.restype = None
+def _load_CS104_Connection_setRawMessageHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_setRawMessageHandler", "cdecl"):
+        CS104_Connection_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_setRawMessageHandler", "cdecl")
+        CS104_Connection_setRawMessageHandler.argtypes = [CS104_Connection, IEC60870_RawMessageHandler, POINTER(None)]
+        CS104_Connection_setRawMessageHandler.restype = None
+    return locals().get("CS104_Connection_setRawMessageHandler")
+_loaders["CS104_Connection_setRawMessageHandler"] = _load_CS104_Connection_setRawMessageHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 350
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_close", "cdecl"):
-    CS104_Connection_close = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_close", "cdecl")
-    CS104_Connection_close.argtypes = [CS104_Connection]
-    CS104_Connection_close.restype = None
+def _load_CS104_Connection_close():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_close", "cdecl"):
+        CS104_Connection_close = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_close", "cdecl")
+        CS104_Connection_close.argtypes = [CS104_Connection]
+        CS104_Connection_close.restype = None
+    return locals().get("CS104_Connection_close")
+_loaders["CS104_Connection_close"] = _load_CS104_Connection_close
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs104_connection.h: 356
-if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_destroy", "cdecl"):
-    CS104_Connection_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_destroy", "cdecl")
-    CS104_Connection_destroy.argtypes = [CS104_Connection]
-    CS104_Connection_destroy.restype = None
+def _load_CS104_Connection_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS104_Connection_destroy", "cdecl"):
+        CS104_Connection_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS104_Connection_destroy", "cdecl")
+        CS104_Connection_destroy.argtypes = [CS104_Connection]
+        CS104_Connection_destroy.restype = None
+    return locals().get("CS104_Connection_destroy")
+_loaders["CS104_Connection_destroy"] = _load_CS104_Connection_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/link_layer_parameters.h: 42
 class struct_sLinkLayerParameters(Structure):
@@ -5347,160 +7039,238 @@ class struct_sCS101_Master(Structure):
 CS101_Master = POINTER(struct_sCS101_Master)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 55
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 68
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_create", "cdecl"):
-    CS101_Master_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_create", "cdecl")
-    CS101_Master_create.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode]
-    CS101_Master_create.restype = CS101_Master
+def _load_CS101_Master_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_create", "cdecl"):
+        CS101_Master_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_create", "cdecl")
+        CS101_Master_create.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode]
+        CS101_Master_create.restype = CS101_Master
+    return locals().get("CS101_Master_create")
+_loaders["CS101_Master_create"] = _load_CS101_Master_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 82
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_createEx", "cdecl"):
-    CS101_Master_createEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_createEx", "cdecl")
-    CS101_Master_createEx.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode, c_int]
-    CS101_Master_createEx.restype = CS101_Master
+def _load_CS101_Master_createEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_createEx", "cdecl"):
+        CS101_Master_createEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_createEx", "cdecl")
+        CS101_Master_createEx.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode, c_int]
+        CS101_Master_createEx.restype = CS101_Master
+    return locals().get("CS101_Master_createEx")
+_loaders["CS101_Master_createEx"] = _load_CS101_Master_createEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 92
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_run", "cdecl"):
-    CS101_Master_run = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_run", "cdecl")
-    CS101_Master_run.argtypes = [CS101_Master]
-    CS101_Master_run.restype = None
+def _load_CS101_Master_run():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_run", "cdecl"):
+        CS101_Master_run = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_run", "cdecl")
+        CS101_Master_run.argtypes = [CS101_Master]
+        CS101_Master_run.restype = None
+    return locals().get("CS101_Master_run")
+_loaders["CS101_Master_run"] = _load_CS101_Master_run
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 104
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_start", "cdecl"):
-    CS101_Master_start = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_start", "cdecl")
-    CS101_Master_start.argtypes = [CS101_Master]
-    CS101_Master_start.restype = None
+def _load_CS101_Master_start():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_start", "cdecl"):
+        CS101_Master_start = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_start", "cdecl")
+        CS101_Master_start.argtypes = [CS101_Master]
+        CS101_Master_start.restype = None
+    return locals().get("CS101_Master_start")
+_loaders["CS101_Master_start"] = _load_CS101_Master_start
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 112
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_stop", "cdecl"):
-    CS101_Master_stop = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_stop", "cdecl")
-    CS101_Master_stop.argtypes = [CS101_Master]
-    CS101_Master_stop.restype = None
+def _load_CS101_Master_stop():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_stop", "cdecl"):
+        CS101_Master_stop = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_stop", "cdecl")
+        CS101_Master_stop.argtypes = [CS101_Master]
+        CS101_Master_stop.restype = None
+    return locals().get("CS101_Master_stop")
+_loaders["CS101_Master_stop"] = _load_CS101_Master_stop
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 124
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_addSlave", "cdecl"):
-    CS101_Master_addSlave = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_addSlave", "cdecl")
-    CS101_Master_addSlave.argtypes = [CS101_Master, c_int]
-    CS101_Master_addSlave.restype = None
+def _load_CS101_Master_addSlave():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_addSlave", "cdecl"):
+        CS101_Master_addSlave = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_addSlave", "cdecl")
+        CS101_Master_addSlave.argtypes = [CS101_Master, c_int]
+        CS101_Master_addSlave.restype = None
+    return locals().get("CS101_Master_addSlave")
+_loaders["CS101_Master_addSlave"] = _load_CS101_Master_addSlave
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 138
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_pollSingleSlave", "cdecl"):
-    CS101_Master_pollSingleSlave = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_pollSingleSlave", "cdecl")
-    CS101_Master_pollSingleSlave.argtypes = [CS101_Master, c_int]
-    CS101_Master_pollSingleSlave.restype = None
+def _load_CS101_Master_pollSingleSlave():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_pollSingleSlave", "cdecl"):
+        CS101_Master_pollSingleSlave = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_pollSingleSlave", "cdecl")
+        CS101_Master_pollSingleSlave.argtypes = [CS101_Master, c_int]
+        CS101_Master_pollSingleSlave.restype = None
+    return locals().get("CS101_Master_pollSingleSlave")
+_loaders["CS101_Master_pollSingleSlave"] = _load_CS101_Master_pollSingleSlave
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 144
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_destroy", "cdecl"):
-    CS101_Master_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_destroy", "cdecl")
-    CS101_Master_destroy.argtypes = [CS101_Master]
-    CS101_Master_destroy.restype = None
+def _load_CS101_Master_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_destroy", "cdecl"):
+        CS101_Master_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_destroy", "cdecl")
+        CS101_Master_destroy.argtypes = [CS101_Master]
+        CS101_Master_destroy.restype = None
+    return locals().get("CS101_Master_destroy")
+_loaders["CS101_Master_destroy"] = _load_CS101_Master_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 155
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setDIR", "cdecl"):
-    CS101_Master_setDIR = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setDIR", "cdecl")
-    CS101_Master_setDIR.argtypes = [CS101_Master, c_bool]
-    CS101_Master_setDIR.restype = None
+def _load_CS101_Master_setDIR():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setDIR", "cdecl"):
+        CS101_Master_setDIR = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setDIR", "cdecl")
+        CS101_Master_setDIR.argtypes = [CS101_Master, c_bool]
+        CS101_Master_setDIR.restype = None
+    return locals().get("CS101_Master_setDIR")
+_loaders["CS101_Master_setDIR"] = _load_CS101_Master_setDIR
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 163
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setOwnAddress", "cdecl"):
-    CS101_Master_setOwnAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setOwnAddress", "cdecl")
-    CS101_Master_setOwnAddress.argtypes = [CS101_Master, c_int]
-    CS101_Master_setOwnAddress.restype = None
+def _load_CS101_Master_setOwnAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setOwnAddress", "cdecl"):
+        CS101_Master_setOwnAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setOwnAddress", "cdecl")
+        CS101_Master_setOwnAddress.argtypes = [CS101_Master, c_int]
+        CS101_Master_setOwnAddress.restype = None
+    return locals().get("CS101_Master_setOwnAddress")
+_loaders["CS101_Master_setOwnAddress"] = _load_CS101_Master_setOwnAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 175
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_useSlaveAddress", "cdecl"):
-    CS101_Master_useSlaveAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_useSlaveAddress", "cdecl")
-    CS101_Master_useSlaveAddress.argtypes = [CS101_Master, c_int]
-    CS101_Master_useSlaveAddress.restype = None
+def _load_CS101_Master_useSlaveAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_useSlaveAddress", "cdecl"):
+        CS101_Master_useSlaveAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_useSlaveAddress", "cdecl")
+        CS101_Master_useSlaveAddress.argtypes = [CS101_Master, c_int]
+        CS101_Master_useSlaveAddress.restype = None
+    return locals().get("CS101_Master_useSlaveAddress")
+_loaders["CS101_Master_useSlaveAddress"] = _load_CS101_Master_useSlaveAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 185
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_getAppLayerParameters", "cdecl"):
-    CS101_Master_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_getAppLayerParameters", "cdecl")
-    CS101_Master_getAppLayerParameters.argtypes = [CS101_Master]
-    CS101_Master_getAppLayerParameters.restype = CS101_AppLayerParameters
+def _load_CS101_Master_getAppLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_getAppLayerParameters", "cdecl"):
+        CS101_Master_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_getAppLayerParameters", "cdecl")
+        CS101_Master_getAppLayerParameters.argtypes = [CS101_Master]
+        CS101_Master_getAppLayerParameters.restype = CS101_AppLayerParameters
+    return locals().get("CS101_Master_getAppLayerParameters")
+_loaders["CS101_Master_getAppLayerParameters"] = _load_CS101_Master_getAppLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 193
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_getLinkLayerParameters", "cdecl"):
-    CS101_Master_getLinkLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_getLinkLayerParameters", "cdecl")
-    CS101_Master_getLinkLayerParameters.argtypes = [CS101_Master]
-    CS101_Master_getLinkLayerParameters.restype = LinkLayerParameters
+def _load_CS101_Master_getLinkLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_getLinkLayerParameters", "cdecl"):
+        CS101_Master_getLinkLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_getLinkLayerParameters", "cdecl")
+        CS101_Master_getLinkLayerParameters.argtypes = [CS101_Master]
+        CS101_Master_getLinkLayerParameters.restype = LinkLayerParameters
+    return locals().get("CS101_Master_getLinkLayerParameters")
+_loaders["CS101_Master_getLinkLayerParameters"] = _load_CS101_Master_getLinkLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 206
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_isChannelReady", "cdecl"):
-    CS101_Master_isChannelReady = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_isChannelReady", "cdecl")
-    CS101_Master_isChannelReady.argtypes = [CS101_Master, c_int]
-    CS101_Master_isChannelReady.restype = c_bool
+def _load_CS101_Master_isChannelReady():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_isChannelReady", "cdecl"):
+        CS101_Master_isChannelReady = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_isChannelReady", "cdecl")
+        CS101_Master_isChannelReady.argtypes = [CS101_Master, c_int]
+        CS101_Master_isChannelReady.restype = c_bool
+    return locals().get("CS101_Master_isChannelReady")
+_loaders["CS101_Master_isChannelReady"] = _load_CS101_Master_isChannelReady
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 215
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendLinkLayerTestFunction", "cdecl"):
-    CS101_Master_sendLinkLayerTestFunction = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendLinkLayerTestFunction", "cdecl")
-    CS101_Master_sendLinkLayerTestFunction.argtypes = [CS101_Master]
-    CS101_Master_sendLinkLayerTestFunction.restype = None
+def _load_CS101_Master_sendLinkLayerTestFunction():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendLinkLayerTestFunction", "cdecl"):
+        CS101_Master_sendLinkLayerTestFunction = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendLinkLayerTestFunction", "cdecl")
+        CS101_Master_sendLinkLayerTestFunction.argtypes = [CS101_Master]
+        CS101_Master_sendLinkLayerTestFunction.restype = None
+    return locals().get("CS101_Master_sendLinkLayerTestFunction")
+_loaders["CS101_Master_sendLinkLayerTestFunction"] = _load_CS101_Master_sendLinkLayerTestFunction
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 225
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendInterrogationCommand", "cdecl"):
-    CS101_Master_sendInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendInterrogationCommand", "cdecl")
-    CS101_Master_sendInterrogationCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, QualifierOfInterrogation]
-    CS101_Master_sendInterrogationCommand.restype = None
+def _load_CS101_Master_sendInterrogationCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendInterrogationCommand", "cdecl"):
+        CS101_Master_sendInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendInterrogationCommand", "cdecl")
+        CS101_Master_sendInterrogationCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, QualifierOfInterrogation]
+        CS101_Master_sendInterrogationCommand.restype = None
+    return locals().get("CS101_Master_sendInterrogationCommand")
+_loaders["CS101_Master_sendInterrogationCommand"] = _load_CS101_Master_sendInterrogationCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 235
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendCounterInterrogationCommand", "cdecl"):
-    CS101_Master_sendCounterInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendCounterInterrogationCommand", "cdecl")
-    CS101_Master_sendCounterInterrogationCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, c_uint8]
-    CS101_Master_sendCounterInterrogationCommand.restype = None
+def _load_CS101_Master_sendCounterInterrogationCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendCounterInterrogationCommand", "cdecl"):
+        CS101_Master_sendCounterInterrogationCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendCounterInterrogationCommand", "cdecl")
+        CS101_Master_sendCounterInterrogationCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, c_uint8]
+        CS101_Master_sendCounterInterrogationCommand.restype = None
+    return locals().get("CS101_Master_sendCounterInterrogationCommand")
+_loaders["CS101_Master_sendCounterInterrogationCommand"] = _load_CS101_Master_sendCounterInterrogationCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 247
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendReadCommand", "cdecl"):
-    CS101_Master_sendReadCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendReadCommand", "cdecl")
-    CS101_Master_sendReadCommand.argtypes = [CS101_Master, c_int, c_int]
-    CS101_Master_sendReadCommand.restype = None
+def _load_CS101_Master_sendReadCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendReadCommand", "cdecl"):
+        CS101_Master_sendReadCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendReadCommand", "cdecl")
+        CS101_Master_sendReadCommand.argtypes = [CS101_Master, c_int, c_int]
+        CS101_Master_sendReadCommand.restype = None
+    return locals().get("CS101_Master_sendReadCommand")
+_loaders["CS101_Master_sendReadCommand"] = _load_CS101_Master_sendReadCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 256
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendClockSyncCommand", "cdecl"):
-    CS101_Master_sendClockSyncCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendClockSyncCommand", "cdecl")
-    CS101_Master_sendClockSyncCommand.argtypes = [CS101_Master, c_int, CP56Time2a]
-    CS101_Master_sendClockSyncCommand.restype = None
+def _load_CS101_Master_sendClockSyncCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendClockSyncCommand", "cdecl"):
+        CS101_Master_sendClockSyncCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendClockSyncCommand", "cdecl")
+        CS101_Master_sendClockSyncCommand.argtypes = [CS101_Master, c_int, CP56Time2a]
+        CS101_Master_sendClockSyncCommand.restype = None
+    return locals().get("CS101_Master_sendClockSyncCommand")
+_loaders["CS101_Master_sendClockSyncCommand"] = _load_CS101_Master_sendClockSyncCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 266
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendTestCommand", "cdecl"):
-    CS101_Master_sendTestCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendTestCommand", "cdecl")
-    CS101_Master_sendTestCommand.argtypes = [CS101_Master, c_int]
-    CS101_Master_sendTestCommand.restype = None
+def _load_CS101_Master_sendTestCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendTestCommand", "cdecl"):
+        CS101_Master_sendTestCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendTestCommand", "cdecl")
+        CS101_Master_sendTestCommand.argtypes = [CS101_Master, c_int]
+        CS101_Master_sendTestCommand.restype = None
+    return locals().get("CS101_Master_sendTestCommand")
+_loaders["CS101_Master_sendTestCommand"] = _load_CS101_Master_sendTestCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 277
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendProcessCommand", "cdecl"):
-    CS101_Master_sendProcessCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendProcessCommand", "cdecl")
-    CS101_Master_sendProcessCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, InformationObject]
-    CS101_Master_sendProcessCommand.restype = None
+def _load_CS101_Master_sendProcessCommand():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendProcessCommand", "cdecl"):
+        CS101_Master_sendProcessCommand = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendProcessCommand", "cdecl")
+        CS101_Master_sendProcessCommand.argtypes = [CS101_Master, CS101_CauseOfTransmission, c_int, InformationObject]
+        CS101_Master_sendProcessCommand.restype = None
+    return locals().get("CS101_Master_sendProcessCommand")
+_loaders["CS101_Master_sendProcessCommand"] = _load_CS101_Master_sendProcessCommand
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 293
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendASDU", "cdecl"):
-    CS101_Master_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendASDU", "cdecl")
-    CS101_Master_sendASDU.argtypes = [CS101_Master, CS101_ASDU]
-    CS101_Master_sendASDU.restype = None
+def _load_CS101_Master_sendASDU():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_sendASDU", "cdecl"):
+        CS101_Master_sendASDU = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_sendASDU", "cdecl")
+        CS101_Master_sendASDU.argtypes = [CS101_Master, CS101_ASDU]
+        CS101_Master_sendASDU.restype = None
+    return locals().get("CS101_Master_sendASDU")
+_loaders["CS101_Master_sendASDU"] = _load_CS101_Master_sendASDU
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 302
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setASDUReceivedHandler", "cdecl"):
-    CS101_Master_setASDUReceivedHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setASDUReceivedHandler", "cdecl")
-    CS101_Master_setASDUReceivedHandler.argtypes = [CS101_Master, CS101_ASDUReceivedHandler, POINTER(None)]
-    CS101_Master_setASDUReceivedHandler.restype = None
+def _load_CS101_Master_setASDUReceivedHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setASDUReceivedHandler", "cdecl"):
+        CS101_Master_setASDUReceivedHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setASDUReceivedHandler", "cdecl")
+        CS101_Master_setASDUReceivedHandler.argtypes = [CS101_Master, CS101_ASDUReceivedHandler, POINTER(None)]
+        CS101_Master_setASDUReceivedHandler.restype = None
+    return locals().get("CS101_Master_setASDUReceivedHandler")
+_loaders["CS101_Master_setASDUReceivedHandler"] = _load_CS101_Master_setASDUReceivedHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 308
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setLinkLayerStateChanged", "cdecl"):
-    CS101_Master_setLinkLayerStateChanged = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setLinkLayerStateChanged", "cdecl")
-    CS101_Master_setLinkLayerStateChanged.argtypes = [CS101_Master, IEC60870_LinkLayerStateChangedHandler, POINTER(None)]
-    CS101_Master_setLinkLayerStateChanged.restype = None
+def _load_CS101_Master_setLinkLayerStateChanged():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setLinkLayerStateChanged", "cdecl"):
+        CS101_Master_setLinkLayerStateChanged = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setLinkLayerStateChanged", "cdecl")
+        CS101_Master_setLinkLayerStateChanged.argtypes = [CS101_Master, IEC60870_LinkLayerStateChangedHandler, POINTER(None)]
+        CS101_Master_setLinkLayerStateChanged.restype = None
+    return locals().get("CS101_Master_setLinkLayerStateChanged")
+_loaders["CS101_Master_setLinkLayerStateChanged"] = _load_CS101_Master_setLinkLayerStateChanged
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 317
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setRawMessageHandler", "cdecl"):
-    CS101_Master_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setRawMessageHandler", "cdecl")
-    CS101_Master_setRawMessageHandler.argtypes = [CS101_Master, IEC60870_RawMessageHandler, POINTER(None)]
-    CS101_Master_setRawMessageHandler.restype = None
+def _load_CS101_Master_setRawMessageHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setRawMessageHandler", "cdecl"):
+        CS101_Master_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setRawMessageHandler", "cdecl")
+        CS101_Master_setRawMessageHandler.argtypes = [CS101_Master, IEC60870_RawMessageHandler, POINTER(None)]
+        CS101_Master_setRawMessageHandler.restype = None
+    return locals().get("CS101_Master_setRawMessageHandler")
+_loaders["CS101_Master_setRawMessageHandler"] = _load_CS101_Master_setRawMessageHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_master.h: 328
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setIdleTimeout", "cdecl"):
-    CS101_Master_setIdleTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setIdleTimeout", "cdecl")
-    CS101_Master_setIdleTimeout.argtypes = [CS101_Master, c_int]
-    CS101_Master_setIdleTimeout.restype = None
+def _load_CS101_Master_setIdleTimeout():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Master_setIdleTimeout", "cdecl"):
+        CS101_Master_setIdleTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS101_Master_setIdleTimeout", "cdecl")
+        CS101_Master_setIdleTimeout.argtypes = [CS101_Master, c_int]
+        CS101_Master_setIdleTimeout.restype = None
+    return locals().get("CS101_Master_setIdleTimeout")
+_loaders["CS101_Master_setIdleTimeout"] = _load_CS101_Master_setIdleTimeout
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 59
 class struct_sCS101_Slave(Structure):
@@ -5509,172 +7279,256 @@ class struct_sCS101_Slave(Structure):
 CS101_Slave = POINTER(struct_sCS101_Slave)# /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 59
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 75
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_create", "cdecl"):
-    CS101_Slave_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_create", "cdecl")
-    CS101_Slave_create.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode]
-    CS101_Slave_create.restype = CS101_Slave
+def _load_CS101_Slave_create():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_create", "cdecl"):
+        CS101_Slave_create = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_create", "cdecl")
+        CS101_Slave_create.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode]
+        CS101_Slave_create.restype = CS101_Slave
+    return locals().get("CS101_Slave_create")
+_loaders["CS101_Slave_create"] = _load_CS101_Slave_create
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 92
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_createEx", "cdecl"):
-    CS101_Slave_createEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_createEx", "cdecl")
-    CS101_Slave_createEx.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode, c_int, c_int]
-    CS101_Slave_createEx.restype = CS101_Slave
+def _load_CS101_Slave_createEx():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_createEx", "cdecl"):
+        CS101_Slave_createEx = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_createEx", "cdecl")
+        CS101_Slave_createEx.argtypes = [SerialPort, LinkLayerParameters, CS101_AppLayerParameters, IEC60870_LinkLayerMode, c_int, c_int]
+        CS101_Slave_createEx.restype = CS101_Slave
+    return locals().get("CS101_Slave_createEx")
+_loaders["CS101_Slave_createEx"] = _load_CS101_Slave_createEx
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 101
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_destroy", "cdecl"):
-    CS101_Slave_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_destroy", "cdecl")
-    CS101_Slave_destroy.argtypes = [CS101_Slave]
-    CS101_Slave_destroy.restype = None
+def _load_CS101_Slave_destroy():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_destroy", "cdecl"):
+        CS101_Slave_destroy = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_destroy", "cdecl")
+        CS101_Slave_destroy.argtypes = [CS101_Slave]
+        CS101_Slave_destroy.restype = None
+    return locals().get("CS101_Slave_destroy")
+_loaders["CS101_Slave_destroy"] = _load_CS101_Slave_destroy
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 112
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setDIR", "cdecl"):
-    CS101_Slave_setDIR = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setDIR", "cdecl")
-    CS101_Slave_setDIR.argtypes = [CS101_Slave, c_bool]
-    CS101_Slave_setDIR.restype = None
+def _load_CS101_Slave_setDIR():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setDIR", "cdecl"):
+        CS101_Slave_setDIR = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setDIR", "cdecl")
+        CS101_Slave_setDIR.argtypes = [CS101_Slave, c_bool]
+        CS101_Slave_setDIR.restype = None
+    return locals().get("CS101_Slave_setDIR")
+_loaders["CS101_Slave_setDIR"] = _load_CS101_Slave_setDIR
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 120
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_addPlugin", "cdecl"):
-    CS101_Slave_addPlugin = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_addPlugin", "cdecl")
-    CS101_Slave_addPlugin.argtypes = [CS101_Slave, CS101_SlavePlugin]
-    CS101_Slave_addPlugin.restype = None
+def _load_CS101_Slave_addPlugin():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_addPlugin", "cdecl"):
+        CS101_Slave_addPlugin = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_addPlugin", "cdecl")
+        CS101_Slave_addPlugin.argtypes = [CS101_Slave, CS101_SlavePlugin]
+        CS101_Slave_addPlugin.restype = None
+    return locals().get("CS101_Slave_addPlugin")
+_loaders["CS101_Slave_addPlugin"] = _load_CS101_Slave_addPlugin
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 131
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setIdleTimeout", "cdecl"):
-    CS101_Slave_setIdleTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setIdleTimeout", "cdecl")
-    CS101_Slave_setIdleTimeout.argtypes = [CS101_Slave, c_int]
-    CS101_Slave_setIdleTimeout.restype = None
+def _load_CS101_Slave_setIdleTimeout():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setIdleTimeout", "cdecl"):
+        CS101_Slave_setIdleTimeout = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setIdleTimeout", "cdecl")
+        CS101_Slave_setIdleTimeout.argtypes = [CS101_Slave, c_int]
+        CS101_Slave_setIdleTimeout.restype = None
+    return locals().get("CS101_Slave_setIdleTimeout")
+_loaders["CS101_Slave_setIdleTimeout"] = _load_CS101_Slave_setIdleTimeout
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 137
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerStateChanged", "cdecl"):
-    CS101_Slave_setLinkLayerStateChanged = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerStateChanged", "cdecl")
-    CS101_Slave_setLinkLayerStateChanged.argtypes = [CS101_Slave, IEC60870_LinkLayerStateChangedHandler, POINTER(None)]
-    CS101_Slave_setLinkLayerStateChanged.restype = None
+def _load_CS101_Slave_setLinkLayerStateChanged():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerStateChanged", "cdecl"):
+        CS101_Slave_setLinkLayerStateChanged = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerStateChanged", "cdecl")
+        CS101_Slave_setLinkLayerStateChanged.argtypes = [CS101_Slave, IEC60870_LinkLayerStateChangedHandler, POINTER(None)]
+        CS101_Slave_setLinkLayerStateChanged.restype = None
+    return locals().get("CS101_Slave_setLinkLayerStateChanged")
+_loaders["CS101_Slave_setLinkLayerStateChanged"] = _load_CS101_Slave_setLinkLayerStateChanged
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 147
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerAddress", "cdecl"):
-    CS101_Slave_setLinkLayerAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerAddress", "cdecl")
-    CS101_Slave_setLinkLayerAddress.argtypes = [CS101_Slave, c_int]
-    CS101_Slave_setLinkLayerAddress.restype = None
+def _load_CS101_Slave_setLinkLayerAddress():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerAddress", "cdecl"):
+        CS101_Slave_setLinkLayerAddress = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerAddress", "cdecl")
+        CS101_Slave_setLinkLayerAddress.argtypes = [CS101_Slave, c_int]
+        CS101_Slave_setLinkLayerAddress.restype = None
+    return locals().get("CS101_Slave_setLinkLayerAddress")
+_loaders["CS101_Slave_setLinkLayerAddress"] = _load_CS101_Slave_setLinkLayerAddress
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 156
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerAddressOtherStation", "cdecl"):
-    CS101_Slave_setLinkLayerAddressOtherStation = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerAddressOtherStation", "cdecl")
-    CS101_Slave_setLinkLayerAddressOtherStation.argtypes = [CS101_Slave, c_int]
-    CS101_Slave_setLinkLayerAddressOtherStation.restype = None
+def _load_CS101_Slave_setLinkLayerAddressOtherStation():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setLinkLayerAddressOtherStation", "cdecl"):
+        CS101_Slave_setLinkLayerAddressOtherStation = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setLinkLayerAddressOtherStation", "cdecl")
+        CS101_Slave_setLinkLayerAddressOtherStation.argtypes = [CS101_Slave, c_int]
+        CS101_Slave_setLinkLayerAddressOtherStation.restype = None
+    return locals().get("CS101_Slave_setLinkLayerAddressOtherStation")
+_loaders["CS101_Slave_setLinkLayerAddressOtherStation"] = _load_CS101_Slave_setLinkLayerAddressOtherStation
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 166
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_isClass1QueueFull", "cdecl"):
-    CS101_Slave_isClass1QueueFull = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_isClass1QueueFull", "cdecl")
-    CS101_Slave_isClass1QueueFull.argtypes = [CS101_Slave]
-    CS101_Slave_isClass1QueueFull.restype = c_bool
+def _load_CS101_Slave_isClass1QueueFull():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_isClass1QueueFull", "cdecl"):
+        CS101_Slave_isClass1QueueFull = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_isClass1QueueFull", "cdecl")
+        CS101_Slave_isClass1QueueFull.argtypes = [CS101_Slave]
+        CS101_Slave_isClass1QueueFull.restype = c_bool
+    return locals().get("CS101_Slave_isClass1QueueFull")
+_loaders["CS101_Slave_isClass1QueueFull"] = _load_CS101_Slave_isClass1QueueFull
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 175
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_enqueueUserDataClass1", "cdecl"):
-    CS101_Slave_enqueueUserDataClass1 = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_enqueueUserDataClass1", "cdecl")
-    CS101_Slave_enqueueUserDataClass1.argtypes = [CS101_Slave, CS101_ASDU]
-    CS101_Slave_enqueueUserDataClass1.restype = None
+def _load_CS101_Slave_enqueueUserDataClass1():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_enqueueUserDataClass1", "cdecl"):
+        CS101_Slave_enqueueUserDataClass1 = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_enqueueUserDataClass1", "cdecl")
+        CS101_Slave_enqueueUserDataClass1.argtypes = [CS101_Slave, CS101_ASDU]
+        CS101_Slave_enqueueUserDataClass1.restype = None
+    return locals().get("CS101_Slave_enqueueUserDataClass1")
+_loaders["CS101_Slave_enqueueUserDataClass1"] = _load_CS101_Slave_enqueueUserDataClass1
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 185
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_isClass2QueueFull", "cdecl"):
-    CS101_Slave_isClass2QueueFull = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_isClass2QueueFull", "cdecl")
-    CS101_Slave_isClass2QueueFull.argtypes = [CS101_Slave]
-    CS101_Slave_isClass2QueueFull.restype = c_bool
+def _load_CS101_Slave_isClass2QueueFull():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_isClass2QueueFull", "cdecl"):
+        CS101_Slave_isClass2QueueFull = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_isClass2QueueFull", "cdecl")
+        CS101_Slave_isClass2QueueFull.argtypes = [CS101_Slave]
+        CS101_Slave_isClass2QueueFull.restype = c_bool
+    return locals().get("CS101_Slave_isClass2QueueFull")
+_loaders["CS101_Slave_isClass2QueueFull"] = _load_CS101_Slave_isClass2QueueFull
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 194
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_enqueueUserDataClass2", "cdecl"):
-    CS101_Slave_enqueueUserDataClass2 = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_enqueueUserDataClass2", "cdecl")
-    CS101_Slave_enqueueUserDataClass2.argtypes = [CS101_Slave, CS101_ASDU]
-    CS101_Slave_enqueueUserDataClass2.restype = None
+def _load_CS101_Slave_enqueueUserDataClass2():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_enqueueUserDataClass2", "cdecl"):
+        CS101_Slave_enqueueUserDataClass2 = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_enqueueUserDataClass2", "cdecl")
+        CS101_Slave_enqueueUserDataClass2.argtypes = [CS101_Slave, CS101_ASDU]
+        CS101_Slave_enqueueUserDataClass2.restype = None
+    return locals().get("CS101_Slave_enqueueUserDataClass2")
+_loaders["CS101_Slave_enqueueUserDataClass2"] = _load_CS101_Slave_enqueueUserDataClass2
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 202
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_flushQueues", "cdecl"):
-    CS101_Slave_flushQueues = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_flushQueues", "cdecl")
-    CS101_Slave_flushQueues.argtypes = [CS101_Slave]
-    CS101_Slave_flushQueues.restype = None
+def _load_CS101_Slave_flushQueues():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_flushQueues", "cdecl"):
+        CS101_Slave_flushQueues = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_flushQueues", "cdecl")
+        CS101_Slave_flushQueues.argtypes = [CS101_Slave]
+        CS101_Slave_flushQueues.restype = None
+    return locals().get("CS101_Slave_flushQueues")
+_loaders["CS101_Slave_flushQueues"] = _load_CS101_Slave_flushQueues
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 213
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_run", "cdecl"):
-    CS101_Slave_run = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_run", "cdecl")
-    CS101_Slave_run.argtypes = [CS101_Slave]
-    CS101_Slave_run.restype = None
+def _load_CS101_Slave_run():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_run", "cdecl"):
+        CS101_Slave_run = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_run", "cdecl")
+        CS101_Slave_run.argtypes = [CS101_Slave]
+        CS101_Slave_run.restype = None
+    return locals().get("CS101_Slave_run")
+_loaders["CS101_Slave_run"] = _load_CS101_Slave_run
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 225
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_start", "cdecl"):
-    CS101_Slave_start = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_start", "cdecl")
-    CS101_Slave_start.argtypes = [CS101_Slave]
-    CS101_Slave_start.restype = None
+def _load_CS101_Slave_start():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_start", "cdecl"):
+        CS101_Slave_start = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_start", "cdecl")
+        CS101_Slave_start.argtypes = [CS101_Slave]
+        CS101_Slave_start.restype = None
+    return locals().get("CS101_Slave_start")
+_loaders["CS101_Slave_start"] = _load_CS101_Slave_start
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 233
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_stop", "cdecl"):
-    CS101_Slave_stop = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_stop", "cdecl")
-    CS101_Slave_stop.argtypes = [CS101_Slave]
-    CS101_Slave_stop.restype = None
+def _load_CS101_Slave_stop():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_stop", "cdecl"):
+        CS101_Slave_stop = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_stop", "cdecl")
+        CS101_Slave_stop.argtypes = [CS101_Slave]
+        CS101_Slave_stop.restype = None
+    return locals().get("CS101_Slave_stop")
+_loaders["CS101_Slave_stop"] = _load_CS101_Slave_stop
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 243
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_getAppLayerParameters", "cdecl"):
-    CS101_Slave_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_getAppLayerParameters", "cdecl")
-    CS101_Slave_getAppLayerParameters.argtypes = [CS101_Slave]
-    CS101_Slave_getAppLayerParameters.restype = CS101_AppLayerParameters
+def _load_CS101_Slave_getAppLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_getAppLayerParameters", "cdecl"):
+        CS101_Slave_getAppLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_getAppLayerParameters", "cdecl")
+        CS101_Slave_getAppLayerParameters.argtypes = [CS101_Slave]
+        CS101_Slave_getAppLayerParameters.restype = CS101_AppLayerParameters
+    return locals().get("CS101_Slave_getAppLayerParameters")
+_loaders["CS101_Slave_getAppLayerParameters"] = _load_CS101_Slave_getAppLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 253
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_getLinkLayerParameters", "cdecl"):
-    CS101_Slave_getLinkLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_getLinkLayerParameters", "cdecl")
-    CS101_Slave_getLinkLayerParameters.argtypes = [CS101_Slave]
-    CS101_Slave_getLinkLayerParameters.restype = LinkLayerParameters
+def _load_CS101_Slave_getLinkLayerParameters():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_getLinkLayerParameters", "cdecl"):
+        CS101_Slave_getLinkLayerParameters = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_getLinkLayerParameters", "cdecl")
+        CS101_Slave_getLinkLayerParameters.argtypes = [CS101_Slave]
+        CS101_Slave_getLinkLayerParameters.restype = LinkLayerParameters
+    return locals().get("CS101_Slave_getLinkLayerParameters")
+_loaders["CS101_Slave_getLinkLayerParameters"] = _load_CS101_Slave_getLinkLayerParameters
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 262
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setResetCUHandler", "cdecl"):
-    CS101_Slave_setResetCUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setResetCUHandler", "cdecl")
-    CS101_Slave_setResetCUHandler.argtypes = [CS101_Slave, CS101_ResetCUHandler, POINTER(None)]
-    CS101_Slave_setResetCUHandler.restype = None
+def _load_CS101_Slave_setResetCUHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setResetCUHandler", "cdecl"):
+        CS101_Slave_setResetCUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setResetCUHandler", "cdecl")
+        CS101_Slave_setResetCUHandler.argtypes = [CS101_Slave, CS101_ResetCUHandler, POINTER(None)]
+        CS101_Slave_setResetCUHandler.restype = None
+    return locals().get("CS101_Slave_setResetCUHandler")
+_loaders["CS101_Slave_setResetCUHandler"] = _load_CS101_Slave_setResetCUHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 271
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setInterrogationHandler", "cdecl"):
-    CS101_Slave_setInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setInterrogationHandler", "cdecl")
-    CS101_Slave_setInterrogationHandler.argtypes = [CS101_Slave, CS101_InterrogationHandler, POINTER(None)]
-    CS101_Slave_setInterrogationHandler.restype = None
+def _load_CS101_Slave_setInterrogationHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setInterrogationHandler", "cdecl"):
+        CS101_Slave_setInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setInterrogationHandler", "cdecl")
+        CS101_Slave_setInterrogationHandler.argtypes = [CS101_Slave, CS101_InterrogationHandler, POINTER(None)]
+        CS101_Slave_setInterrogationHandler.restype = None
+    return locals().get("CS101_Slave_setInterrogationHandler")
+_loaders["CS101_Slave_setInterrogationHandler"] = _load_CS101_Slave_setInterrogationHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 280
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setCounterInterrogationHandler", "cdecl"):
-    CS101_Slave_setCounterInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setCounterInterrogationHandler", "cdecl")
-    CS101_Slave_setCounterInterrogationHandler.argtypes = [CS101_Slave, CS101_CounterInterrogationHandler, POINTER(None)]
-    CS101_Slave_setCounterInterrogationHandler.restype = None
+def _load_CS101_Slave_setCounterInterrogationHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setCounterInterrogationHandler", "cdecl"):
+        CS101_Slave_setCounterInterrogationHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setCounterInterrogationHandler", "cdecl")
+        CS101_Slave_setCounterInterrogationHandler.argtypes = [CS101_Slave, CS101_CounterInterrogationHandler, POINTER(None)]
+        CS101_Slave_setCounterInterrogationHandler.restype = None
+    return locals().get("CS101_Slave_setCounterInterrogationHandler")
+_loaders["CS101_Slave_setCounterInterrogationHandler"] = _load_CS101_Slave_setCounterInterrogationHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 289
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setReadHandler", "cdecl"):
-    CS101_Slave_setReadHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setReadHandler", "cdecl")
-    CS101_Slave_setReadHandler.argtypes = [CS101_Slave, CS101_ReadHandler, POINTER(None)]
-    CS101_Slave_setReadHandler.restype = None
+def _load_CS101_Slave_setReadHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setReadHandler", "cdecl"):
+        CS101_Slave_setReadHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setReadHandler", "cdecl")
+        CS101_Slave_setReadHandler.argtypes = [CS101_Slave, CS101_ReadHandler, POINTER(None)]
+        CS101_Slave_setReadHandler.restype = None
+    return locals().get("CS101_Slave_setReadHandler")
+_loaders["CS101_Slave_setReadHandler"] = _load_CS101_Slave_setReadHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 298
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setClockSyncHandler", "cdecl"):
-    CS101_Slave_setClockSyncHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setClockSyncHandler", "cdecl")
-    CS101_Slave_setClockSyncHandler.argtypes = [CS101_Slave, CS101_ClockSynchronizationHandler, POINTER(None)]
-    CS101_Slave_setClockSyncHandler.restype = None
+def _load_CS101_Slave_setClockSyncHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setClockSyncHandler", "cdecl"):
+        CS101_Slave_setClockSyncHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setClockSyncHandler", "cdecl")
+        CS101_Slave_setClockSyncHandler.argtypes = [CS101_Slave, CS101_ClockSynchronizationHandler, POINTER(None)]
+        CS101_Slave_setClockSyncHandler.restype = None
+    return locals().get("CS101_Slave_setClockSyncHandler")
+_loaders["CS101_Slave_setClockSyncHandler"] = _load_CS101_Slave_setClockSyncHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 307
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setResetProcessHandler", "cdecl"):
-    CS101_Slave_setResetProcessHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setResetProcessHandler", "cdecl")
-    CS101_Slave_setResetProcessHandler.argtypes = [CS101_Slave, CS101_ResetProcessHandler, POINTER(None)]
-    CS101_Slave_setResetProcessHandler.restype = None
+def _load_CS101_Slave_setResetProcessHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setResetProcessHandler", "cdecl"):
+        CS101_Slave_setResetProcessHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setResetProcessHandler", "cdecl")
+        CS101_Slave_setResetProcessHandler.argtypes = [CS101_Slave, CS101_ResetProcessHandler, POINTER(None)]
+        CS101_Slave_setResetProcessHandler.restype = None
+    return locals().get("CS101_Slave_setResetProcessHandler")
+_loaders["CS101_Slave_setResetProcessHandler"] = _load_CS101_Slave_setResetProcessHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 316
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setDelayAcquisitionHandler", "cdecl"):
-    CS101_Slave_setDelayAcquisitionHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setDelayAcquisitionHandler", "cdecl")
-    CS101_Slave_setDelayAcquisitionHandler.argtypes = [CS101_Slave, CS101_DelayAcquisitionHandler, POINTER(None)]
-    CS101_Slave_setDelayAcquisitionHandler.restype = None
+def _load_CS101_Slave_setDelayAcquisitionHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setDelayAcquisitionHandler", "cdecl"):
+        CS101_Slave_setDelayAcquisitionHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setDelayAcquisitionHandler", "cdecl")
+        CS101_Slave_setDelayAcquisitionHandler.argtypes = [CS101_Slave, CS101_DelayAcquisitionHandler, POINTER(None)]
+        CS101_Slave_setDelayAcquisitionHandler.restype = None
+    return locals().get("CS101_Slave_setDelayAcquisitionHandler")
+_loaders["CS101_Slave_setDelayAcquisitionHandler"] = _load_CS101_Slave_setDelayAcquisitionHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 328
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setASDUHandler", "cdecl"):
-    CS101_Slave_setASDUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setASDUHandler", "cdecl")
-    CS101_Slave_setASDUHandler.argtypes = [CS101_Slave, CS101_ASDUHandler, POINTER(None)]
-    CS101_Slave_setASDUHandler.restype = None
+def _load_CS101_Slave_setASDUHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setASDUHandler", "cdecl"):
+        CS101_Slave_setASDUHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setASDUHandler", "cdecl")
+        CS101_Slave_setASDUHandler.argtypes = [CS101_Slave, CS101_ASDUHandler, POINTER(None)]
+        CS101_Slave_setASDUHandler.restype = None
+    return locals().get("CS101_Slave_setASDUHandler")
+_loaders["CS101_Slave_setASDUHandler"] = _load_CS101_Slave_setASDUHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/inc/api/cs101_slave.h: 337
-if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setRawMessageHandler", "cdecl"):
-    CS101_Slave_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setRawMessageHandler", "cdecl")
-    CS101_Slave_setRawMessageHandler.argtypes = [CS101_Slave, IEC60870_RawMessageHandler, POINTER(None)]
-    CS101_Slave_setRawMessageHandler.restype = None
+def _load_CS101_Slave_setRawMessageHandler():
+    if _libs["/usr/local/lib/lib60870.so"].has("CS101_Slave_setRawMessageHandler", "cdecl"):
+        CS101_Slave_setRawMessageHandler = _libs["/usr/local/lib/lib60870.so"].get("CS101_Slave_setRawMessageHandler", "cdecl")
+        CS101_Slave_setRawMessageHandler.argtypes = [CS101_Slave, IEC60870_RawMessageHandler, POINTER(None)]
+        CS101_Slave_setRawMessageHandler.restype = None
+    return locals().get("CS101_Slave_setRawMessageHandler")
+_loaders["CS101_Slave_setRawMessageHandler"] = _load_CS101_Slave_setRawMessageHandler
 
 # /home/user/Desktop/scada/lib60870/lib60870-C/src/hal/inc/lib_memory.h: 15
 def CALLOC(nmemb, size):
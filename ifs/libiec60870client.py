@@ -1,227 +1,321 @@
 #!/usr/bin/env python3
-from lib60870 import *
+import ctypes
+from ctypes import cast, pointer
+from lib60870 import (
+    CP56Time2a, CP56Time2a_createFromMsTimestamp, CS101_ASDUReceivedHandler,
+    CS101_ASDU_getCOT, CS101_ASDU_getTypeID, CS101_ASDU_isNegative, CS101_COT_ACTIVATION,
+    CS101_COT_ACTIVATION_TERMINATION, CS104_CONNECTION_CLOSED, CS104_CONNECTION_OPENED,
+    CS104_CONNECTION_STARTDT_CON_RECEIVED, CS104_CONNECTION_STOPDT_CON_RECEIVED, CS104_ConnectionHandler,
+    CS104_Connection_connectAsync, CS104_Connection_create, CS104_Connection_destroy,
+    CS104_Connection_sendInterrogationCommand, CS104_Connection_sendProcessCommandEx,
+    CS104_Connection_sendStartDT, CS104_Connection_sendStopDT, CS104_Connection_sendTestCommandWithTimestamp,
+    CS104_Connection_setASDUReceivedHandler, CS104_Connection_setConnectTimeout,
+    CS104_Connection_setConnectionHandler, CS104_Connection_setRawMessageHandler, C_DC_NA_1, C_IC_NA_1,
+    C_SC_NA_1, C_TS_TA_1,
+    DoubleCommand_create, Hal_getTimeInMs, IEC60870_RawMessageHandler,
+    InformationObject, InformationObject_destroy, SingleCommand_create, TypeID_toString, sCP56Time2a,
+    CS104_Connection_getAPCIParameters, CS104_Connection_setAPCIParameters, struct_sCS104_APCIParameters,
+)
+from asdudecoders import get_decoder
+from pointtable import PointTable
+from asduqueue import AsduQueue
+from gischeduler import GIScheduler, QOI_STATION
+from commandtracker import CommandTracker
+from timerwheel import TimerWheel
 from urllib.parse import urlparse
+from collections import deque
+import random
+import threading
 import time
 
+# connection states of an RTU
+RTU_IDLE = 0        # not connected, waiting for the next connection attempt
+RTU_CONNECTING = 1  # connecting asynchronously, waiting for CS104_CONNECTION_OPENED
+RTU_STARTDT = 2     # connected, waiting for STARTDT_CON
+RTU_ACTIVE = 3      # connection is up, the model is read by the GI scheduler
+
+# event from the ASDU handler, in addition to the CS104_CONNECTION_* events
+RTU_EVENT_GI_TERMINATED = 100 # GI done (ACT_TERM)
+RTU_EVENT_GI_REJECTED = 101 # negative ACT_CON of a GI
+
+# APCI parameters that can be set per RTU: windows k and w, and timers t0-t3 in seconds
+APCI_PARAMETERS = ('k', 'w', 't0', 't1', 't2', 't3')
+
 class IEC60870_5_104_client:
-    # Connection event handler 
+    # Connection event handler, called from the connection thread
+    # events are queued, and processed by poll()
     def connectionHandler (self, parameter, connection, event):
         tupl = ctypes.cast(parameter, ctypes.py_object).value
         if event == CS104_CONNECTION_OPENED:
             print("Connection established")
-            self.connections[tupl]['state'] = 1
         elif event == CS104_CONNECTION_CLOSED:
             print("Connection closed")
-            self.connections[tupl]['state'] = 0
         elif event == CS104_CONNECTION_STARTDT_CON_RECEIVED:
             print("Received STARTDT_CON")
-            self.connections[tupl]['state'] = 2
         elif event == CS104_CONNECTION_STOPDT_CON_RECEIVED:
             print("Received STOPDT_CON")
-            self.connections[tupl]['state'] = 1
+        self.queueEvent(tupl, event)
+
+
+    def queueEvent(self, tupl, event):
+        if tupl in self.connections:
+            # the generation identifies the connection attempt, so late events of an old connection are ignored
+            self.events.append((tupl, self.connections[tupl]['generation'], event))
+            self.wakeup.set()
 
 
     #CS101_ASDUReceivedHandler implementation
     #For CS104 the address parameter has to be ignored
+    #this runs in the connection thread, so values are only decoded and queued, and processed by processASDU
     def asduReceivedHandler (self, parameter, address, asdu):
-        data = {}
         tupl = ctypes.cast(parameter, ctypes.py_object).value
         if not tupl in self.connections:
             print("error: cannot find %s in connections" % str(tupl))
             return False
 
-        print("RECVD ASDU type: %s(%i) elements: %i" % (
-            TypeID_toString(CS101_ASDU_getTypeID(asdu)),
-            CS101_ASDU_getTypeID(asdu),
-            CS101_ASDU_getNumberOfElements(asdu)
-        ))
-
-        if CS101_ASDU_getTypeID(asdu) == C_IC_NA_1:
-            self.connections[tupl]['GI'] = True
-
-        if (CS101_ASDU_getTypeID(asdu) == M_ME_TE_1):
-
-            print("  measured scaled values with CP56Time2a timestamp:")
-
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), MeasuredValueScaledWithCP56Time2a) 
-                ioa = InformationObject_getObjectAddress(cast(io, InformationObject) )
-                value = MeasuredValueScaled_getValue(cast(io, MeasuredValueScaled) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': M_ME_TE_1}
-                data[ioa] = {'value': value, 'ASDU': M_ME_TE_1}
-                MeasuredValueScaledWithCP56Time2a_destroy(io)
-
-        elif (CS101_ASDU_getTypeID(asdu) == M_SP_NA_1):
-            print("  single point information:")
-
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), SinglePointInformation) 
-                ioa = InformationObject_getObjectAddress(cast(io,InformationObject) )
-                value = SinglePointInformation_getValue(cast(io,SinglePointInformation) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': M_SP_NA_1}
-                data[ioa] = {'value': value, 'ASDU': M_SP_NA_1}
-                SinglePointInformation_destroy(io)
-        elif (CS101_ASDU_getTypeID(asdu) == M_DP_NA_1):
-            print("  double point information:")
-
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), DoublePointInformation)
-                ioa = InformationObject_getObjectAddress(cast(io,InformationObject) ) 
-                value = DoublePointInformation_getValue(cast(io,DoublePointInformation) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': M_DP_NA_1}
-                data[ioa] = {'value': value, 'ASDU': M_DP_NA_1}
-                DoublePointInformation_destroy(io)
-        elif (CS101_ASDU_getTypeID(asdu) == M_ME_NB_1):
-            print("  measured value scaled:")
-
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), MeasuredValueScaled) 
-                ioa = InformationObject_getObjectAddress(cast(io,InformationObject) )
-                value = MeasuredValueScaled_getValue(cast(io,MeasuredValueScaled) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': M_ME_NB_1}
-                data[ioa] = {'value': value, 'ASDU': M_ME_NB_1}
-                MeasuredValueScaled_destroy(io)     
-        elif (CS101_ASDU_getTypeID(asdu) == C_SC_NA_1):
-            print("received single command response")
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), SinglePointInformation) 
-                ioa = InformationObject_getObjectAddress(cast(io,InformationObject) )
-                value = SinglePointInformation_getValue(cast(io,SinglePointInformation) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': C_SC_NA_1}
-                data[ioa] = {'value': value, 'ASDU': C_SC_NA_1}
-                SinglePointInformation_destroy(io)
-
-        elif (CS101_ASDU_getTypeID(asdu) == C_DC_NA_1):
-            print("received double command response")
-            for i in range(CS101_ASDU_getNumberOfElements(asdu)):
-
-                io = cast(CS101_ASDU_getElement(asdu, i), DoublePointInformation) 
-                ioa = InformationObject_getObjectAddress(cast(io,InformationObject) )
-                value = DoublePointInformation_getValue(cast(io,DoublePointInformation) )
-                print("    IOA: %i value: %i" % (ioa,value ))
-                self.connections[tupl]['data'][ioa] = {'value': value, 'ASDU': C_DC_NA_1}
-                data[ioa] = {'value': value, 'ASDU': C_DC_NA_1}
-                DoublePointInformation_destroy(io)
-
-        elif (CS101_ASDU_getTypeID(asdu) == C_TS_TA_1):
+        type_id = CS101_ASDU_getTypeID(asdu)
+        if type_id == C_IC_NA_1:
+            if CS101_ASDU_isNegative(asdu) == True:
+                self.queueEvent(tupl, RTU_EVENT_GI_REJECTED)
+            elif CS101_ASDU_getCOT(asdu) == CS101_COT_ACTIVATION_TERMINATION:
+                self.queueEvent(tupl, RTU_EVENT_GI_TERMINATED)
+            return True
+
+        if type_id == C_TS_TA_1:
             self.connections[tupl]['testfr_received'] += 1
-            print("  received test command with timestamp. send: %i, received: %i" % (self.connections[tupl]['testfr_send'],self.connections[tupl]['testfr_received']))
             return True
 
+        decoder = get_decoder(type_id)
+        if type_id == C_SC_NA_1 or type_id == C_DC_NA_1:
+            # command response, this is not a measurement
+            cot = CS101_ASDU_getCOT(asdu)
+            negative = CS101_ASDU_isNegative(asdu) == True
+            for ioa, value, quality, timestamp in decoder(asdu):
+                self.commands.response(tupl, type_id, ioa, cot, negative)
+            return True
+
+        if decoder == None:
+            print("  no decoder for ASDU type: %s(%i)" % (TypeID_toString(type_id), type_id))
+            return True
+
+        self.queue.put(tupl, (self.connections[tupl]['points'], type_id, decoder(asdu)))
+        return True
+
+
+    # process a queued ASDU in a worker thread. the points are updated in place,
+    # and the callback receives the updated points of this ASDU
+    def processASDU(self, tupl, item):
+        points, type_id, elements = item
+        data = [points.update(type_id, ioa, value, quality, timestamp) for ioa, value, quality, timestamp in elements]
         if self.callback != None and len(data) > 0:
             self.callback(tupl, data)
-        return True
 
 
-    def __init__(self, callback):
+    # raw message handler, called from the connection thread for each sent and received APDU
+    # counts the I frames received and S frames sent, to report the throughput of an RTU
+    def rawMessageHandler (self, parameter, msg, msgSize, sent):
+        tupl = ctypes.cast(parameter, ctypes.py_object).value
+        rtu = self.connections.get(tupl)
+        if rtu != None and msgSize > 2:
+            if sent == False and msg[2] & 0x01 == 0:
+                rtu['i_received'] += 1
+            elif sent == True and msg[2] & 0x03 == 0x01:
+                rtu['s_sent'] += 1
+        if sent == False and self.raw_handler != None:
+            self.raw_handler(tupl, ctypes.string_at(msg, msgSize))
+
+
+    def __init__(self, callback, state_callback=None, max_pending=10, workers=2, max_gi=4, gi_jitter=2):
         self.connections = {}
-        self.timeout = 2
+        self.events = deque()
+        self.wakeup = threading.Event() # set when an event is queued, so the main loop can call poll() directly
+        self.timers = TimerWheel() # one timer per RTU: the deadline of connecting, next testframe, or next connection attempt
+        self.connecting = set() # RTU's in RTU_CONNECTING or RTU_STARTDT
+        self.connect_queue = deque() # RTU's that should connect, waiting for a free slot (max_pending)
+        self.timeout = 2 # seconds for each step of connecting (connect, STARTDT)
+        self.testframe_interval = 1 # seconds
+        self.max_pending = max_pending # maximum amount of RTU's connecting at the same time
+        self.min_backoff = 1 # seconds before the first reconnect attempt
+        self.max_backoff = 60 # seconds between reconnect attempts, when an RTU keeps failing
         self.callback = callback
+        self.state_callback = state_callback # called with (tupl, online) when an RTU becomes active, or is lost
+        self.raw_handler = None # called with (tupl, apdu) for each received APDU
+        self.command_callback = None # called from poll() with the result (dict) of each command, see commandtracker.py
+        self.commands = CommandTracker()
+        self.queue = AsduQueue(self.processASDU, workers) # received values, processed by worker threads that call callback
+        self.gi = GIScheduler(self.sendGI, max_gi, gi_jitter) # station GI's after a connect, and periodic GI's, called from poll()
         self.p_connectionHandler = CS104_ConnectionHandler(self.connectionHandler)
         self.p_asduReceivedHandler = CS101_ASDUReceivedHandler(self.asduReceivedHandler)
+        self.p_rawMessageHandler = IEC60870_RawMessageHandler(self.rawMessageHandler)
 
 
-
-    # retrieve an active connection to an RTU, and up to date datamodel, stored in 'connections'
-    def getRTU(self, host, port):
+    # register an RTU, the connection is (re)established by poll()
+    # apci is a dict with APCI_PARAMETERS to override the library defaults, applied on the next connect
+    # gi_schedule is a dict {qoi: interval in seconds} of periodic GI's, for the station (20) or groups (21-36)
+    def addRTU(self, host, port, apci=None, gi_schedule=None):
         if port == "" or port == None:
             port = 2404
 
+        tupl = host + ":" + str(port)
+        if tupl in self.connections:
+            rtu = self.connections[tupl]
+            rtu["apci"] = apci
+            if rtu["gi_schedule"] != gi_schedule:
+                rtu["gi_schedule"] = gi_schedule
+                if rtu["state"] == RTU_ACTIVE:
+                    self.gi.schedule(tupl, time.monotonic(), gi_schedule)
+        else:
+            self.connections[tupl] = {
+                "host": host,
+                "port": int(port),
+                "con": None,
+                "state": RTU_IDLE,
+                "generation": 0,
+                "GI": False,
+                "points": PointTable(tupl), # kept over reconnects, the GI refreshes all values
+                "testfr_received": 0,
+                "testfr_send": 0,
+                "backoff": 0,
+                "apci": apci,
+                "gi_schedule": gi_schedule,
+                "i_received": 0, # I frames received
+                "s_sent": 0, # S frames sent (acknowledgements without data)
+                "self": tupl,
+            }
+            self.connect_queue.append(tupl)
+        return tupl
+
+
+    # check for an active connection to an RTU, with an up to date datamodel, stored in 'connections'
+    # this does not block; an unknown RTU is registered, and connected by poll()
+    def getRTU(self, host, port):
         if host == None:
             print("missing hostname")
             return -1
 
-        tupl = host + ":" + str(port)
-        if tupl in self.connections and self.connections[tupl]["con"] != None:
-            if self.connections[tupl]["GI"] == False:
-                con = self.connections[tupl]["con"]
-                if CS104_Connection_sendInterrogationCommand(con, CS101_COT_ACTIVATION, 1, IEC60870_QOI_STATION) == False:
-                    print("error: could not send GI")
-                    CS104_Connection_sendStopDT(con)
-                    CS104_Connection_destroy(con)
-                    self.connections[tupl]["con"] = None
-                    self.connections[tupl]["state"] = 0
-                    return -1
-
-                counter = 0
-                while self.connections[tupl]["GI"] == False and counter < self.timeout: 
-                    counter += 1
-                    time.sleep(1)
-                if self.connections[tupl]["GI"] == True:
-                    return 0
-                else:
-                    CS104_Connection_sendStopDT(con)
-		            #we could not perform a GI, so remove connection
-                    CS104_Connection_destroy(con)
-                    self.connections[tupl]["con"] = None
-                    self.connections[tupl]["state"] = 0
-                    return -1
+        tupl = self.addRTU(host, port)
+        if self.connections[tupl]["state"] == RTU_ACTIVE and self.connections[tupl]["GI"] == True:
+            return 0
+        return -1
+
+
+    # process connection events and expired timers of the RTU's, without blocking
+    # this should be called periodically (i.e. every 100ms), and when wakeup is set
+    # only RTU's with an event or an expired timer are processed, not all RTU's
+    def poll(self):
+        now = time.monotonic()
+        while len(self.events) > 0:
+            tupl, generation, event = self.events.popleft()
+            if tupl in self.connections and self.connections[tupl]["generation"] == generation:
+                self.handleEvent(self.connections[tupl], event, now)
+
+        for tupl in self.timers.expired(now):
+            rtu = self.connections.get(tupl)
+            if rtu == None:
+                continue
+            state = rtu["state"]
+            if state == RTU_ACTIVE:
+                if self.sendTestframe(rtu, now) == 0:
+                    self.timers.schedule(tupl, now + self.testframe_interval)
+            elif state == RTU_IDLE:
+                self.connect_queue.append(tupl)
             else:
-		#we have a connection and a model
-                return 0
-		
-        if not tupl in self.connections or self.connections[tupl]["con"] == None:
-            self.connections[tupl] = {}
-            self.connections[tupl]["con"] = None
-            self.connections[tupl]["GI"] = False
-            self.connections[tupl]["data"] = {}
-            self.connections[tupl]["state"] = 0
-            self.connections[tupl]['testfr_received'] = 0
-            self.connections[tupl]['testfr_send'] = 0
-            self.connections[tupl]['self'] = tupl
-
-            con = CS104_Connection_create(host, port)
-            if CS104_Connection_connect(con) == False:
-                print("error: could not connect")
-                CS104_Connection_destroy(con)
-                return -1
-
-            if CS104_Connection_sendStartDT(con) == False:
+                print("error: timeout while connecting to %s (state: %i)" % (tupl, state))
+                self.disconnectRTU(rtu, now)
+
+        while len(self.connect_queue) > 0 and len(self.connecting) < self.max_pending:
+            rtu = self.connections.get(self.connect_queue.popleft())
+            if rtu != None and rtu["state"] == RTU_IDLE:
+                self.connectRTU(rtu, now)
+
+        self.gi.poll(now)
+        for result in self.commands.poll(now):
+            if self.command_callback != None:
+                self.command_callback(result)
+
+
+    def handleEvent(self, rtu, event, now):
+        if event == CS104_CONNECTION_OPENED and rtu["state"] == RTU_CONNECTING:
+            if CS104_Connection_sendStartDT(rtu["con"]) == False:
                 print("error: could not send startDT")
-                CS104_Connection_destroy(con)
-                return -1
-
-            CS104_Connection_setConnectionHandler(con, self.p_connectionHandler, id(self.connections[tupl]['self']))
-            CS104_Connection_setASDUReceivedHandler(con, self.p_asduReceivedHandler, id(self.connections[tupl]['self']))
-
-            counter = 0
-            while self.connections[tupl]["state"] == 0 and counter < self.timeout: 
-                counter += 1
-                time.sleep(1)
-
-            if self.connections[tupl]["state"] == 2:
-                # read the model
-                if CS104_Connection_sendInterrogationCommand(con, CS101_COT_ACTIVATION, 1, IEC60870_QOI_STATION) == False:
-                    print("error: could not send GI")
-                    CS104_Connection_sendStopDT(con)
-                    CS104_Connection_destroy(con)
-                    self.connections[tupl]["state"] = 0
-                    return -1
-
-                # store the active connection
-                self.connections[tupl]["con"] = con
-                counter = 0
-                while self.connections[tupl]["GI"] == False and counter < self.timeout: 
-                    counter += 1
-                    time.sleep(1)
-                if self.connections[tupl]["GI"] == True:
-                    return 0
-            else:
-                CS104_Connection_sendStopDT(con)
-                CS104_Connection_destroy(con)
-                self.connections[tupl]["state"] = 0
-                self.connections[tupl]["con"] = None
-            return -1
+                self.disconnectRTU(rtu, now)
+                return
+            rtu["state"] = RTU_STARTDT
+            self.timers.schedule(rtu["self"], now + self.timeout)
+
+        elif event == CS104_CONNECTION_STARTDT_CON_RECEIVED and rtu["state"] == RTU_STARTDT:
+            rtu["state"] = RTU_ACTIVE
+            rtu["backoff"] = 0
+            self.connecting.discard(rtu["self"])
+            self.timers.schedule(rtu["self"], now + self.testframe_interval)
+            # read the model, when the scheduler has a free slot
+            self.gi.connected(rtu["self"], now, rtu["gi_schedule"])
+            if self.state_callback != None:
+                self.state_callback(rtu["self"], True)
+
+        elif event == RTU_EVENT_GI_TERMINATED and rtu["state"] == RTU_ACTIVE:
+            if self.gi.completed(rtu["self"]) == QOI_STATION:
+                rtu["GI"] = True
+
+        elif event == RTU_EVENT_GI_REJECTED and rtu["state"] == RTU_ACTIVE:
+            print("error: GI rejected by %s" % rtu["self"])
+            self.gi.completed(rtu["self"])
+
+        elif event == CS104_CONNECTION_CLOSED and rtu["state"] != RTU_IDLE:
+            self.disconnectRTU(rtu, now)
+
+
+    # start an asynchronous connection attempt, the result is handled by handleEvent() or the timer in poll()
+    def connectRTU(self, rtu, now):
+        rtu["generation"] += 1
+        rtu["GI"] = False
+        rtu["testfr_received"] = 0
+        rtu["testfr_send"] = 0
+
+        con = CS104_Connection_create(rtu["host"], rtu["port"])
+        connect_timeout = self.timeout
+        if rtu["apci"] != None:
+            parameters = struct_sCS104_APCIParameters.from_buffer_copy(CS104_Connection_getAPCIParameters(con).contents)
+            for key in APCI_PARAMETERS:
+                if key in rtu["apci"]:
+                    setattr(parameters, key, int(rtu["apci"][key]))
+            CS104_Connection_setAPCIParameters(con, pointer(parameters))
+            if "t0" in rtu["apci"]: # else the library default would replace the timeout of the IFS
+                connect_timeout = parameters.t0
+        CS104_Connection_setConnectTimeout(con, connect_timeout * 1000)
+        CS104_Connection_setConnectionHandler(con, self.p_connectionHandler, id(rtu['self']))
+        CS104_Connection_setASDUReceivedHandler(con, self.p_asduReceivedHandler, id(rtu['self']))
+        CS104_Connection_setRawMessageHandler(con, self.p_rawMessageHandler, id(rtu['self']))
+        rtu["con"] = con
+        rtu["state"] = RTU_CONNECTING
+        self.connecting.add(rtu["self"])
+        self.timers.schedule(rtu["self"], now + connect_timeout + 1) # allow the library to time out first, so destroy does not block
+        CS104_Connection_connectAsync(con)
+
+
+    # close the connection of an RTU, and schedule a reconnect with exponential backoff
+    def disconnectRTU(self, rtu, now, reconnect=True):
+        was_active = rtu["state"] == RTU_ACTIVE
+        if rtu["con"] != None:
+            if rtu["state"] != RTU_CONNECTING:
+                CS104_Connection_sendStopDT(rtu["con"])
+            CS104_Connection_destroy(rtu["con"])
+            rtu["con"] = None
+        rtu["generation"] += 1 # ignore events of the closed connection
+        rtu["state"] = RTU_IDLE
+        rtu["GI"] = False
+        self.connecting.discard(rtu["self"])
+        self.gi.disconnected(rtu["self"])
+        self.commands.disconnected(rtu["self"])
+
+        if reconnect == True:
+            rtu["backoff"] = min(max(rtu["backoff"] * 2, self.min_backoff), self.max_backoff)
+            self.timers.schedule(rtu["self"], now + rtu["backoff"] + random.uniform(0, rtu["backoff"] * 0.1))
+        else:
+            self.timers.cancel(rtu["self"])
+
+        if was_active == True and self.state_callback != None:
+            self.state_callback(rtu["self"], False)
 
 
     def parseref(self,ref):
@@ -240,16 +334,18 @@ class IEC60870_5_104_client:
 
         tupl = uri_ref.hostname + ":" + str(port)
 
-        #check if connection is active, or reconnect
-        err = self.getRTU(uri_ref.hostname, port)
-        if err == 0:
+        #check if connection is active, reconnecting is done by poll()
+        if not tupl in self.connections:
+            print("unknown RTU: %s" % tupl)
+            return None
+
+        if self.connections[tupl]["state"] == RTU_ACTIVE:
             con = self.connections[tupl]['con']
             if not con:
                 print("no valid connection")
                 return None		
 
-            model = self.connections[tupl]['data']
-            if not model:
+            if len(self.connections[tupl]['points']) == 0:
                 print("no valid model")
                 return None
 			
@@ -259,43 +355,41 @@ class IEC60870_5_104_client:
             return {"RTU":self.connections[tupl], "type":type, "ioa":int(ioa) }
 
 
-    def select(self,ref, value):
-        obj = self.parseref(ref) 
-        if obj != None:
-            ca = 1 # common address
-            if obj['type'] == "SinglePointCommand":
-                dc = cast(SingleCommand_create(None, obj['ioa'], value, True, 0), InformationObject)
-                print("Send select command C_SC_NA_1")
-            elif obj['type'] == "DoublePointCommand":
-                dc = cast(DoubleCommand_create(None, obj['ioa'], value, True, 0), InformationObject)
-                print("Send select command C_DC_NA_1")
-            else:
-                return 0
+    # send a select or operate command, the ACT_CON/ACT_TERM of the RTU are matched by self.commands
+    # command is the dict of the command as received by the IFS, it is included in the result
+    def command(self, ref, value, select, command=None):
+        obj = self.parseref(ref)
+        if obj == None:
+            return 0
+        ca = 1 # common address
+        if obj['type'] == "SinglePointCommand":
+            type_id = C_SC_NA_1
+            dc = cast(SingleCommand_create(None, obj['ioa'], value, select, 0), InformationObject)
+        elif obj['type'] == "DoublePointCommand":
+            type_id = C_DC_NA_1
+            dc = cast(DoubleCommand_create(None, obj['ioa'], value, select, 0), InformationObject)
+        else:
+            return 0
+        print("Send %s command %s" % ("select" if select == True else "operate", "C_SC_NA_1" if type_id == C_SC_NA_1 else "C_DC_NA_1"))
+
+        tupl = obj["RTU"]["self"]
+        self.commands.start(tupl, type_id, obj['ioa'], select, command if command != None else {"element": ref, "value": value})
+        sent = CS104_Connection_sendProcessCommandEx(obj["RTU"]["con"], CS101_COT_ACTIVATION, ca, dc)
+        InformationObject_destroy(dc)
+        if sent == False:
+            self.commands.discard(tupl, type_id, obj['ioa'])
+            return 0
+        return 1
 
-            CS104_Connection_sendProcessCommandEx(obj["RTU"]["con"], CS101_COT_ACTIVATION, ca, dc)
-            InformationObject_destroy(dc)
-            return 1
-        return 0
 
+    def select(self, ref, value, command=None):
+        return self.command(ref, value, True, command)
 
-    def operate(self,ref, value):
-        obj = self.parseref(ref) 
-        if obj != None:
-            ca = 1 # common address
-            if obj['type'] == "SinglePointCommand":
-                dc = cast(SingleCommand_create(None, obj['ioa'], value, False, 0), InformationObject)
-                print("Send operate command C_SC_NA_1")
-            elif obj['type'] == "DoublePointCommand":
-                dc = cast(DoubleCommand_create(None, obj['ioa'], value, False, 0), InformationObject)
-                print("Send operate command C_DC_NA_1")
-            else:
-                return 0
 
-            CS104_Connection_sendProcessCommandEx(obj["RTU"]["con"], CS101_COT_ACTIVATION, ca, dc)
-            InformationObject_destroy(dc)
-            return 1
-        return 0
+    def operate(self, ref, value, command=None):
+        return self.command(ref, value, False, command)
 
+    # send a testframe to an RTU, returns -1 if the connection was closed
     def testframe(self, host, port):
         if port == "" or port == None:
             port = 2404
@@ -304,33 +398,35 @@ class IEC60870_5_104_client:
             print("missing hostname")
             return -1
 
-        err = self.getRTU(host, port)
-        if err == 0:
-            tupl = host + ":" + str(port)
-            con = self.connections[tupl]['con']
-            if not con:
-                print("no valid connection")
-                return -1
-            if self.connections[tupl]['testfr_send'] > self.connections[tupl]['testfr_received'] + 5:
-                print("error: too many missed testframes, closing connection")
-                CS104_Connection_sendStopDT(self.connections[tupl]["con"])
-                CS104_Connection_destroy(self.connections[tupl]["con"])
-                self.connections[tupl]["con"] = None
-                self.connections[tupl]["state"] = 0
-                return -1
-
-            newTime = sCP56Time2a() 
-            CP56Time2a_createFromMsTimestamp(CP56Time2a(newTime), Hal_getTimeInMs())
-            if CS104_Connection_sendTestCommandWithTimestamp(con, 1, 0x4938, newTime) == False:
-                print("error: could not send testframe, closing connection")
-                CS104_Connection_sendStopDT(con)
-                CS104_Connection_destroy(con)
-                self.connections[tupl]["con"] = None
-                self.connections[tupl]["state"] = 0              
-                return -1
-
-            self.connections[tupl]['testfr_send'] += 1
-            return 0
+        tupl = host + ":" + str(port)
+        if not tupl in self.connections or self.connections[tupl]["state"] != RTU_ACTIVE:
+            return -1
+        return self.sendTestframe(self.connections[tupl], time.monotonic())
+
+
+    def sendTestframe(self, rtu, now):
+        if rtu['testfr_send'] > rtu['testfr_received'] + 5:
+            print("error: too many missed testframes, closing connection")
+            self.disconnectRTU(rtu, now)
+            return -1
+
+        newTime = sCP56Time2a() 
+        CP56Time2a_createFromMsTimestamp(CP56Time2a(newTime), Hal_getTimeInMs())
+        if CS104_Connection_sendTestCommandWithTimestamp(rtu["con"], 1, 0x4938, newTime) == False:
+            print("error: could not send testframe, closing connection")
+            self.disconnectRTU(rtu, now)
+            return -1
+
+        rtu['testfr_send'] += 1
+        return 0
+
+
+    # send a GI, called by the GI scheduler
+    def sendGI(self, tupl, qoi):
+        rtu = self.connections.get(tupl)
+        if rtu == None or rtu["state"] != RTU_ACTIVE:
+            return False
+        return CS104_Connection_sendInterrogationCommand(rtu["con"], CS101_COT_ACTIVATION, 1, qoi)
 
 
     def removeRTU(self,host,port):
@@ -338,12 +434,9 @@ class IEC60870_5_104_client:
             port = 2404
 
         tupl = host + ":" + str(port)
-        if tupl in self.connections and self.connections[tupl]["con"] != None:
-            CS104_Connection_sendStopDT(self.connections[tupl]["con"])
-            CS104_Connection_destroy(self.connections[tupl]["con"])
-            self.connections[tupl]["con"] = None
-
-        self.connections[tupl]["state"] = 0
+        if tupl in self.connections:
+            self.disconnectRTU(self.connections[tupl], time.monotonic(), False)
+            del self.connections[tupl]
 
 
 def testcallb(tupl, data):
@@ -352,10 +445,16 @@ def testcallb(tupl, data):
 #test the class
 if __name__== "__main__":
     client = IEC60870_5_104_client(testcallb)
+    client.addRTU("localhost", 2404)
+    counter = 0
+    while client.getRTU("localhost", 2404) != 0 and counter < 50:
+        client.poll()
+        time.sleep(0.1)
+        counter += 1
     if client.getRTU("localhost", 2404) == 0:
         tupl = "localhost:2404"
         # perform read of latest data
-        print(client.connections[tupl]["data"])
+        print(list(client.connections[tupl]["points"].points.values()))
         #perform operate
         if client.select("iec60870-5-104://localhost:2404/DoublePointCommand/6000", 1) == 1:
             if client.operate("iec60870-5-104://localhost:2404/DoublePointCommand/6000", 1) == 1:
@@ -364,5 +463,3 @@ if __name__== "__main__":
                 print("oper failed")
         else:
             print("select failed")
-
-
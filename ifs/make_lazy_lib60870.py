@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# Convert the ctypesgen output (lib60870.py) into lazy bindings
+# ctypesgen resolves and declares all ~600 functions of the library when the module is imported.
+# this moves each function declaration into a loader, that is called by the module __getattr__
+# on the first access of that function, so only the functions that are used are resolved.
+# types, structures and constants are still defined on import, as they are cheap.
+#
+# functions are not included in "from lib60870 import *", they should be imported by name
+#
+# usage: python3 make_lazy_lib60870.py <ctypesgen output> [output file, default: overwrite input]
+#
+import re
+import sys
+
+FUNCTION_IF = re.compile(r'^if _libs\[".*"\]\.has\("(\w+)", "\w+"\):')
+FUNCTION_FOR = re.compile(r'^    if not _lib\.has\("(\w+)", "\w+"\):')
+
+LAZY_LOADER = '''
+# Begin lazy loader (added by make_lazy_lib60870.py)
+
+_loaders = {}
+
+
+def __getattr__(name):
+    loader = _loaders.get(name)
+    if loader is not None:
+        value = loader()
+        if value is not None:
+            globals()[name] = value
+            return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_loaders))
+
+
+# resolve all functions, as the module did before it was made lazy
+def load_all():
+    for name in list(_loaders):
+        if name not in globals():
+            try:
+                __getattr__(name)
+            except AttributeError:
+                pass
+
+# End lazy loader
+'''
+
+
+def convert(lines):
+    output = []
+    count = 0
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        match = FUNCTION_IF.match(line)
+        if match == None and line.startswith("for _lib in _libs.values():") and i + 1 < len(lines):
+            match = FUNCTION_FOR.match(lines[i + 1])
+        if match == None:
+            output.append(line)
+            if line.startswith("# End libraries"):
+                output.append(LAZY_LOADER)
+            i += 1
+            continue
+
+        name = match.group(1)
+        block = [line]
+        i += 1
+        while i < len(lines) and lines[i].startswith(" "):
+            block.append(lines[i])
+            i += 1
+        output.append("def _load_%s():\n" % name)
+        for item in block:
+            output.append("    " + item)
+        output.append('    return locals().get("%s")\n' % name)
+        output.append('_loaders["%s"] = _load_%s\n' % (name, name))
+        count += 1
+    return output, count
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("usage: python3 make_lazy_lib60870.py <ctypesgen output> [output file]")
+        exit(-1)
+    with open(sys.argv[1], 'r') as f:
+        lines = f.readlines()
+    if "# Begin lazy loader (added by make_lazy_lib60870.py)\n" in lines:
+        print("%s already has lazy bindings" % sys.argv[1])
+        exit(0)
+    output, count = convert(lines)
+    with open(sys.argv[-1] if len(sys.argv) > 2 else sys.argv[1], 'w') as f:
+        f.writelines(output)
+    print("converted %i functions to lazy bindings" % count)
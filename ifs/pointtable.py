@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+#
+# Compact in-memory table of the datapoints of an RTU
+# each point is a slotted record, created once when its first value is received. The datapoint id,
+# redis key and influxdb series key are computed at that moment, so an update only assigns
+# the value, quality and timestamp of the existing record.
+#
+
+ASDU_NAMES = {
+    1: "SinglePointInformation", #                  M_SP_NA_1; 1 (bool)
+    3: "DoublePointInformation", #                  M_DP_NA_1; 3 (2 bits enum)
+    5: "StepPositionInformation", #                 M_ST_NA_1; 5 (int between -64 and 63)
+    7: "BitString32", #                             M_BO_NA_1; 7 (bits, max 32 bits )
+    9: "MeasuredValueNormalized", #                 M_ME_NA_1; 9 (float normalized value between -1 and 1)
+    11: "MeasuredValueScaled", #                    M_ME_NB_1; 11 (int between -32.768 and 32.767)
+    13: "MeasuredValueShort", #                     M_ME_NC_1; 13 (float value)
+    15: "IntegratedTotals", #                       M_IT_NA_1; 15 (32 bit counter)
+    21: "MeasuredValueNormalizedWithoutQuality", #  M_ME_ND_1; 21 (float normalized value between -1 and 1, no quality)
+    30: "SinglePointInformation_CP56Time2a", #      M_SP_TB_1; 30 (bool with timestamp)
+    31: "DoublePointInformation_CP56Time2a", #      M_DP_TB_1; 31 (2 bits enum with timestamp)
+    32: "StepPositionInformation_CP56Time2a", #     M_ST_TB_1; 32 (int between -64 and 63 with timestamp)
+    33: "BitString32_CP56Time2a", #                 M_BO_TB_1; 33 (bits, max 32 bits with timestamp)
+    34: "MeasuredValueNormalized_CP56Time2a", #     M_ME_TD_1; 34 (float normalized value between -1 and 1 with timestamp)
+    35: "MeasuredValueScaled_CP56Time2a", #         M_ME_TE_1; 35 (int between -32.768 and 32.767 with timestamp)
+    36: "MeasuredValueShort_CP56Time2a", #          M_ME_TF_1; 36 (float value with timestamp)
+    37: "IntegratedTotals_CP56Time2a", #            M_IT_TB_1; 37 (32 bit counter with timestamp)
+    45: "SinglePointCommand", #                     C_SC_NA_1; 45 (bool)
+    46: "DoublePointCommand", #                     C_DC_NA_1; 46 (2 bits enum)
+    47: "RegulatingStepCommand", #                  C_RC_NA_1; 47 (0=invalid, 1=lower, 2=higher, 3=invalid)
+    48: "SetpointCommandNormalized", #              C_SE_NA_1; 48 (float normalized value between -1 and 1)
+    49: "SetpointCommandScaled", #                  C_SE_NB_1; 49 (int between -32.768 and 32.767)
+    50: "SetpointCommandShort", #                   C_SE_NC_1; 50 (float value)
+    51: "BitstringCommand", #                       C_BO_NA_1; 51 (bits, max 32 bits )
+    107: "TestCommand_CP56Time2a", #                C_TS_TA_1; 107
+    256: "status", #                                RTU status type, not mapped in IEC60870 standard, used for device status datapoint in IFS
+}
+
+
+def getAsduName(datatype):
+    return ASDU_NAMES.get(datatype)
+
+
+def datapoint_id(rtu, ASDU, ioa):
+    return "iec60870-5-104://" + rtu + "/" + str(getAsduName(ASDU)) + "/" + str(ioa)
+
+
+# escape a tag value for the influxdb line protocol
+def escape_tag(value):
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+
+class DataPoint:
+    __slots__ = ('ioa', 'ASDU', 'id', 'redis_key', 'series_key', 'value', 'quality', 'timestamp')
+
+    def __init__(self, rtu, ASDU, ioa):
+        self.ioa = ioa
+        self.ASDU = ASDU
+        self.id = datapoint_id(rtu, ASDU, ioa)
+        self.redis_key = "data:" + self.id
+        self.series_key = "datapoint,id=" + escape_tag(self.id) # influxdb measurement and id tag
+        self.value = None
+        self.quality = 0
+        self.timestamp = None # source time in ms, None if the ASDU has no timestamp
+
+
+    def __repr__(self):
+        return "%s=%s(q:%i)" % (self.id, str(self.value), self.quality)
+
+
+class PointTable:
+
+    def __init__(self, rtu):
+        self.rtu = rtu
+        self.points = {} # (ASDU << 24) | ioa -> DataPoint, an IOA is at most 24 bits
+
+
+    def __len__(self):
+        return len(self.points)
+
+
+    def get(self, ASDU, ioa):
+        key = (ASDU << 24) | ioa
+        point = self.points.get(key)
+        if point == None:
+            point = DataPoint(self.rtu, ASDU, ioa)
+            self.points[key] = point
+        return point
+
+
+    def update(self, ASDU, ioa, value, quality=0, timestamp=None):
+        point = self.get(ASDU, ioa)
+        point.value = value
+        point.quality = quality
+        point.timestamp = timestamp
+        return point
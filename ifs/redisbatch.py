@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+# Batched writer for the realtime db(redis)
+# values are collected per ASDU (and within a short flush window), and written with a
+# pipelined MSET, so the amount of round trips does not scale with the amount of IOA's
+# each update is also appended to the value stream in the same pipeline (see valuestream.py)
+#
+import threading
+import time
+import logging
+
+import valuestream
+
+logger = logging.getLogger('ifs')
+
+
+class RedisBatchWriter:
+
+    def __init__(self, rt_db, flush_interval=0.05, batch_size=1000):
+        self.rt_db = rt_db
+        self.flush_interval = flush_interval # seconds, 0 means flush every batch immediately
+        self.batch_size = batch_size # max keys per MSET, a full buffer is flushed immediately
+        self.pending = {}
+        self.updates = [] # (point, value, quality, timestamp) for the value stream, these are not coalesced
+        self.lock = threading.Lock() # protects pending
+        self.flush_lock = threading.Lock() # ensures batches reach redis in the order they were collected
+        self.running = False
+        self.thread = None
+        self.stats = {
+            'flushes': 0,   # amount of pipelines executed
+            'keys': 0,      # amount of keys written
+            'coalesced': 0, # amount of updates overwritten by a newer value within the same window
+            'errors': 0,    # amount of failed pipelines
+        }
+
+
+    def start(self):
+        if self.flush_interval > 0 and self.thread == None:
+            self.running = True
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+
+    def stop(self):
+        self.running = False
+        if self.thread != None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+
+    def set(self, key, value, quality=0, timestamp=None):
+        self.update_many([(key, value, quality, timestamp)])
+
+
+    # add a batch of key/values (i.e. all IOA's of an ASDU)
+    def set_many(self, mapping):
+        self.update_many([(key, value, 0, None) for key, value in mapping.items()])
+
+
+    # add a batch of (key, value, quality, timestamp), timestamp in ms or None for now
+    def update_many(self, updates):
+        now = int(time.time() * 1000)
+        with self.lock:
+            size = len(self.pending)
+            for key, value, quality, timestamp in updates:
+                self.pending[key] = value
+                self.updates.append((key[5:], value, quality, timestamp or now)) # key without data:
+            self.stats['coalesced'] += size + len(updates) - len(self.pending)
+            full = len(self.pending) >= self.batch_size
+
+        if full == True or self.flush_interval <= 0:
+            self.flush()
+
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                if len(self.pending) == 0:
+                    return 0
+                batch = self.pending
+                updates = self.updates
+                self.pending = {}
+                self.updates = []
+
+            items = list(batch.items())
+            try:
+                pipe = self.rt_db.pipeline(transaction=False)
+                for i in range(0, len(items), self.batch_size):
+                    pipe.mset(dict(items[i:i + self.batch_size]))
+                for point, value, quality, timestamp in updates:
+                    valuestream.add_value(pipe, point, value, quality, timestamp)
+                pipe.execute()
+                self.stats['flushes'] += 1
+                self.stats['keys'] += len(items)
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error("redis: could not write batch of %i keys: %s" % (len(items), str(e)))
+                return -1
+            return len(items)
+
+
+    def run(self):
+        while self.running == True:
+            time.sleep(self.flush_interval)
+            self.flush()
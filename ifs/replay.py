@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+#
+# Replay a capture file of the IFS (see IFS_CAPTURE_FILE) through the normal ingest path:
+# decode -> scaling -> deadband -> redis -> influxdb, to benchmark ingest changes with field data offline
+# the scaling and deadbands of datapoint_config are loaded from mongodb as the IFS does, if mongodb
+# cannot be reached, the values are replayed without them
+#
+# usage: python3 replay.py <capture file> [speed] [remote]
+#   speed: 1 replays at the recorded speed (default), N replays N times faster, 0 as fast as possible
+#   remote: use the IFS_* environment variables for the databases, as app.py does
+#
+import os
+import sys
+import time
+import logging
+
+import redis
+import pymongo
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.write_api import SYNCHRONOUS
+
+import app
+from capture import read_capture
+from iec104asyncio import decode_apdu, C_SC_NA_1, C_DC_NA_1
+from pointtable import PointTable
+from redisbatch import RedisBatchWriter
+from influxdb_writer import InfluxDBBatchWriter
+
+
+def replay(filename, speed):
+    tables = {} # rtu -> PointTable
+    apdus = 0
+    values = 0
+    first = None
+    start = time.monotonic()
+    for received, rtu, apdu in read_capture(filename):
+        if speed > 0:
+            if first == None:
+                first = received
+            delay = (received - first) / speed - (time.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+        apdus += 1
+        asdu = decode_apdu(apdu)
+        if asdu == None or asdu[2] == None: # S/U frame, or a type without values (GI, testframe)
+            continue
+        type_id, cot, elements = asdu
+        if type_id == C_SC_NA_1 or type_id == C_DC_NA_1: # command responses are not stored
+            continue
+        if not rtu in tables:
+            tables[rtu] = PointTable(rtu)
+        points = tables[rtu]
+        data = [points.update(type_id, ioa, value, quality, timestamp) for ioa, value, quality, timestamp in elements]
+        if len(data) > 0:
+            app.callback(rtu, data)
+            values += len(data)
+    return apdus, values
+
+
+if __name__ == '__main__':
+    logger = logging.getLogger('replay')
+    logging.basicConfig(format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s',
+        level=logging.INFO)
+
+    if len(sys.argv) < 2:
+        print("usage: python3 replay.py <capture file> [speed] [remote]")
+        exit(-1)
+    filename = sys.argv[1]
+    speed = 1.0
+    if len(sys.argv) > 2:
+        speed = float(sys.argv[2])
+
+    mongodb_host = "mongodb"
+    mongodb_db = "scada"
+    mongodb_username="dbuser"
+    mongodb_password="mongo_secret"
+
+    redis_host = "localhost"
+    redis_password = "redis_secret"
+
+    influxdb_host = "http://127.0.0.1:8086"
+    influxdb_api = "influxdb_secret"
+    influxdb_org = "scada"
+
+    if len(sys.argv) > 3 and sys.argv[3] == "remote":
+        mongodb_host = os.environ['IFS_MONGODB_HOST']
+        mongodb_db = os.environ['IFS_MONGODB_DB']
+        mongodb_username=os.environ['IFS_MONGODB_USERNAME']
+        mongodb_password=os.environ['IFS_MONGODB_PASSWORD']
+
+        redis_host = os.environ['IFS_REDIS_HOST']
+        redis_password = os.environ['IFS_REDIS_PASSWORD']
+
+        influxdb_host = os.environ['IFS_INFLUXDB_HOST']
+        influxdb_api = os.environ['IFS_INFLUXDB_API']
+        influxdb_org = os.environ['IFS_INFLUXDB_ORG']
+
+    rt_db = redis.Redis(host=redis_host, port=6379, password=redis_password)
+    influxdb_client = InfluxDBClient(url=influxdb_host, token=influxdb_api, org=influxdb_org)
+
+    # use the ingest path of the IFS, with the same batching settings, scaling and deadbands
+    app.logger = logger
+    try:
+        mongodb_client = pymongo.MongoClient(host=mongodb_host, port=27017,
+            username=mongodb_username,
+            password=mongodb_password,
+            authSource=mongodb_db,
+            authMechanism='SCRAM-SHA-256',
+            connect=True,
+            connectTimeoutMS=2000,
+            socketTimeoutMS=2000,
+            serverSelectionTimeoutMS=2000)
+        app.scada_database = mongodb_client.scada
+        app.load_datapoint_config()
+    except Exception as e:
+        logger.warning("could not load datapoint_config from mongodb, replaying without scaling and deadbands: " + str(e))
+    app.redis_writer = RedisBatchWriter(rt_db, app.REDIS_FLUSH_INTERVAL, app.REDIS_BATCH_SIZE)
+    app.influxdb_writer = InfluxDBBatchWriter(influxdb_client.write_api(write_options=SYNCHRONOUS), influxdb_org,
+            batch_size=app.INFLUXDB_BATCH_SIZE,
+            flush_interval=app.INFLUXDB_FLUSH_INTERVAL,
+            queue_size=app.INFLUXDB_QUEUE_SIZE,
+            spill_file=None)
+    app.update_datapoint = app.update_datapoint_influxdb
+    app.redis_writer.start()
+    app.influxdb_writer.start()
+
+    logger.info("replaying %s at %s" % (filename, "max speed" if speed <= 0 else str(speed) + "x"))
+    start = time.monotonic()
+    apdus, values = replay(filename, speed)
+    # include writing the remaining batches
+    app.redis_writer.stop()
+    app.influxdb_writer.stop()
+    elapsed = time.monotonic() - start
+    logger.info("replayed %i APDU's with %i values in %.2f seconds (%.0f values/s)" % (apdus, values, elapsed, values / max(elapsed, 0.001)))
+    logger.info("redis: %s" % str(app.redis_writer.stats))
+    logger.info("influxdb: %s" % str(app.influxdb_writer.stats))
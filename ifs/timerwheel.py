@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+#
+# Hashed timer wheel, for the timers of the RTU's (testframe, connect timeout, reconnect) and the
+# jobs of the IFS main loop. A timer is stored in the slot of the tick it expires in, so expired()
+# only looks at the slots of the ticks that passed, instead of at all timers: the cost of a poll does
+# not depend on the amount of RTU's. Timers further away than one round of the wheel stay in their
+# slot, and are checked once per round.
+#
+# a key has at most one timer, scheduling it again replaces the timer
+#
+
+
+class TimerWheel:
+
+    def __init__(self, tick=0.1, slots=512):
+        self.tick = tick # seconds per slot, timers expire up to one tick late
+        self.slots = [{} for i in range(slots)] # key -> expiry time
+        self.timers = {} # key -> slot index
+        self.current = None # last tick processed by expired()
+        self.first = None # first tick of the timers scheduled before the first expired()
+
+
+    def schedule(self, key, when):
+        self.cancel(key)
+        # the first tick that starts after 'when', so the timer has expired when its slot is processed
+        tick = int(when / self.tick) + 1
+        if self.current != None and tick <= self.current:
+            tick = self.current + 1
+        elif self.current == None and (self.first == None or tick < self.first):
+            self.first = tick
+        index = tick % len(self.slots)
+        self.slots[index][key] = when
+        self.timers[key] = index
+
+
+    def cancel(self, key):
+        index = self.timers.pop(key, None)
+        if index != None:
+            del self.slots[index][key]
+
+
+    def __contains__(self, key):
+        return key in self.timers
+
+
+    def __len__(self):
+        return len(self.timers)
+
+
+    # remove and return the keys of all expired timers
+    def expired(self, now):
+        tick = int(now / self.tick)
+        if self.current == None:
+            # start at the first timer, so timers scheduled before the first call are not skipped for a round
+            self.current = min(tick, self.first if self.first != None else tick) - 1
+        keys = []
+        # at most one round, when more ticks passed all slots are processed once
+        for t in range(max(self.current + 1, tick - len(self.slots) + 1), tick + 1):
+            slot = self.slots[t % len(self.slots)]
+            if len(slot) == 0:
+                continue
+            for key, when in list(slot.items()):
+                if when <= now:
+                    del slot[key]
+                    del self.timers[key]
+                    keys.append(key)
+        self.current = max(self.current, tick)
+        return keys
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+#
+# IFS for modbus TCP devices
+# the devices are configured in the mongodb collection dataprovider_list, like the RTU's of the
+# IEC104 IFS, with type "modbus" and the registers to poll:
+#
+#   { "dataprovider": "10.1.0.20:502", "type": "modbus", "enabled": 1, "IFS": "",
+#     "poll_interval": 1,       # seconds, optional
+#     "max_gap": 10,            # optional, max unused addresses read to merge two read requests
+#     "max_requests": 1,        # optional, requests in flight on the connection
+#     "registers": [
+#       { "unit": 1, "table": "holding", "address": 100, "count": 4, "format": "int16" },
+#       { "unit": 1, "table": "coil", "address": 0, "count": 8 } ] }
+#
+# values are written to the realtime db as data:modbus://<host:port>/<unit>/<table>/<address>, and
+# the connection state as connections:<rtu>.active and the status datapoint modbus://<host:port>/status/1
+# coils and holding registers are written with operate:modbus://<host:port>/<unit>/<table>/<address>
+#
+
+import os
+import time
+import math
+import sys
+import asyncio
+import threading
+import logging
+from urllib.parse import urlparse
+import redis
+from redisbatch import RedisBatchWriter
+from deadband import DeadbandFilter
+from scaling import ValueScaler
+from planner import Register, TABLES
+from device import ModbusDevice
+
+import pymongo
+
+from influxdb_client import InfluxDBClient
+from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_writer import InfluxDBBatchWriter
+
+IFS_NAME = os.environ.get('IFS_NAME', "MODBUS_A")
+LIMIT = int(os.environ.get('IFS_RTU_LIMIT', 100)) # maximum devices polled by this instance
+value_bucket = "bucket_1"
+redis_writer = None
+influxdb_writer = None
+loop = None # event loop of the devices
+devices = {} # RTU name -> ModbusDevice, of the devices of this IFS
+deadband_filter = DeadbandFilter()
+value_scaler = ValueScaler()
+
+# batching of realtime db writes, values received within the flush interval are written in one pipeline
+REDIS_FLUSH_INTERVAL = float(os.environ.get('IFS_REDIS_FLUSH_INTERVAL', 0.05)) # seconds, 0 writes each poll immediately
+REDIS_BATCH_SIZE = int(os.environ.get('IFS_REDIS_BATCH_SIZE', 1000)) # max keys per MSET
+# batching of historical db writes, values are queued and written by a background thread
+INFLUXDB_BATCH_SIZE = int(os.environ.get('IFS_INFLUXDB_BATCH_SIZE', 500)) # max records per write
+INFLUXDB_FLUSH_INTERVAL = float(os.environ.get('IFS_INFLUXDB_FLUSH_INTERVAL', 1.0)) # seconds
+INFLUXDB_QUEUE_SIZE = int(os.environ.get('IFS_INFLUXDB_QUEUE_SIZE', 100000)) # records buffered in memory
+INFLUXDB_SPILL_FILE = os.environ.get('IFS_INFLUXDB_SPILL_FILE', "./influxdb_spill.lp") # records buffered on disk while influxdb is down
+MODBUS_POLL_INTERVAL = float(os.environ.get('IFS_MODBUS_POLL_INTERVAL', 1)) # seconds, default for devices without poll_interval
+MODBUS_TIMEOUT = float(os.environ.get('IFS_MODBUS_TIMEOUT', 3)) # seconds to wait for a connection or response
+MODBUS_RECONNECT_INTERVAL = float(os.environ.get('IFS_MODBUS_RECONNECT_INTERVAL', 5)) # seconds between connection attempts
+STATS_INTERVAL = 10 # seconds between publishing IFS statistics
+HEARTBEAT_INTERVAL = 1 # seconds between watchdog signals and configuration checks
+WATCH_RETRY_INTERVAL = 5 # seconds before a failed watch of a mongodb collection is restarted
+
+
+def status_id(rtu):
+    return "modbus://%s/status/1" % rtu
+
+
+# value as stored in the realtime db, floats (float32 registers, scaled values) without truncation
+def store_value(value):
+    if isinstance(value, float) and not value.is_integer():
+        return value
+    return int(value)
+
+
+# write a value as line protocol, like the datapoints of the IEC104 IFS, with floats also in the field value_float
+def update_datapoint_influxdb(datapoint, value, timestamp):
+    global influxdb_writer
+    if isinstance(value, float):
+        # nan and inf (float32 registers) have no integer value, and are not accepted by influxdb, they are only stored in the realtime db
+        if not math.isfinite(value):
+            logger.warning("value %r of %s not stored in influxdb" % (value, datapoint))
+            return
+        influxdb_writer.write(value_bucket, "datapoint,id=%s,quality=good value=%ii,value_float=%r %i" % (escape_tag(datapoint), int(value), value, timestamp))
+    else:
+        influxdb_writer.write(value_bucket, "datapoint,id=%s,quality=good value=%ii %i" % (escape_tag(datapoint), int(value), timestamp))
+
+
+def escape_tag(value):
+    return value.replace("\\", "\\\\").replace(",", "\\,").replace("=", "\\=").replace(" ", "\\ ")
+
+
+# called from the device task with the values that changed in a poll
+def callback(rtu, values):
+    global redis_writer
+    logger.debug("RTU:" + rtu + " - update:" + str(values))
+    # all values of a poll are written to the realtime db as one batch
+    updates = []
+    now = time.monotonic()
+    timestamp = time.time_ns()
+    # convert all values of the poll to engineering units at once
+    registers = [register for register, value in values]
+    values = value_scaler.convert([register.id for register in registers], [value for register, value in values])
+    for register, value in zip(registers, values):
+        # skip values within the deadband of this datapoint
+        if deadband_filter.accept(register.id, value, 0, now) == False:
+            continue
+        updates.append((register.redis_key, store_value(value), 0, None))
+        update_datapoint_influxdb(register.id, value, timestamp)
+    if len(updates) > 0:
+        redis_writer.update_many(updates)
+
+
+def set_status(rtu, value):
+    redis_writer.set("data:" + status_id(rtu), value)
+    update_datapoint_influxdb(status_id(rtu), value, time.time_ns())
+
+
+# called from the device task when the connection opened or closed
+def rtu_state_changed(rtu, online):
+    if online == True:
+        logger.info("RTU connected:"+rtu)
+        rt_db.set('connections:'+rtu+".active", b'1')
+        set_status(rtu, 1) # set status datapoint to online
+    else:
+        logger.info("RTU disconnected:"+rtu)
+        rt_db.set("connections:"+rtu+".active", b'0')
+        set_status(rtu, 0) # set status datapoint to offline
+
+
+# operate:modbus://<host:port>/<unit>/<table>/<address>, from the redis subscriber thread
+def operate_handler(message):
+    element = message['channel'].decode("utf-8")[8:]
+    value = message['data'].decode("utf-8")
+    logger.info("operate:" + element + ">" + value)
+    uri = urlparse(element)
+    path = uri.path.strip("/").split("/")
+    device = devices.get(uri.netloc)
+    if device == None:
+        logger.error("operate: device %s is not polled by %s" % (uri.netloc, IFS_NAME))
+        return
+    if len(path) != 3 or not path[1] in TABLES or not path[0].isdigit() or not path[2].isdigit():
+        logger.error("operate: invalid datapoint %s" % element)
+        return
+    future = asyncio.run_coroutine_threadsafe(device.write(int(path[0]), path[1], int(path[2]), value), loop)
+    future.add_done_callback(lambda done: operate_done(element, done))
+
+
+def operate_done(element, done):
+    if done.exception() != None:
+        logger.error("operate of %s failed: %s" % (element, str(done.exception()) or type(done.exception()).__name__))
+
+
+def split_RTU(rtu):
+    _rtu = rtu.split(":")
+    ip = _rtu[0]
+    if len(_rtu) > 1:
+        port = int(_rtu[1])
+    else:
+        port = 502
+    return ip, port
+
+
+# retrieve the modbus devices of this IFS from mongodb, the IFS field empty or "auto" is any modbus IFS
+# (the devices are not divided over modbus IFS instances: a device without IFS is polled by every instance,
+# so assign the devices when there is more than one). The first LIMIT devices are polled, the others are
+# logged, and published in the redis set modbus_rtu_unserved:<IFS_NAME>
+def get_RTU_config():
+    global scada_database
+    config = {}
+    cursor = scada_database.dataprovider_list.find({"enabled": 1, "type": "modbus"})
+    for item in cursor:
+        if not item.get("IFS", "") in ("", "auto", IFS_NAME):
+            continue
+        config[item['dataprovider']] = item
+    rtus = sorted(config)
+    unserved = rtus[LIMIT:]
+    if len(unserved) > 0:
+        logger.error("too much RTU's for this IFS. limit: %i, %i RTU's not polled: %s" % (LIMIT, len(unserved), ", ".join(unserved)))
+    pipe = rt_db.pipeline()
+    pipe.delete("modbus_rtu_unserved:" + IFS_NAME)
+    if len(unserved) > 0:
+        pipe.sadd("modbus_rtu_unserved:" + IFS_NAME, *unserved)
+    pipe.execute()
+    return dict((rtu, config[rtu]) for rtu in rtus[:LIMIT])
+
+
+# the registers of a device, an entry with a count is that amount of registers of its format, one after another
+def get_registers(rtu, item):
+    registers = []
+    for entry in item.get("registers", []):
+        try:
+            address = int(entry["address"])
+            for i in range(int(entry.get("count", 1))):
+                register = Register(rtu, entry.get("unit", 1), entry["table"], address, entry.get("format", "uint16"))
+                registers.append(register)
+                address += register.count
+        except (KeyError, ValueError) as e:
+            logger.error("invalid register %s of %s: %s" % (str(entry), rtu, str(e)))
+    return registers
+
+
+def add_RTU(rtu, item):
+    ip, port = split_RTU(rtu)
+    device = ModbusDevice(rtu, ip, port, get_registers(rtu, item), callback, rtu_state_changed,
+            poll_interval=float(item.get("poll_interval", MODBUS_POLL_INTERVAL)),
+            timeout=MODBUS_TIMEOUT,
+            max_gap=item.get("max_gap"),
+            max_requests=int(item.get("max_requests", 1)),
+            reconnect_interval=MODBUS_RECONNECT_INTERVAL)
+    logger.info("RTU %s: %i registers in %i read requests" % (rtu, len(device.registers), len(device.requests)))
+    rt_db.set("connections:"+rtu+".active", b'0')
+    set_status(rtu, 0) # set status datapoint to offline, if we initialise the RTU
+    rt_db.hset("ifs_rtu_owner", rtu, IFS_NAME)
+    devices[rtu] = device
+    device.start()
+
+
+# the status datapoint is set offline by the device, when it was connected
+def remove_RTU(rtu, removed=True):
+    device = devices.pop(rtu)
+    device.stop()
+    if removed == True: # if the RTU is only changed, it is added again
+        rt_db.hdel("ifs_rtu_owner", rtu)
+
+
+# publish counters of this IFS in the realtime db, as ifs_stats:<IFS_NAME>, and per device as ifs_rtu_stats:<IFS_NAME>
+def publish_stats():
+    stats = {}
+    for key, value in redis_writer.stats.items():
+        stats["redis_" + key] = value
+    for key, value in influxdb_writer.stats.items():
+        stats["influxdb_" + key] = value
+    for key, value in deadband_filter.stats.items():
+        stats["deadband_" + key] = value
+    for key, value in value_scaler.stats.items():
+        stats["scaling_" + key] = value
+    stats["devices"] = len(devices)
+    stats["devices_online"] = len([device for device in devices.values() if device.online == True])
+    rtu_stats = {}
+    for rtu, device in devices.items():
+        for key, value in device.stats.items():
+            rtu_stats[rtu + "." + key] = value
+        for key, value in device.client.stats.items():
+            rtu_stats[rtu + "." + key] = value
+    pipe = rt_db.pipeline(transaction=False)
+    pipe.hset("ifs_stats:" + IFS_NAME, mapping=stats)
+    pipe.delete("ifs_rtu_stats:" + IFS_NAME)
+    if len(rtu_stats) > 0:
+        pipe.hset("ifs_rtu_stats:" + IFS_NAME, mapping=rtu_stats)
+    pipe.execute()
+
+
+# retrieve deadband and scaling configuration per datapoint from mongodb
+def load_datapoint_config():
+    global scada_database
+    documents = list(scada_database.datapoint_config.find({"datapoint": {"$regex": "^modbus://"}}))
+    count = deadband_filter.load(documents)
+    logger.info("loaded deadband configuration for %i datapoints" % count)
+    count = value_scaler.load(documents)
+    logger.info("loaded scaling configuration for %i datapoints" % count)
+
+
+# watch a collection in mongodb for changes, in a thread. the watch blocks until there is a change,
+# which sets changed, so changes are applied at the next heartbeat
+def watch_collection(collection, changed):
+    while True:
+        try:
+            with collection.watch() as stream:
+                # changes before the watch started, or while it was down, are not in the stream
+                changed.set()
+                for change in stream:
+                    logger.debug("Change document: %r" % (change,))
+                    changed.set()
+        except pymongo.errors.PyMongoError as e:
+            logger.error("mongodb: watch of %s failed: %s" % (collection.name, str(e)))
+        time.sleep(WATCH_RETRY_INTERVAL)
+
+
+async def main():
+    global loop
+    loop = asyncio.get_running_loop()
+    rtu_config = {}
+
+    # changes in mongodb are watched by threads
+    dataprovider_changed = threading.Event()
+    datapoint_config_changed = threading.Event()
+    for collection, changed in ((scada_database.dataprovider_list, dataprovider_changed), (scada_database.datapoint_config, datapoint_config_changed)):
+        threading.Thread(target=watch_collection, args=(collection, changed), daemon=True).start()
+    dataprovider_changed.set()
+    datapoint_config_changed.set()
+
+    next_stats = time.monotonic() + STATS_INTERVAL
+    while True:
+        # watchdog signal, the IEC104 IFS instances do not divide their RTU's with this IFS, so it has its own channel
+        rt_db.publish("modbus_status_online", IFS_NAME)
+
+        # datapoint configuration changed in mongo, reload the deadbands and scaling
+        if datapoint_config_changed.is_set():
+            datapoint_config_changed.clear()
+            load_datapoint_config()
+
+        # datapoint table changed in mongo, restart the devices that were added, removed or changed
+        if dataprovider_changed.is_set():
+            dataprovider_changed.clear()
+            new_rtu_config = get_RTU_config()
+            for rtu in list(devices):
+                if rtu_config.get(rtu) != new_rtu_config.get(rtu):
+                    logger.info("removing RTU:" + rtu)
+                    remove_RTU(rtu, not rtu in new_rtu_config)
+            for rtu, item in new_rtu_config.items():
+                if not rtu in devices:
+                    logger.info("adding RTU:" + rtu)
+                    add_RTU(rtu, item)
+            rtu_config = new_rtu_config
+
+        if time.monotonic() >= next_stats:
+            next_stats += STATS_INTERVAL
+            publish_stats()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+
+
+
+################################################################
+if __name__ == '__main__':
+    logger = logging.getLogger('modbus_ifs')
+    logging.basicConfig(format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s',
+        level=logging.INFO)
+
+    logger.info("starting modbus IFS")
+
+    mongodb_host = "mongodb"
+    mongodb_db = "scada"
+    mongodb_username="dbuser"
+    mongodb_password="mongo_secret"
+
+    redis_host = "localhost"
+    redis_password = "redis_secret"
+
+    influxdb_host = "http://127.0.0.1:8086"
+    influxdb_api = "influxdb_secret"
+    influxdb_org = "scada"
+
+    if len(sys.argv) > 1:
+        if sys.argv[1] == "remote":
+            logger.info("remote host parameters (for inside docker-compose network)")
+            mongodb_host = os.environ['IFS_MONGODB_HOST']
+            mongodb_db = os.environ['IFS_MONGODB_DB']
+            mongodb_username=os.environ['IFS_MONGODB_USERNAME']
+            mongodb_password=os.environ['IFS_MONGODB_PASSWORD']
+
+            redis_host = os.environ['IFS_REDIS_HOST']
+            redis_password = os.environ['IFS_REDIS_PASSWORD']
+
+            influxdb_host = os.environ['IFS_INFLUXDB_HOST'] #"http://influxdb:8086"
+            influxdb_api = os.environ['IFS_INFLUXDB_API']
+            influxdb_org = os.environ['IFS_INFLUXDB_ORG']
+
+
+    #connect redis, mongodb and influxdb
+    try:
+        mongodb_client = pymongo.MongoClient(host=mongodb_host, port=27017,
+            username=mongodb_username,
+            password=mongodb_password,
+            authSource=mongodb_db,
+            authMechanism='SCRAM-SHA-256',
+            connect=True,
+            connectTimeoutMS=2000,
+            socketTimeoutMS=2000)
+        logger.info("connected to mongodb")
+        scada_database = mongodb_client.scada
+    except Exception as e:
+        logger.error("mongodb: exception while initialising mongodb connection: " + str(e))
+        mongodb_client = None
+        exit(-1)
+
+    try:
+        rt_db = redis.Redis(host=redis_host, port=6379, password=redis_password)
+        logger.info("connected to redis")
+        redis_writer = RedisBatchWriter(rt_db, REDIS_FLUSH_INTERVAL, REDIS_BATCH_SIZE)
+        redis_writer.start()
+        #subscribe redis events for operate, of all modbus devices
+        call_p = rt_db.pubsub()
+        call_p.psubscribe(**{ "operate:modbus://*": operate_handler })
+        thread = call_p.run_in_thread(sleep_time=0.001)
+    except:
+        logger.error("there is an issue with redis db")
+        rt_db = None
+        exit(-1)
+
+    try:
+        influxdb_client = InfluxDBClient(url=influxdb_host,
+                token=influxdb_api,
+                org=influxdb_org)
+        influxdb_write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
+        influxdb_writer = InfluxDBBatchWriter(influxdb_write_api, influxdb_org,
+                batch_size=INFLUXDB_BATCH_SIZE,
+                flush_interval=INFLUXDB_FLUSH_INTERVAL,
+                queue_size=INFLUXDB_QUEUE_SIZE,
+                spill_file=INFLUXDB_SPILL_FILE)
+        influxdb_writer.start()
+    except:
+        logger.error("there is an issue with influxdb")
+        exit(-1)
+
+    logger.info("init done, %s polling modbus devices" % IFS_NAME)
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+#
+# Deadband / report-by-exception filter for received values
+# configured per datapoint in the mongodb collection datapoint_config:
+#   { "datapoint": "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/100",
+#     "deadband_abs": 5,      # absolute deadband, 0 reports every change (report-by-exception)
+#     "deadband_pct": 1.0,    # deadband in percent of the last stored value
+#     "max_silence": 300 }    # seconds after which an unchanged value is stored anyway
+# a value is stored if it differs from the last stored value by more than the largest of both deadbands,
+# or if its quality changed. Datapoints without configuration are not filtered.
+#
+
+
+class DeadbandFilter:
+
+    def __init__(self):
+        self.config = {} # datapoint -> (deadband_abs, deadband_pct, max_silence)
+        self.last = {} # datapoint -> (value, quality, time) of the last stored value
+        self.stats = {
+            'passed': 0,     # values stored
+            'suppressed': 0, # values not stored, as they were within the deadband
+            'forced': 0,     # unchanged values stored due to max_silence
+        }
+
+
+    # load the configuration from documents of the datapoint_config collection
+    def load(self, documents):
+        config = {}
+        for item in documents:
+            if not 'datapoint' in item:
+                continue
+            if not 'deadband_abs' in item and not 'deadband_pct' in item and not 'max_silence' in item:
+                continue
+            try:
+                max_silence = item.get('max_silence', None)
+                config[item['datapoint']] = (
+                    float(item.get('deadband_abs', 0)),
+                    float(item.get('deadband_pct', 0)),
+                    float(max_silence) if max_silence != None else None
+                )
+            except (TypeError, ValueError):
+                print("error: invalid deadband or max_silence of %s" % item['datapoint'])
+                continue
+        self.config = config
+        # forget values of datapoints that are no longer filtered
+        for datapoint in list(self.last):
+            if not datapoint in config:
+                self.last.pop(datapoint, None)
+        return len(config)
+
+
+    # returns True if the value should be stored
+    def accept(self, datapoint, value, quality, now):
+        cfg = self.config.get(datapoint)
+        if cfg == None:
+            return True
+
+        last = self.last.get(datapoint)
+        if last != None and quality == last[1]:
+            deadband_abs, deadband_pct, max_silence = cfg
+            band = max(deadband_abs, abs(last[0]) * deadband_pct / 100.0)
+            if abs(value - last[0]) <= band:
+                if max_silence == None or now - last[2] < max_silence:
+                    self.stats['suppressed'] += 1
+                    return False
+                self.stats['forced'] += 1
+
+        self.last[datapoint] = (value, quality, now)
+        self.stats['passed'] += 1
+        return True
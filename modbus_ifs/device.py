@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+#
+# Polling of one modbus TCP device, as an asyncio task
+# each poll sends the read requests of the poll planner concurrently (limited by max_requests of the
+# connection), and reports the values that changed since the previous poll. All devices are polled
+# by their own task, so a slow or unreachable device does not delay the others.
+#
+import asyncio
+import time
+
+from modbus import ModbusClient, ModbusError
+from planner import Register, plan_reads, TABLES
+
+
+class ModbusDevice:
+
+    def __init__(self, rtu, host, port, registers, callback, state_changed, poll_interval=1, timeout=3,
+            max_gap=None, max_requests=1, reconnect_interval=5):
+        self.rtu = rtu # name of the dataprovider
+        self.client = ModbusClient(host, port, timeout, max_requests)
+        self.registers = {register.id: register for register in registers}
+        self.requests = plan_reads(registers, max_gap)
+        self.callback = callback # called with (rtu, [(register, value)]) with the changed values of a poll
+        self.state_changed = state_changed # called with (rtu, online) when the connection opens or closes
+        self.poll_interval = poll_interval # seconds between the start of two polls
+        self.reconnect_interval = reconnect_interval # seconds between connection attempts
+        self.values = {} # datapoint id -> last reported value
+        self.online = False
+        self.wakeup = None # asyncio.Event, set to poll directly (i.e. after a write)
+        self.task = None
+        self.stats = {
+            'polls': 0,       # completed polls
+            'reads': 0,       # read requests sent
+            'read_errors': 0, # read requests with an exception response
+            'writes': 0,      # writes by operate commands
+            'poll_ms': 0,     # duration of the last poll
+        }
+
+
+    def start(self):
+        self.wakeup = asyncio.Event()
+        self.task = asyncio.ensure_future(self.run())
+
+
+    def stop(self):
+        if self.task != None:
+            self.task.cancel()
+            self.task = None
+        self.disconnected()
+
+
+    def disconnected(self):
+        self.client.close()
+        self.values = {} # report all values again after a reconnect
+        if self.online == True:
+            self.online = False
+            self.state_changed(self.rtu, False)
+
+
+    async def run(self):
+        while True:
+            if not self.client.connected():
+                try:
+                    await self.client.connect()
+                except Exception as e:
+                    print("error: could not connect to %s: %s" % (self.rtu, str(e)))
+                    self.disconnected()
+                    await asyncio.sleep(self.reconnect_interval)
+                    continue
+                self.online = True
+                self.state_changed(self.rtu, True)
+
+            start = time.monotonic()
+            try:
+                await self.poll()
+            except Exception as e: # a connection error, timeout, or an unexpected response: reconnect, so the task does not end
+                print("error: poll of %s failed: %s" % (self.rtu, str(e) or type(e).__name__))
+                self.disconnected()
+                await asyncio.sleep(self.reconnect_interval)
+                continue
+            self.stats['poll_ms'] = round((time.monotonic() - start) * 1000, 1)
+
+            # wait for the next poll, or a write
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), max(0, start + self.poll_interval - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+
+
+    # send all read requests at once, and report the changed values
+    # a connection error or timeout of any request is raised, and closes the connection
+    async def poll(self):
+        results = await asyncio.gather(*[self.read(request) for request in self.requests], return_exceptions=True)
+        self.stats['reads'] += len(self.requests)
+        changed = []
+        for request, result in zip(self.requests, results):
+            if isinstance(result, ModbusError):
+                # i.e. an address in the request does not exist, see max_gap
+                self.stats['read_errors'] += 1
+                print("error: read of %s %s: %s" % (self.rtu, str(request), str(result)))
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            for register in request.registers:
+                value = register.decode(result, request.start)
+                if self.values.get(register.id) != value:
+                    self.values[register.id] = value
+                    changed.append((register, value))
+        self.stats['polls'] += 1
+        if len(changed) > 0:
+            self.callback(self.rtu, changed)
+
+
+    async def read(self, request):
+        if TABLES[request.table][2] == True:
+            return await self.client.read_bits(request.unit, request.function, request.start, request.count)
+        return await self.client.read_registers(request.unit, request.function, request.start, request.count)
+
+
+    # write a value to a coil or holding register, a register that is not polled is written as uint16
+    # raises ValueError for a table that can not be written, or a value that does not fit
+    async def write(self, unit, table, address, value):
+        register = Register(self.rtu, unit, table, address)
+        register = self.registers.get(register.id, register)
+        if table == "coil":
+            await self.client.write_coil(register.unit, register.address, register.encode(value)[0])
+        elif table == "holding":
+            words = register.encode(value)
+            if len(words) == 1:
+                await self.client.write_register(register.unit, register.address, words[0])
+            else:
+                await self.client.write_registers(register.unit, register.address, words)
+        else:
+            raise ValueError("%s is read only" % table)
+        self.stats['writes'] += 1
+        # read the new value directly
+        self.wakeup.set()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+#
+# Modbus TCP client, in pure python with asyncio
+# a request is a PDU (function code and data) in an MBAP header with a transaction id, the
+# response with the same transaction id completes the request. max_requests limits the amount of
+# requests in flight on the connection, 1 (the default) waits for each response before the next
+# request is sent, as many devices handle only one request at a time.
+#
+import asyncio
+import struct
+
+# function codes
+READ_COILS = 1
+READ_DISCRETE_INPUTS = 2
+READ_HOLDING_REGISTERS = 3
+READ_INPUT_REGISTERS = 4
+WRITE_SINGLE_COIL = 5
+WRITE_SINGLE_REGISTER = 6
+WRITE_MULTIPLE_COILS = 15
+WRITE_MULTIPLE_REGISTERS = 16
+
+EXCEPTION_NAMES = {
+    1: "illegal function",
+    2: "illegal data address",
+    3: "illegal data value",
+    4: "server device failure",
+    6: "server device busy",
+    10: "gateway path unavailable",
+    11: "gateway target device failed to respond",
+}
+
+
+# exception response of the device
+class ModbusError(Exception):
+
+    def __init__(self, function, code):
+        self.function = function
+        self.code = code
+        super().__init__("function %i: exception %i (%s)" % (function, code, EXCEPTION_NAMES.get(code, "unknown")))
+
+
+# the data of a read response is a byte count and the bytes, a response that does not have the requested amount
+# of bytes is a broken device or connection, raises ConnectionError so the connection is closed
+def check_length(function, data, length):
+    if len(data) == 0 or data[0] != length or len(data) != length + 1:
+        raise ConnectionError("invalid response of function %i: %i bytes expected, received %s" % (function, length, data.hex()))
+
+
+# MBAP header: transaction id, protocol id (0), length of the rest of the frame, unit id
+def encode_frame(transaction, unit, pdu):
+    return struct.pack(">HHHB", transaction, 0, len(pdu) + 1, unit) + pdu
+
+
+def unpack_bits(data, count):
+    return [(data[i // 8] >> (i % 8)) & 1 for i in range(count)]
+
+
+def pack_bits(values):
+    data = bytearray((len(values) + 7) // 8)
+    for i, value in enumerate(values):
+        if value:
+            data[i // 8] |= 1 << (i % 8)
+    return bytes(data)
+
+
+class ModbusClient:
+
+    def __init__(self, host, port=502, timeout=3, max_requests=1):
+        self.host = host
+        self.port = port
+        self.timeout = timeout # seconds to wait for the connection, and for each response
+        self.reader = None
+        self.writer = None
+        self.receiver = None # task that reads the responses
+        self.transaction = 0
+        self.pending = {} # transaction id -> future of the response PDU
+        self.slots = asyncio.Semaphore(max_requests)
+        self.stats = {
+            'requests': 0,   # requests sent
+            'responses': 0,  # responses received
+            'exceptions': 0, # exception responses
+            'timeouts': 0,   # requests without response within timeout
+        }
+
+
+    def connected(self):
+        return self.writer != None and not self.writer.is_closing()
+
+
+    async def connect(self):
+        self.reader, self.writer = await asyncio.wait_for(asyncio.open_connection(self.host, self.port), self.timeout)
+        self.receiver = asyncio.ensure_future(self.receive())
+
+
+    def close(self):
+        if self.receiver != None:
+            self.receiver.cancel()
+            self.receiver = None
+        if self.writer != None:
+            self.writer.close()
+            self.writer = None
+        for future in self.pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("connection closed"))
+        self.pending = {}
+
+
+    async def receive(self):
+        try:
+            while True:
+                header = await self.reader.readexactly(7)
+                transaction, protocol, length, unit = struct.unpack(">HHHB", header)
+                if length < 1: # the length includes the unit id, the stream can not be framed anymore
+                    break
+                pdu = await self.reader.readexactly(length - 1)
+                future = self.pending.pop(transaction, None)
+                if future != None and not future.done():
+                    future.set_result(pdu)
+        except (asyncio.IncompleteReadError, ConnectionError, OSError):
+            pass
+        # the connection is gone, fail the requests in flight
+        self.receiver = None
+        self.close()
+
+
+    # send a PDU and return the data of the response, raises ModbusError for an exception response,
+    # asyncio.TimeoutError without response, and ConnectionError if the connection is closed
+    async def request(self, unit, function, data):
+        async with self.slots:
+            if not self.connected():
+                raise ConnectionError("not connected")
+            self.transaction = (self.transaction + 1) % 65536
+            transaction = self.transaction
+            future = asyncio.get_running_loop().create_future()
+            self.pending[transaction] = future
+            self.writer.write(encode_frame(transaction, unit, struct.pack(">B", function) + data))
+            self.stats['requests'] += 1
+            try:
+                pdu = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                self.pending.pop(transaction, None)
+                self.stats['timeouts'] += 1
+                raise
+        self.stats['responses'] += 1
+        if len(pdu) == 0 or (pdu[0] == function | 0x80 and len(pdu) < 2):
+            raise ConnectionError("invalid response of function %i: %s" % (function, pdu.hex()))
+        if pdu[0] == function | 0x80:
+            self.stats['exceptions'] += 1
+            raise ModbusError(function, pdu[1])
+        if pdu[0] != function:
+            raise ModbusError(function, 0)
+        return pdu[1:]
+
+
+    # read coils (1) or discrete inputs (2), returns a list of 0/1
+    async def read_bits(self, unit, function, address, count):
+        data = await self.request(unit, function, struct.pack(">HH", address, count))
+        check_length(function, data, (count + 7) // 8)
+        return unpack_bits(data[1:], count)
+
+
+    # read holding (3) or input (4) registers, returns a list of unsigned 16 bit values
+    async def read_registers(self, unit, function, address, count):
+        data = await self.request(unit, function, struct.pack(">HH", address, count))
+        check_length(function, data, 2 * count)
+        return list(struct.unpack(">%iH" % count, data[1:]))
+
+
+    async def write_coil(self, unit, address, value):
+        await self.request(unit, WRITE_SINGLE_COIL, struct.pack(">HH", address, 0xFF00 if value else 0))
+
+
+    async def write_register(self, unit, address, value):
+        await self.request(unit, WRITE_SINGLE_REGISTER, struct.pack(">HH", address, value & 0xFFFF))
+
+
+    # write a list of unsigned 16 bit values
+    async def write_registers(self, unit, address, values):
+        await self.request(unit, WRITE_MULTIPLE_REGISTERS, struct.pack(">HHB%iH" % len(values), address, len(values), 2 * len(values), *values))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+#
+# Poll planner of the modbus IFS
+# the registers configured for a device are merged into as few read requests as possible: per unit
+# id and table, registers are sorted by address, and a request is extended with the next register
+# as long as the request stays within the maximum size of a modbus PDU (125 registers, or 2000 bits).
+# The unused addresses between two registers are read as well, max_gap limits how many, for devices
+# that reject reads of addresses that do not exist.
+#
+# a datapoint is addressed as modbus://<host:port>/<unit>/<table>/<address>, i.e.
+#   modbus://10.1.0.20:502/1/holding/100
+#
+import struct
+
+# table -> (read function code, max amount per read request, bits)
+TABLES = {
+    "coil":     (1, 2000, True),
+    "discrete": (2, 2000, True),
+    "holding":  (3, 125, False),
+    "input":    (4, 125, False),
+}
+
+# format -> (amount of registers, struct format of the big endian bytes)
+FORMATS = {
+    "uint16": (1, ">H"),
+    "int16":  (1, ">h"),
+    "uint32": (2, ">I"),
+    "int32":  (2, ">i"),
+    "float32": (2, ">f"),
+}
+
+
+def datapoint_id(rtu, unit, table, address):
+    return "modbus://%s/%i/%s/%i" % (rtu, unit, table, address)
+
+
+class Register:
+    __slots__ = ('unit', 'table', 'address', 'format', 'count', 'id', 'redis_key')
+
+    def __init__(self, rtu, unit, table, address, format="uint16"):
+        if not table in TABLES:
+            raise ValueError("unknown table: %s" % str(table))
+        if TABLES[table][2] == True:
+            format = "bit"
+            count = 1
+        elif format in FORMATS:
+            count = FORMATS[format][0]
+        else:
+            raise ValueError("unknown format: %s" % str(format))
+        self.unit = int(unit)
+        self.table = table
+        self.address = int(address)
+        if self.address < 0 or self.address + count > 65536:
+            raise ValueError("address out of range: %i" % self.address)
+        self.format = format
+        self.count = count # amount of bits or registers
+        self.id = datapoint_id(rtu, self.unit, table, self.address)
+        self.redis_key = "data:" + self.id
+
+
+    # value of this register, from the bits or registers of the read request it is part of
+    def decode(self, values, start):
+        offset = self.address - start
+        if self.format == "bit":
+            return values[offset]
+        words = values[offset:offset + self.count]
+        return struct.unpack(FORMATS[self.format][1], struct.pack(">%iH" % self.count, *words))[0]
+
+
+    # registers to write for a value, raises ValueError (or struct.error) if it does not fit the format
+    def encode(self, value):
+        if self.format == "bit":
+            return [1 if float(value) != 0 else 0]
+        if self.format != "float32":
+            value = int(float(value))
+        else:
+            value = float(value)
+        return list(struct.unpack(">%iH" % self.count, struct.pack(FORMATS[self.format][1], value)))
+
+
+    def __repr__(self):
+        return "%s(%s)" % (self.id, self.format)
+
+
+class ReadRequest:
+    __slots__ = ('unit', 'table', 'function', 'start', 'count', 'registers')
+
+    def __init__(self, unit, table, start, count, registers):
+        self.unit = unit
+        self.table = table
+        self.function = TABLES[table][0]
+        self.start = start
+        self.count = count
+        self.registers = registers # the configured registers within start..start+count
+
+
+    def __repr__(self):
+        return "unit %i %s %i-%i (%i registers)" % (self.unit, self.table, self.start, self.start + self.count - 1, len(self.registers))
+
+
+# merge registers into the minimum amount of read requests per unit id and table
+# a request starts at the lowest address not read yet, and includes each next register that
+# fits within the maximum request size (and max_gap, if set). this is optimal for sorted registers,
+# as no other request can start later and still include the first register.
+def plan_reads(registers, max_gap=None):
+    groups = {}
+    for register in registers:
+        groups.setdefault((register.unit, register.table), []).append(register)
+
+    requests = []
+    for (unit, table), group in sorted(groups.items()):
+        maximum = TABLES[table][1]
+        group.sort(key=lambda register: (register.address, register.count))
+        current = []
+        start = end = None # addresses of the current request, end is exclusive
+        for register in group:
+            if register.count > maximum:
+                continue
+            if len(current) > 0 and register.address + register.count - start <= maximum and (max_gap == None or register.address - end <= max_gap):
+                current.append(register)
+                end = max(end, register.address + register.count)
+                continue
+            if len(current) > 0:
+                requests.append(ReadRequest(unit, table, start, end - start, current))
+            current = [register]
+            start = register.address
+            end = register.address + register.count
+        if len(current) > 0:
+            requests.append(ReadRequest(unit, table, start, end - start, current))
+    return requests
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+#
+# Conversion of received values to engineering units, before they are filtered and stored
+# configured per datapoint in the mongodb collection datapoint_config, next to the deadbands:
+#   { "datapoint": "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/100",
+#     "scale": 0.1, "offset": -40 }                       # linear: value * scale + offset
+#   { "datapoint": "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/101",
+#     "table": [[0, 0], [4000, 100], [20000, 500]] }      # lookup table: (raw, engineering) pairs, interpolated
+# a lookup table is interpolated linearly between its pairs, and clamped to its first and last pair.
+#
+# the coefficients are loaded once into arrays, with a slot per datapoint, and all values of a batch
+# (i.e. all IOA's of an ASDU) are converted in one pass over the arrays. Datapoints without
+# configuration are not converted, a batch without configured datapoints is returned as is.
+# (numpy is not used: the values arrive as python lists, and the conversion to and from numpy arrays
+# costs more than the loop, up to batches of ~2000 values, far more than the IOA's of an ASDU)
+#
+from array import array
+from bisect import bisect_right
+
+
+class ValueScaler:
+
+    def __init__(self):
+        self.slots = {} # datapoint -> slot in the arrays below
+        self.scale = array('d')
+        self.offset = array('d')
+        self.table = array('i') # slot -> index in tables, -1 for a linear conversion
+        self.tables = [] # (raw values, engineering values) of each lookup table, raw values ascending
+        self.stats = {
+            'batches': 0, # batches with at least one converted value
+            'values': 0,  # values converted
+        }
+
+
+    # load the configuration from documents of the datapoint_config collection
+    def load(self, documents):
+        slots = {}
+        scale = array('d')
+        offset = array('d')
+        table = array('i')
+        tables = []
+        for item in documents:
+            if not 'datapoint' in item:
+                continue
+            if 'table' in item:
+                try:
+                    pairs = sorted((float(raw), float(value)) for raw, value in item['table'])
+                except (TypeError, ValueError):
+                    print("error: invalid scaling table of %s" % item['datapoint'])
+                    continue
+                if len(pairs) < 2:
+                    print("error: scaling table of %s needs at least 2 pairs" % item['datapoint'])
+                    continue
+                table.append(len(tables))
+                tables.append(([raw for raw, value in pairs], [value for raw, value in pairs]))
+                scale.append(1.0)
+                offset.append(0.0)
+            elif 'scale' in item or 'offset' in item:
+                try:
+                    coefficients = (float(item.get('scale', 1)), float(item.get('offset', 0)))
+                except (TypeError, ValueError):
+                    print("error: invalid scale or offset of %s" % item['datapoint'])
+                    continue
+                table.append(-1)
+                scale.append(coefficients[0])
+                offset.append(coefficients[1])
+            else:
+                continue
+            slots[item['datapoint']] = len(scale) - 1
+
+        # replace the arrays at once, so a batch that is converted at the same time (by a worker thread) uses the old or the new ones
+        self.slots, self.scale, self.offset, self.table, self.tables = slots, scale, offset, table, tables
+        return len(slots)
+
+
+    # convert the values of a batch, returns a list with the values in engineering units (floats), and
+    # the values of datapoints without configuration unchanged. ids and values are lists of equal length
+    def convert(self, ids, values):
+        slots, scale, offset, table, tables = self.slots, self.scale, self.offset, self.table, self.tables
+        if len(slots) == 0:
+            return values
+        index = [slots.get(id, -1) for id in ids]
+        converted = len(index) - index.count(-1)
+        if converted == 0:
+            return values
+        self.stats['batches'] += 1
+        self.stats['values'] += converted
+        result = list(values)
+        for i, slot in enumerate(index):
+            if slot < 0:
+                continue
+            if table[slot] < 0:
+                result[i] = values[i] * scale[slot] + offset[slot]
+            else:
+                result[i] = interpolate(tables[table[slot]], values[i])
+        return result
+
+
+# interpolate linearly between the pairs of a lookup table, clamped to the first and last pair
+def interpolate(table, value):
+    raw, values = table
+    i = bisect_right(raw, value)
+    if i == 0:
+        return values[0]
+    if i == len(raw):
+        return values[-1]
+    return values[i - 1] + (value - raw[i - 1]) * (values[i] - values[i - 1]) / (raw[i] - raw[i - 1])
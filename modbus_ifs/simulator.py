@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+#
+# Simulated Modbus TCP server, to test the modbus IFS without a device
+# all addresses of all unit id's exist and start at 0, writes are stored, and the input registers
+# 0-9 of unit 1 change every second. The amount of requests per function is printed every 10 seconds,
+# to see how many read requests the poll planner uses.
+#
+#   python3 simulator.py [port]
+#
+# a dataprovider for the simulator, in the mongodb collection dataprovider_list:
+#   { "dataprovider": "127.0.0.1:1502", "type": "modbus", "enabled": 1, "IFS": "",
+#     "registers": [ { "unit": 1, "table": "input", "address": 0, "count": 10 } ] }
+#
+import asyncio
+import random
+import struct
+import sys
+
+from modbus import encode_frame, pack_bits, unpack_bits
+
+TABLES = {1: "coil", 2: "discrete", 3: "holding", 4: "input"}
+
+
+class ModbusSimulator:
+
+    def __init__(self):
+        self.memory = {} # (unit, table) -> {address: value}
+        self.requests = {} # function code -> amount of requests
+
+
+    def get(self, unit, table, address):
+        return self.memory.get((unit, table), {}).get(address, 0)
+
+
+    def set(self, unit, table, address, value):
+        self.memory.setdefault((unit, table), {})[address] = value
+
+
+    # handle a request PDU, and return the response PDU
+    def handle(self, unit, pdu):
+        function = pdu[0]
+        self.requests[function] = self.requests.get(function, 0) + 1
+        if function in (1, 2, 3, 4):
+            address, count = struct.unpack(">HH", pdu[1:5])
+            bits = function in (1, 2)
+            if count < 1 or count > (2000 if bits else 125) or address + count > 65536:
+                return struct.pack(">BB", function | 0x80, 3)
+            values = [self.get(unit, TABLES[function], a) for a in range(address, address + count)]
+            if bits:
+                data = pack_bits(values)
+            else:
+                data = struct.pack(">%iH" % count, *values)
+            return struct.pack(">BB", function, len(data)) + data
+        if function == 5:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            self.set(unit, "coil", address, 1 if value == 0xFF00 else 0)
+            return pdu[:5]
+        if function == 6:
+            address, value = struct.unpack(">HH", pdu[1:5])
+            self.set(unit, "holding", address, value)
+            return pdu[:5]
+        if function == 15:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            for i, value in enumerate(unpack_bits(pdu[6:], count)):
+                self.set(unit, "coil", address + i, value)
+            return pdu[:5]
+        if function == 16:
+            address, count = struct.unpack(">HH", pdu[1:5])
+            for i, value in enumerate(struct.unpack(">%iH" % count, pdu[6:6 + 2 * count])):
+                self.set(unit, "holding", address + i, value)
+            return pdu[:5]
+        return struct.pack(">BB", function | 0x80, 1) # illegal function
+
+
+    async def serve_client(self, reader, writer):
+        try:
+            while True:
+                header = await reader.readexactly(7)
+                transaction, protocol, length, unit = struct.unpack(">HHHB", header)
+                pdu = await reader.readexactly(length - 1)
+                writer.write(encode_frame(transaction, unit, self.handle(unit, pdu)))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        writer.close()
+
+
+    async def start(self, host="127.0.0.1", port=1502):
+        return await asyncio.start_server(self.serve_client, host, port)
+
+
+async def main(port):
+    simulator = ModbusSimulator()
+    server = await simulator.start("0.0.0.0", port)
+    print("modbus simulator listening on port %i" % port)
+    seconds = 0
+    while True:
+        await asyncio.sleep(1)
+        for address in range(10):
+            simulator.set(1, "input", address, random.randint(0, 1000))
+        seconds += 1
+        if seconds % 10 == 0:
+            print("requests per function: %s" % str(simulator.requests))
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1502))
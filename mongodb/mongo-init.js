@@ -6,6 +6,10 @@ db.dataprovider_list.insert([
 	{ "dataprovider":"10.1.0.10:2404","enabled":1,"IFS":"IFS_A","type":"iec60870-5-104" },
 ]);
 
+db.createCollection("datapoint_config");
+
+db.createCollection("switching_sequences");
+
 db.createCollection("alarm_table");
 db.alarm_table.insert([
     {"alert_id":1,"datapoint":"static://local/DoublePointInformation/414","acknowledged":false,"alarm":true,"details":"some stuff<br>link to schema alarm location: <a href=\"http://127.0.0.1:5000/?focus=0#19/-0.00018/0.00111\">here</a><br>link to gis alarm location: <a href=\"http://127.0.0.1:5000/?focus=1#19/51.99039/5.84950\">here</a>","element":"s2.a/b/c/d","message":"Trip","open":true,"severity":0,"time":"2023-02-20 19:25:28.830368+00:00","value":"2","comment":""}
@@ -7,30 +7,32 @@
 # switch within property is also the connection of both datapoints : 
 #   properties: { "v_node_list" : [{ type, link1, link2, input},..] }
 #
-import logging, time, os, sys
+import logging, time, os, sys, json
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
 
 import pymongo
 from bson import ObjectId
 import redis
+import socket
+import valuestream
+from topology import Topology, EXT, SWITCH
+from islands import Islands
 
 value_bucket = "bucket_1"
+MGET_BATCH = 1000 # keys per MGET
 
 # query all nodes in schema for properties, v_node_list
 # for all results (all v_node_lists)
-#    make dict of id : {type, node(s), (input), value=0, to_be_resolved=true}
+#    make dict of id : {type, node(s), (input)}
 #link = {
 #    "type": "ext", # ext, link,
 #    "uri": "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/100", # URI
-#    "value": 0,
-#    "to_be_resolved": True
 #}  links = {"1234567": link}
 #node = {
 #    "type": "coupling", # coupling, switch
-#    "link1": get_link_byref(links, "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/100"), # URI
-#    "link2": get_link_byref(links, "solver://link/100"), # URI
-#    "to_be_resolved": True
+#    "link1": "iec60870-5-104://127.0.0.1:2404/MeasuredValueScaled/100", # URI
+#    "link2": "solver://link/100", # URI
 #    #"input":"iec60870-5-104://127.0.0.1:2404/DoublePointValue/100"
 #}
 #nodes = {"1234567": node}
@@ -38,7 +40,7 @@ def get_schema_data():
   global mongoclient
   if mongoclient == None:
     logger.error("no mongodb connection")
-    return {}
+    return {}, {}
 
   db = mongoclient.scada
   cursor1 = db.schema_objects.find(
@@ -50,9 +52,7 @@ def get_schema_data():
   nodes = {}
   for item in cursor1:
     for subkey, subitem in enumerate(item['properties']['v_node_list']):
-        subitem["to_be_resolved"] = True
         if subitem['type'] == "ext" or subitem['type'] == "link":
-            subitem["value"] = 0
             links[str(item['_id']) + "_" + str(subkey) ] = subitem
         if subitem['type'] == "coupling" or subitem['type'] == "switch":
             nodes[str(item['_id']) + "_" + str(subkey) ] = subitem
@@ -63,9 +63,7 @@ def get_schema_data():
     )
   for item in cursor2:
     for subkey, subitem in enumerate(item['properties']['v_node_list']):
-        subitem["to_be_resolved"] = True
         if subitem['type'] == "ext" or subitem['type'] == "link":
-            subitem["value"] = 0
             links[str(item['_id']) + "_" + str(subkey) ] = subitem
         if subitem['type'] == "coupling" or subitem['type'] == "switch":
             nodes[str(item['_id']) + "_" + str(subkey) ] = subitem
@@ -74,119 +72,126 @@ def get_schema_data():
 
 
 
+# compile the v_node_list entries into a topology
 def get_network_mongodb():
     links, nodes = get_schema_data()
-
-    # remove all id's of type link with duplicate node, slow, but ok for now
-    temp = []
-    result_link = dict()
-    for key, link in links.items():
-        if link['uri'] not in temp:
-            temp.append(link['uri'])
-            result_link[key] = link
-        else:
-            logger.warning("removed nonsensical link: "+ str(key) +", both links have same ref")
-    links = result_link
-
-    # remove nonsensical nodes, where both refs are the same, and
-    # remove all id's of type coupling with both nodes duplicate + warn,  keep duplicate switch nodes, but warn
-    temp = []
-    result_nodes = dict()
-    for key, node in nodes.items():
-        if node['link1'] == node['link2']:
-            logger.warning("removed nonsensical node: "+ str(key) +", both links have same ref")
-            continue
-
-        forward = node['type'] + "_" + node['link1'] + node['link2']
-        reverse = node['type'] + "_" + node['link2'] + node['link1']    
-        if forward in temp or reverse in temp:
-            if node['type'] == "coupling":
-                logger.warning("duplicate coupling, removing second one: " + str(key))
-                continue
-            else:
-                logger.warning("duplicate switch: " + str(key) + ", keeping node")
-        # append to resulting list
-        temp.append(forward)
-        temp.append(reverse)
-
-        # remove nodes that reference to items that not resolve
-        link1 = get_link_byref(links, node['link1'])
-        if link1 == None:
-            logger.warning("could not resolve link: " + str(node['link1']))
+    topology = Topology(links, nodes)
+    logger.info("topology: " + str(topology))
+    return topology
+
+
+# write the link values that changed since the last publish to redis in one pipeline, without ext values,
+# of all links or the given link id's, with a summary of the solve on solver_summary. An unchanged network
+# is not written at all. returns the amount of links written
+def publish_signals(topology, values, links=None, solve="full", solve_ms=0):
+    global published
+    if published == None or len(published) != len(values):
+        published = [None] * len(values) # link id -> value in redis
+    if links == None:
+        links = range(len(values))
+    pipe = rt_db.pipeline(transaction=False)
+    changed = 0
+    for link in links:
+        if topology.link_type[link] == EXT:
             continue
-        node['link1'] = link1
-
-        link2 = get_link_byref(links, node['link2'])
-        if link2 == None:
-            logger.warning("could not resolve link: " + str(node['link2']))
+        value = int(values[link])
+        if published[link] == value:
             continue
-        node['link2'] = link2
-
-        result_nodes[key] = node
-    nodes = result_nodes
-
-    return nodes, links #return 2 dicts, 1 of link/ext nodes, one of coupling/switch nodes
-
-
-def get_link_byref(link_list, ref): 
-    for link in link_list:
-        if link_list[link]['uri'] == ref:
-            return link_list[link] 
-    return None
-
-
-
-def publish_signals(link_list):
-    # copy dict over to redis, without ext values
-    for link in link_list:
-        if link_list[link]['type'] == "link":
-            rt_db.set("data:" + link_list[link]['uri'], int(link_list[link]['value']) )
+        published[link] = value
+        uri = topology.uris[topology.link_uri[link]]
+        pipe.set("data:" + uri, value)
+        valuestream.add_value(pipe, uri, value)
+        changed += 1
+    if changed > 0:
+        pipe.publish("solver_summary", json.dumps({ 'solve': solve, 'changed': changed, 'solve_ms': solve_ms,
+            'conflicts': len(islands.conflicts), 'ts': int(time.time() * 1000) }))
+        pipe.execute()
+    return changed
+
+
+# fetch the values of the inputs from redis, with one MGET per MGET_BATCH uris in one pipeline. Inputs that
+# are not in redis keep their value in cached (the inputs of the last solve, with the updates from the
+# value stream), or else are queried from influxdb at once
+def get_input_values(uris, cached):
+    pipe = rt_db.pipeline(transaction=False)
+    for i in range(0, len(uris), MGET_BATCH):
+        pipe.mget(["data:" + uri for uri in uris[i:i + MGET_BATCH]])
+    results = pipe.execute()
+
+    values = {}
+    missing = []
+    for i, data in enumerate(item for result in results for item in result):
+        uri = uris[i]
+        if data != None:
+            try:
+                values[uri] = to_value(data.decode("utf-8"))
+                continue
+            except ValueError:
+                logger.error("invalid value for " + uri + ": " + str(data))
+        if uri in cached:
+            values[uri] = cached[uri]
+        else:
+            missing.append(uri)
 
+    if len(missing) > 0:
+        try:
+            found = influxdb_get_values(missing)
+            for uri in missing:
+                values[uri] = found.get(uri, 0) # an input without any value is 0, until it is updated
+            logger.info("%i inputs not in redis, %i found in influxdb" % (len(missing), len(found)))
+        except Exception as e:
+            logger.error("could not query influxdb for %i inputs. Error: %s" % (len(missing), str(e)))
+    return values
 
-def get_datapoint_value(ref):
-    #get datapoint value from redis or influxdb, 
-    data = rt_db.get("data:" + ref )
-    if data != None:
-        return int(data.decode("utf-8"))
 
-    influxdata = influxdb_get_value(ref)
-    if influxdata != None:
-        return influxdata
-    return 0
+# values are stored as text, scaled values can be floats
+def to_value(data):
+    try:
+        return int(data)
+    except ValueError:
+        return float(data)
 
 
-def influxdb_get_value(point):
+# the last value of each point in influxdb, in one query, returns a dict point -> value
+def influxdb_get_values(points):
   global influxdb_query_api
-  # query influxdb for possible update
   query = ' from(bucket:"' + value_bucket + '")\
     |> range(start: 0)\
     |> filter(fn:(r) => r._measurement == "datapoint")\
-    |> filter(fn: (r) => r.id == "' + point + '")\
+    |> filter(fn:(r) => r._field == "value")\
+    |> filter(fn: (r) => contains(value: r.id, set: ' + json.dumps(points) + '))\
     |> last() '
 
   result = influxdb_query_api.query(org="scada", query=query)
-  if result and len(result) > 0:
-    for table in result:
-      for record in table.records:
-        return record.get_value() # return first result
-  return None
-
-
-def re_init(list):
-    for item in list:
-        list[item]['to_be_resolved'] = True
-        if "value" in list[item]:
-            list[item]['value'] = 0
-
-
-# update the calculation if a redis update event happened
-def redis_dataUpdate(msg):
-    # only update when an ext is updated
-    if msg['channel'].decode("utf-8").startswith("__keyspace@0__:data:solver://"):
-        return
-    global update
-    logger.info("dataupdate!")
-    update = True
+  values = {}
+  times = {}
+  for table in result or []:
+    for record in table.records:
+      # a point has a table per quality, keep the latest
+      point = record.values.get("id")
+      if not point in times or record.get_time() > times[point]:
+        times[point] = record.get_time()
+        values[point] = record.get_value()
+  return values
+
+
+# re-evaluate the islands of the ext's and switches that were updated, and publish the links that changed
+def redis_dataUpdate(updates):
+    start = time.perf_counter()
+    changed = set()
+    for point, value, quality, timestamp in updates:
+        # the own links are no input
+        if point.startswith("solver://"):
+            continue
+        try:
+            changed.update(islands.update(point, to_value(value)))
+        except ValueError:
+            logger.error("invalid value for " + point + ": " + str(value))
+    if len(changed) > 0:
+        solve_ms = round((time.perf_counter() - start) * 1000, 1)
+        published = publish_signals(islands.topology, islands.values, changed, "update", solve_ms)
+        log_conflicts(islands)
+        logger.info("dataupdate, %i links changed, %i published" % (len(changed), published))
 
 
 # watch for changes in mongodb
@@ -203,72 +208,53 @@ def mongo_watch_changes(stream):
             return False
 
 
-def calculate_network(node_list, link_list):
-    # take all sensors(i.e external datapoints), for these, voltage is known, init those nodes with that value, to-be-resolved = false
-    for link in link_list:
-        if link_list[link]['type'] == 'ext':
-            try:
-                link_list[link]['value'] = get_datapoint_value(link_list[link]['uri'])
-                link_list[link]['to_be_resolved'] = False
-            except Exception as e:
-                logger.error("could not resolve datapoint value. Error:" + str(e))
-    # all other links(i.e. own datapoint type) left as: to_be_resolved = true
-
-    # check if all is resolved, or no mutations anymore
-    resolved = 0
-    while True:
-        old_resolved = resolved # store result of previous iteration
-        resolved = 0   # count amount of resolved nodes
-        to_be_resolved = 0 # count amount of nodes to resolve
-
-        for node in node_list:
-            if node_list[node]['to_be_resolved'] == False: # already resolved
-                resolved = resolved + 1 # count how many we skip
-                continue
-            to_be_resolved = to_be_resolved + 1
-            
-            link1 = node_list[node]['link1']
-            link2 = node_list[node]['link2']
+# the uris of all inputs of the network: the values of the ext's and the states of the switches
+def get_input_uris(topology):
+    inputs = set()
+    for link, uri in enumerate(topology.link_uri):
+        if topology.link_type[link] == EXT:
+            inputs.add(uri)
+    for node, uri in enumerate(topology.node_input):
+        if topology.node_type[node] == SWITCH and uri >= 0:
+            inputs.add(uri)
+    return [topology.uris[uri] for uri in inputs]
+
+
+# solve the whole network by islands (see islands.py), with the inputs fetched at once
+def calculate_network(islands, uris):
+    start = time.perf_counter()
+    inputs = get_input_values(uris, islands.inputs)
+    fetch_ms = round((time.perf_counter() - start) * 1000, 1)
+    values = islands.solve(inputs)
+    log_conflicts(islands)
+    logger.info("fetched %i inputs in %.1f ms" % (len(uris), fetch_ms))
+    return values
+
+
+# compare a full solve with the incremental result before it. Inputs that changed in redis without an update on
+# the value stream are counted on their own, as the incremental result could not know them, and the links are
+# only compared when the full solve used the same inputs. ext's are no result of the solve, and are not compared
+def check_consistency(islands, previous, previous_inputs):
+    changed = [uri for uri, value in islands.inputs.items() if previous_inputs.get(uri, 0) != value]
+    if len(changed) > 0:
+        logger.warning("consistency check: %i inputs changed without an update on the value stream: %s" % (len(changed), ", ".join(changed[:10])))
+        return
+    link_type = islands.topology.link_type
+    differences = sum(1 for link in range(len(previous)) if link_type[link] != EXT and islands.values[link] != previous[link])
+    if differences > 0:
+        logger.warning("consistency check: %i links differ from the incremental solve" % differences)
 
-            if link1['to_be_resolved'] == True and link2['to_be_resolved'] == True: # nothing to solve if both unkown, wait until more info
-                continue
-            elif link1['to_be_resolved'] == False and link2['to_be_resolved'] == False: # both are known, nothing to be done, so dont try to resolve anymore this coupling/switch
-                node_list[node]['to_be_resolved'] = False
-                continue
 
-            if node_list[node]['type'] == 'coupling':
-                # one should here be tresolved, and the other not, if so, copy value, to-be-resolved = false of coupling, and link
-                if link1['to_be_resolved'] == True:
-                    link1['value'] = link2['value'] # FUTURE: value * ratio, 
-                    link1['to_be_resolved'] = False
-                if link2['to_be_resolved'] == True:
-                    link2['value'] = link1['value'] # FUTURE: value * ratio,  
-                    link2['to_be_resolved'] = False
-                node_list[node]['to_be_resolved'] = False
-
-            if node_list[node]['type'] == 'switch':
-                # one should here be tresolved, and the other not, if so, check switch state
-                conducting = get_datapoint_value(node_list[node]['input'])
-                if conducting != 0 and conducting != 2: # if switch is conducting, copy value, else leave them unknown
-                    if link1['to_be_resolved'] == True:
-                        link1['value'] = link2['value'] 
-                        link1['to_be_resolved'] = False
-                    if link2['to_be_resolved'] == True:
-                        link2['value'] = link1['value']   
-                        link2['to_be_resolved'] = False
-                node_list[node]['to_be_resolved'] = False
-            # end type checks
-            resolved = resolved + 1 # count how many we have done
-
-        # end for loop for all nodes
-        
-        if to_be_resolved == 0 or old_resolved == resolved: # if true, no more (new) resolves, so quit
-            break
-    # end while loop for resove iterations
+# log the islands with conflicting sources once, when the conflict appears
+def log_conflicts(islands):
+    global conflicts
+    found = set(tuple(sorted(sources)) for sources in islands.conflicts.values())
+    for sources in found - conflicts:
+        logger.warning("value conflict, island with sources: " + ", ".join("%s=%s" % source for source in sources))
+    conflicts = found
 
 
 if __name__ == "__main__":
-    global update
 
     logger = logging.getLogger('solver')
     logging.basicConfig(format='%(asctime)s %(name)-12s %(levelname)-8s %(message)s',
@@ -323,9 +309,8 @@ if __name__ == "__main__":
 
     try:
         rt_db = redis.Redis(host=redis_host, port=6379, password=redis_password)
-        rt_pubsub = rt_db.pubsub()
-
-        rt_pubsub.psubscribe(**{'__keyspace@0__:data:*': redis_dataUpdate}) 
+        # receive value updates in batches from the value stream
+        rt_stream = valuestream.StreamConsumer(rt_db, "solver", socket.gethostname())
         logger.info("connected to redis")
     except:
         logger.error("there is an issue with redis db")
@@ -345,39 +330,36 @@ if __name__ == "__main__":
         influxdb_write_api = None
 
 
-    # retrieve all unique items in mongodb, and put them in dict, based on type(link-node, ext, switch, coupling). dict contains node(s)
-    node_list, link_list = get_network_mongodb()
-    publish_signals(link_list) # publish link_list dict with id and value (ignore ext, as it is input) to redis
+    # retrieve all v_node_list items in mongodb, and compile them into a topology of links and nodes(switch, coupling)
+    topology = get_network_mongodb()
+    islands = Islands(topology)
+    input_uris = get_input_uris(topology)
+    conflicts = set()
+    published = None
 
-    update = True
+    # updates are evaluated incrementally, the full solve is repeated as a consistency check
+    check_interval = int(os.environ.get('SOLVER_CHECK_INTERVAL', 60))
     settime = 0
     while True:
-        timer = int(time.monotonic())
-        if update == True:
-            re_init(node_list)
-            re_init(link_list)        
-            calculate_network(node_list, link_list)
-            publish_signals(link_list)
-            update = False
-            curtime = int(time.monotonic())
-            settime = curtime + 1
-            logger.info("sleeping " + str(settime - curtime) + " seconds")
-            #time.sleep(settime - curtime)
-        # rerun calc periodic, 
+        timer = time.monotonic()
         if timer > settime:
-            update = True
-        #time.sleep(1)
-
-        if rt_pubsub == None:
+            previous = list(islands.values)
+            previous_inputs = dict(islands.inputs)
+            values = calculate_network(islands, input_uris)
+            if islands.stats['solves'] > 1:
+                check_consistency(islands, previous, previous_inputs)
+            changed = publish_signals(topology, values, None, "full", islands.stats['solve_ms'])
+            settime = timer + check_interval
+            logger.info("full solve in %.1f ms, %i links published, next in %i seconds, %s" % (islands.stats['solve_ms'], changed, check_interval, str(islands.stats)))
+
+        if rt_db == None:
             logger.error("no redis connection")
             continue
         else:
-            message = rt_pubsub.get_message()
-            if message:
-                logger.warning("missed event:" + str(message))
-            else:
-                time.sleep(0.5)
+            rt_stream.read(redis_dataUpdate, 500) # waits up to 500ms for updates
         # update calc if mongodb updates
         #if mongo_watch_changes(stream_svg) == True or mongo_watch_changes(stream_geo) == True:
-        #    node_list, link_list = get_network_mongodb()
-        #    update = True
+        #    topology = get_network_mongodb()
+        #    islands = Islands(topology)
+        #    input_uris = get_input_uris(topology)
+        #    settime = 0
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+#
+# Benchmark of the island solver (islands.py) against the iterative solver it replaced
+# generates a radial network of feeders, each an ext followed by a chain of links joined by couplings
+# and switches, with normally open ties between neighbouring feeders, in random order as the objects
+# in the schema, and solves it with both. The results are compared for all links outside islands with
+# a value conflict, as the iterative solver gives those the value of the source it happened to reach first.
+# After that, random inputs are changed one by one and evaluated incrementally, and the result is
+# compared with a full solve.
+#
+#   python3 benchmark.py [feeders] [links per feeder]
+#
+import random
+import sys
+import time
+
+from topology import Topology, EXT, SWITCH
+from islands import Islands
+
+
+def generate(feeders, length, seed=1):
+    random.seed(seed)
+    links = {}
+    nodes = {}
+    inputs = {}
+    for feeder in range(feeders):
+        source = "ext://feeder/%i" % feeder
+        links["%i_ext" % feeder] = { "type": "ext", "uri": source }
+        inputs[source] = random.choice([0, 1, 1, 1])
+        previous = source
+        for i in range(length):
+            uri = "solver://feeder/%i/%i" % (feeder, i)
+            links["%i_%i" % (feeder, i)] = { "type": "link", "uri": uri }
+            if i % 3 == 0:
+                state = "switch://feeder/%i/%i" % (feeder, i)
+                nodes["%i_%i_node" % (feeder, i)] = { "type": "switch", "link1": previous, "link2": uri, "input": state }
+                inputs[state] = random.choice([0, 1, 1, 1, 2])
+            else:
+                nodes["%i_%i_node" % (feeder, i)] = { "type": "coupling", "link1": previous, "link2": uri }
+            previous = uri
+        if feeder > 0:
+            state = "switch://tie/%i" % feeder
+            nodes["%i_tie" % feeder] = { "type": "switch", "link1": previous, "link2": "solver://feeder/%i/%i" % (feeder - 1, length - 1), "input": state }
+            inputs[state] = random.choice([2, 2, 2, 1])
+    # the schema objects are not stored in the order of the network
+    keys = list(nodes)
+    random.shuffle(keys)
+    return links, dict((key, nodes[key]) for key in keys), inputs
+
+
+# the iterative solver: copy values over the nodes until no node resolves another link
+def solve_iterative(topology, inputs):
+    links = {}
+    for link, key in enumerate(topology.link_key):
+        uri = topology.uris[topology.link_uri[link]]
+        links[key] = { "ext": topology.link_type[link] == EXT, "uri": uri, "value": 0, "to_be_resolved": True }
+    nodes = {}
+    for node, key in enumerate(topology.node_key):
+        nodes[key] = { "switch": topology.node_type[node] == SWITCH, "to_be_resolved": True,
+            "input": topology.uris[topology.node_input[node]] if topology.node_input[node] >= 0 else None,
+            "link1": links[topology.link_key[topology.node_link1[node]]], "link2": links[topology.link_key[topology.node_link2[node]]] }
+
+    for link in links.values():
+        if link['ext']:
+            link['value'] = inputs.get(link['uri'], 0)
+            link['to_be_resolved'] = False
+
+    resolved = 0
+    while True:
+        old_resolved = resolved
+        resolved = 0
+        to_be_resolved = 0
+        for node in nodes.values():
+            if node['to_be_resolved'] == False:
+                resolved += 1
+                continue
+            to_be_resolved += 1
+            link1 = node['link1']
+            link2 = node['link2']
+            if link1['to_be_resolved'] == True and link2['to_be_resolved'] == True:
+                continue
+            elif link1['to_be_resolved'] == False and link2['to_be_resolved'] == False:
+                node['to_be_resolved'] = False
+                continue
+            conducting = inputs.get(node['input'], 0) if node['switch'] else 1
+            if conducting != 0 and conducting != 2:
+                if link1['to_be_resolved'] == True:
+                    link1['value'] = link2['value']
+                    link1['to_be_resolved'] = False
+                if link2['to_be_resolved'] == True:
+                    link2['value'] = link1['value']
+                    link2['to_be_resolved'] = False
+            node['to_be_resolved'] = False
+            resolved += 1
+        if to_be_resolved == 0 or old_resolved == resolved:
+            break
+    return [links[key]['value'] for key in topology.link_key]
+
+
+if __name__ == "__main__":
+    feeders = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    length = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    links, nodes, inputs = generate(feeders, length)
+    topology = Topology(links, nodes)
+    print("topology: " + str(topology))
+
+    start = time.perf_counter()
+    expected = solve_iterative(topology, inputs)
+    iterative = time.perf_counter() - start
+
+    islands = Islands(topology)
+    start = time.perf_counter()
+    values = islands.solve(inputs)
+    solved = time.perf_counter() - start
+
+    conflict = set(islands.conflicts)
+    differences = 0
+    for link in range(len(values)):
+        if islands.find(link) not in conflict and values[link] != expected[link]:
+            differences += 1
+
+    print("iterative: %.1f ms" % (iterative * 1000))
+    print("islands:   %.1f ms, %i islands with a source, %i with a value conflict" % (solved * 1000, islands.stats['islands'], islands.stats['conflicts']))
+    print("speedup:   %.1fx, %i differences outside conflicts" % (iterative / solved, differences))
+
+    # incremental updates of random inputs, checked against a full solve with the same inputs
+    keys = list(inputs)
+    updates = 10000
+    start = time.perf_counter()
+    for i in range(updates):
+        islands.update(random.choice(keys), random.choice([0, 1, 1, 2]))
+    incremental = time.perf_counter() - start
+    check = Islands(topology)
+    check.solve(islands.inputs)
+    differences = sum(1 for link in range(len(values)) if islands.values[link] != check.values[link])
+    print("updates:   %.3f ms per update (%i merges, %i splits), %i differences with a full solve" % (incremental * 1000 / updates,
+        islands.stats['merges'], islands.stats['splits'], differences))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+#
+# Energization of the network by islands
+# links joined by couplings and conducting switches form an island, and all links of an island have
+# the same value: the value of the ext's (sources) in it. The islands are found with union-find over
+# all nodes, and every island gets the value of its sources in one pass over the links, instead of
+# propagating values over the nodes until nothing changes.
+#
+# an island with sources of different values has a conflict, it gets the highest value, and is
+# reported in conflicts. An island without source has value 0, as an unresolved link.
+#
+# after a full solve, a changed input only re-evaluates the islands it affects:
+#   ext value       the island of the ext
+#   switch closes   the islands on both sides are merged
+#   switch opens    the island of the switch is split, by union-find over its own links only
+# so the cost of an update is proportional to the size of the affected islands, not of the network.
+#
+import time
+from array import array
+
+from topology import EXT, SWITCH
+
+
+# a switch conducts unless its state is 0 or 2 (as the iterative solver did)
+def is_conducting(state):
+    return state != 0 and state != 2
+
+
+class Islands:
+
+    def __init__(self, topology):
+        self.topology = topology
+        links = len(topology.link_key)
+        self.parent = array('i', range(links)) # link id -> parent link id, the root of an island is its own parent
+        self.size = array('i', [1] * links) # root -> amount of links in the island
+        self.members = {} # root -> link id's of the island
+        self.sources = {} # root -> link id's of the ext's of the island, only islands with a source
+        self.values = [0] * links # link id -> value, the value of an ext is its input
+        self.conflicts = {} # root -> (uri, value) of the sources of islands with a conflict
+        self.inputs = {} # uri -> value of the ext's and switch states of the last solve and updates
+        self.conducting = bytearray(len(topology.node_key)) # node id -> 1 if the node joins its links
+
+        # switches by the uri id of their input
+        self.input_nodes = {}
+        for node, uri in enumerate(topology.node_input):
+            if topology.node_type[node] == SWITCH and uri >= 0:
+                self.input_nodes.setdefault(uri, []).append(node)
+
+        self.stats = {
+            'solves': 0,    # full solves
+            'solve_ms': 0,  # duration of the last full solve
+            'updates': 0,   # changed inputs, evaluated incrementally
+            'merges': 0,    # islands merged by a closing switch
+            'splits': 0,    # islands split by an opening switch
+            'evaluated': 0, # links evaluated by updates
+            'islands': 0,   # islands with a source
+            'conflicts': 0, # islands with sources of different values
+        }
+
+
+    def find(self, link):
+        parent = self.parent
+        while parent[link] != link:
+            parent[link] = parent[parent[link]] # path halving
+            link = parent[link]
+        return link
+
+
+    # join the islands of two links, returns the root of the joined island
+    def union(self, a, b):
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return a
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return a
+
+
+    # solve the whole network, inputs is a dict uri -> value of the ext's and switch states, missing inputs are 0
+    # returns the value of each link id
+    def solve(self, inputs):
+        start = time.perf_counter()
+        topology = self.topology
+        uris = topology.uris
+        links = len(topology.link_key)
+        self.inputs = dict(inputs)
+        self.parent = array('i', range(links))
+        self.size = array('i', [1] * links)
+
+        # merge the links of each coupling and conducting switch
+        # (find and union are inlined, as this loop runs for every node of the network)
+        parent, size, conducting, inputs = self.parent, self.size, self.conducting, self.inputs
+        node_type, node_link1, node_link2, node_input = topology.node_type, topology.node_link1, topology.node_link2, topology.node_input
+        for node in range(len(topology.node_key)):
+            if node_type[node] == SWITCH:
+                uri = node_input[node]
+                conducts = uri >= 0 and is_conducting(inputs.get(uris[uri], 0))
+                conducting[node] = conducts
+                if not conducts:
+                    continue
+            else:
+                conducting[node] = 1
+            a = node_link1[node]
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            b = node_link2[node]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+            if size[a] < size[b]:
+                a, b = b, a
+            parent[b] = a
+            size[a] += size[b]
+
+        # the links and sources of each island, ext's keep their own input
+        members = self.members = {}
+        self.sources = {}
+        values = self.values = [0] * links
+        link_type, link_uri = topology.link_type, topology.link_uri
+        for link in range(links):
+            root = link
+            while parent[root] != root:
+                root = parent[root]
+            island = members.get(root)
+            if island == None:
+                members[root] = [link]
+            else:
+                island.append(link)
+            if link_type[link] == EXT:
+                values[link] = inputs.get(uris[link_uri[link]], 0)
+                self.sources.setdefault(root, []).append(link)
+
+        # the links of an island with a source get its value, the others stay 0
+        self.conflicts = {}
+        for root in self.sources:
+            self.evaluate(root)
+
+        self.stats['solves'] += 1
+        self.stats['solve_ms'] = round((time.perf_counter() - start) * 1000, 1)
+        self.stats['islands'] = len(self.sources)
+        self.stats['conflicts'] = len(self.conflicts)
+        return self.values
+
+
+    # apply a changed input, and re-evaluate the islands it affects
+    # returns the link id's of which the value changed
+    def update(self, uri, value):
+        topology = self.topology
+        id = topology.uri_ids.get(uri)
+        if id == None or self.inputs.get(uri, 0) == value:
+            return []
+        self.inputs[uri] = value
+        self.stats['updates'] += 1
+
+        changed = []
+        link = topology.link_ids.get(id)
+        if link != None and topology.link_type[link] == EXT:
+            if self.values[link] != value:
+                self.values[link] = value
+                changed.append(link)
+            changed += self.evaluate(self.find(link), True)
+
+        for node in self.input_nodes.get(id, []):
+            conducting = is_conducting(value)
+            if conducting == self.conducting[node]:
+                continue
+            self.conducting[node] = conducting
+            if conducting:
+                changed += self.merge(node)
+            else:
+                changed += self.split(node)
+
+        self.stats['islands'] = len(self.sources)
+        self.stats['conflicts'] = len(self.conflicts)
+        return changed
+
+
+    # a switch closed, join the islands of its links
+    def merge(self, node):
+        a = self.find(self.topology.node_link1[node])
+        b = self.find(self.topology.node_link2[node])
+        if a == b: # a parallel path already joined them
+            return []
+        root = self.union(a, b)
+        other = b if root == a else a
+        self.members[root] += self.members.pop(other)
+        sources = self.sources.get(root, []) + self.sources.pop(other, [])
+        if len(sources) > 0:
+            self.sources[root] = sources
+        self.conflicts.pop(other, None)
+        self.stats['merges'] += 1
+        return self.evaluate(root, True)
+
+
+    # a switch opened, rebuild the islands of the links of its island, using the nodes of these links only
+    def split(self, node):
+        topology = self.topology
+        root = self.find(topology.node_link1[node])
+        members = self.members.pop(root)
+        self.sources.pop(root, None)
+        self.conflicts.pop(root, None)
+        for link in members:
+            self.parent[link] = link
+            self.size[link] = 1
+
+        nodes = set()
+        for link in members:
+            nodes.update(topology.adjacent(link))
+        for node in nodes:
+            if self.conducting[node]:
+                self.union(topology.node_link1[node], topology.node_link2[node])
+
+        roots = []
+        for link in members:
+            root = self.find(link)
+            if not root in self.members:
+                self.members[root] = []
+                roots.append(root)
+            self.members[root].append(link)
+            if topology.link_type[link] == EXT:
+                self.sources.setdefault(root, []).append(link)
+
+        changed = []
+        for root in roots:
+            changed += self.evaluate(root, True)
+        self.stats['splits'] += 1
+        return changed
+
+
+    # give the links of an island the value of its sources, and check for a conflict
+    # returns the link id's of which the value changed
+    def evaluate(self, root, update=False):
+        topology = self.topology
+        sources = self.sources.get(root, [])
+        found = set(self.values[link] for link in sources)
+        value = max(found) if len(found) > 0 else 0
+        if len(found) > 1:
+            self.conflicts[root] = [(topology.uris[topology.link_uri[link]], self.values[link]) for link in sources]
+        else:
+            self.conflicts.pop(root, None)
+
+        changed = []
+        values, link_type = self.values, topology.link_type
+        members = self.members[root]
+        for link in members:
+            if link_type[link] != EXT and values[link] != value:
+                values[link] = value
+                changed.append(link)
+        if update:
+            self.stats['evaluated'] += len(members)
+        return changed
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+#
+# Compiled network topology of the solver
+# the v_node_list entries of the schema (links, ext's, couplings and switches) are compiled once into
+# arrays, indexed by dense integer id's, instead of dicts that reference each other:
+#   uris        uri id -> uri, of all links and switch inputs (uri_ids is the reverse index)
+#   links       link id -> key, uri id and type (ext or link), unique per uri
+#   nodes       node id -> key, type (coupling or switch), link id's of both sides, and input uri id
+#   adjacency   link id -> node id's connected to it, in CSR format (adj_start, adj_node)
+# all lookups during the compile are hash lookups, so the compile is linear in the amount of entries.
+#
+import sys
+import time
+from array import array
+
+LINK = 0
+EXT = 1
+
+COUPLING = 0
+SWITCH = 1
+
+
+class Topology:
+
+    def __init__(self, links, nodes):
+        start = time.perf_counter()
+        self.uris = []
+        self.uri_ids = {} # uri -> uri id
+        self.link_key = [] # link id -> key of the v_node_list entry (<_id>_<index>)
+        self.link_uri = array('i') # link id -> uri id
+        self.link_type = array('b') # link id -> LINK or EXT
+        self.link_ids = {} # uri id -> link id
+        self.node_key = []
+        self.node_type = array('b') # node id -> COUPLING or SWITCH
+        self.node_link1 = array('i') # node id -> link id
+        self.node_link2 = array('i')
+        self.node_input = array('i') # node id -> uri id of the switch state, -1 for a coupling
+        self.adj_start = array('i') # link id -> start of its nodes in adj_node, adj_start[link id + 1] is the end
+        self.adj_node = array('i')
+        self.warnings = 0
+
+        self.add_links(links)
+        self.add_nodes(nodes)
+        self.build_adjacency()
+        self.compile_ms = round((time.perf_counter() - start) * 1000, 1)
+
+
+    def uri_id(self, uri):
+        id = self.uri_ids.get(uri)
+        if id == None:
+            id = len(self.uris)
+            self.uri_ids[uri] = id
+            self.uris.append(uri)
+        return id
+
+
+    def warning(self, message):
+        self.warnings += 1
+        print("warning: " + message)
+
+
+    # links and ext's, a second link with the same uri is removed
+    def add_links(self, links):
+        for key, link in links.items():
+            uri = link.get('uri')
+            if uri == None:
+                self.warning("removed link without uri: " + str(key))
+                continue
+            uri = self.uri_id(uri)
+            if uri in self.link_ids:
+                self.warning("removed nonsensical link: " + str(key) + ", both links have same ref")
+                continue
+            self.link_ids[uri] = len(self.link_key)
+            self.link_key.append(key)
+            self.link_uri.append(uri)
+            self.link_type.append(EXT if link['type'] == "ext" else LINK)
+
+
+    # couplings and switches, nodes that connect a link to itself, a second coupling between the same
+    # links, and nodes with a link that does not exist are removed. duplicate switches are kept
+    def add_nodes(self, nodes):
+        seen = set() # (type, link uri, link uri) of the nodes, in both directions
+        for key, node in nodes.items():
+            uri1 = node.get('link1')
+            uri2 = node.get('link2')
+            if uri1 == uri2:
+                self.warning("removed nonsensical node: " + str(key) + ", both links have same ref")
+                continue
+            node_type = SWITCH if node['type'] == "switch" else COUPLING
+            if (node_type, uri1, uri2) in seen:
+                if node_type == COUPLING:
+                    self.warning("duplicate coupling, removing second one: " + str(key))
+                    continue
+                self.warning("duplicate switch: " + str(key) + ", keeping node")
+            seen.add((node_type, uri1, uri2))
+            seen.add((node_type, uri2, uri1))
+
+            link1 = self.link_ids.get(self.uri_ids.get(uri1))
+            if link1 == None:
+                self.warning("could not resolve link: " + str(uri1))
+                continue
+            link2 = self.link_ids.get(self.uri_ids.get(uri2))
+            if link2 == None:
+                self.warning("could not resolve link: " + str(uri2))
+                continue
+
+            self.node_key.append(key)
+            self.node_type.append(node_type)
+            self.node_link1.append(link1)
+            self.node_link2.append(link2)
+            self.node_input.append(self.uri_id(node['input']) if node_type == SWITCH and node.get('input') != None else -1)
+
+
+    def build_adjacency(self):
+        degree = array('i', bytes(4 * (len(self.link_key) + 1)))
+        for link in self.node_link1:
+            degree[link + 1] += 1
+        for link in self.node_link2:
+            degree[link + 1] += 1
+        for i in range(1, len(degree)):
+            degree[i] += degree[i - 1]
+        self.adj_start = array('i', degree)
+        self.adj_node = array('i', bytes(4 * degree[-1]))
+        position = degree # next free position per link
+        for node in range(len(self.node_key)):
+            for link in (self.node_link1[node], self.node_link2[node]):
+                self.adj_node[position[link]] = node
+                position[link] += 1
+
+
+    # the nodes connected to a link
+    def adjacent(self, link):
+        return self.adj_node[self.adj_start[link]:self.adj_start[link + 1]]
+
+
+    # the other link of a node
+    def other(self, node, link):
+        link1 = self.node_link1[node]
+        return self.node_link2[node] if link1 == link else link1
+
+
+    # approximate memory of the compiled topology in bytes (containers, keys and uris)
+    def memory(self):
+        size = 0
+        for item in (self.uris, self.uri_ids, self.link_key, self.link_ids, self.node_key):
+            size += sys.getsizeof(item)
+        for item in (self.link_uri, self.link_type, self.node_type, self.node_link1, self.node_link2, self.node_input, self.adj_start, self.adj_node):
+            size += item.buffer_info()[1] * item.itemsize
+        size += sum(sys.getsizeof(uri) for uri in self.uris)
+        size += sum(sys.getsizeof(key) for key in self.link_key) + sum(sys.getsizeof(key) for key in self.node_key)
+        return size
+
+
+    def __repr__(self):
+        return "%i uris, %i links, %i nodes, compiled in %.1f ms, %.1f MB" % (len(self.uris), len(self.link_key), len(self.node_key),
+            self.compile_ms, self.memory() / 1000000.0)
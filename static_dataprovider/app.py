@@ -18,18 +18,21 @@ import pickle
 
 from influxdb_client import InfluxDBClient, Point
 from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_writer import InfluxDBBatchWriter
+import valuestream
 
 update_datapoint = None
 value_bucket = "bucket_1"
+influxdb_writer = None
 
 
 def update_datapoint_influxdb(channel, value):
-    global influxdb_write_api
+    global influxdb_writer
     global value_bucket
     id = channel
     #TODO: store quality and timestamp from 'value'. should be in format of: {'value':1, 'quality':'good', 'time':'2023/01/03 - 13:37:05.003'}
     p = Point("datapoint").tag("id", id).tag("quality", "good").field("value", int(value))
-    influxdb_write_api.write(bucket=value_bucket, record=p)
+    influxdb_writer.write(value_bucket, p)
     return
 
 
@@ -75,7 +78,10 @@ def operate_handler(item):
     if ref.startswith("operate:"):
         channel = ref[8:]
         data = item['data'].decode("utf-8") 
-        rt_db.set("data:"+channel, data)
+        pipe = rt_db.pipeline(transaction=False)
+        pipe.set("data:"+channel, data)
+        valuestream.add_value(pipe, channel, data)
+        pipe.execute()
         # push timeseries data to time series db 
         update_datapoint(channel, data)
     else:
@@ -134,6 +140,8 @@ if __name__ == '__main__':
                 org=influxdb_org)
         influxdb_write_api = influxdb_client.write_api(write_options=SYNCHRONOUS)
         influxdb_query_api = influxdb_client.query_api()
+        influxdb_writer = InfluxDBBatchWriter(influxdb_write_api, influxdb_org, spill_file="./influxdb_spill.lp")
+        influxdb_writer.start()
     except:
         logger.error("there is an issue with influxdb")
         exit(-1)
@@ -169,6 +177,7 @@ if __name__ == '__main__':
                     logger.info("importing:" + str(item) + ", with value:" + str(loaded_dict[item]))
                     update_datapoint(item, loaded_dict[item] )
                 f.close()
+            influxdb_writer.stop() # ensure all imported values are written before exit
             logger.info("import done")
             del influxdb_client
             del rt_db
@@ -193,12 +202,15 @@ if __name__ == '__main__':
     # update redis with historic influxdb data
     result = influxdb_get_datapoints()
     if result != None:
+        pipe = rt_db.pipeline(transaction=False)
         for table in result:
             for record in table.records:
                 value = record.get_value() # return first result
                 point = record.values.get("id")
                 logger.info("set redis item:"+str(point)+" with value:"+str(value))
-                rt_db.set("data:"+point, int(value))#
+                pipe.set("data:"+point, int(value))#
+                valuestream.add_value(pipe, point, int(value))
+        pipe.execute()
 
     logger.info("init done")
 
@@ -1,5 +1,27 @@
 #!/usr/bin/env python3
-from lib60870 import *
+from ctypes import cast
+from lib60870 import (
+    CP56Time2a_getDayOfMonth, CP56Time2a_getHour, CP56Time2a_getMinute, CP56Time2a_getMonth,
+    CP56Time2a_getSecond, CP56Time2a_getYear, CP56Time2a_setFromMsTimestamp, CP56Time2a_toMsTimestamp,
+    CS101_ASDUHandler, CS101_ASDU_addInformationObject, CS101_ASDU_create, CS101_ASDU_destroy,
+    CS101_ASDU_getCOT, CS101_ASDU_getElement, CS101_ASDU_getTypeID, CS101_ASDU_setCOT, CS101_COT_ACTIVATION,
+    CS101_COT_ACTIVATION_CON, CS101_COT_ACTIVATION_TERMINATION, CS101_COT_INTERROGATED_BY_STATION,
+    CS101_COT_SPONTANEOUS, CS101_COT_UNKNOWN_COT, CS101_COT_UNKNOWN_IOA, CS101_COT_UNKNOWN_TYPE_ID,
+    CS101_ClockSynchronizationHandler, CS101_InterrogationHandler, CS101_ReadHandler,
+    CS104_CON_EVENT_ACTIVATED, CS104_CON_EVENT_CONNECTION_CLOSED, CS104_CON_EVENT_CONNECTION_OPENED,
+    CS104_CON_EVENT_DEACTIVATED, CS104_ConnectionEventHandler, CS104_ConnectionRequestHandler,
+    CS104_MODE_SINGLE_REDUNDANCY_GROUP, CS104_Slave_create, CS104_Slave_destroy, CS104_Slave_enqueueASDU,
+    CS104_Slave_getAppLayerParameters, CS104_Slave_isRunning, CS104_Slave_setASDUHandler,
+    CS104_Slave_setClockSyncHandler, CS104_Slave_setConnectionEventHandler,
+    CS104_Slave_setConnectionRequestHandler, CS104_Slave_setInterrogationHandler, CS104_Slave_setLocalAddress,
+    CS104_Slave_setReadHandler, CS104_Slave_setServerMode, CS104_Slave_start, CS104_Slave_stop, C_DC_NA_1,
+    C_SC_NA_1, DoubleCommand, DoubleCommand_getState, DoubleCommand_isSelect, DoublePointInformation,
+    DoublePointInformation_create, Hal_getTimeInMs, IEC60870_QUALITY_GOOD,
+    IMasterConnection_getApplicationLayerParameters, IMasterConnection_sendACT_CON,
+    IMasterConnection_sendACT_TERM, IMasterConnection_sendASDU, InformationObject, InformationObject_destroy,
+    InformationObject_getObjectAddress, MeasuredValueScaled, MeasuredValueScaled_create, SingleCommand,
+    SingleCommand_getState, SingleCommand_isSelect, SinglePointInformation, SinglePointInformation_create,
+)
 import time
 
 class IEC60870_5_104_server: